@@ -10,6 +10,12 @@ import sys
 from pathlib import Path
 from typing import Any, Iterable
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from mutants.registries.sqlite_store import SQLiteConnectionManager, bulk_import  # noqa: E402
+
 
 CATALOG_REQUIRED_FIELDS = {
     "monster_id",
@@ -29,55 +35,8 @@ INNATE_ATTACK_FIELDS = {"name", "power_base", "power_per_level", "line"}
 
 
 def _ensure_database(db_path: Path) -> sqlite3.Connection:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys=ON")
-    _ensure_tables(conn)
-    return conn
-
-
-def _ensure_tables(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS monsters_catalog (
-            monster_id TEXT PRIMARY KEY,
-            name TEXT,
-            level INT,
-            hp_max INT,
-            armour_class INT,
-            spawn_years TEXT,
-            spawnable INT,
-            taunt TEXT,
-            stats_json TEXT,
-            innate_attack_json TEXT,
-            exp_bonus INT,
-            ions_min INT,
-            ions_max INT,
-            riblets_min INT,
-            riblets_max INT,
-            spells_json TEXT,
-            starter_armour_json TEXT,
-            starter_items_json TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-    )
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS monsters_instances (
-            instance_id TEXT PRIMARY KEY,
-            monster_id TEXT,
-            year INT,
-            x INT,
-            y INT,
-            hp_cur INT,
-            hp_max INT,
-            stats_json TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-    )
+    # The connection manager creates the full schema (and parent directory).
+    return SQLiteConnectionManager(db_path).connect()
 
 
 def _load_catalog(path: Path) -> Iterable[dict[str, Any]]:
@@ -269,7 +228,7 @@ def _upsert_catalog(conn: sqlite3.Connection, records: Iterable[dict[str, Any]])
     if not normalized:
         return 0
 
-    with conn:
+    with bulk_import(conn, ("monsters_catalog",)), conn:
         conn.executemany(sql, normalized)
     return len(normalized)
 
@@ -14,6 +14,7 @@ from mutants.data.room_headers import ROOM_HEADERS, STORE_FOR_SALE_IDX
 from mutants.env import runtime_spawner_config
 from mutants.registries import monsters_catalog as mon_catalog
 from mutants.registries import monsters_instances as mon_instances
+from mutants.registries import dynamics as dynamics_registry
 from mutants.registries import world as world_registry
 from mutants.registries.world import load_nearest_year
 from mutants.state import state_path
@@ -30,7 +31,10 @@ from mutants.ui import styles as st
 from ..registries import items_instances as itemsreg
 from mutants.services import (
     audio_cues,
+    db_maintenance,
+    ground_summary,
     monster_leveling,
+    monster_spawner,
     monsters_state,
     player_state as pstate,
 )
@@ -67,6 +71,25 @@ DEFAULT_THEME_PATH = state_path("ui", "themes", "bbs.json")
 
 _CURRENT_CTX: Dict[str, Any] | None = None
 
+# Static room parts (header, edge descriptors, dark flag) keyed by
+# (year, x, y, world_version, dynamics_version).  Entries are only reused while
+# neither the loaded world nor the dynamics overlays have been written.
+_STATIC_ROOM_CACHE: Dict[tuple, tuple[str, Dict[str, Dict[str, Any]], bool]] = {}
+_STATIC_ROOM_CACHE_MAX = 512
+
+_MOVE_LAG_LOG_ENABLED = True
+
+
+def set_move_lag_logging(enabled: bool) -> bool:
+    """Enable or disable the movement lag probe log (state/logs/move_lag.log).
+
+    Returns the previous setting.
+    """
+    global _MOVE_LAG_LOG_ENABLED
+    previous = _MOVE_LAG_LOG_ENABLED
+    _MOVE_LAG_LOG_ENABLED = bool(enabled)
+    return previous
+
 
 def build_context() -> Dict[str, Any]:
     """Build the application context."""
@@ -182,6 +205,7 @@ def build_context() -> Dict[str, Any]:
     scheduler = TurnScheduler(ctx)
     ctx["turn_scheduler"] = scheduler
     session.set_turn_scheduler(scheduler)
+    db_maintenance.start()
     global _CURRENT_CTX
     _CURRENT_CTX = ctx
     return ctx
@@ -203,6 +227,48 @@ def _active(state: Dict[str, Any]) -> Dict[str, Any]:
     return state["players"][0]
 
 
+def _static_room_key(world: Any, year: int, x: int, y: int) -> tuple | None:
+    """Return the memo key for the static parts of ``(year, x, y)``.
+
+    Only real :class:`YearWorld` instances bump the world version on mutation,
+    so other loaders (tests, tools) are never cached.
+    """
+    if not isinstance(world, world_registry.YearWorld):
+        return None
+    return (
+        int(year),
+        int(x),
+        int(y),
+        world_registry.world_version(),
+        dynamics_registry.version(),
+    )
+
+
+def _static_room_parts(
+    world: Any, year: int, x: int, y: int
+) -> tuple[str, Dict[str, Dict[str, Any]], bool, tuple | None]:
+    """Return ``(header, dirs, dark, static_key)`` for the tile at ``(x, y)``."""
+    key = _static_room_key(world, year, x, y)
+    cached = _STATIC_ROOM_CACHE.get(key) if key is not None else None
+    if cached is None:
+        tile = world.get_tile(x, y)
+        header = _resolve_header_text(tile or {}, year)
+        dirs: Dict[str, Dict[str, Any]] = {}
+        if tile:
+            for d in ("N", "S", "E", "W"):
+                e = tile["edges"].get(d, {})
+                dirs[d] = {k: e.get(k) for k in ("base", "gate_state", "key_type")}
+        dark = bool(tile.get("dark")) if tile else False
+        cached = (header, dirs, dark)
+        if key is not None:
+            if len(_STATIC_ROOM_CACHE) >= _STATIC_ROOM_CACHE_MAX:
+                _STATIC_ROOM_CACHE.clear()
+            _STATIC_ROOM_CACHE[key] = cached
+    header, dirs, dark = cached
+    # Hand out copies so view-model consumers can never corrupt the memo.
+    return header, {d: dict(e) for d, e in dirs.items()}, dark, key
+
+
 def build_room_vm(
     state: Dict[str, Any],
     world_loader: Any,
@@ -221,15 +287,7 @@ def build_room_vm(
             pos, year, x, y
         )
     world = world_loader(year)
-    tile = world.get_tile(x, y)
-
-    header = _resolve_header_text(tile or {}, year)
-
-    dirs: Dict[str, Dict[str, Any]] = {}
-    if tile:
-        for d in ("N", "S", "E", "W"):
-            e = tile["edges"].get(d, {})
-            dirs[d] = {k: e.get(k) for k in ("base", "gate_state", "key_type")}
+    header, dirs, dark, static_key = _static_room_parts(world, year, x, y)
 
     monsters_here: List[Dict[str, str]] = []
     seen_monster_ids: set[str] = set()
@@ -317,7 +375,12 @@ def build_room_vm(
     ground_ids: List[str] = []
     if items and hasattr(items, "list_ids_at"):
         try:
-            ground_ids = items.list_ids_at(year, x, y)  # type: ignore[attr-defined]
+            # Reuse the ground summary the monster AI loaded this tick.
+            summary = ground_summary.cached(year, x, y) if items is itemsreg else None
+            if summary is not None:
+                ground_ids = list(summary.item_ids)
+            else:
+                ground_ids = items.list_ids_at(year, x, y)  # type: ignore[attr-defined]
             # Emit a renderer-side probe of exactly what we're about to show.
             try:
                 items_probe.probe("renderer", items, year, x, y)
@@ -338,13 +401,16 @@ def build_room_vm(
         "has_ground": bool(ground_ids),
         "events": [],
         "shadows": shadows,
-        "flags": {"dark": bool(tile.get("dark")) if tile else False},
+        "flags": {"dark": dark},
+        "static_key": static_key,
     }
     return vm
 
 
 def _log_move_lag(ctx: Dict[str, Any], probe: Mapping[str, Any]) -> None:
     """Append a movement lag entry to state/logs/move_lag.log (independent of global logging)."""
+    if not _MOVE_LAG_LOG_ENABLED:
+        return
     start = probe.get("start")
     if not isinstance(start, (float, int)):
         return
@@ -442,6 +508,8 @@ def render_frame(ctx: Dict[str, Any]) -> None:
             ctx["monsters"],
             ctx.get("items"),
         )
+    # The frame closes the tick: later reads go back to the store.
+    ground_summary.end_tick()
     force_show_monsters = bool(ctx.pop("_force_show_monsters", False))
     pre_turn_monsters = ctx.pop("_monsters_were_here", None)
     pre_turn_monsters_pos = ctx.pop("_monsters_were_here_pos", None)
@@ -518,8 +586,9 @@ def render_frame(ctx: Dict[str, Any]) -> None:
     # Expose vm for tests that inspect rendered payloads.
     if isinstance(ctx, MutableMapping):
         ctx["_last_vm"] = vm
-    for line in lines:
-        print(line)
+    # Emit the whole frame in one write instead of one print per line.
+    if lines:
+        sys.stdout.write("\n".join(str(line) for line in lines) + "\n")
     # Also log the human-facing ground list that was rendered.
     try:
         if items_probe.enabled():
@@ -536,6 +605,42 @@ def render_frame(ctx: Dict[str, Any]) -> None:
         _log_move_lag(ctx, probe)
 
 
+# One-shot hints that only shape the next rendered frame.
+_FRAME_ONLY_KEYS = (
+    "peek_vm",
+    "_force_show_monsters",
+    "_monsters_were_here",
+    "_monsters_were_here_pos",
+    "_shadows_before_turn",
+    "_shadows_before_turn_pos",
+    "_suppress_monsters_once",
+    "_suppress_shadows_once",
+    "_shadow_hint_once",
+    "_move_lag_probe",
+)
+
+
+def skip_frame(ctx: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Consume a pending frame without building a view model or any text.
+
+    Applies the same game-state side effects as :func:`render_frame` (ready
+    target partition check, end of the ground-summary tick, one-shot hint
+    cleanup) and returns the feedback events, audio cues included, that the
+    frame would have shown.
+    """
+    current_pos = _player_partition(ctx)
+    if isinstance(ctx, MutableMapping) and current_pos:
+        _clear_ready_target_if_cross_year(ctx, current_pos)
+    ground_summary.end_tick()
+    for key in _FRAME_ONLY_KEYS:
+        ctx.pop(key, None)
+    ctx["render_next"] = False
+    cues = audio_cues.drain(ctx)
+    events: List[Dict[str, Any]] = list(ctx["feedback_bus"].drain())
+    events.extend({"kind": "AUDIO/CUE", "text": cue} for cue in cues)
+    return events
+
+
 def flush_feedback(ctx: Dict[str, Any]) -> None:
     try:
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -588,7 +588,7 @@ def run_daily_litter_reset(root: str | Path | None = None) -> None:
 
 def run_daily_litter() -> None:
     backend = str(get_state_backend()).lower()
-    if backend == "sqlite":
+    if backend in {"sqlite", "sqlite-memory"}:
         return run_daily_litter_sqlite()
     from .daily_litter import run_daily_litter_reset as _json_reset
 
@@ -5,12 +5,14 @@ import shlex
 from typing import Mapping, MutableMapping, Sequence
 
 from mutants.env import debug_commands_enabled
-from mutants.services import monster_manual_spawn, player_state as pstate
+from mutants.services import db_maintenance, monster_manual_spawn, player_state as pstate
+from mutants.services.monster_ai import scheduler as ai_scheduler
 from mutants.registries import (
     items_catalog,
     items_instances,
     monsters_catalog,
     monsters_instances,
+    sqlite_statements,
 )
 from ..util.textnorm import normalize_item_query
 from ..services import state_debug
@@ -121,8 +123,7 @@ def _debug_where(ctx) -> None:
 def _debug_count(ctx) -> None:
     year, x, y = _pos_from_ctx(ctx)
     store = itemsreg._items_store()
-    snapshot = list(store.snapshot())
-    total = len(snapshot)
+    total = sum(1 for _ in store.iter_snapshot(("iid",)))
     here = len(list(store.list_at(year, x, y)))
     ctx["feedback_bus"].push(
         "DEBUG", f"items total={total} here={here} at ({year}, {x}, {y})"
@@ -387,13 +388,41 @@ def debug_add_cmd(arg: str, ctx):
     )
 
 
+def _debug_ai_budget(ctx) -> None:
+    bus = ctx["feedback_bus"]
+    for line in ai_scheduler.get_scheduler(ctx).report_lines():
+        bus.push("DEBUG", line)
+
+
+def _debug_sql(ctx, args: Sequence[str]) -> None:
+    bus = ctx["feedback_bus"]
+    if args and args[0] == "reset":
+        sqlite_statements.reset()
+        bus.push("DEBUG", "SQL statement counters reset.")
+        return
+    try:
+        limit = int(args[0]) if args else 10
+    except ValueError:
+        bus.push("SYSTEM/INFO", "Usage: debug sql [top_n|reset]")
+        return
+    for line in sqlite_statements.format_report(sqlite_statements.snapshot(), limit):
+        bus.push("DEBUG", line)
+
+
+def _debug_wal(ctx) -> None:
+    bus = ctx["feedback_bus"]
+    for line in db_maintenance.format_stats(db_maintenance.stats()):
+        bus.push("DEBUG", line)
+
+
 def debug_cmd(arg: str, ctx):
     parts = shlex.split(arg.strip())
     if not parts:
         ctx["feedback_bus"].push(
             "SYSTEM/INFO",
             "Usage: debug add <item_id> [qty] | debug monster <monster_id> | "
-            "debug where | debug count | debug ions <amount> | debug riblets <amount> | debug hp <amount> | debug set <key> <value>",
+            "debug where | debug count | debug ions <amount> | debug riblets <amount> | debug hp <amount> | debug set <key> <value> | "
+            "debug ai-budget | debug sql [top_n|reset] | debug wal",
         )
         return
 
@@ -418,6 +447,18 @@ def debug_cmd(arg: str, ctx):
         _debug_count(ctx)
         return
 
+    if parts[0] == "ai-budget":
+        _debug_ai_budget(ctx)
+        return
+
+    if parts[0] == "sql":
+        _debug_sql(ctx, parts[1:])
+        return
+
+    if parts[0] == "wal":
+        _debug_wal(ctx)
+        return
+
     if parts[0] == "set" and len(parts) >= 3:
         _debug_set(ctx, parts[1], parts[2])
         return
@@ -473,7 +514,8 @@ def debug_cmd(arg: str, ctx):
     ctx["feedback_bus"].push(
         "SYSTEM/INFO",
         "Usage: debug add <item_id> [qty] | debug monster <monster_id> | "
-        "debug where | debug count | debug ions <amount> | debug riblets <amount> | debug hp <amount> | debug set <key> <value>",
+        "debug where | debug count | debug ions <amount> | debug riblets <amount> | debug hp <amount> | debug set <key> <value> | "
+        "debug ai-budget | debug sql [top_n|reset] | debug wal",
     )
 
 
@@ -486,6 +528,9 @@ _DEBUG_HELP_ENTRIES: Sequence[str] = (
     "debug riblets <amount>",
     "debug hp <amount>",
     "debug set <key> <value> (keys: flee_dir)",
+    "debug ai-budget",
+    "debug sql [top_n|reset]",
+    "debug wal",
 )
 
 
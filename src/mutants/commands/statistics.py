@@ -5,21 +5,18 @@ import os
 from collections.abc import Mapping
 
 from mutants.registries import items_catalog, items_instances as itemsreg
-from mutants.services import player_state as pstate
+from mutants.services import inventory_aggregates, player_state as pstate
 from mutants.services.combat_calc import (
     armour_class_for_active,
     armour_class_from_equipped,
     dex_bonus_for_active,
 )
-from mutants.services.items_weight import get_effective_weight
 from mutants.ui import styles as st
 from mutants.ui import groups as UG
 from mutants.ui.item_display import item_label, number_duplicates, with_article
 from mutants.ui import wrap as uwrap
 from mutants.ui.textutils import harden_final_display
 
-from . import inv as inv_cmd_mod
-
 
 def _int(value: object, default: int = 0) -> int:
     try:
@@ -28,17 +25,6 @@ def _int(value: object, default: int = 0) -> int:
         return default
 
 
-def _coerce_weight(value):
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return int(value)
-    try:
-        return int(float(value))
-    except (TypeError, ValueError):
-        return None
-
-
 def statistics_cmd(arg: str, ctx) -> None:
     prev_ansi = getattr(st, "_ANSI_ENABLED", True)
     if os.getenv("PYTEST_CURRENT_TEST"):
@@ -200,13 +186,13 @@ def statistics_cmd(arg: str, ctx) -> None:
     equipped = pstate.get_equipped_armour_id(inv_state) or pstate.get_equipped_armour_id(inv_player)
     if equipped:
         inventory = [iid for iid in inventory if iid != equipped]
-    cat = items_catalog.load_catalog()
     names = []
-    total_weight = 0
+    instances: Dict[str, Mapping[str, object]] = {}
     for iid in inventory:
         inst = itemsreg.get_instance(iid)
         tpl = {}
         if inst:
+            instances[iid] = inst
             tpl_id = inst.get("item_id") or inst.get("catalog_id") or inst.get("id")
             tpl = cat.get(str(tpl_id)) if tpl_id and cat else {}
             if not tpl and tpl_id:
@@ -215,7 +201,6 @@ def statistics_cmd(arg: str, ctx) -> None:
                 except Exception:
                     tpl = {}
             names.append(item_label(inst, tpl or {}, show_charges=False))
-            weight = _coerce_weight(get_effective_weight(inst, tpl or {}))
         else:
             tpl = cat.get(str(iid)) if cat else {}
             if not tpl:
@@ -225,12 +210,15 @@ def statistics_cmd(arg: str, ctx) -> None:
                     tpl = {}
             if tpl:
                 names.append(item_label({"item_id": str(iid)}, tpl or {}, show_charges=False))
-                weight = _coerce_weight(get_effective_weight({}, tpl or {}))
             else:
                 names.append(str(iid))
-                weight = None
-        if weight is not None:
-            total_weight += max(0, weight)
+    totals = inventory_aggregates.sync_owner(
+        str(inv_player.get("id") or ""),
+        inventory,
+        armour_iid=equipped,
+        instances=instances,
+    )
+    total_weight = totals.total_weight
 
     numbered = number_duplicates(names)
     display = [harden_final_display(with_article(n)) for n in numbered]
@@ -58,7 +58,11 @@ def _tile_items(itemsreg: Any, year: int, x: int, y: int) -> Tuple[List[str], Li
 
     cache_obj_id = -1
     try:
-        raw = itemsreg.snapshot_instances()
+        raw = list(
+            itemsreg.iter_instances(
+                ("iid", "item_id", "year", "x", "y"), year=int(year), x=int(x), y=int(y)
+            )
+        )
     except Exception:
         raw = []
     item_ids: List[str] = []
@@ -149,9 +153,9 @@ def find_all(itemsreg: Any, item_id_like: str) -> None:
     if not enabled():
         return
     try:
-        raw = itemsreg.snapshot_instances()
+        raw = itemsreg.iter_instances(("iid", "item_id", "year", "x", "y"))
     except Exception:
-        raw = []
+        raw = iter(())
     hits: List[str] = []
     needle = item_id_like.lower()
     for inst in raw:
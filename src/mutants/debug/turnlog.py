@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Deque, Iterable, Mapping, Optional
 
 from mutants.services import player_state as pstate
 
 LOG = logging.getLogger(__name__)
 LOG_P = logging.getLogger("mutants.playersdbg")
 
+_ENABLED = True
+_RING_CAPACITY = 256
+
+
+def set_enabled(enabled: bool) -> bool:
+    """Enable or disable structured turn logging process-wide; return the old value."""
+
+    global _ENABLED
+    previous = _ENABLED
+    _ENABLED = bool(enabled)
+    return previous
+
 
 def _coerce_int(value: Any, default: int = 0) -> int:
     try:
@@ -17,13 +30,17 @@ def _coerce_int(value: Any, default: int = 0) -> int:
         return default
 
 
-def _hp_snapshot() -> Optional[tuple[int, int]]:
-    try:
-        state = pstate.load_state()
-    except Exception:  # pragma: no cover - defensive guard
+def _hp_snapshot(ctx: Any) -> Optional[tuple[int, int]]:
+    """Return ``(current, max)`` HP from the in-memory player state on *ctx*."""
+
+    if isinstance(ctx, Mapping):
+        state = ctx.get("player_state")
+    else:
+        state = getattr(ctx, "player_state", None)
+    if not isinstance(state, Mapping):
         return None
     try:
-        block = pstate.get_hp_for_active(state)
+        block = pstate.get_hp_for_active(state)  # type: ignore[arg-type]
     except Exception:  # pragma: no cover - defensive guard
         return None
     if not isinstance(block, Mapping):
@@ -34,7 +51,8 @@ def _hp_snapshot() -> Optional[tuple[int, int]]:
 
 
 def _observer_from_ctx(ctx: Any) -> "TurnObserver | None":
-    if isinstance(ctx, Mapping):
+    # Plain dict check first: the ABC isinstance test dominates the no-consumer path.
+    if type(ctx) is dict or isinstance(ctx, Mapping):
         observer = ctx.get("turn_observer")
     else:
         observer = getattr(ctx, "turn_observer", None)
@@ -42,7 +60,7 @@ def _observer_from_ctx(ctx: Any) -> "TurnObserver | None":
 
 
 def _sink_from_ctx(ctx: Any) -> Any:
-    if isinstance(ctx, Mapping):
+    if type(ctx) is dict or isinstance(ctx, Mapping):
         return ctx.get("logsink")
     return getattr(ctx, "logsink", None)
 
@@ -64,24 +82,53 @@ def _format_meta(meta: Mapping[str, Any]) -> str:
     return " ".join(parts)
 
 
+def enabled(ctx: Any = None) -> bool:
+    """Return True when an emitted event would reach a consumer.
+
+    Without *ctx* this only reports the process-wide switch.  With *ctx* it
+    also requires a logsink or an active :class:`TurnObserver`, so callers can
+    skip building event metadata entirely.
+    """
+
+    if not _ENABLED:
+        return False
+    if ctx is None:
+        return True
+    if _sink_from_ctx(ctx) is not None:
+        return True
+    observer = _observer_from_ctx(ctx)
+    return observer is not None and observer._active
+
+
 def emit(ctx: Any, kind: str, *, message: str | None = None, **meta: Any) -> None:
     """Emit a structured turn log event.
 
-    The event is written to the logsink (if present) and recorded by the
-    :class:`TurnObserver` for playersdbg summaries.
+    The event is handed to the logsink (if present) and recorded by the
+    :class:`TurnObserver` for playersdbg summaries.  Text is formatted only
+    when a consumer reads it; with no consumer this returns immediately.
     """
 
-    text = message if message is not None else _format_meta(meta)
+    if not _ENABLED:
+        return
     sink = _sink_from_ctx(ctx)
-    if sink and hasattr(sink, "handle"):
+    observer = _observer_from_ctx(ctx)
+    if sink is None and (observer is None or not observer._active):
+        return
+
+    if sink is not None:
         try:
-            sink.handle({"ts": "", "kind": kind, "text": text})
+            deferred = getattr(sink, "add_deferred", None)
+            if message is not None:
+                sink.handle({"ts": "", "kind": kind, "text": message})
+            elif deferred is not None:
+                deferred(kind, _format_meta, meta)
+            elif hasattr(sink, "handle"):
+                sink.handle({"ts": "", "kind": kind, "text": _format_meta(meta)})
         except Exception:  # pragma: no cover - defensive guard
-            LOG.exception("Failed to write structured log", extra={"kind": kind, "text": text})
+            LOG.exception("Failed to write structured log", extra={"kind": kind})
 
-    observer = _observer_from_ctx(ctx)
-    if observer:
-        observer.record(kind, meta, text)
+    if observer is not None:
+        observer.record(kind, meta, message)
 
 
 def get_observer(ctx: Any) -> "TurnObserver | None":
@@ -168,39 +215,40 @@ def _summarize_events(events: Iterable[tuple[str, Mapping[str, Any]]]) -> list[s
 
 @dataclass
 class TurnObserver:
-    """Collect structured events and emit a playersdbg summary each turn."""
+    """Collect structured events and emit a playersdbg summary each turn.
+
+    Events are kept as ``(kind, meta)`` tuples in a fixed-size ring buffer and
+    only summarized in :meth:`finish_turn`.
+    """
 
     _active: bool = False
     _token: str | None = None
     _resolved: str | None = None
     _hp_before: tuple[int, int] | None = None
-    _events: list[tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    _events: Deque[tuple[str, Mapping[str, Any]]] = field(
+        default_factory=lambda: deque(maxlen=_RING_CAPACITY)
+    )
 
     def begin_turn(self, ctx: Any, token: str, resolved: Optional[str]) -> None:
-        if not pstate._pdbg_enabled():
+        if not _ENABLED or not pstate._pdbg_enabled():
             self.reset()
             return
         self._active = True
         self._token = token
         self._resolved = resolved
-        self._hp_before = _hp_snapshot()
+        self._hp_before = _hp_snapshot(ctx)
         self._events.clear()
 
     def record(self, kind: str, meta: Mapping[str, Any], text: str | None = None) -> None:
         if not self._active:
             return
-        payload: Dict[str, Any] = {}
-        for key, value in meta.items():
-            payload[str(key)] = value
-        if text and "text" not in payload:
-            payload["text"] = text
-        self._events.append((kind, payload))
+        self._events.append((kind, meta))
 
     def finish_turn(self, ctx: Any, token: str, resolved: Optional[str]) -> None:
         if not self._active:
             self.reset()
             return
-        hp_after = _hp_snapshot()
+        hp_after = _hp_snapshot(ctx)
         delta: Optional[int] = None
         if self._hp_before and hp_after:
             delta = hp_after[0] - self._hp_before[0]
@@ -235,4 +283,4 @@ class TurnObserver:
         self._events.clear()
 
 
-__all__ = ["TurnObserver", "emit", "get_observer"]
+__all__ = ["TurnObserver", "emit", "enabled", "get_observer", "set_enabled"]
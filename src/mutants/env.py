@@ -11,7 +11,7 @@ from mutants.util import parse_int
 _LOG = logging.getLogger(__name__)
 
 _STATE_BACKEND_ENV: Final[str] = "MUTANTS_STATE_BACKEND"
-_VALID_STATE_BACKENDS: Final[frozenset[str]] = frozenset({"sqlite"})
+_VALID_STATE_BACKENDS: Final[frozenset[str]] = frozenset({"sqlite", "sqlite-memory"})
 _DB_FILENAME: Final[str] = "mutants.db"
 _CONFIG_LOGGED = False
 _COMBAT_CONFIG_FILENAME: Final[tuple[str, str]] = ("config", "combat.json")
@@ -22,6 +22,22 @@ _POP_FLOOR_ENV: Final[str] = "POP_FLOOR"
 _POP_CAP_ENV: Final[str] = "POP_CAP"
 _SPAWN_BATCH_ENV: Final[str] = "SPAWN_BATCH_MAX"
 _DEBUG_ENV: Final[str] = "DEBUG"
+_OWNER_AGGREGATES_TABLE_ENV: Final[str] = "MUTANTS_OWNER_AGGREGATES_TABLE"
+_AI_NEAR_RADIUS_ENV: Final[str] = "MUTANTS_AI_NEAR_RADIUS"
+_AI_FAR_CADENCE_ENV: Final[str] = "MUTANTS_AI_FAR_CADENCE"
+_AI_BUDGET_MS_ENV: Final[str] = "MUTANTS_AI_BUDGET_MS"
+_AI_CATCHUP_CAP_ENV: Final[str] = "MUTANTS_AI_CATCHUP_CAP"
+_CHECK_TARGET_INDEX_ENV: Final[str] = "MUTANTS_CHECK_TARGET_INDEX"
+_SQLITE_STATEMENT_CACHE_ENV: Final[str] = "MUTANTS_SQLITE_STATEMENT_CACHE"
+_SQLITE_TRACE_ENV: Final[str] = "MUTANTS_SQLITE_TRACE"
+_SQL_STATS_ENV: Final[str] = "MUTANTS_SQL_STATS"
+_SQL_STATS_FILENAME: Final[tuple[str, str]] = ("logs", "sql_stats.json")
+_SQLITE_PROFILE_ENV: Final[str] = "MUTANTS_SQLITE_PROFILE"
+_VALID_SQLITE_PROFILES: Final[frozenset[str]] = frozenset({"interactive", "bulk-import", "durable"})
+_DB_MAINTENANCE_ENV: Final[str] = "MUTANTS_DB_MAINTENANCE"
+_WAL_TRUNCATE_KB_ENV: Final[str] = "MUTANTS_WAL_TRUNCATE_KB"
+_DB_OPTIMIZE_INTERVAL_ENV: Final[str] = "MUTANTS_DB_OPTIMIZE_INTERVAL_S"
+_CHANGE_FEED_ENV: Final[str] = "MUTANTS_CHANGE_FEED"
 
 
 def _parse_bool(raw: Optional[str], *, default: bool = False) -> bool:
@@ -50,8 +66,9 @@ def get_state_backend() -> str:
     """Return the configured state backend.
 
     The backend is controlled via the ``MUTANTS_STATE_BACKEND`` environment
-    variable. Currently only the ``"sqlite"`` value is honoured; any other
-    value falls back to ``"sqlite"``.
+    variable: ``"sqlite"`` (the state database file) or ``"sqlite-memory"``
+    (a shared-cache in-memory database with the same schema, for tests and
+    offline simulations).  Any other value falls back to ``"sqlite"``.
     """
 
     raw = os.getenv(_STATE_BACKEND_ENV)
@@ -128,7 +145,102 @@ def runtime_spawner_config() -> Dict[str, int]:
     }
 
 
+def ai_scheduler_config() -> Dict[str, int]:
+    """Return configuration for the tiered monster AI scheduler.
+
+    ``budget_ms`` of ``0`` disables the per-tick budget for coarse updates.
+    """
+
+    near_radius = max(0, _parse_int_env(_AI_NEAR_RADIUS_ENV, 1))
+    cadence = max(1, _parse_int_env(_AI_FAR_CADENCE_ENV, 3))
+    budget_ms = max(0, _parse_int_env(_AI_BUDGET_MS_ENV, 8))
+    catchup_cap = max(1, _parse_int_env(_AI_CATCHUP_CAP_ENV, 20))
+    return {
+        "near_radius": near_radius,
+        "cadence": cadence,
+        "budget_ms": budget_ms,
+        "catchup_cap": catchup_cap,
+    }
+
+
 def debug_commands_enabled() -> bool:
     """Return ``True`` when debug-only commands should be enabled."""
 
     return _parse_bool(os.getenv(_DEBUG_ENV), default=False)
+
+
+def target_index_checks_enabled() -> bool:
+    """Return ``True`` when the monster targeting index is cross-checked on reads."""
+
+    return _parse_bool(os.getenv(_CHECK_TARGET_INDEX_ENV), default=False)
+
+
+def owner_aggregates_table_enabled() -> bool:
+    """Return ``True`` when inventory aggregates are mirrored to SQLite."""
+
+    return _parse_bool(os.getenv(_OWNER_AGGREGATES_TABLE_ENV), default=False)
+
+
+def sqlite_statement_config() -> Dict[str, int]:
+    """Return configuration for the SQLite statement layer.
+
+    ``cache_size`` bounds both the per-connection prepared-statement cache and
+    the rendered dynamic statements kept by ``sqlite_statements``.  ``trace``
+    attaches a tracing callback to every state connection and ``publish``
+    writes the statement counters to :func:`get_sql_stats_path` so
+    ``sqlite_admin stats --live`` can read them from another process.
+    """
+
+    return {
+        "cache_size": max(16, _parse_int_env(_SQLITE_STATEMENT_CACHE_ENV, 128)),
+        "trace": int(_parse_bool(os.getenv(_SQLITE_TRACE_ENV), default=False)),
+        "publish": int(_parse_bool(os.getenv(_SQL_STATS_ENV), default=False)),
+    }
+
+
+def get_sqlite_profile() -> str:
+    """Return the PRAGMA profile for state database connections.
+
+    ``MUTANTS_SQLITE_PROFILE`` selects ``"interactive"`` (the default),
+    ``"bulk-import"`` (``synchronous=OFF`` with a large cache, for offline
+    imports) or ``"durable"`` (``synchronous=FULL``).  Unknown values fall back
+    to ``"interactive"``.
+    """
+
+    raw = os.getenv(_SQLITE_PROFILE_ENV)
+    if raw is None:
+        return "interactive"
+    candidate = raw.strip().lower()
+    return candidate if candidate in _VALID_SQLITE_PROFILES else "interactive"
+
+
+def db_maintenance_config() -> Dict[str, int]:
+    """Return configuration for the idle-time database maintenance thread.
+
+    ``enabled`` (``MUTANTS_DB_MAINTENANCE``, on by default) starts the thread
+    with the REPL.  While the REPL waits for input it checkpoints the WAL,
+    truncating it once it exceeds ``truncate_kb``
+    (``MUTANTS_WAL_TRUNCATE_KB``), and runs ``PRAGMA optimize`` every
+    ``optimize_interval_s`` seconds (``MUTANTS_DB_OPTIMIZE_INTERVAL_S``).
+    """
+
+    return {
+        "enabled": int(_parse_bool(os.getenv(_DB_MAINTENANCE_ENV), default=True)),
+        "truncate_kb": max(0, _parse_int_env(_WAL_TRUNCATE_KB_ENV, 4096)),
+        "optimize_interval_s": max(1, _parse_int_env(_DB_OPTIMIZE_INTERVAL_ENV, 600)),
+    }
+
+
+def get_change_feed_enabled() -> bool:
+    """Return whether instance-store writes are appended to the ``changes`` table.
+
+    Controlled by ``MUTANTS_CHANGE_FEED`` (off by default).
+    """
+
+    return _parse_bool(os.getenv(_CHANGE_FEED_ENV), default=False)
+
+
+def get_sql_stats_path() -> Path:
+    """Return the path of the published SQL statement counters."""
+
+    return state_path(*_SQL_STATS_FILENAME)
@@ -10,6 +10,14 @@ from mutants.util.directions import DELTA as _DELTA, OPP as _OPP
 
 PATH = state_path("world", "dynamics.json")
 
+# Bumped on every write so render caches can tell when overlays/locks changed.
+_VERSION = 0
+
+
+def version() -> int:
+    """Return the number of dynamics writes made by this process."""
+    return _VERSION
+
 
 def _load() -> Dict[str, Dict]:
     try:
@@ -20,6 +28,8 @@ def _load() -> Dict[str, Dict]:
 
 
 def _save(data: Dict[str, Dict]) -> None:
+    global _VERSION
+    _VERSION += 1
     tmp = PATH.with_name(PATH.name + ".tmp")
     PATH.parent.mkdir(parents=True, exist_ok=True)
     with tmp.open("w", encoding="utf-8") as f:
@@ -0,0 +1,107 @@
+"""Hi/lo block allocation of integer ids backed by ``runtime_kv``.
+
+Each :class:`BlockAllocator` reserves a range of ``block_size`` ids with one
+:meth:`RuntimeKVStore.reserve` transaction and hands them out from memory.
+The key stores the highest id reserved so far, so a crash wastes at most the
+unused part of one block and never reissues an id, and allocators in other
+threads or processes sharing the database always get disjoint ranges.
+
+When the key does not exist yet, ``floor`` (if given) is called once to find
+the highest id already in use, e.g. by scanning the instance table.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional
+
+from .storage import RuntimeKVStore, get_stores
+
+__all__ = [
+    "BlockAllocator",
+    "ITEM_IID_BLOCK",
+    "MONSTER_COUNTER_BLOCK",
+    "SUFFIX_BLOCK",
+    "allocator",
+]
+
+ITEM_IID_BLOCK = 256
+MONSTER_COUNTER_BLOCK = 64
+SUFFIX_BLOCK = 16
+
+FloorFn = Callable[[], int]
+
+
+class BlockAllocator:
+    """Hand out increasing ids for *key* from blocks reserved in *kv*."""
+
+    __slots__ = ("_kv", "_key", "_block_size", "_floor", "_lock", "_next", "_limit", "reservations")
+
+    def __init__(
+        self,
+        kv: RuntimeKVStore,
+        key: str,
+        *,
+        block_size: int,
+        floor: Optional[FloorFn] = None,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self._kv = kv
+        self._key = key
+        self._block_size = int(block_size)
+        self._floor = floor
+        self._lock = threading.Lock()
+        self._next = 0
+        self._limit = -1  # empty: the first next() reserves a block
+        self.reservations = 0
+
+    @property
+    def kv(self) -> RuntimeKVStore:
+        return self._kv
+
+    def next(self) -> int:
+        """Return the next id, reserving a new block when this one is used up."""
+
+        with self._lock:
+            if self._next > self._limit:
+                self._reserve()
+            value = self._next
+            self._next += 1
+            return value
+
+    def _reserve(self) -> None:
+        floor = 0
+        if self._floor is not None and self._kv.get(self._key) is None:
+            floor = int(self._floor())
+        start = self._kv.reserve(self._key, self._block_size, floor=floor)
+        self._next = start
+        self._limit = start + self._block_size - 1
+        self.reservations += 1
+
+
+_ALLOCATORS: Dict[str, BlockAllocator] = {}
+_ALLOCATORS_LOCK = threading.Lock()
+
+
+def allocator(
+    key: str,
+    *,
+    block_size: int,
+    floor: Optional[FloorFn] = None,
+    kv: Optional[RuntimeKVStore] = None,
+) -> BlockAllocator:
+    """Return the process-wide allocator for *key* on the current state store.
+
+    The allocator is rebuilt (dropping its in-memory block) when the state
+    stores change, e.g. after :func:`sqlite_store.close_all` or when a test
+    switches databases.
+    """
+
+    store = kv if kv is not None else get_stores().runtime_kv
+    with _ALLOCATORS_LOCK:
+        current = _ALLOCATORS.get(key)
+        if current is None or current.kv is not store:
+            current = BlockAllocator(store, key, block_size=block_size, floor=floor)
+            _ALLOCATORS[key] = current
+        return current
@@ -4,16 +4,15 @@ import json
 import logging
 import os
 import time
-import uuid
 from collections.abc import MutableSet
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 # NOTE: Imported by ``mutants.registries.json_store`` via :func:`get_stores`.
 
 from mutants.state import state_path
 from .storage import get_stores
-from . import items_catalog
+from . import id_blocks, items_catalog
 from .items_catalog import instance_defaults
 
 DEFAULT_INSTANCES_PATH = state_path("items", "instances.json")
@@ -51,14 +50,22 @@ NOT_ENCHANTABLE_REASONS = (
 )
 
 
+_IID_COUNTER_KEY = "item_iid_counter"
+
+
 def mint_iid(*, seen: Optional[MutableSet[str] | Iterable[str]] = None) -> str:
     """Return a fresh unique item instance identifier.
 
+    Identifiers come from a block allocator over ``runtime_kv`` and are never
+    reissued for the same database, so nothing has to be compared against
+    existing ids.  Legacy ``uuid4`` iids are 32 hex digits and can't collide
+    with the 16-digit allocated ones.
+
     Parameters
     ----------
     seen
-        Optional collection used to seed the set of IDs that must not be reused. The
-        collection is updated in-place when it is a mutable set.
+        Optional collection of IDs already in use. The new ID is added to it
+        when it is a mutable set.
 
     Returns
     -------
@@ -66,25 +73,11 @@ def mint_iid(*, seen: Optional[MutableSet[str] | Iterable[str]] = None) -> str:
         Hex string suitable for storing in ``iid`` / ``instance_id`` fields.
     """
 
-    seen_ids: set[str]
-    updater: Optional[MutableSet[str]]
-    if seen is None:
-        seen_ids = set()
-        updater = None
-    elif isinstance(seen, MutableSet):
-        seen_ids = {str(token) for token in seen}
-        updater = seen
-    else:
-        seen_ids = {str(token) for token in seen}
-        updater = None
-
-    while True:
-        candidate = uuid.uuid4().hex
-        if candidate not in seen_ids:
-            seen_ids.add(candidate)
-            if updater is not None:
-                updater.add(candidate)
-            return candidate
+    allocator = id_blocks.allocator(_IID_COUNTER_KEY, block_size=id_blocks.ITEM_IID_BLOCK)
+    candidate = f"{allocator.next():016x}"
+    if isinstance(seen, MutableSet):
+        seen.add(candidate)
+    return candidate
 
 
 def remint_iid(inst: MutableMapping[str, Any], *, seen: Optional[Iterable[str]] = None) -> str:
@@ -103,14 +96,10 @@ def remint_iid(inst: MutableMapping[str, Any], *, seen: Optional[Iterable[str]]
         The new identifier written to ``inst``.
     """
 
-    existing = set(str(token) for token in seen or [])
-    while True:
-        candidate = mint_iid(seen=existing)
-        if candidate not in existing:
-            existing.add(candidate)
-            inst["iid"] = candidate
-            inst["instance_id"] = candidate
-            return candidate
+    candidate = mint_iid(seen=seen if isinstance(seen, MutableSet) else None)
+    inst["iid"] = candidate
+    inst["instance_id"] = candidate
+    return candidate
 
 
 def _instance_id(inst: Dict[str, Any]) -> str:
@@ -484,6 +473,17 @@ def _items_store():
     return get_stores().items
 
 
+_AGGREGATE_FIELDS = frozenset({"item_id", "enchant", "condition"})
+
+
+def _notify_aggregates(iid: str) -> None:
+    """Tell the inventory aggregates that ``iid`` changed weight or armour."""
+
+    from mutants.services import inventory_aggregates  # local import to avoid cycle
+
+    inventory_aggregates.item_changed(str(iid))
+
+
 def mint_on_ground_with_defaults(
     item_id: str,
     *,
@@ -870,6 +870,8 @@ def update_instance(iid: str, **fields: Any) -> Dict[str, Any]:
             store.update_fields(siid, **to_set)
         except KeyError:
             raise KeyError(iid) from None
+        if _AGGREGATE_FIELDS.intersection(to_set):
+            _notify_aggregates(siid)
 
     record = store.get_by_iid(siid)
     if record is None:
@@ -883,9 +885,10 @@ def remove_instance(iid: str) -> bool:
     store = _items_store()
     try:
         store.delete(str(iid))
-        return True
     except KeyError:
         return False
+    _notify_aggregates(str(iid))
+    return True
 
 
 def move_instance(
@@ -928,26 +931,80 @@ def save_instances() -> None:
 def remove_instances(instance_ids: List[str]) -> int:
     """Remove all instances whose ids are in ``instance_ids``."""
 
-    targets = {str(i) for i in instance_ids if i}
-    if not targets:
-        return 0
+    removed = _items_store().delete_many(str(i) for i in instance_ids if i)
+    for iid in removed:
+        _notify_aggregates(iid)
+    return len(removed)
 
-    store = _items_store()
-    removed = 0
-    for iid in targets:
-        try:
-            store.delete(iid)
-            removed += 1
-        except KeyError:
-            continue
+
+def remove_owner_instances(owner: str) -> List[str]:
+    """Remove every instance owned by ``owner`` in one statement."""
+
+    removed = _items_store().delete_by_owner(str(owner))
+    for iid in removed:
+        _notify_aggregates(iid)
     return removed
 
+
+def move_instances(
+    instance_ids: Iterable[str],
+    dest: Tuple[int, int, int],
+    *,
+    cap: Optional[int] = None,
+    created_at: Optional[Mapping[str, int]] = None,
+) -> List[str]:
+    """Put ``instance_ids`` on the ground at ``dest`` in one transaction.
+
+    ``cap`` limits the tile to that many items (checked by the store in SQL);
+    ``created_at`` maps iids to the creation stamps that order them on the
+    tile.  Returns the iids that moved, in the order given.
+    """
+
+    year, x, y = (int(dest[0]), int(dest[1]), int(dest[2]))
+    return _items_store().move_many(
+        (str(i) for i in instance_ids if i), (year, x, y), cap=cap, created_at=created_at
+    )
+
+
+def drop_or_delete_instances(
+    groups: Iterable[Iterable[str]], dest: Tuple[int, int, int], cap: int
+) -> Tuple[List[str], List[str]]:
+    """Drop ``groups`` of iids at ``dest`` under ``cap``; delete what does not fit.
+
+    Earlier groups claim the free slots first.  The moves and deletes share one
+    store transaction.  Returns ``(dropped, deleted)`` iids.
+    """
+
+    year, x, y = (int(dest[0]), int(dest[1]), int(dest[2]))
+    dropped, deleted = _items_store().drop_or_delete(
+        ([str(i) for i in group if i] for group in groups), (year, x, y), cap
+    )
+    for iid in deleted:
+        _notify_aggregates(iid)
+    return dropped, deleted
+
+
 def list_instances_at(year: int, x: int, y: int) -> List[Dict[str, Any]]:
     """Return cached instance payloads at ``(year, x, y)``."""
 
     store = _items_store()
     records = store.list_at(int(year), int(x), int(y))
     return [_inflate_store_record(rec) for rec in records]
+
+
+def list_instances_at_many(
+    positions: Iterable[Sequence[int]],
+) -> Dict[Tuple[int, int, int], List[Dict[str, Any]]]:
+    """Return instance payloads for every tile in ``positions`` in one batch."""
+
+    store = _items_store()
+    tiles = [(int(pos[0]), int(pos[1]), int(pos[2])) for pos in positions]
+    records = store.list_at_many(tiles)
+    return {
+        pos: [_inflate_store_record(rec) for rec in recs] for pos, recs in records.items()
+    }
+
+
 def get_instance(iid: str) -> Optional[Dict[str, Any]]:
     """Return the cached instance matching ``iid`` if present."""
 
@@ -1029,6 +1086,7 @@ def set_condition(iid: str, value: int) -> int:
         return 0
     amount = _sanitize_condition(value)
     _items_store().update_fields(str(iid), condition=amount)
+    _notify_aggregates(str(iid))
     return amount
 
 
@@ -1049,6 +1107,7 @@ def crack_instance(iid: str) -> Optional[Dict[str, Any]]:
         store.update_fields(str(iid), item_id=new_item_id, condition=None)
     except KeyError:
         return None
+    _notify_aggregates(str(iid))
     return get_instance(iid)
 
 
@@ -1059,6 +1118,20 @@ def snapshot_instances() -> List[Dict[str, Any]]:
     return [_inflate_store_record(rec) for rec in store.snapshot()]
 
 
+def iter_instances(
+    columns: Optional[Sequence[str]] = None, **where: Any
+) -> Iterator[Dict[str, Any]]:
+    """Stream inflated instances without materializing the table.
+
+    *columns* limits what is read from the store (fields left out get the
+    usual inflation defaults); keyword arguments filter by equality in SQL,
+    e.g. ``owner=None`` for ground items or ``year=2000, x=0, y=0`` for a tile.
+    """
+
+    rows = _items_store().iter_snapshot(columns, **where)
+    return (_inflate_store_record(rec) for rec in rows)
+
+
 def clear_position(iid: str) -> None:
     """Back-compat: clear by iid (may hit wrong object if duplicate iids exist)."""
 
@@ -302,6 +302,19 @@ class JSONMonstersInstanceStore:
         registry._add(payload)  # type: ignore[attr-defined]
         registry.save()
 
+    def spawn_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        registry = self._load()
+        count = 0
+        for rec in records:
+            payload = dict(rec)
+            if "instance_id" not in payload:
+                raise KeyError("Monsters instances require an 'instance_id' field")
+            registry._add(payload)  # type: ignore[attr-defined]
+            count += 1
+        if count:
+            registry.save()
+        return count
+
     def update_fields(self, mid: str, **fields: Any) -> None:
         registry = self._load()
         monster = registry.get(str(mid))
@@ -5,14 +5,14 @@ import json
 import logging
 import os
 import random
-import threading
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 # NOTE: Imported by ``mutants.registries.json_store`` via :func:`get_stores`.
 
 from mutants.services.monster_entities import DEFAULT_INNATE_ATTACK_LINE
 from mutants.state import state_path
+from . import id_blocks
 from .storage import MonstersInstanceStore, RuntimeKVStore, get_stores
 
 DEFAULT_INSTANCES_PATH = state_path("monsters", "instances.json")
@@ -48,7 +48,6 @@ def _guard_command_read(method_name: str) -> None:
         del frame
 
 _INSTANCE_COUNTER_KEY = "monster_instance_counter"
-_COUNTER_LOCK = threading.Lock()
 
 def _iid(row: Mapping[str, Any] | Any) -> str:
     if not isinstance(row, Mapping):
@@ -136,7 +135,6 @@ class MonstersInstances:
             self._kv_store = stores.runtime_kv
         else:
             self._kv_store = kv_store
-        self._counter_cache: int | None = None
 
     # ---------- Internal helpers ----------
     @staticmethod
@@ -219,6 +217,21 @@ class MonstersInstances:
     def spawn(self, inst: Dict[str, Any]) -> Dict[str, Any]:
         return self._add(inst)
 
+    def spawn_many(self, insts: Iterable[Dict[str, Any]]) -> int:
+        """Persist several new instances in one store transaction."""
+
+        store = self._ensure_store()
+        payloads = [dict(inst) for inst in insts]
+        for payload in payloads:
+            if payload.get("instance_id") is None:
+                raise KeyError("instance_id")
+        spawn_many = getattr(store, "spawn_many", None)
+        if callable(spawn_many):
+            return int(spawn_many(payloads))
+        for payload in payloads:
+            store.spawn(payload)
+        return len(payloads)
+
     def add_instance(self, inst: Dict[str, Any]) -> bool:
         try:
             self._add(inst)
@@ -250,55 +263,22 @@ class MonstersInstances:
         store = self._ensure_store()
         highest = 0
         try:
-            records = store.snapshot()
+            for record in store.iter_snapshot(("instance_id",)):
+                value = self._counter_from_instance_id(record.get("instance_id"))
+                if value is not None and value > highest:
+                    highest = value
         except Exception:
-            return 0
-        for record in records:
-            instance_id = record.get("instance_id") if isinstance(record, Mapping) else None
-            value = self._counter_from_instance_id(instance_id)
-            if value is not None and value > highest:
-                highest = value
+            return highest
         return highest
 
-    def _ensure_counter_seeded(self) -> None:
-        if self._counter_cache is not None:
-            return
-
-        store = self._ensure_kv()
-        seed = 0
-        if store is not None:
-            try:
-                raw = store.get(_INSTANCE_COUNTER_KEY)
-            except Exception:
-                raw = None
-            if raw is not None:
-                try:
-                    seed = int(str(raw))
-                except ValueError:
-                    seed = 0
-            else:
-                seed = self._scan_existing_counter()
-                try:
-                    store.set(_INSTANCE_COUNTER_KEY, str(seed))
-                except Exception:
-                    pass
-        else:
-            seed = self._scan_existing_counter()
-
-        self._counter_cache = seed
-
     def _next_counter(self) -> int:
-        with _COUNTER_LOCK:
-            self._ensure_counter_seeded()
-            current = (self._counter_cache or 0) + 1
-            self._counter_cache = current
-            store = self._ensure_kv()
-            if store is not None:
-                try:
-                    store.set(_INSTANCE_COUNTER_KEY, str(current))
-                except Exception:
-                    pass
-            return current
+        allocator = id_blocks.allocator(
+            _INSTANCE_COUNTER_KEY,
+            block_size=id_blocks.MONSTER_COUNTER_BLOCK,
+            floor=self._scan_existing_counter,
+            kv=self._ensure_kv(),
+        )
+        return allocator.next()
 
     @staticmethod
     def _format_counter(value: int) -> str:
@@ -312,6 +292,11 @@ class MonstersInstances:
         suffix = self._next_counter()
         return f"{base}#{self._format_counter(suffix)}"
 
+    def mint_store_instance_id(self, monster_kind: Any) -> str:
+        """Return an ``i.``-prefixed id the store accepts, from the same counter."""
+
+        return f"i.{self.mint_instance_id(monster_kind)}"
+
     def remint_instance_id(self, payload: MutableMapping[str, Any]) -> str:
         monster_kind = payload.get("monster_id")
         new_id = self.mint_instance_id(monster_kind)
@@ -440,6 +425,16 @@ class MonstersInstances:
             for record in store.snapshot()
         ]
 
+    def iter_fields(self, *columns: str, **where: Any) -> Iterator[Dict[str, Any]]:
+        """Stream raw store columns for every monster matching *where*.
+
+        Unlike :meth:`list_all` nothing is decoded or materialized, so scans
+        that only need a few columns stay flat in memory.
+        """
+
+        _guard_command_read("iter_fields")
+        return self._ensure_store().iter_snapshot(columns or None, **where)
+
     def list_at(self, year: int, x: int, y: int) -> Iterable[Dict[str, Any]]:
         _guard_command_read("list_at")
         store = self._ensure_store()
@@ -0,0 +1,409 @@
+"""Named SQL statements for the SQLite state store, with per-statement counters.
+
+Every runtime query in ``sqlite_store`` is declared once at import time with
+:func:`declare` (connection setup and schema migrations still run raw SQL)
+and run through :func:`execute`, :func:`executemany`,
+:func:`fetchall`, :func:`fetchone` or :func:`iterate`.  Each call is counted under the
+statement's name (calls, rows, cumulative and worst time), so a change that
+adds queries to a turn shows up in ``debug sql`` and
+``sqlite_admin stats --live``.
+
+Statements whose text depends on the call (``UPDATE ... SET`` column lists,
+``IN (...)`` batches) are declared as templates and filled with
+:meth:`Statement.render`.  Rendered text is kept in a bounded LRU so the same
+SQL string comes back for the same shape, which keeps ``sqlite3``'s
+per-connection prepared-statement cache (sized by ``cache_size`` as well)
+hitting instead of re-preparing.
+
+Counters are process-wide and are not locked: concurrent threads may
+undercount slightly, which is fine for diagnostics.
+
+``MUTANTS_SQLITE_TRACE`` attaches :func:`log_trace` to every state connection
+through ``sqlite3.Connection.set_trace_callback``; :func:`set_trace` and
+:func:`capture_trace` do the same from code.  With ``MUTANTS_SQL_STATS`` set
+the counters are written to ``state/logs/sql_stats.json`` at most every
+:data:`PUBLISH_INTERVAL_S` seconds of turns and at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic, perf_counter, time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from mutants.env import get_sql_stats_path, sqlite_statement_config
+
+LOG = logging.getLogger(__name__)
+TRACE_LOG = logging.getLogger("mutants.sql.trace")
+
+__all__ = [
+    "CACHE_SIZE",
+    "ITER_CHUNK",
+    "Statement",
+    "StatementStats",
+    "capture_trace",
+    "declare",
+    "declared",
+    "end_turn",
+    "execute",
+    "executemany",
+    "fetchall",
+    "fetchone",
+    "format_report",
+    "iterate",
+    "load_published",
+    "log_trace",
+    "publish",
+    "reset",
+    "set_trace",
+    "snapshot",
+    "top",
+    "trace_callback",
+]
+
+_CONFIG = sqlite_statement_config()
+CACHE_SIZE: int = _CONFIG["cache_size"]
+PUBLISH_INTERVAL_S = 5.0
+# Rows per ``fetchmany`` round trip for :func:`iterate`.
+ITER_CHUNK = 500
+
+TraceCallback = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class Statement:
+    """A named SQL statement (or template) issued by the state store."""
+
+    name: str
+    sql: str
+
+    def render(self, **parts: str) -> str:
+        """Return the template filled with *parts* (``str.format`` fields)."""
+
+        key = (self.name, tuple(sorted(parts.items())))
+        text = _RENDERED.get(key)
+        if text is not None:
+            _RENDERED.move_to_end(key)
+            return text
+        text = self.sql.format(**parts)
+        _RENDERED[key] = text
+        if len(_RENDERED) > CACHE_SIZE:
+            _RENDERED.popitem(last=False)
+        return text
+
+
+class StatementStats:
+    """Counters for one named statement."""
+
+    __slots__ = ("name", "calls", "rows", "total_ms", "max_ms")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+_DECLARED: Dict[str, Statement] = {}
+_RENDERED: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], str]" = OrderedDict()
+_STATS: Dict[str, StatementStats] = {}
+_TURNS = 0
+_LAST_PUBLISH = 0.0
+_TRACE: Optional[TraceCallback] = None
+
+
+def _normalize_sql(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def declare(name: str, sql: str) -> Statement:
+    """Register *sql* under *name* and return the :class:`Statement`.
+
+    Whitespace is collapsed so traces print one statement per line.
+    Re-declaring a name with different SQL raises :class:`ValueError`.
+    """
+
+    statement = Statement(name, _normalize_sql(sql))
+    existing = _DECLARED.get(name)
+    if existing is not None and existing != statement:
+        raise ValueError(f"statement {name!r} is already declared with different SQL")
+    _DECLARED[name] = statement
+    return statement
+
+
+def declared() -> Dict[str, str]:
+    """Return ``{name: sql}`` for every declared statement."""
+
+    return {name: stmt.sql for name, stmt in sorted(_DECLARED.items())}
+
+
+def _record(name: str, rows: int, started: float) -> None:
+    elapsed = (perf_counter() - started) * 1000.0
+    stats = _STATS.get(name)
+    if stats is None:
+        stats = _STATS.setdefault(name, StatementStats(name))
+    stats.calls += 1
+    stats.rows += rows
+    stats.total_ms += elapsed
+    if elapsed > stats.max_ms:
+        stats.max_ms = elapsed
+
+
+def execute(
+    conn: sqlite3.Connection,
+    stmt: Statement,
+    params: Sequence[Any] | Mapping[str, Any] = (),
+    *,
+    sql: Optional[str] = None,
+) -> sqlite3.Cursor:
+    """Run a write (or a query whose rows are not needed); rows = ``rowcount``.
+
+    *sql* is the rendered text for template statements.
+    """
+
+    started = perf_counter()
+    cur = conn.execute(sql or stmt.sql, params)
+    _record(stmt.name, max(cur.rowcount, 0), started)
+    return cur
+
+
+def executemany(
+    conn: sqlite3.Connection,
+    stmt: Statement,
+    seq_params: Iterable[Sequence[Any] | Mapping[str, Any]],
+    *,
+    sql: Optional[str] = None,
+) -> sqlite3.Cursor:
+    started = perf_counter()
+    cur = conn.executemany(sql or stmt.sql, seq_params)
+    _record(stmt.name, max(cur.rowcount, 0), started)
+    return cur
+
+
+def fetchall(
+    conn: sqlite3.Connection,
+    stmt: Statement,
+    params: Sequence[Any] | Mapping[str, Any] = (),
+    *,
+    sql: Optional[str] = None,
+) -> List[Any]:
+    started = perf_counter()
+    rows = conn.execute(sql or stmt.sql, params).fetchall()
+    _record(stmt.name, len(rows), started)
+    return rows
+
+
+def iterate(
+    conn: sqlite3.Connection,
+    stmt: Statement,
+    params: Sequence[Any] | Mapping[str, Any] = (),
+    *,
+    sql: Optional[str] = None,
+    chunk_size: int = ITER_CHUNK,
+) -> Iterator[Any]:
+    """Yield the rows of a query *chunk_size* at a time via ``fetchmany``.
+
+    At most one chunk is held in memory.  The call is counted when the
+    iterator is exhausted or closed, with the rows actually fetched and only
+    the time spent inside SQLite (not in the consumer between chunks).
+    """
+
+    started = perf_counter()
+    cur = conn.execute(sql or stmt.sql, params)
+    spent = perf_counter() - started
+    fetched = 0
+    try:
+        while True:
+            started = perf_counter()
+            rows = cur.fetchmany(max(1, chunk_size))
+            spent += perf_counter() - started
+            if not rows:
+                return
+            fetched += len(rows)
+            yield from rows
+    finally:
+        cur.close()
+        _record(stmt.name, fetched, perf_counter() - spent)
+
+
+def fetchone(
+    conn: sqlite3.Connection,
+    stmt: Statement,
+    params: Sequence[Any] | Mapping[str, Any] = (),
+    *,
+    sql: Optional[str] = None,
+) -> Any:
+    started = perf_counter()
+    row = conn.execute(sql or stmt.sql, params).fetchone()
+    _record(stmt.name, 0 if row is None else 1, started)
+    return row
+
+
+# Counters --------------------------------------------------------------
+
+
+def top(n: int = 10, *, key: str = "total_ms") -> List[StatementStats]:
+    """Return the *n* statements with the highest *key* (default: time)."""
+
+    ranked = sorted(_STATS.values(), key=lambda s: (getattr(s, key), s.name), reverse=True)
+    return ranked[: max(0, n)]
+
+
+def reset() -> None:
+    """Zero every counter (and the turn count)."""
+
+    global _TURNS
+    _STATS.clear()
+    _TURNS = 0
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return the counters as a JSON-friendly mapping, slowest first."""
+
+    return {
+        "generated_at": int(time()),
+        "pid": os.getpid(),
+        "turns": _TURNS,
+        "statements": [stats.as_dict() for stats in top(len(_STATS))],
+    }
+
+
+def format_report(data: Mapping[str, Any], n: int = 10) -> List[str]:
+    """Render a :func:`snapshot` (live or published) as report lines."""
+
+    statements = [s for s in data.get("statements") or () if isinstance(s, Mapping)]
+    statements.sort(key=lambda s: float(s.get("total_ms") or 0.0), reverse=True)
+    turns = int(data.get("turns") or 0)
+    calls = sum(int(s.get("calls") or 0) for s in statements)
+    total_ms = sum(float(s.get("total_ms") or 0.0) for s in statements)
+    header = f"SQL: {len(statements)} statements, {calls} calls, {total_ms:.1f}ms"
+    if turns:
+        header += f" over {turns} turns ({calls / turns:.1f} calls/turn, {total_ms / turns:.2f}ms/turn)"
+    lines = [header]
+    if not statements:
+        return lines
+    lines.append(f"{'statement':<32} {'calls':>8} {'rows':>9} {'total ms':>10} {'mean ms':>8} {'max ms':>8}")
+    for entry in statements[: max(0, n)]:
+        calls_n = int(entry.get("calls") or 0)
+        total = float(entry.get("total_ms") or 0.0)
+        lines.append(
+            f"{str(entry.get('name')):<32} {calls_n:>8} {int(entry.get('rows') or 0):>9} "
+            f"{total:>10.2f} {total / calls_n if calls_n else 0.0:>8.3f} "
+            f"{float(entry.get('max_ms') or 0.0):>8.3f}"
+        )
+    return lines
+
+
+def publish(path: Optional[Path] = None) -> Path:
+    """Write :func:`snapshot` to *path* (default: ``get_sql_stats_path()``)."""
+
+    global _LAST_PUBLISH
+    target = Path(path) if path is not None else get_sql_stats_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(snapshot(), indent=2), encoding="utf-8")
+    os.replace(tmp, target)
+    _LAST_PUBLISH = monotonic()
+    return target
+
+
+def load_published(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Read counters written by :func:`publish`; ``None`` if absent or invalid."""
+
+    target = Path(path) if path is not None else get_sql_stats_path()
+    try:
+        data = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def end_turn() -> None:
+    """Count a finished turn and publish the counters if enabled and due."""
+
+    global _TURNS
+    _TURNS += 1
+    if _CONFIG["publish"] and monotonic() - _LAST_PUBLISH >= PUBLISH_INTERVAL_S:
+        try:
+            publish()
+        except OSError:  # pragma: no cover - diagnostics must not break turns
+            LOG.exception("Failed to publish SQL statement counters")
+
+
+def _publish_at_exit() -> None:
+    if _CONFIG["publish"] and _STATS:
+        try:
+            publish()
+        except OSError:  # pragma: no cover - defensive
+            pass
+
+
+atexit.register(_publish_at_exit)
+
+
+# Tracing ---------------------------------------------------------------
+
+
+def log_trace(sql: str) -> None:
+    """Trace callback that logs every statement SQLite runs at DEBUG."""
+
+    TRACE_LOG.debug("%s", sql)
+
+
+def trace_callback() -> Optional[TraceCallback]:
+    """Return the callback new connections should trace with, if any."""
+
+    if _TRACE is not None:
+        return _TRACE
+    return log_trace if _CONFIG["trace"] else None
+
+
+def set_trace(callback: Optional[TraceCallback]) -> None:
+    """Attach *callback* to every open and future state connection.
+
+    ``None`` detaches it (falling back to :func:`log_trace` when
+    ``MUTANTS_SQLITE_TRACE`` is set).
+    """
+
+    global _TRACE
+    from mutants.registries import sqlite_store  # local import to avoid cycle
+
+    _TRACE = callback
+    active = trace_callback()
+    for conn in sqlite_store.open_connections():
+        conn.set_trace_callback(active)
+
+
+@contextlib.contextmanager
+def capture_trace() -> Iterator[List[str]]:
+    """Collect the SQL run on state connections inside the ``with`` block."""
+
+    previous = _TRACE
+    captured: List[str] = []
+    set_trace(captured.append)
+    try:
+        yield captured
+    finally:
+        set_trace(previous)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
+import hashlib
 import logging
 import os
 import sqlite3
 import json
+import threading
 from pathlib import Path
 from time import time
 from typing import (
@@ -12,6 +16,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     Optional,
@@ -20,13 +25,124 @@ from typing import (
 )
 
 from mutants.constants import DEFAULT_INNATE_ATTACK_LINE
-from mutants.env import get_state_database_path
+from mutants.env import (
+    get_change_feed_enabled,
+    get_sqlite_profile,
+    get_state_backend,
+    get_state_database_path,
+)
+from mutants.registries import sqlite_statements as stmts
 
 LOG = logging.getLogger(__name__)
 
 DEBUG_QUERY_PLAN = bool(os.getenv("MUTANTS_SQLITE_DEBUG_PLAN"))
 MONSTER_CACHE_DEBUG = bool(os.getenv("MUTANTS_MONSTER_CACHE_DEBUG"))
 
+# Ground batch fetches bind at most three parameters per tile; stay under
+# SQLite's historical 999 host-parameter limit.
+_GROUND_BATCH_TILES = 300
+
+# Set-based item moves bind up to three parameters per iid (IN list plus a
+# created_at stamp); same limit.
+_IID_BATCH = 300
+
+# Rows per fetch for the streaming ``iter_snapshot`` readers.
+_STREAM_CHUNK = stmts.ITER_CHUNK
+
+ItemsListener = Callable[[Optional[str], Optional[Tuple[int, int, int]]], None]
+_ITEMS_LISTENERS: list[ItemsListener] = []
+
+
+def add_items_listener(listener: ItemsListener) -> None:
+    """Call *listener* after every write to ``items_instances``.
+
+    The listener receives the affected iid and, when the write placed the item
+    somewhere, its new ``(year, x, y)``.  Bulk inserts report ``(None, None)``;
+    set-based moves and deletes report each affected iid.
+    """
+
+    if listener not in _ITEMS_LISTENERS:
+        _ITEMS_LISTENERS.append(listener)
+
+
+def remove_items_listener(listener: ItemsListener) -> None:
+    if listener in _ITEMS_LISTENERS:
+        _ITEMS_LISTENERS.remove(listener)
+
+
+def _notify_items(iid: Optional[str], pos: Optional[Tuple[int, int, int]] = None) -> None:
+    for listener in tuple(_ITEMS_LISTENERS):
+        try:
+            listener(iid, pos)
+        except Exception:  # pragma: no cover - defensive
+            LOG.exception("items listener failed")
+
+
+# Change feed ------------------------------------------------------------
+#
+# With the feed on, every instance-store write also appends one row per
+# affected record to ``changes`` inside the same transaction, so a reader
+# following ``seq`` never sees a change whose write rolled back.  Set-based
+# deletes are logged once, as op ``delete_where`` with the equality
+# predicate in ``fields`` (``{}``: the whole table).
+
+_CHANGE_FEED_OVERRIDE: Optional[bool] = None
+_CHANGE_TICK = 0
+
+ChangeEntry = Tuple[Optional[str], Optional[Mapping[str, Any]]]
+
+
+def change_feed_enabled() -> bool:
+    """Return whether writes are logged (:func:`set_change_feed` or env)."""
+
+    if _CHANGE_FEED_OVERRIDE is not None:
+        return _CHANGE_FEED_OVERRIDE
+    return get_change_feed_enabled()
+
+
+def set_change_feed(enabled: Optional[bool]) -> None:
+    """Turn the change feed on or off; ``None`` goes back to ``MUTANTS_CHANGE_FEED``."""
+
+    global _CHANGE_FEED_OVERRIDE
+    _CHANGE_FEED_OVERRIDE = None if enabled is None else bool(enabled)
+
+
+def set_change_tick(tick: int) -> None:
+    """Stamp subsequent change rows with game tick *tick*."""
+
+    global _CHANGE_TICK
+    _CHANGE_TICK = _coerce_int(tick)
+
+
+_CHANGES_APPEND = stmts.declare(
+    "changes.append",
+    "INSERT INTO changes (table_name, key, op, fields_json, tick) VALUES (?, ?, ?, ?, ?)",
+)
+
+
+def _log_changes(
+    conn: sqlite3.Connection, table: str, op: str, entries: Iterable[ChangeEntry]
+) -> None:
+    """Append ``(key, fields)`` *entries* to the feed inside the caller's transaction."""
+
+    if not change_feed_enabled():
+        return
+    rows = [
+        (
+            table,
+            key,
+            op,
+            None
+            if fields is None
+            else json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str),
+            _CHANGE_TICK,
+        )
+        for key, fields in entries
+    ]
+    if rows:
+        stmts.executemany(conn, _CHANGES_APPEND, rows)
+
+
 _CATALOG_REQUIRED_FIELDS = {
     "monster_id",
     "name",
@@ -76,8 +192,38 @@ def _coerce_int(value: Any, *, default: int = 0) -> int:
         return default
 
 
+_BEGIN_IMMEDIATE = stmts.declare("txn.begin_immediate", "BEGIN IMMEDIATE")
+
+
 def _begin_immediate(conn: sqlite3.Connection) -> None:
-    conn.execute("BEGIN IMMEDIATE")
+    stmts.execute(conn, _BEGIN_IMMEDIATE)
+
+
+def _render_stream(
+    stmt: stmts.Statement,
+    allowed: Sequence[str],
+    columns: Sequence[str],
+    where: Mapping[str, Any],
+) -> Tuple[str, list[Any]]:
+    """Fill a ``*.stream`` template with a projection and equality filters.
+
+    A filter value of ``None`` matches NULL.  Unknown columns raise
+    :class:`KeyError`.
+    """
+
+    for key in (*columns, *where):
+        if key not in allowed:
+            raise KeyError(key)
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, value in sorted(where.items()):
+        if value is None:
+            clauses.append(f"{key} IS NULL")
+        else:
+            clauses.append(f"{key} = ?")
+            params.append(value)
+    where_sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return stmt.render(columns=", ".join(columns), where=where_sql), params
 
 
 def _normalize_created_at(value: Any, *, default: Optional[int] = None) -> int:
@@ -105,6 +251,47 @@ def _debug_query_plan(
         LOG.info("QUERY PLAN %s :: %s", sql, detail)
 
 
+_ITEM_CATALOG_UPSERT = stmts.declare(
+    "items_catalog.upsert",
+    """
+    INSERT INTO items_catalog (item_id, data_json)
+    VALUES (?, ?)
+    ON CONFLICT(item_id) DO UPDATE SET data_json = excluded.data_json
+    """,
+)
+_ITEM_CATALOG_GET = stmts.declare(
+    "items_catalog.get",
+    "SELECT data_json FROM items_catalog WHERE item_id = ?",
+)
+_ITEM_CATALOG_SPAWNABLE = stmts.declare(
+    "items_catalog.list_spawnable",
+    "SELECT item_id, data_json FROM items_catalog "
+    "WHERE json_extract(data_json, '$.spawnable') = 1",
+)
+_MONSTER_CATALOG_UPSERT = stmts.declare(
+    "monsters_catalog.upsert",
+    f"INSERT INTO monsters_catalog ({', '.join(_MONSTER_CATALOG_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in _MONSTER_CATALOG_COLUMNS)}) "
+    "ON CONFLICT(monster_id) DO UPDATE SET "
+    "name=excluded.name, level=excluded.level, hp_max=excluded.hp_max, "
+    "armour_class=excluded.armour_class, spawn_years=excluded.spawn_years, "
+    "spawnable=excluded.spawnable, taunt=excluded.taunt, "
+    "stats_json=excluded.stats_json, innate_attack_json=excluded.innate_attack_json, "
+    "exp_bonus=excluded.exp_bonus, ions_min=excluded.ions_min, ions_max=excluded.ions_max, "
+    "riblets_min=excluded.riblets_min, riblets_max=excluded.riblets_max, "
+    "spells_json=excluded.spells_json, starter_armour_json=excluded.starter_armour_json, "
+    "starter_items_json=excluded.starter_items_json, updated_at=CURRENT_TIMESTAMP",
+)
+_MONSTER_CATALOG_GET = stmts.declare(
+    "monsters_catalog.get",
+    f"SELECT {', '.join(_MONSTER_CATALOG_COLUMNS)} FROM monsters_catalog WHERE monster_id = ?",
+)
+_MONSTER_CATALOG_SPAWNABLE = stmts.declare(
+    "monsters_catalog.list_spawnable",
+    f"SELECT {', '.join(_MONSTER_CATALOG_COLUMNS)} FROM monsters_catalog WHERE spawnable = 1",
+)
+
+
 def _coerce_optional_int(value: Any) -> Optional[int]:
     if value is None:
         return None
@@ -311,11 +498,27 @@ def _decode_monster_row(row: sqlite3.Row) -> Optional[Dict[str, Any]]:
     return monster
 
 __all__ = [
+    "SQLiteChangeFeedStore",
     "SQLiteConnectionManager",
     "SQLiteItemsInstanceStore",
     "SQLiteMonstersInstanceStore",
+    "SQLiteOwnerAggregatesStore",
     "SQLiteRuntimeKVStore",
+    "PRAGMA_PROFILES",
+    "active_profile",
+    "apply_profile",
+    "bulk_import",
+    "change_feed_enabled",
+    "close_all",
+    "connection_stats",
     "get_stores",
+    "open_connections",
+    "restore_database",
+    "set_change_feed",
+    "set_change_tick",
+    "set_profile",
+    "set_wal_autocheckpoint",
+    "snapshot_database",
 ]
 
 if TYPE_CHECKING:
@@ -327,38 +530,311 @@ def _resolve_db_path(db_path: Optional[os.PathLike[str] | str]) -> Path:
     return get_state_database_path()
 
 
+# Per-connection PRAGMAs by profile.  ``journal_mode=WAL`` and
+# ``busy_timeout`` are set on every connection regardless of profile.
+# Negative ``cache_size`` is in KiB.
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Play: WAL-safe NORMAL sync, page cache and mmap sized for the world.
+    "interactive": {
+        "synchronous": "NORMAL",
+        "cache_size": -16384,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1000,
+    },
+    # Offline imports: no fsync, big cache, rare checkpoints.  A crash
+    # mid-import can lose the import, never corrupt earlier commits in WAL.
+    "bulk-import": {
+        "synchronous": "OFF",
+        "cache_size": -131072,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 10000,
+    },
+    # Every commit fsynced, for hosts where losing the last turns matters.
+    "durable": {
+        "synchronous": "FULL",
+        "cache_size": -16384,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1000,
+    },
+}
+
+_PROFILE_OVERRIDE: Optional[str] = None
+_AUTOCHECKPOINT_OVERRIDE: Optional[int] = None
+
+
+def active_profile() -> str:
+    """Return the profile new connections use (:func:`set_profile` or env)."""
+
+    return _PROFILE_OVERRIDE if _PROFILE_OVERRIDE is not None else get_sqlite_profile()
+
+
+def apply_profile(conn: sqlite3.Connection, name: Optional[str] = None) -> None:
+    """Set the PRAGMAs of profile *name* (default: :func:`active_profile`)."""
+
+    profile = PRAGMA_PROFILES[name or active_profile()]
+    for pragma, value in profile.items():
+        if pragma == "wal_autocheckpoint" and _AUTOCHECKPOINT_OVERRIDE is not None:
+            value = _AUTOCHECKPOINT_OVERRIDE
+        conn.execute(f"PRAGMA {pragma}={value}")
+
+
+def set_profile(name: Optional[str]) -> None:
+    """Switch every open and future state connection to profile *name*.
+
+    ``None`` goes back to ``MUTANTS_SQLITE_PROFILE``.
+    """
+
+    global _PROFILE_OVERRIDE
+    if name is not None and name not in PRAGMA_PROFILES:
+        raise ValueError(f"unknown SQLite profile {name!r}")
+    _PROFILE_OVERRIDE = name
+    active = active_profile()
+    for conn in open_connections():
+        try:
+            apply_profile(conn, active)
+        except sqlite3.Error:  # pragma: no cover - defensive
+            LOG.exception("Failed to apply SQLite profile %s", active)
+
+
+def set_wal_autocheckpoint(pages: Optional[int]) -> None:
+    """Override ``wal_autocheckpoint`` on every open and future connection.
+
+    ``0`` stops commits from checkpointing (the idle maintenance thread does
+    it instead); ``None`` goes back to the profile's value.
+    """
+
+    global _AUTOCHECKPOINT_OVERRIDE
+    _AUTOCHECKPOINT_OVERRIDE = None if pages is None else max(0, int(pages))
+    active = active_profile()
+    for conn in open_connections():
+        try:
+            apply_profile(conn, active)
+        except sqlite3.Error:  # pragma: no cover - defensive
+            LOG.exception("Failed to apply wal_autocheckpoint override")
+
+
+@contextlib.contextmanager
+def bulk_import(conn: sqlite3.Connection, tables: Iterable[str] = ()) -> Iterator[sqlite3.Connection]:
+    """Run a bulk load on *conn* under the ``bulk-import`` profile.
+
+    Non-unique indexes on *tables* are dropped for the duration of the block
+    and rebuilt once at the end (also when the block raises), which is
+    cheaper than maintaining them row by row.  Unique indexes stay, since
+    upserts resolve conflicts through them.
+    """
+
+    names = tuple(tables)
+    deferred: list[tuple[str, str]] = []
+    if names:
+        marks = ", ".join("?" for _ in names)
+        deferred = [
+            (row[0], row[1])
+            for row in conn.execute(
+                f"SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                f"AND tbl_name IN ({marks}) AND sql IS NOT NULL",
+                names,
+            ).fetchall()
+            if not row[1].lstrip().upper().startswith("CREATE UNIQUE")
+        ]
+    previous = _PROFILE_OVERRIDE
+    set_profile("bulk-import")
+    try:
+        if deferred:
+            with conn:
+                _begin_immediate(conn)
+                for name, _sql in deferred:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+        yield conn
+    finally:
+        try:
+            if deferred:
+                with conn:
+                    _begin_immediate(conn)
+                    for _name, sql in deferred:
+                        conn.execute(sql)
+        finally:
+            set_profile(previous)
+
+
+class _ConnectionRegistry:
+    """Process-wide SQLite connections keyed by database path and thread.
+
+    Each thread gets its own connection per database file (``sqlite3``
+    connections must not be shared between threads), configured once when it
+    is opened.  The schema check and migrations run once per path for the
+    life of the process, not once per connection.  :func:`close_all` closes
+    everything and forgets which paths were verified.
+
+    In-memory databases (``MUTANTS_STATE_BACKEND=sqlite-memory``) are
+    shared-cache ``:memory:`` databases that live while any registry
+    connection to them is open, so :func:`close_all` discards them.
+    """
+
+    __slots__ = ("_lock", "_connections", "_verified", "opened", "schema_checks")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: Dict[Tuple[str, int], sqlite3.Connection] = {}
+        self._verified: set[str] = set()
+        self.opened = 0
+        self.schema_checks = 0
+
+    def acquire(self, manager: "SQLiteConnectionManager") -> sqlite3.Connection:
+        key = (manager._key, threading.get_ident())
+        conn = self._connections.get(key)
+        if conn is not None:
+            return conn
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is not None:
+                return conn
+            if manager.in_memory:
+                target: str | Path = manager.uri
+            else:
+                target = manager.path
+                target.parent.mkdir(parents=True, exist_ok=True)
+            # Connections never cross threads; this only lets close_all()
+            # close them from whichever thread shuts the process down.
+            conn = sqlite3.connect(
+                target,
+                check_same_thread=False,
+                cached_statements=stmts.CACHE_SIZE,
+                uri=manager.in_memory,
+            )
+            try:
+                manager._configure_connection(conn)
+                trace = stmts.trace_callback()
+                if trace is not None:
+                    conn.set_trace_callback(trace)
+                if manager._key not in self._verified:
+                    self.schema_checks += 1
+                    manager._ensure_schema(conn)
+                    self._verified.add(manager._key)
+            except Exception:
+                conn.close()
+                raise
+            self._connections[key] = conn
+            self.opened += 1
+            return conn
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._verified.clear()
+        for conn in connections:
+            try:
+                # Let SQLite refresh the statistics the session's queries
+                # would have used; cheap when nothing changed.
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                LOG.debug("PRAGMA optimize failed on close", exc_info=True)
+            try:
+                conn.close()
+            except sqlite3.Error:  # pragma: no cover - defensive
+                LOG.exception("Failed to close SQLite connection")
+
+    def connections(self) -> list[sqlite3.Connection]:
+        with self._lock:
+            return list(self._connections.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "open": len(self._connections),
+            "opened": self.opened,
+            "schema_checks": self.schema_checks,
+        }
+
+
+_REGISTRY = _ConnectionRegistry()
+_STORES: Dict[str, "StateStores"] = {}
+
+
+def close_all() -> None:
+    """Close every registry connection (at exit, and between tests).
+
+    Each connection runs ``PRAGMA optimize`` first.
+    """
+
+    _STORES.clear()
+    _REGISTRY.close_all()
+
+
+def connection_stats() -> Dict[str, int]:
+    """Return open/opened connection and schema-check counters."""
+
+    return _REGISTRY.stats()
+
+
+def open_connections() -> list[sqlite3.Connection]:
+    """Return every open registry connection (all threads)."""
+
+    return _REGISTRY.connections()
+
+
+atexit.register(close_all)
+
+
 class SQLiteConnectionManager:
-    """Create SQLite connections with project defaults applied."""
+    """Hand out the registry connection for a database path.
+
+    Managers are cheap handles: every manager for the same path shares the
+    calling thread's connection from the process-wide registry, and the
+    schema is verified once per path.
+
+    With ``in_memory`` (by default when ``MUTANTS_STATE_BACKEND`` is
+    ``sqlite-memory``) the path only names a shared-cache in-memory database;
+    nothing is written to disk.
+    """
 
-    __slots__ = ("_db_path", "_connection")
+    __slots__ = ("_db_path", "_key", "_in_memory")
 
-    def __init__(self, db_path: Optional[os.PathLike[str] | str] = None) -> None:
+    def __init__(
+        self,
+        db_path: Optional[os.PathLike[str] | str] = None,
+        *,
+        in_memory: Optional[bool] = None,
+    ) -> None:
         self._db_path = _resolve_db_path(db_path)
-        self._connection: Optional[sqlite3.Connection] = None
+        if in_memory is None:
+            in_memory = get_state_backend() == "sqlite-memory"
+        self._in_memory = bool(in_memory)
+        resolved = str(self._db_path.resolve())
+        self._key = f"memory:{resolved}" if self._in_memory else resolved
 
     @property
     def path(self) -> Path:
         return self._db_path
 
+    @property
+    def in_memory(self) -> bool:
+        return self._in_memory
+
+    @property
+    def uri(self) -> str:
+        """SQLite URI of the in-memory database standing in for :attr:`path`."""
+
+        digest = hashlib.sha1(self._key.encode("utf-8")).hexdigest()[:16]
+        return f"file:mutants-{digest}?mode=memory&cache=shared"
+
     def connect(self) -> sqlite3.Connection:
-        if self._connection is None:
-            self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(self._db_path)
-            self._configure_connection(conn)
-            self._ensure_schema(conn)
-            self._connection = conn
-        return self._connection
+        return _REGISTRY.acquire(self)
 
     def close(self) -> None:
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Release the manager; the shared connection stays open.
+
+        Use :func:`close_all` to actually close registry connections.
+        """
+        return None
 
     def _configure_connection(self, conn: sqlite3.Connection) -> None:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA busy_timeout=5000")
+        apply_profile(conn)
 
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         with conn:
@@ -385,6 +861,8 @@ class SQLiteConnectionManager:
                 (5, self._migrate_to_v5),
                 (6, self._migrate_to_v6),
                 (7, self._migrate_to_v7),
+                (8, self._migrate_to_v8),
+                (9, self._migrate_to_v9),
             )
 
             for target_version, migration in migrations:
@@ -400,22 +878,11 @@ class SQLiteConnectionManager:
         conn = self.connect()
         with conn:
             _begin_immediate(conn)
-            conn.execute(
-                """
-                INSERT INTO items_catalog (item_id, data_json)
-                VALUES (?, ?)
-                ON CONFLICT(item_id) DO UPDATE SET data_json = excluded.data_json
-                """,
-                (str(item_id), str(data_json)),
-            )
+            stmts.execute(conn, _ITEM_CATALOG_UPSERT, (str(item_id), str(data_json)))
 
     def get_item_catalog(self, item_id: str) -> Optional[Dict[str, Any]]:
         conn = self.connect()
-        cur = conn.execute(
-            "SELECT data_json FROM items_catalog WHERE item_id = ?",
-            (str(item_id),),
-        )
-        row = cur.fetchone()
+        row = stmts.fetchone(conn, _ITEM_CATALOG_GET, (str(item_id),))
         if row is None:
             return None
         raw = row["data_json"]
@@ -434,14 +901,9 @@ class SQLiteConnectionManager:
 
     def list_spawnable_items(self) -> Iterable[Dict[str, Any]]:
         conn = self.connect()
-        sql = (
-            "SELECT item_id, data_json FROM items_catalog "
-            "WHERE json_extract(data_json, '$.spawnable') = 1"
-        )
-        _debug_query_plan(conn, sql, tuple())
-        cur = conn.execute(sql)
+        _debug_query_plan(conn, _ITEM_CATALOG_SPAWNABLE.sql, tuple())
         results: list[Dict[str, Any]] = []
-        for row in cur.fetchall():
+        for row in stmts.fetchall(conn, _ITEM_CATALOG_SPAWNABLE):
             raw = row["data_json"]
             if not isinstance(raw, str):
                 continue
@@ -467,41 +929,13 @@ class SQLiteConnectionManager:
         normalized = _normalize_monster_catalog_entry(record)
 
         conn = self.connect()
-        columns = (
-            "monster_id, name, level, hp_max, armour_class, spawn_years, spawnable, "
-            "taunt, stats_json, innate_attack_json, exp_bonus, ions_min, ions_max, "
-            "riblets_min, riblets_max, spells_json, starter_armour_json, starter_items_json"
-        )
-        placeholders = (
-            ":monster_id, :name, :level, :hp_max, :armour_class, :spawn_years, :spawnable, "
-            ":taunt, :stats_json, :innate_attack_json, :exp_bonus, :ions_min, :ions_max, "
-            ":riblets_min, :riblets_max, :spells_json, :starter_armour_json, :starter_items_json"
-        )
-        sql = (
-            f"INSERT INTO monsters_catalog ({columns}) VALUES ({placeholders}) "
-            "ON CONFLICT(monster_id) DO UPDATE SET "
-            "name=excluded.name, level=excluded.level, hp_max=excluded.hp_max, "
-            "armour_class=excluded.armour_class, spawn_years=excluded.spawn_years, "
-            "spawnable=excluded.spawnable, taunt=excluded.taunt, "
-            "stats_json=excluded.stats_json, innate_attack_json=excluded.innate_attack_json, "
-            "exp_bonus=excluded.exp_bonus, ions_min=excluded.ions_min, ions_max=excluded.ions_max, "
-            "riblets_min=excluded.riblets_min, riblets_max=excluded.riblets_max, "
-            "spells_json=excluded.spells_json, starter_armour_json=excluded.starter_armour_json, "
-            "starter_items_json=excluded.starter_items_json, updated_at=CURRENT_TIMESTAMP"
-        )
-
         with conn:
             _begin_immediate(conn)
-            conn.execute(sql, normalized)
+            stmts.execute(conn, _MONSTER_CATALOG_UPSERT, normalized)
 
     def get_monster_catalog(self, monster_id: str) -> Optional[Dict[str, Any]]:
         conn = self.connect()
-        columns = ", ".join(_MONSTER_CATALOG_COLUMNS)
-        cur = conn.execute(
-            f"SELECT {columns} FROM monsters_catalog WHERE monster_id = ?",
-            (str(monster_id),),
-        )
-        row = cur.fetchone()
+        row = stmts.fetchone(conn, _MONSTER_CATALOG_GET, (str(monster_id),))
         if row is None:
             return None
         monster = _decode_monster_row(row)
@@ -512,12 +946,9 @@ class SQLiteConnectionManager:
 
     def list_spawnable_monsters(self) -> Iterable[Dict[str, Any]]:
         conn = self.connect()
-        columns = ", ".join(_MONSTER_CATALOG_COLUMNS)
-        sql = f"SELECT {columns} FROM monsters_catalog WHERE spawnable = 1"
-        _debug_query_plan(conn, sql, tuple())
-        cur = conn.execute(sql)
+        _debug_query_plan(conn, _MONSTER_CATALOG_SPAWNABLE.sql, tuple())
         results: list[Dict[str, Any]] = []
-        for row in cur.fetchall():
+        for row in stmts.fetchall(conn, _MONSTER_CATALOG_SPAWNABLE):
             monster = _decode_monster_row(row)
             if monster is None:
                 continue
@@ -803,6 +1234,36 @@ class SQLiteConnectionManager:
             if column not in existing:
                 conn.execute(f"ALTER TABLE items_instances ADD COLUMN {column} TEXT")
 
+    def _migrate_to_v8(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS owner_aggregates (
+                owner TEXT PRIMARY KEY,
+                total_weight INTEGER NOT NULL DEFAULT 0,
+                item_count INTEGER NOT NULL DEFAULT 0,
+                armour_class INTEGER NOT NULL DEFAULT 0,
+                updated_at INTEGER NOT NULL CHECK(updated_at >= 0)
+            )
+            """
+        )
+
+
+    def _migrate_to_v9(self, conn: sqlite3.Connection) -> None:
+        # AUTOINCREMENT: seq is never reused after compaction, so follower
+        # cursors stay valid.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                key TEXT,
+                op TEXT NOT NULL,
+                fields_json TEXT,
+                tick INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+
 
 class SQLiteItemsInstanceStore:
     """SQLite-backed implementation of :class:`ItemsInstanceStore`."""
@@ -826,6 +1287,64 @@ class SQLiteItemsInstanceStore:
         "created_at",
     )
 
+    _SELECT = f"SELECT {', '.join(_COLUMNS)} FROM items_instances"
+    _ORDER = "ORDER BY created_at ASC, iid ASC"
+    _SNAPSHOT = stmts.declare("items.snapshot", f"{_SELECT} {_ORDER}")
+    # {columns}: projection; {where}: "" or " WHERE column = ? AND ...".
+    # Rowid order needs no sort, so SQLite never buffers the result.
+    _STREAM = stmts.declare(
+        "items.stream", "SELECT {columns} FROM items_instances{where} ORDER BY rowid"
+    )
+    _GET = stmts.declare("items.get_by_iid", f"{_SELECT} WHERE iid = ?")
+    _LIST_AT = stmts.declare(
+        "items.list_at", f"{_SELECT} WHERE year = ? AND x = ? AND y = ? {_ORDER}"
+    )
+    # {clauses}: "(year = ? AND x = ? AND y IN (?, ...)) OR ..."
+    _LIST_AT_MANY = stmts.declare("items.list_at_many", f"{_SELECT} WHERE {{clauses}}")
+    _LIST_BY_OWNER = stmts.declare("items.list_by_owner", f"{_SELECT} WHERE owner = ? {_ORDER}")
+    _INSERT = stmts.declare(
+        "items.insert",
+        f"INSERT INTO items_instances ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+    )
+    # {assignments}: "column = ?, ..."
+    _UPDATE = stmts.declare("items.update_fields", "UPDATE items_instances SET {assignments} WHERE iid = ?")
+    _DELETE = stmts.declare("items.delete", "DELETE FROM items_instances WHERE iid = ?")
+    _DELETE_BY_ORIGIN = stmts.declare(
+        "items.delete_by_origin", "DELETE FROM items_instances WHERE origin = ?"
+    )
+    _DELETE_ALL = stmts.declare("items.delete_all", "DELETE FROM items_instances")
+    # Set-based ownership changes.  LIMIT is the room left on the target tile
+    # under a cap bound as the first parameter; a NULL cap makes it -1 (no
+    # limit).  RETURNING reports the rows each statement touched.
+    _TILE_ROOM = (
+        "coalesce(max(0, ? - (SELECT COUNT(*) FROM items_instances"
+        " WHERE year = ? AND x = ? AND y = ?)), -1)"
+    )
+    # {stamps}: "" or ", created_at = CASE iid WHEN ? THEN ? ... ELSE created_at END";
+    # {placeholders}: "?, ...".  Rows already on the tile are left alone.
+    _MOVE_MANY = stmts.declare(
+        "items.move_many",
+        "UPDATE items_instances SET owner = NULL, year = ?, x = ?, y = ?{stamps} "
+        "WHERE iid IN (SELECT iid FROM items_instances WHERE iid IN ({placeholders}) "
+        f"AND (year != ? OR x != ? OR y != ?) ORDER BY iid LIMIT {_TILE_ROOM}) "
+        "RETURNING iid",
+    )
+    # {placeholders}: "?, ..."
+    _DELETE_MANY = stmts.declare(
+        "items.delete_many",
+        "DELETE FROM items_instances WHERE iid IN ({placeholders}) RETURNING iid",
+    )
+    # {placeholders}: "?, ..."
+    _DELETE_OFF_TILE = stmts.declare(
+        "items.delete_off_tile",
+        "DELETE FROM items_instances WHERE iid IN ({placeholders}) "
+        "AND (year != ? OR x != ? OR y != ?) RETURNING iid",
+    )
+    _DELETE_BY_OWNER = stmts.declare(
+        "items.delete_by_owner", "DELETE FROM items_instances WHERE owner = ? RETURNING iid"
+    )
+
     def __init__(self, manager: SQLiteConnectionManager) -> None:
         self._manager = manager
 
@@ -837,11 +1356,29 @@ class SQLiteItemsInstanceStore:
 
     def snapshot(self) -> Iterable[Dict[str, Any]]:
         conn = self._connection()
-        columns = ", ".join(self._COLUMNS)
-        cur = conn.execute(
-            f"SELECT {columns} FROM items_instances ORDER BY created_at ASC, iid ASC"
+        return [self._row_to_dict(row) for row in stmts.fetchall(conn, self._SNAPSHOT)]
+
+    def iter_snapshot(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        *,
+        chunk_size: int = _STREAM_CHUNK,
+        **where: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream rows as dicts of *columns* (default: every column).
+
+        Keyword arguments filter by equality in SQL (``owner=None`` selects
+        ground items).  Only one chunk of *chunk_size* rows is in memory at a
+        time.  Rows come in insertion (rowid) order, not the ``created_at``
+        order of :meth:`snapshot`.
+        """
+
+        selected = tuple(columns) if columns else tuple(self._COLUMNS)
+        sql, params = _render_stream(self._STREAM, self._COLUMNS, selected, where)
+        rows = stmts.iterate(
+            self._connection(), self._STREAM, params, sql=sql, chunk_size=chunk_size
         )
-        return [self._row_to_dict(row) for row in cur.fetchall()]
+        return (dict(zip(selected, row)) for row in rows)
 
     def replace_all(self, records: Iterable[Dict[str, Any]]) -> None:
         if not os.getenv("MUTANTS_ALLOW_REPLACE_ALL"):
@@ -863,15 +1400,15 @@ class SQLiteItemsInstanceStore:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.execute("DELETE FROM items_instances")
+            stmts.execute(conn, self._DELETE_ALL)
+            _log_changes(conn, "items_instances", "delete_where", [(None, {})])
             if payloads:
-                columns = ", ".join(self._COLUMNS)
-                placeholders = ", ".join("?" for _ in self._COLUMNS)
                 values = [tuple(payload[col] for col in self._COLUMNS) for payload in payloads]
-                conn.executemany(
-                    f"INSERT INTO items_instances ({columns}) VALUES ({placeholders})",
-                    values,
+                stmts.executemany(conn, self._INSERT, values)
+                _log_changes(
+                    conn, "items_instances", "insert", [(p["iid"], p) for p in payloads]
                 )
+        _notify_items(None)
 
     def bulk_insert(self, records: Iterable[Dict[str, Any]]) -> None:
         payloads: list[Dict[str, Any]] = []
@@ -891,17 +1428,14 @@ class SQLiteItemsInstanceStore:
         if not payloads:
             return
 
-        columns = ", ".join(self._COLUMNS)
-        placeholders = ", ".join("?" for _ in self._COLUMNS)
         values = [tuple(payload[col] for col in self._COLUMNS) for payload in payloads]
 
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.executemany(
-                f"INSERT INTO items_instances ({columns}) VALUES ({placeholders})",
-                values,
-            )
+            stmts.executemany(conn, self._INSERT, values)
+            _log_changes(conn, "items_instances", "insert", [(p["iid"], p) for p in payloads])
+        _notify_items(None)
 
     def bulk_insert_items(self, records: Iterable[Dict[str, Any]]) -> None:
         self.bulk_insert(records)
@@ -938,38 +1472,63 @@ class SQLiteItemsInstanceStore:
 
     def get_by_iid(self, iid: str) -> Optional[Dict[str, Any]]:
         conn = self._connection()
-        columns = ", ".join(self._COLUMNS)
-        cur = conn.execute(
-            f"SELECT {columns} FROM items_instances WHERE iid = ?",
-            (str(iid),),
-        )
-        row = cur.fetchone()
+        row = stmts.fetchone(conn, self._GET, (str(iid),))
         if row is None:
             return None
         return self._row_to_dict(row)
 
     def list_at(self, year: int, x: int, y: int) -> Iterable[Dict[str, Any]]:
         conn = self._connection()
-        columns = ", ".join(self._COLUMNS)
-        sql = (
-            f"SELECT {columns} FROM items_instances WHERE year = ? AND x = ? AND y = ? "
-            "ORDER BY created_at ASC, iid ASC"
-        )
         params: Tuple[int, int, int] = (year, x, y)
-        _debug_query_plan(conn, sql, params)
-        cur = conn.execute(sql, params)
-        return [self._row_to_dict(row) for row in cur.fetchall()]
+        _debug_query_plan(conn, self._LIST_AT.sql, params)
+        return [self._row_to_dict(row) for row in stmts.fetchall(conn, self._LIST_AT, params)]
+
+    def list_at_many(
+        self, positions: Iterable[Tuple[int, int, int]]
+    ) -> Dict[Tuple[int, int, int], list[Dict[str, Any]]]:
+        """Return the rows on each of *positions* using batched queries.
+
+        Tiles are grouped by ``(year, x)`` and each batch ORs one
+        ``year = ? AND x = ? AND y IN (...)`` term per group, which SQLite
+        runs as a multi-index OR of exact ``items_at_idx`` seeks.  (Separate
+        ``IN`` lists per axis fetched the whole cross product of the axes.)
+        Every requested tile is present in the result, its rows in
+        ``created_at, iid`` order like :meth:`list_at`.
+        """
+
+        wanted: Dict[Tuple[int, int, int], list[Dict[str, Any]]] = {}
+        for pos in positions:
+            wanted.setdefault((int(pos[0]), int(pos[1]), int(pos[2])), [])
+        if not wanted:
+            return wanted
+        conn = self._connection()
+        tiles = list(wanted)
+        for start in range(0, len(tiles), _GROUND_BATCH_TILES):
+            groups: Dict[Tuple[int, int], list[int]] = {}
+            for year, x, y in sorted(tiles[start : start + _GROUND_BATCH_TILES]):
+                groups.setdefault((year, x), []).append(y)
+            clauses = " OR ".join(
+                f"(year = ? AND x = ? AND y IN ({', '.join('?' for _ in ys)}))"
+                for ys in groups.values()
+            )
+            sql = self._LIST_AT_MANY.render(clauses=clauses)
+            params = tuple(
+                value for (year, x), ys in groups.items() for value in (year, x, *ys)
+            )
+            _debug_query_plan(conn, sql, params)
+            for row in stmts.fetchall(conn, self._LIST_AT_MANY, params, sql=sql):
+                wanted[(row["year"], row["x"], row["y"])].append(self._row_to_dict(row))
+        for rows in wanted.values():
+            rows.sort(key=lambda row: (row["created_at"], row["iid"]))
+        return wanted
 
     def list_by_owner(self, owner: str) -> Iterable[Dict[str, Any]]:
         conn = self._connection()
-        columns = ", ".join(self._COLUMNS)
-        sql = (
-            f"SELECT {columns} FROM items_instances WHERE owner = ? ORDER BY created_at ASC, iid ASC"
-        )
         params = (str(owner),)
-        _debug_query_plan(conn, sql, params)
-        cur = conn.execute(sql, params)
-        return [self._row_to_dict(row) for row in cur.fetchall()]
+        _debug_query_plan(conn, self._LIST_BY_OWNER.sql, params)
+        return [
+            self._row_to_dict(row) for row in stmts.fetchall(conn, self._LIST_BY_OWNER, params)
+        ]
 
     def mint(self, rec: Dict[str, Any]) -> None:
         payload = {key: rec.get(key) for key in self._COLUMNS}
@@ -994,20 +1553,17 @@ class SQLiteItemsInstanceStore:
             payload["owner"] = str(payload["owner"])
         payload["charges"] = _coerce_int(payload.get("charges"))
 
-        columns = ", ".join(self._COLUMNS)
-        placeholders = ", ".join("?" for _ in self._COLUMNS)
         values = tuple(payload[key] for key in self._COLUMNS)
 
         conn = self._connection()
         try:
             with conn:
                 _begin_immediate(conn)
-                conn.execute(
-                    f"INSERT INTO items_instances ({columns}) VALUES ({placeholders})",
-                    values,
-                )
+                stmts.execute(conn, self._INSERT, values)
+                _log_changes(conn, "items_instances", "insert", [(payload["iid"], payload)])
         except sqlite3.IntegrityError as exc:  # duplicate iid or other constraint failure
             raise KeyError(str(iid)) from exc
+        _notify_items(payload["iid"], (payload["year"], payload["x"], payload["y"]))
 
     def move(self, iid: str, *, year: int, x: int, y: int) -> None:
         self.update_fields(str(iid), year=year, x=x, y=y)
@@ -1024,6 +1580,7 @@ class SQLiteItemsInstanceStore:
             fields["y"] = -1
         updates = []
         values: list[Any] = []
+        changed: Dict[str, Any] = {}
         for key, value in fields.items():
             if key not in self._COLUMNS or key == "iid":
                 raise KeyError(key)
@@ -1035,45 +1592,220 @@ class SQLiteItemsInstanceStore:
                 value = str(value)
             updates.append(f"{key} = ?")
             values.append(value)
+            changed[key] = value
         values.append(str(iid))
 
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            cur = conn.execute(
-                f"UPDATE items_instances SET {', '.join(updates)} WHERE iid = ?",
+            cur = stmts.execute(
+                conn,
+                self._UPDATE,
                 values,
+                sql=self._UPDATE.render(assignments=", ".join(updates)),
             )
             if cur.rowcount == 0:
                 raise KeyError(str(iid))
+            _log_changes(conn, "items_instances", "update", [(str(iid), changed)])
+        pos = None
+        if {"year", "x", "y"}.issubset(fields):
+            pos = (_coerce_int(fields["year"]), _coerce_int(fields["x"]), _coerce_int(fields["y"]))
+        _notify_items(str(iid), pos)
 
     def delete(self, iid: str) -> None:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            cur = conn.execute(
-                "DELETE FROM items_instances WHERE iid = ?",
-                (str(iid),),
-            )
+            cur = stmts.execute(conn, self._DELETE, (str(iid),))
             if cur.rowcount == 0:
                 raise KeyError(str(iid))
+            _log_changes(conn, "items_instances", "delete", [(str(iid), None)])
+        _notify_items(str(iid))
 
     def delete_by_origin(self, origin: str) -> None:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.execute(
-                "DELETE FROM items_instances WHERE origin = ?",
-                (str(origin),),
-            )
+            cur = stmts.execute(conn, self._DELETE_BY_ORIGIN, (str(origin),))
+            if cur.rowcount:
+                _log_changes(
+                    conn, "items_instances", "delete_where", [(None, {"origin": str(origin)})]
+                )
+        _notify_items(None)
 
     def delete_items_by_origin(self, origin: str) -> None:
         self.delete_by_origin(origin)
 
+    def _move_rows(
+        self,
+        conn: sqlite3.Connection,
+        wanted: Sequence[str],
+        pos: Tuple[int, int, int],
+        cap: Optional[int],
+        stamps: Mapping[str, Any],
+    ) -> set[str]:
+        year, x, y = pos
+        moved: set[str] = set()
+        for start in range(0, len(wanted), _IID_BATCH):
+            batch = wanted[start : start + _IID_BATCH]
+            stamped = [iid for iid in batch if iid in stamps]
+            stamp_sql = ""
+            if stamped:
+                whens = " ".join("WHEN ? THEN ?" for _ in stamped)
+                stamp_sql = f", created_at = CASE iid {whens} ELSE created_at END"
+            params: list[Any] = [year, x, y]
+            for iid in stamped:
+                params.extend((iid, stamps[iid]))
+            params.extend(batch)
+            params.extend((year, x, y, cap, year, x, y))
+            sql = self._MOVE_MANY.render(
+                stamps=stamp_sql, placeholders=", ".join("?" for _ in batch)
+            )
+            rows = stmts.fetchall(conn, self._MOVE_MANY, params, sql=sql)
+            moved.update(row[0] for row in rows)
+        return moved
+
+    def _delete_rows(
+        self,
+        conn: sqlite3.Connection,
+        statement: stmts.Statement,
+        wanted: Sequence[str],
+        extra: Sequence[Any] = (),
+    ) -> set[str]:
+        deleted: set[str] = set()
+        for start in range(0, len(wanted), _IID_BATCH):
+            batch = wanted[start : start + _IID_BATCH]
+            sql = statement.render(placeholders=", ".join("?" for _ in batch))
+            rows = stmts.fetchall(conn, statement, [*batch, *extra], sql=sql)
+            deleted.update(row[0] for row in rows)
+        return deleted
+
+    def move_many(
+        self,
+        iids: Iterable[str],
+        pos: Tuple[int, int, int],
+        *,
+        cap: Optional[int] = None,
+        created_at: Optional[Mapping[str, Any]] = None,
+    ) -> list[str]:
+        """Put *iids* on the ground at *pos* in one transaction.
+
+        With *cap*, only as many rows move as the tile has room for (counted
+        in SQL, lowest iid first).  *created_at* optionally maps iids to new
+        ``created_at`` values so the moved rows list in a chosen order.
+        Returns the iids that moved, in the order given; missing iids and
+        rows already on the tile are skipped.
+        """
+
+        wanted = list(dict.fromkeys(str(iid) for iid in iids if iid))
+        if not wanted:
+            return []
+        year, x, y = (_coerce_int(pos[0]), _coerce_int(pos[1]), _coerce_int(pos[2]))
+        stamps = {
+            str(iid): _normalize_created_at(value) for iid, value in (created_at or {}).items()
+        }
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            moved = self._move_rows(conn, wanted, (year, x, y), cap, stamps)
+            result = [iid for iid in wanted if iid in moved]
+            entries = []
+            for iid in result:
+                fields: Dict[str, Any] = {"owner": None, "year": year, "x": x, "y": y}
+                if iid in stamps:
+                    fields["created_at"] = stamps[iid]
+                entries.append((iid, fields))
+            _log_changes(conn, "items_instances", "update", entries)
+        for iid in result:
+            _notify_items(iid, (year, x, y))
+        return result
+
+    def delete_many(self, iids: Iterable[str]) -> list[str]:
+        """Delete *iids* in one transaction and return those that existed."""
+
+        wanted = list(dict.fromkeys(str(iid) for iid in iids if iid))
+        if not wanted:
+            return []
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            deleted = self._delete_rows(conn, self._DELETE_MANY, wanted)
+            result = [iid for iid in wanted if iid in deleted]
+            _log_changes(conn, "items_instances", "delete", [(iid, None) for iid in result])
+        for iid in result:
+            _notify_items(iid)
+        return result
+
+    def drop_or_delete(
+        self, groups: Iterable[Iterable[str]], pos: Tuple[int, int, int], cap: int
+    ) -> Tuple[list[str], list[str]]:
+        """Drop *groups* of iids at *pos* under *cap* and delete the rest.
+
+        Groups claim the room left on the tile in turn (lowest iid first
+        within a group), and whatever does not fit is deleted, all in one
+        transaction.  Rows already on the tile are neither moved nor deleted.
+        Returns ``(dropped, deleted)`` iids.
+        """
+
+        year, x, y = (_coerce_int(pos[0]), _coerce_int(pos[1]), _coerce_int(pos[2]))
+        cap = max(0, _coerce_int(cap))
+        seen: set[str] = set()
+        pending: list[list[str]] = []
+        for group in groups:
+            wanted = [iid for iid in dict.fromkeys(str(i) for i in group if i) if iid not in seen]
+            seen.update(wanted)
+            if wanted:
+                pending.append(wanted)
+        if not pending:
+            return [], []
+        dropped: list[str] = []
+        leftovers: list[str] = []
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            for wanted in pending:
+                moved = self._move_rows(conn, wanted, (year, x, y), cap, {})
+                dropped.extend(iid for iid in wanted if iid in moved)
+                leftovers.extend(iid for iid in wanted if iid not in moved)
+            gone = self._delete_rows(conn, self._DELETE_OFF_TILE, leftovers, (year, x, y))
+            deleted = [iid for iid in leftovers if iid in gone]
+            fields = {"owner": None, "year": year, "x": x, "y": y}
+            _log_changes(conn, "items_instances", "update", [(iid, fields) for iid in dropped])
+            _log_changes(conn, "items_instances", "delete", [(iid, None) for iid in deleted])
+        for iid in dropped:
+            _notify_items(iid, (year, x, y))
+        for iid in deleted:
+            _notify_items(iid)
+        return dropped, deleted
+
+    def delete_by_owner(self, owner: str) -> list[str]:
+        """Delete every item owned by *owner* and return their iids."""
+
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            rows = stmts.fetchall(conn, self._DELETE_BY_OWNER, (str(owner),))
+            deleted = [row[0] for row in rows]
+            _log_changes(conn, "items_instances", "delete", [(iid, None) for iid in deleted])
+        for iid in deleted:
+            _notify_items(iid)
+        return deleted
+
 
 class SQLiteRuntimeKVStore:
     __slots__ = ("_manager",)
 
+    _GET = stmts.declare("runtime_kv.get", "SELECT value FROM runtime_kv WHERE key = ?")
+    _SET = stmts.declare(
+        "runtime_kv.set",
+        """
+        INSERT INTO runtime_kv(key, value)
+        VALUES(?, ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """,
+    )
+    _DELETE = stmts.declare("runtime_kv.delete", "DELETE FROM runtime_kv WHERE key = ?")
+
     def __init__(self, manager: SQLiteConnectionManager) -> None:
         self._manager = manager
 
@@ -1082,11 +1814,7 @@ class SQLiteRuntimeKVStore:
 
     def get(self, key: str) -> Optional[str]:
         conn = self._connection()
-        cur = conn.execute(
-            "SELECT value FROM runtime_kv WHERE key = ?",
-            (str(key),),
-        )
-        row = cur.fetchone()
+        row = stmts.fetchone(conn, self._GET, (str(key),))
         if row is None:
             return None
         value = row["value"]
@@ -1096,23 +1824,179 @@ class SQLiteRuntimeKVStore:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.execute(
-                """
-                INSERT INTO runtime_kv(key, value)
-                VALUES(?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
-                """,
-                (str(key), str(value)),
-            )
+            stmts.execute(conn, self._SET, (str(key), str(value)))
 
     def delete(self, key: str) -> None:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.execute(
-                "DELETE FROM runtime_kv WHERE key = ?",
-                (str(key),),
+            stmts.execute(conn, self._DELETE, (str(key),))
+
+    def reserve(self, key: str, count: int, *, floor: int = 0) -> int:
+        """Reserve *count* integers after the one stored at *key*.
+
+        The key holds the highest value handed out so far (at least *floor*).
+        Returns the first value of the new range and stores its last, in one
+        ``BEGIN IMMEDIATE`` transaction so concurrent reservations never
+        overlap.
+        """
+
+        if count < 1:
+            raise ValueError("count must be positive")
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            row = stmts.fetchone(conn, self._GET, (str(key),))
+            current = _coerce_int(row["value"]) if row is not None else 0
+            start = max(current, _coerce_int(floor)) + 1
+            stmts.execute(conn, self._SET, (str(key), str(start + count - 1)))
+        return start
+
+
+class SQLiteOwnerAggregatesStore:
+    """SQLite-backed implementation of :class:`OwnerAggregatesStore`."""
+
+    __slots__ = ("_manager",)
+
+    _COLUMNS: Sequence[str] = (
+        "owner",
+        "total_weight",
+        "item_count",
+        "armour_class",
+        "updated_at",
+    )
+
+    _GET = stmts.declare(
+        "owner_aggregates.get",
+        f"SELECT {', '.join(_COLUMNS)} FROM owner_aggregates WHERE owner = ?",
+    )
+    _SNAPSHOT = stmts.declare(
+        "owner_aggregates.snapshot",
+        f"SELECT {', '.join(_COLUMNS)} FROM owner_aggregates ORDER BY owner ASC",
+    )
+    _UPSERT = stmts.declare(
+        "owner_aggregates.upsert",
+        """
+        INSERT INTO owner_aggregates(owner, total_weight, item_count, armour_class, updated_at)
+        VALUES(?, ?, ?, ?, ?)
+        ON CONFLICT(owner) DO UPDATE SET
+            total_weight = excluded.total_weight,
+            item_count = excluded.item_count,
+            armour_class = excluded.armour_class,
+            updated_at = excluded.updated_at
+        """,
+    )
+    _DELETE = stmts.declare("owner_aggregates.delete", "DELETE FROM owner_aggregates WHERE owner = ?")
+
+    def __init__(self, manager: SQLiteConnectionManager) -> None:
+        self._manager = manager
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._manager.connect()
+
+    def get(self, owner: str) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        row = stmts.fetchone(conn, self._GET, (str(owner),))
+        if row is None:
+            return None
+        return {key: row[key] for key in self._COLUMNS}
+
+    def snapshot(self) -> Iterable[Dict[str, Any]]:
+        conn = self._connection()
+        rows = stmts.fetchall(conn, self._SNAPSHOT)
+        return [{key: row[key] for key in self._COLUMNS} for row in rows]
+
+    def upsert(
+        self, owner: str, *, total_weight: int, item_count: int, armour_class: int
+    ) -> None:
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            stmts.execute(
+                conn,
+                self._UPSERT,
+                (
+                    str(owner),
+                    _coerce_int(total_weight),
+                    _coerce_int(item_count),
+                    _coerce_int(armour_class),
+                    _epoch_ms(),
+                ),
+            )
+
+    def delete(self, owner: str) -> None:
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            stmts.execute(conn, self._DELETE, (str(owner),))
+
+
+class SQLiteChangeFeedStore:
+    """Cursor over the ``changes`` table (see :func:`set_change_feed`)."""
+
+    __slots__ = ("_manager",)
+
+    _COLUMNS: Sequence[str] = ("seq", "table_name", "key", "op", "fields_json", "tick")
+
+    _HEAD = stmts.declare("changes.head", "SELECT MAX(seq) AS seq FROM changes")
+    _SINCE = stmts.declare(
+        "changes.since",
+        f"SELECT {', '.join(_COLUMNS)} FROM changes WHERE seq > ? ORDER BY seq LIMIT ?",
+    )
+    _COMPACT = stmts.declare("changes.compact", "DELETE FROM changes WHERE seq <= ?")
+
+    def __init__(self, manager: SQLiteConnectionManager) -> None:
+        self._manager = manager
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._manager.connect()
+
+    def head(self) -> int:
+        """Return the newest stored ``seq`` (0 when the table is empty)."""
+
+        row = stmts.fetchone(self._connection(), self._HEAD)
+        return _coerce_int(row["seq"]) if row is not None and row["seq"] is not None else 0
+
+    def changes_since(self, seq: int, *, limit: int = 1000) -> list[Dict[str, Any]]:
+        """Return up to *limit* changes with ``seq`` greater than *seq*, oldest first.
+
+        ``fields`` is the decoded ``fields_json``: the full row for inserts,
+        the written columns for updates, the predicate for ``delete_where``
+        and ``None`` for deletes.  Pass the last ``seq`` seen to continue.
+        """
+
+        rows = stmts.fetchall(
+            self._connection(), self._SINCE, (_coerce_int(seq), max(1, _coerce_int(limit)))
+        )
+        changes: list[Dict[str, Any]] = []
+        for row in rows:
+            raw = row["fields_json"]
+            changes.append(
+                {
+                    "seq": row["seq"],
+                    "table": row["table_name"],
+                    "key": row["key"],
+                    "op": row["op"],
+                    "fields": json.loads(raw) if raw else None,
+                    "tick": row["tick"],
+                }
             )
+        return changes
+
+    def compact(self, upto: Optional[int] = None, *, keep: int = 0) -> int:
+        """Delete changes up to ``seq`` *upto* (default: all but the newest *keep*).
+
+        Returns the number of rows removed.  Sequence numbers are never
+        reused, so cursors past the compacted range keep working.
+        """
+
+        if upto is None:
+            upto = self.head() - max(0, _coerce_int(keep))
+        conn = self._connection()
+        with conn:
+            _begin_immediate(conn)
+            cur = stmts.execute(conn, self._COMPACT, (_coerce_int(upto),))
+        return max(cur.rowcount, 0)
 
 
 class SQLiteMonstersInstanceStore:
@@ -1136,6 +2020,38 @@ class SQLiteMonstersInstanceStore:
         "timers_json",
     )
 
+    _SELECT = f"SELECT {', '.join(_COLUMNS)} FROM monsters_instances"
+    _ORDER = "ORDER BY created_at ASC, instance_id ASC"
+    _GET = stmts.declare("monsters.get", f"{_SELECT} WHERE instance_id = ?")
+    _SNAPSHOT = stmts.declare("monsters.snapshot", f"{_SELECT} {_ORDER}")
+    # {columns}/{where}: as for items.stream.
+    _STREAM = stmts.declare(
+        "monsters.stream", "SELECT {columns} FROM monsters_instances{where} ORDER BY rowid"
+    )
+    _LIST_AT = stmts.declare(
+        "monsters.list_at", f"{_SELECT} WHERE year = ? AND x = ? AND y = ? {_ORDER}"
+    )
+    # Index order: (target_player_id, rowid), i.e. insertion order.
+    _LIST_BY_TARGET = stmts.declare(
+        "monsters.list_by_target", f"{_SELECT} WHERE target_player_id = ? ORDER BY rowid"
+    )
+    _COUNT_ALIVE = stmts.declare(
+        "monsters.count_alive",
+        "SELECT COUNT(1) AS total FROM monsters_instances WHERE year = ? AND hp_cur > 0",
+    )
+    _INSERT = stmts.declare(
+        "monsters.insert",
+        f"INSERT INTO monsters_instances ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+    )
+    # {assignments}: "column = ?, ..."
+    _UPDATE = stmts.declare(
+        "monsters.update_fields",
+        "UPDATE monsters_instances SET {assignments} WHERE instance_id = ?",
+    )
+    _DELETE = stmts.declare("monsters.delete", "DELETE FROM monsters_instances WHERE instance_id = ?")
+    _DELETE_ALL = stmts.declare("monsters.delete_all", "DELETE FROM monsters_instances")
+
     def __init__(self, manager: SQLiteConnectionManager) -> None:
         self._manager = manager
         self._cache: MutableMapping[str, Dict[str, Any]] = {}
@@ -1351,25 +2267,38 @@ class SQLiteMonstersInstanceStore:
 
     def get(self, mid: str) -> Optional[Dict[str, Any]]:
         conn = self._connection()
-        cur = conn.execute(
-            "SELECT instance_id, monster_id, year, x, y, hp_cur, hp_max, stats_json, created_at, "
-            "target_player_id, ai_state_json, bag_json, timers_json "
-            "FROM monsters_instances WHERE instance_id = ?",
-            (str(mid),),
-        )
-        row = cur.fetchone()
+        row = stmts.fetchone(conn, self._GET, (str(mid),))
         if row is None:
             return None
         return self._row_to_payload(row)
 
     def snapshot(self) -> Iterable[Dict[str, Any]]:
         conn = self._connection()
-        cur = conn.execute(
-            "SELECT instance_id, monster_id, year, x, y, hp_cur, hp_max, stats_json, created_at, "
-            "target_player_id, ai_state_json, bag_json, timers_json "
-            "FROM monsters_instances ORDER BY created_at ASC, instance_id ASC"
+        return [self._row_to_payload(row) for row in stmts.fetchall(conn, self._SNAPSHOT)]
+
+    def iter_snapshot(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        *,
+        chunk_size: int = _STREAM_CHUNK,
+        **where: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream monsters one fetch chunk at a time, in insertion order.
+
+        Without *columns* each row is decoded into the full payload, as in
+        :meth:`snapshot`.  With *columns* the rows are plain dicts of those
+        columns and ``stats_json`` is only read (and left undecoded) when
+        asked for.  Keyword arguments filter by equality in SQL.
+        """
+
+        selected = tuple(columns) if columns else tuple(self._COLUMNS)
+        sql, params = _render_stream(self._STREAM, self._COLUMNS, selected, where)
+        rows = stmts.iterate(
+            self._connection(), self._STREAM, params, sql=sql, chunk_size=chunk_size
         )
-        return [self._row_to_payload(row) for row in cur.fetchall()]
+        if columns:
+            return (dict(zip(selected, row)) for row in rows)
+        return (self._row_to_payload(row) for row in rows)
 
     def replace_all(self, records: Iterable[Dict[str, Any]]) -> None:
         if not os.getenv("MUTANTS_ALLOW_REPLACE_ALL"):
@@ -1388,14 +2317,16 @@ class SQLiteMonstersInstanceStore:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            conn.execute("DELETE FROM monsters_instances")
+            stmts.execute(conn, self._DELETE_ALL)
+            _log_changes(conn, "monsters_instances", "delete_where", [(None, {})])
             if payloads:
-                columns = ", ".join(self._COLUMNS)
-                placeholders = ", ".join("?" for _ in self._COLUMNS)
                 values = [tuple(payload[col] for col in self._COLUMNS) for payload in payloads]
-                conn.executemany(
-                    f"INSERT INTO monsters_instances ({columns}) VALUES ({placeholders})",
-                    values,
+                stmts.executemany(conn, self._INSERT, values)
+                _log_changes(
+                    conn,
+                    "monsters_instances",
+                    "insert",
+                    [(p["instance_id"], p) for p in payloads],
                 )
 
     def list_at(self, year: int, x: int, y: int) -> Iterable[Dict[str, Any]]:
@@ -1415,18 +2346,11 @@ class SQLiteMonstersInstanceStore:
             LOG.warning("--- _list_at: Iterating cache. Keys: %s", list(cache_attr.keys()))
 
         conn = self._connection()
-        sql = (
-            "SELECT instance_id, monster_id, year, x, y, hp_cur, hp_max, stats_json, created_at, "
-            "target_player_id, ai_state_json, bag_json, timers_json "
-            "FROM monsters_instances WHERE year = ? AND x = ? AND y = ? "
-            "ORDER BY created_at ASC, instance_id ASC"
-        )
         params: Tuple[int, int, int] = (year, x, y)
-        _debug_query_plan(conn, sql, params)
-        cur = conn.execute(sql, params)
+        _debug_query_plan(conn, self._LIST_AT.sql, params)
         results = []
         seen_ids = set()
-        for row in cur.fetchall():
+        for row in stmts.fetchall(conn, self._LIST_AT, params):
             data = self._row_to_dict(row)
             instance_id = data.get("instance_id")
             if instance_id and instance_id in seen_ids:
@@ -1449,16 +2373,22 @@ class SQLiteMonstersInstanceStore:
         LOG.warning("<<< _list_at returning %s results.", len(results))
         return results
 
+    def list_by_target(self, player_id: str) -> Iterable[Dict[str, Any]]:
+        """Return the monsters whose ``target_player_id`` is *player_id*."""
+
+        conn = self._connection()
+        params = (str(player_id),)
+        _debug_query_plan(conn, self._LIST_BY_TARGET.sql, params)
+        return [
+            self._row_to_payload(row)
+            for row in stmts.fetchall(conn, self._LIST_BY_TARGET, params)
+        ]
+
     def count_alive(self, year: int) -> int:
         conn = self._connection()
-        sql = (
-            "SELECT COUNT(1) AS total FROM monsters_instances "
-            "WHERE year = ? AND hp_cur > 0"
-        )
         params = (_coerce_int(year),)
-        _debug_query_plan(conn, sql, params)
-        cur = conn.execute(sql, params)
-        row = cur.fetchone()
+        _debug_query_plan(conn, self._COUNT_ALIVE.sql, params)
+        row = stmts.fetchone(conn, self._COUNT_ALIVE, params)
         if row is None:
             return 0
         try:
@@ -1466,7 +2396,7 @@ class SQLiteMonstersInstanceStore:
         except (KeyError, TypeError, ValueError):
             return 0
 
-    def spawn(self, rec: Dict[str, Any]) -> None:
+    def _validate_spawn(self, rec: Mapping[str, Any]) -> None:
         instance_id = rec.get("instance_id") if isinstance(rec, Mapping) else None
         monster_id = rec.get("monster_id") if isinstance(rec, Mapping) else None
         if not isinstance(instance_id, str) or not instance_id.startswith("i."):
@@ -1483,29 +2413,68 @@ class SQLiteMonstersInstanceStore:
                 instance_id,
             )
             raise ValueError("instance_id must not equal monster_id")
+
+    def spawn(self, rec: Dict[str, Any]) -> None:
+        self._validate_spawn(rec)
         normalized = self._normalize_payload(dict(rec), _epoch_ms())
         instance_id = normalized["instance_id"]
-        monster_id = normalized["monster_id"]
 
         if isinstance(rec, dict):
             rec.setdefault("created_at", normalized.get("created_at"))
 
-        columns = ", ".join(self._COLUMNS)
-        placeholders = ", ".join("?" for _ in self._COLUMNS)
         values = tuple(normalized[key] for key in self._COLUMNS)
 
         conn = self._connection()
         try:
             with conn:
                 _begin_immediate(conn)
-                conn.execute(
-                    f"INSERT INTO monsters_instances ({columns}) VALUES ({placeholders})",
-                    values,
-                )
+                stmts.execute(conn, self._INSERT, values)
+                _log_changes(conn, "monsters_instances", "insert", [(instance_id, normalized)])
             self._log_cache_update(dict(normalized))
         except sqlite3.IntegrityError as exc:
             raise KeyError(str(instance_id)) from exc
 
+    def spawn_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert several monsters in a single transaction.
+
+        Either every record is inserted or none is; a duplicate ``instance_id``
+        raises :class:`KeyError` after rolling the batch back.
+        """
+
+        batch = list(records)
+        for rec in batch:
+            self._validate_spawn(rec)
+        if not batch:
+            return 0
+        now = _epoch_ms()
+        normalized_rows = []
+        for rec in batch:
+            normalized = self._normalize_payload(dict(rec), now)
+            if isinstance(rec, dict):
+                rec.setdefault("created_at", normalized.get("created_at"))
+            normalized_rows.append(normalized)
+
+        conn = self._connection()
+        try:
+            with conn:
+                _begin_immediate(conn)
+                stmts.executemany(
+                    conn,
+                    self._INSERT,
+                    [tuple(row[key] for key in self._COLUMNS) for row in normalized_rows],
+                )
+                _log_changes(
+                    conn,
+                    "monsters_instances",
+                    "insert",
+                    [(row["instance_id"], row) for row in normalized_rows],
+                )
+        except sqlite3.IntegrityError as exc:
+            raise KeyError("instance_id") from exc
+        for row in normalized_rows:
+            self._log_cache_update(dict(row))
+        return len(normalized_rows)
+
     def update_fields(self, mid: str, **fields: Any) -> None:
         if not isinstance(mid, str) or not mid.startswith("i."):
             LOG.warning("update_fields blocked for non-instance-shaped id=%r", mid)
@@ -1514,6 +2483,7 @@ class SQLiteMonstersInstanceStore:
             return
         updates = []
         values: list[Any] = []
+        changed: Dict[str, Any] = {}
         for key, value in fields.items():
             if key not in self._COLUMNS or key == "instance_id":
                 raise KeyError(key)
@@ -1523,33 +2493,68 @@ class SQLiteMonstersInstanceStore:
                 value = _coerce_int(value)
             updates.append(f"{key} = ?")
             values.append(value)
+            changed[key] = value
         values.append(str(mid))
 
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            cur = conn.execute(
-                f"UPDATE monsters_instances SET {', '.join(updates)} WHERE instance_id = ?",
+            cur = stmts.execute(
+                conn,
+                self._UPDATE,
                 values,
+                sql=self._UPDATE.render(assignments=", ".join(updates)),
             )
             if cur.rowcount == 0:
                 raise KeyError(str(mid))
+            _log_changes(conn, "monsters_instances", "update", [(str(mid), changed)])
 
     def delete(self, mid: str) -> None:
         conn = self._connection()
         with conn:
             _begin_immediate(conn)
-            cur = conn.execute(
-                "DELETE FROM monsters_instances WHERE instance_id = ?",
-                (str(mid),),
-            )
+            cur = stmts.execute(conn, self._DELETE, (str(mid),))
             if cur.rowcount == 0:
                 raise KeyError(str(mid))
+            _log_changes(conn, "monsters_instances", "delete", [(str(mid), None)])
 
 
 def get_stores(db_path: Optional[os.PathLike[str] | str] = None) -> "StateStores":
     manager = SQLiteConnectionManager(db_path)
-    return _build_state_stores(manager)
+    stores = _STORES.get(manager._key)
+    if stores is None:
+        stores = _build_state_stores(manager)
+        _STORES[manager._key] = stores
+    return stores
+
+
+def snapshot_database(
+    db_path: Optional[os.PathLike[str] | str] = None, *, in_memory: Optional[bool] = None
+) -> sqlite3.Connection:
+    """Copy the state database into a private ``:memory:`` connection.
+
+    Uses the SQLite backup API, so the copy is consistent even while other
+    connections write.  Pair with :func:`restore_database` to seed a database
+    once and clone it many times (e.g. once per test).
+    """
+
+    source = SQLiteConnectionManager(db_path, in_memory=in_memory).connect()
+    snapshot = sqlite3.connect(":memory:", check_same_thread=False)
+    source.backup(snapshot)
+    return snapshot
+
+
+def restore_database(
+    snapshot: sqlite3.Connection,
+    db_path: Optional[os.PathLike[str] | str] = None,
+    *,
+    in_memory: Optional[bool] = None,
+) -> None:
+    """Overwrite the state database with the contents of *snapshot*."""
+
+    target = SQLiteConnectionManager(db_path, in_memory=in_memory).connect()
+    snapshot.backup(target)
+    _notify_items(None)
 
 
 def _build_state_stores(manager: SQLiteConnectionManager) -> "StateStores":
@@ -1559,4 +2564,6 @@ def _build_state_stores(manager: SQLiteConnectionManager) -> "StateStores":
         items=SQLiteItemsInstanceStore(manager),
         monsters=SQLiteMonstersInstanceStore(manager),
         runtime_kv=SQLiteRuntimeKVStore(manager),
+        owner_aggregates=SQLiteOwnerAggregatesStore(manager),
+        changes=SQLiteChangeFeedStore(manager),
     )
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional, Protocol
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Protocol, Sequence, Tuple
 
 from mutants.env import get_state_backend as _get_state_backend
 
 from .sqlite_store import get_stores as sqlite_get_stores
 
 __all__ = [
+    "ChangeFeedStore",
     "ItemsInstanceStore",
     "MonstersInstanceStore",
+    "OwnerAggregatesStore",
     "RuntimeKVStore",
     "StateStores",
     "get_state_backend",
@@ -20,12 +22,20 @@ __all__ = [
 class ItemsInstanceStore(Protocol):
     def snapshot(self) -> Iterable[Dict[str, Any]]: ...
 
+    def iter_snapshot(
+        self, columns: Optional[Sequence[str]] = None, *, chunk_size: int = ..., **where: Any
+    ) -> Iterator[Dict[str, Any]]: ...
+
     def replace_all(self, records: Iterable[Dict[str, Any]]) -> None: ...
 
     def get_by_iid(self, iid: str) -> Optional[Dict[str, Any]]: ...
 
     def list_at(self, year: int, x: int, y: int) -> Iterable[Dict[str, Any]]: ...
 
+    def list_at_many(
+        self, positions: Iterable[Tuple[int, int, int]]
+    ) -> Dict[Tuple[int, int, int], list[Dict[str, Any]]]: ...
+
     def list_by_owner(self, owner: str) -> Iterable[Dict[str, Any]]: ...
 
     def mint(self, rec: Dict[str, Any]) -> None: ...
@@ -40,6 +50,23 @@ class ItemsInstanceStore(Protocol):
 
     def bulk_insert(self, records: Iterable[Dict[str, Any]]) -> None: ...
 
+    def move_many(
+        self,
+        iids: Iterable[str],
+        pos: Tuple[int, int, int],
+        *,
+        cap: Optional[int] = None,
+        created_at: Optional[Mapping[str, Any]] = None,
+    ) -> list[str]: ...
+
+    def drop_or_delete(
+        self, groups: Iterable[Iterable[str]], pos: Tuple[int, int, int], cap: int
+    ) -> Tuple[list[str], list[str]]: ...
+
+    def delete_many(self, iids: Iterable[str]) -> list[str]: ...
+
+    def delete_by_owner(self, owner: str) -> list[str]: ...
+
 
 class RuntimeKVStore(Protocol):
     def get(self, key: str) -> Optional[str]: ...
@@ -48,30 +75,62 @@ class RuntimeKVStore(Protocol):
 
     def delete(self, key: str) -> None: ...
 
+    def reserve(self, key: str, count: int, *, floor: int = 0) -> int: ...
+
 
 class MonstersInstanceStore(Protocol):
     def snapshot(self) -> Iterable[Dict[str, Any]]: ...
 
+    def iter_snapshot(
+        self, columns: Optional[Sequence[str]] = None, *, chunk_size: int = ..., **where: Any
+    ) -> Iterator[Dict[str, Any]]: ...
+
     def replace_all(self, records: Iterable[Dict[str, Any]]) -> None: ...
 
     def get(self, mid: str) -> Optional[Dict[str, Any]]: ...
 
     def list_at(self, year: int, x: int, y: int) -> Iterable[Dict[str, Any]]: ...
 
+    def list_by_target(self, player_id: str) -> Iterable[Dict[str, Any]]: ...
+
     def count_alive(self, year: int) -> int: ...
 
     def spawn(self, rec: Dict[str, Any]) -> None: ...
 
+    def spawn_many(self, records: Iterable[Dict[str, Any]]) -> int: ...
+
     def update_fields(self, mid: str, **fields: Any) -> None: ...
 
     def delete(self, mid: str) -> None: ...
 
 
+class OwnerAggregatesStore(Protocol):
+    def get(self, owner: str) -> Optional[Dict[str, Any]]: ...
+
+    def snapshot(self) -> Iterable[Dict[str, Any]]: ...
+
+    def upsert(
+        self, owner: str, *, total_weight: int, item_count: int, armour_class: int
+    ) -> None: ...
+
+    def delete(self, owner: str) -> None: ...
+
+
+class ChangeFeedStore(Protocol):
+    def head(self) -> int: ...
+
+    def changes_since(self, seq: int, *, limit: int = ...) -> list[Dict[str, Any]]: ...
+
+    def compact(self, upto: Optional[int] = None, *, keep: int = 0) -> int: ...
+
+
 @dataclass(frozen=True)
 class StateStores:
     items: ItemsInstanceStore
     monsters: MonstersInstanceStore
     runtime_kv: RuntimeKVStore
+    owner_aggregates: OwnerAggregatesStore
+    changes: ChangeFeedStore
 
 
 def get_state_backend() -> str:
@@ -80,6 +139,6 @@ def get_state_backend() -> str:
 
 def get_stores() -> StateStores:
     backend = get_state_backend()
-    if backend == "sqlite":
+    if backend in {"sqlite", "sqlite-memory"}:
         return sqlite_get_stores()
     raise ValueError(f"Unsupported state backend: {backend}")
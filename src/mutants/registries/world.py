@@ -53,6 +53,20 @@ GATE_OPEN = 0
 GATE_CLOSED = 1
 GATE_LOCKED = 2
 
+# Monotonic counter bumped whenever any loaded tile changes or a year is
+# (re)loaded.  Render caches key on it to know when static room text is stale.
+_WORLD_VERSION = 0
+
+
+def _bump_world_version() -> None:
+    global _WORLD_VERSION
+    _WORLD_VERSION += 1
+
+
+def world_version() -> int:
+    """Return the process-wide world mutation counter."""
+    return _WORLD_VERSION
+
 
 def _edge_defaults(edge: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """Return a normalized edge dict with all expected keys present."""
@@ -142,6 +156,7 @@ class YearWorld:
 
     def _touch(self) -> None:
         self._dirty = True
+        _bump_world_version()
 
     # ---------- tile field mutations ----------
 
@@ -355,6 +370,7 @@ class WorldRegistry:
                         pass
 
         self._by_year[year] = yw
+        _bump_world_version()
         return yw
 
     def get_year(self, year: int) -> Optional[YearWorld]:
@@ -409,3 +425,4 @@ def clear_cache() -> None:
     """Forget any cached YearWorlds."""
     global _default_world_registry
     _default_world_registry = None
+    _bump_world_version()
@@ -1,8 +1,12 @@
 from __future__ import annotations
+import argparse
+import json
 import logging
-from typing import Any, MutableMapping
+import time
+from typing import Any, Iterable, MutableMapping, Optional, Sequence, TextIO
 
-from mutants.app.context import build_context, render_frame, flush_feedback
+from mutants.app import context as appctx
+from mutants.app.context import build_context, render_frame, flush_feedback, skip_frame
 from mutants.repl.dispatch import Dispatch
 from mutants.commands.register_all import register_all
 from mutants.repl.prompt import make_prompt
@@ -11,7 +15,11 @@ from mutants.ui import styles as st
 from mutants.ui import groups as UG
 from mutants.ui.class_menu import handle_input, render_menu
 from mutants.services import player_state as pstate
+from mutants.services import db_maintenance
 from mutants.services import monsters_state as mon_state
+from mutants.services import state_debug
+from mutants.debug import turnlog
+from mutants.ui.textutils import resolve_feedback_text
 import sys
 
 
@@ -31,6 +39,15 @@ def _flush_state(ctx: MutableMapping[str, Any]) -> None:
         pstate.save_player_state(ctx)
     except Exception:
         LOG.debug("Failed to save player state on exit", exc_info=True)
+    try:
+        scheduler = ctx.get("turn_scheduler") if isinstance(ctx, MutableMapping) else None
+        manager = getattr(scheduler, "status_manager", None)
+        flush = getattr(manager, "flush", None)
+        if callable(flush):
+            # Status durations live on the timer wheel between expiries.
+            flush()
+    except Exception:
+        LOG.debug("Failed to flush status effect durations on exit", exc_info=True)
     try:
         monsters = ctx.get("monsters") if isinstance(ctx, MutableMapping) else None
         if monsters is None:
@@ -44,13 +61,33 @@ def _flush_state(ctx: MutableMapping[str, Any]) -> None:
         LOG.debug("Failed to save monsters on exit", exc_info=True)
 
 
-def main() -> None:
-    try:  # Ensure UTF-8 output so non-ASCII glyphs don't render as '?' on Windows.
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    except Exception:
-        pass
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="mutants")
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run commands from FILE ('-' for stdin) headless and exit",
+    )
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="skip room frames and emit feedback as JSON lines",
+    )
+    parser.add_argument(
+        "--no-debug-io",
+        action="store_true",
+        help="disable state_debug, turnlog and move-lag logging",
+    )
+    return parser.parse_args(argv)
 
+
+def _start_session(
+    *, banner: bool = True, ansi: bool = True
+) -> tuple[MutableMapping[str, Any], Dispatch]:
     ctx = build_context()
+    if not ansi:
+        # Headless output is plain text whatever the theme says.
+        st.set_ansi_enabled(False)
     dispatch = Dispatch()
     dispatch.set_feedback_bus(ctx["feedback_bus"])
     dispatch.set_context(ctx)
@@ -59,7 +96,8 @@ def main() -> None:
     register_all(dispatch, ctx)
 
     # Show startup banner *before* entering menu
-    ctx["feedback_bus"].push("SYSTEM/INFO", startup_banner(ctx))
+    if banner:
+        ctx["feedback_bus"].push("SYSTEM/INFO", startup_banner(ctx))
 
     # Enter class selection menu at startup; suppress any pending room render.
     try:
@@ -72,9 +110,133 @@ def main() -> None:
     ctx["mode"] = "class_select"
     ctx["render_next"] = False
     render_menu(ctx)
+    return ctx, dispatch
+
+
+def set_debug_io(enabled: bool) -> tuple[bool, bool, bool]:
+    """Toggle the state_debug, turnlog and move-lag log writers together.
+
+    Returns the previous settings for :func:`_restore_debug_io`.
+    """
+    return (
+        state_debug.set_enabled(enabled),
+        turnlog.set_enabled(enabled),
+        appctx.set_move_lag_logging(enabled),
+    )
+
+
+def _restore_debug_io(previous: tuple[bool, bool, bool]) -> None:
+    state_debug_on, turnlog_on, move_lag_on = previous
+    state_debug.set_enabled(state_debug_on)
+    turnlog.set_enabled(turnlog_on)
+    appctx.set_move_lag_logging(move_lag_on)
+
+
+def _script_commands(lines: Iterable[str]) -> Iterable[str]:
+    for line in lines:
+        raw = line.rstrip("\r\n")
+        if not raw.strip() or raw.lstrip().startswith("#"):
+            continue
+        yield raw
+
+
+def _json_lines(seq: int, raw: Optional[str], events: Sequence[Any]) -> str:
+    out: list[str] = []
+    for ev in events:
+        payload: dict[str, Any] = {"seq": seq, "cmd": raw}
+        if isinstance(ev, MutableMapping):
+            payload.update(ev)
+        payload["text"] = resolve_feedback_text(ev)
+        out.append(json.dumps(payload, ensure_ascii=False, default=str) + "\n")
+    return "".join(out)
+
+
+def run_headless(
+    commands: Iterable[str],
+    *,
+    out: Optional[TextIO] = None,
+    debug_io: bool = True,
+) -> dict[str, Any]:
+    """Execute *commands* without rendering and stream events as JSON lines.
+
+    Commands go through :class:`Dispatch` (and therefore the turn scheduler)
+    exactly as in the interactive loop, but no room view-model or ANSI text is
+    built.  Each feedback event becomes one JSON object tagged with the
+    1-based ``seq`` and raw ``cmd`` that produced it (``seq`` 0 is startup).
+    A ``SCRIPT/SUMMARY`` line closes the stream; its payload is returned.
+    With ``debug_io=False`` the debug log writers are off for the run and
+    restored afterwards.
+    """
+    stream = out if out is not None else sys.stdout
+    previous_io = set_debug_io(False) if not debug_io else None
+    try:
+        return _run_script(commands, stream)
+    finally:
+        if previous_io is not None:
+            _restore_debug_io(previous_io)
+
+
+def _run_script(commands: Iterable[str], stream: TextIO) -> dict[str, Any]:
+    start = time.perf_counter()
+    ctx, dispatch = _start_session(banner=False, ansi=False)
+    stream.write(_json_lines(0, None, skip_frame(ctx)))
+
+    count = 0
+    total_events = 0
+    for raw in _script_commands(commands):
+        count += 1
+        stopped = False
+        try:
+            if ctx.get("mode") == "class_select":
+                handle_input(raw, ctx)
+            else:
+                token, _, arg = raw.strip().partition(" ")
+                dispatch.call(token, arg)
+        except SystemExit:
+            stopped = True
+        events = skip_frame(ctx)
+        total_events += len(events)
+        stream.write(_json_lines(count, raw, events))
+        if stopped:
+            break
+
+    _flush_state(ctx)
+    _clear_target_on_exit("quit")
+    elapsed = time.perf_counter() - start
+    summary = {
+        "kind": "SCRIPT/SUMMARY",
+        "commands": count,
+        "events": total_events,
+        "elapsed_ms": round(elapsed * 1000.0, 3),
+        "commands_per_sec": round(count / elapsed, 1) if elapsed > 0 else None,
+    }
+    stream.write(json.dumps(summary) + "\n")
+    stream.flush()
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    try:  # Ensure UTF-8 output so non-ASCII glyphs don't render as '?' on Windows.
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    except Exception:
+        pass
+
+    args = _parse_args(argv)
+    if args.script or args.no_render:
+        if args.script and args.script != "-":
+            with open(args.script, "r", encoding="utf-8") as fh:
+                run_headless(fh, debug_io=not args.no_debug_io)
+        else:
+            run_headless(sys.stdin, debug_io=not args.no_debug_io)
+        return
+    if args.no_debug_io:
+        set_debug_io(False)
+
+    ctx, dispatch = _start_session()
     flush_feedback(ctx)
 
     while True:
+        db_maintenance.enter_idle()
         try:
             raw = input(make_prompt(ctx))
         except (EOFError, KeyboardInterrupt):
@@ -82,6 +244,8 @@ def main() -> None:
             _flush_state(ctx)
             _clear_target_on_exit("quit")
             break
+        finally:
+            db_maintenance.leave_idle()
 
         try:
             if not raw.strip():
@@ -1,16 +1,14 @@
 """Utilities for propagating monster audio cues to the UI."""
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Deque, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Sequence
 
 from mutants.world import vision
 
-__all__ = ["emit_sound", "drain", "peek"]
+__all__ = ["emit_sound", "emit_sounds", "drain", "peek"]
 
 
 _STORE_KEY = "_audio_cues_queue"
-_STORE_POS_KEY = "_audio_cues_queue_pos"
 _MAX_DISTANCE = 4
 
 _SOUND_LABELS: Mapping[str, str] = {
@@ -72,37 +70,103 @@ def _sound_label(kind: Any) -> str:
         token = str(kind).strip().lower() if kind is not None else ""
     if not token:
         return "sounds"
-    return _SOUND_LABELS.get(token, token)
+    label = _SOUND_LABELS.get(token, token)
+    # Special-case combined phrasing used in reference.
+    if label == "yelling":
+        label = "yelling and screaming"
+    return label
 
 
-def _resolve_store(ctx: Any, *, create: bool) -> Deque[tuple[str, tuple[int, int, int] | None]] | None:
+def _format_message(dx: int, dy: int, label: str) -> str | None:
+    dist = max(abs(dx), abs(dy))
+    if dist == 0 or dist > _MAX_DISTANCE:
+        # Reference does not emit a cue when co-located; suppress the adjacent variant.
+        return None
+    token = _direction_token(dx, dy)
+    if token is None:
+        return None
+    direction = vision.direction_word(token)
+    if dist > 1:
+        return f"You hear faint sounds of {label} far to the {direction}."
+    return f"You hear loud sounds of {label} to the {direction}."
+
+
+# Cue text for every audible offset, keyed by (dx, dy, label).  Known labels are
+# filled in up front; unusual kinds are formatted once on first use.
+_MESSAGES: dict[tuple[int, int, str], str | None] = {
+    (dx, dy, label): _format_message(dx, dy, label)
+    for label in {_sound_label(k) for k in _SOUND_LABELS}
+    for dx in range(-_MAX_DISTANCE, _MAX_DISTANCE + 1)
+    for dy in range(-_MAX_DISTANCE, _MAX_DISTANCE + 1)
+}
+_LABELS: dict[Any, str] = {}
+
+
+def _cue_message(dx: int, dy: int, kind: Any) -> str | None:
+    if abs(dx) > _MAX_DISTANCE or abs(dy) > _MAX_DISTANCE:
+        return None
+    try:
+        label = _LABELS[kind]
+    except (KeyError, TypeError):
+        label = _sound_label(kind)
+        try:
+            _LABELS[kind] = label
+        except TypeError:
+            pass
+    key = (dx, dy, label)
+    try:
+        return _MESSAGES[key]
+    except KeyError:
+        message = _MESSAGES[key] = _format_message(dx, dy, label)
+        return message
+
+
+_Store = Dict[str, "tuple[int, int, int] | None"]
+
+
+def _resolve_store(ctx: Any, *, create: bool) -> _Store | None:
+    """Return the per-frame ordered set of cues (message -> player position)."""
+
     if ctx is None:
         return None
-    queue: Deque[tuple[str, tuple[int, int, int] | None]] | None = None
+    store: _Store | None = None
     if isinstance(ctx, MutableMapping):
         candidate = ctx.get(_STORE_KEY)
-        if isinstance(candidate, deque):
-            queue = candidate
+        if isinstance(candidate, dict):
+            store = candidate
         elif create:
-            queue = deque()
-            ctx[_STORE_KEY] = queue
+            store = {}
+            ctx[_STORE_KEY] = store
     else:
         candidate = getattr(ctx, _STORE_KEY, None)
-        if isinstance(candidate, deque):
-            queue = candidate
+        if isinstance(candidate, dict):
+            store = candidate
         elif create:
-            queue = deque()
+            store = {}
             try:
-                setattr(ctx, _STORE_KEY, queue)
+                setattr(ctx, _STORE_KEY, store)
             except Exception:
-                queue = None
-    return queue
-
-
-def _distance(monster: tuple[int, int, int], player: tuple[int, int, int]) -> int:
-    dx = monster[1] - player[1]
-    dy = monster[2] - player[2]
-    return max(abs(dx), abs(dy))
+                store = None
+    return store
+
+
+def _queue_cue(
+    store: _Store | None,
+    ctx: Any,
+    message: str,
+    player: tuple[int, int, int],
+    far: bool,
+) -> None:
+    if store is None or message in store:
+        return
+    store[message] = player
+    # When hearing a monster at distance > 1, suppress shadows for the next render
+    # so they appear a frame later.
+    if far and isinstance(ctx, MutableMapping):
+        try:
+            ctx["_suppress_shadows_once"] = True
+        except Exception:
+            pass
 
 
 def emit_sound(
@@ -118,6 +182,8 @@ def emit_sound(
 
     When ``monster_pos`` and ``player_pos`` are co-located, ``movement`` may be
     provided to hint at the direction from which the monster approached.
+    Cues are deduplicated per frame by message text; ``once_per_frame`` is
+    kept for API compatibility since the drained output was always unique.
     """
 
     monster = _coerce_pos(monster_pos)
@@ -126,57 +192,55 @@ def emit_sound(
         return None
     if monster[0] != player[0]:
         return None
-
-    dist = _distance(monster, player)
-    if dist > _MAX_DISTANCE:
+    dx = monster[1] - player[1]
+    dy = monster[2] - player[2]
+    message = _cue_message(dx, dy, kind)
+    if message is None:
         return None
+    far = max(abs(dx), abs(dy)) > 1
+    _queue_cue(_resolve_store(ctx, create=True), ctx, message, player, far)
+    return message
 
-    label = _sound_label(kind)
-    # Special-case combined phrasing used in reference.
-    if label == "yelling":
-        label = "yelling and screaming"
 
-    if dist == 0:
-        # Reference does not emit a cue when co-located; suppress the adjacent variant.
-        return None
-    else:
-        dx = monster[1] - player[1]
-        dy = monster[2] - player[2]
-        token = _direction_token(dx, dy)
-        if token is None:
-            return None
-        direction = vision.direction_word(token)
-        if dist > 1:
-            message = f"You hear faint sounds of {label} far to the {direction}."
-        else:
-            message = f"You hear loud sounds of {label} to the {direction}."
-
-    queue = _resolve_store(ctx, create=True)
-    if queue is not None:
-        existing_msgs = [entry[0] for entry in queue]
-        if once_per_frame and message in existing_msgs:
-            return message
-        # Avoid piling up duplicate cues within the same tick/frame.
-        if not queue or queue[-1][0] != message:
-            queue.append((message, player))
-            # When hearing a monster at distance > 1, suppress shadows for the next render
-            # so they appear a frame later.
-            try:
-                if dist > 1 and isinstance(ctx, MutableMapping):
-                    ctx["_suppress_shadows_once"] = True
-            except Exception:
-                pass
-    return message
+def emit_sounds(
+    sounds: Iterable[tuple[Any, Any]],
+    player_pos: Any,
+    *,
+    ctx: Any | None = None,
+) -> List[str]:
+    """Queue every ``(monster_pos, kind)`` in *sounds* heard from *player_pos*.
+
+    This is the batched form of :func:`emit_sound` for a whole tick: the player
+    position and the store are resolved once.  Returns the audible messages in
+    emission order, duplicates included.
+    """
+
+    player = _coerce_pos(player_pos)
+    if player is None:
+        return []
+    store = _resolve_store(ctx, create=True)
+    year, px, py = player
+    messages: List[str] = []
+    for monster_pos, kind in sounds:
+        monster = _coerce_pos(monster_pos)
+        if monster is None or monster[0] != year:
+            continue
+        dx = monster[1] - px
+        dy = monster[2] - py
+        message = _cue_message(dx, dy, kind)
+        if message is None:
+            continue
+        _queue_cue(store, ctx, message, player, max(abs(dx), abs(dy)) > 1)
+        messages.append(message)
+    return messages
 
 
 def drain(ctx: Any) -> List[str]:
     """Return and clear pending audio cues stored on *ctx*."""
 
-    queue = _resolve_store(ctx, create=False)
-    if not queue:
+    store = _resolve_store(ctx, create=False)
+    if not store:
         return []
-    items = []
-    seen: set[str] = set()
     current_pos = None
     if isinstance(ctx, MutableMapping):
         try:
@@ -185,23 +249,23 @@ def drain(ctx: Any) -> List[str]:
             current_pos = pstate.canonical_player_pos(ctx.get("player_state"))
         except Exception:
             current_pos = None
-    while queue:
-        msg, pos = queue.popleft()
-        if current_pos and pos and current_pos[0] != pos[0]:
-            # Drop cross-year cues to avoid stale hints after travel.
-            continue
-        if msg in seen:
-            continue
-        seen.add(msg)
-        items.append(msg)
-    queue.clear()
+    if current_pos:
+        # Drop cross-year cues to avoid stale hints after travel.
+        items = [
+            msg
+            for msg, pos in store.items()
+            if not (pos and current_pos[0] != pos[0])
+        ]
+    else:
+        items = list(store)
+    store.clear()
     return items
 
 
 def peek(ctx: Any) -> List[str]:
     """Return the pending audio cues without clearing the queue."""
 
-    queue = _resolve_store(ctx, create=False)
-    if not queue:
+    store = _resolve_store(ctx, create=False)
+    if not store:
         return []
-    return [entry[0] for entry in list(queue)]
+    return list(store)
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Mapping, Optional
 
-from mutants.registries import items_catalog, items_instances as itemsreg
-from mutants.services import player_state as pstate
+from mutants.registries import items_catalog
+from mutants.services import inventory_aggregates, player_state as pstate
 
 
 def _coerce_int(value: Any) -> int:
@@ -55,33 +55,9 @@ def armour_class_from_equipped(state) -> int:
     if not armour_iid:
         return 0
 
-    try:
-        catalog = items_catalog.load_catalog()
-    except FileNotFoundError:
-        catalog = None
-
-    template: Optional[dict[str, Any]] = None
-    inst = itemsreg.get_instance(armour_iid)
-    if inst:
-        tpl_id: Optional[str] = None
-        for key in ("item_id", "catalog_id", "id"):
-            candidate = inst.get(key)
-            if candidate is None:
-                continue
-            tpl_id = str(candidate)
-            if tpl_id:
-                break
-        if tpl_id and catalog:
-            template = catalog.get(tpl_id)
-
-    if not template and catalog:
-        template = catalog.get(str(armour_iid))
-    if not template:
-        return 0
-
-    enchant_level = itemsreg.get_enchant_level(armour_iid)
-    base_ac = max(0, _coerce_int(template.get("armour_class")))
-    return base_ac + max(0, enchant_level)
+    # Cached per instance and invalidated by the items registry on enchant,
+    # condition or template changes.
+    return inventory_aggregates.contribution_for(armour_iid).armour_class
 
 
 def dex_bonus_for_active(state) -> int:
@@ -161,22 +161,34 @@ def drop_new_entries(
     return minted
 
 
-def drop_existing_iids(iids: Iterable[str], pos: tuple[int, int, int]) -> list[str]:
-    """Move existing ``iids`` to ``pos`` and return the resolved IDs."""
+def drop_existing_iids(
+    iids: Iterable[str],
+    pos: tuple[int, int, int],
+    *,
+    cap: int | None = None,
+) -> list[str]:
+    """Move existing ``iids`` to ``pos`` and return the IDs that landed.
 
-    year, x, y = pos
-    dropped: list[str] = []
-    for iid in iids:
-        if not iid:
-            continue
-        inst = itemsreg.get_instance(iid)
-        if not inst:
-            continue
-        moved = itemsreg.move_instance(iid, dest=(year, x, y))
-        if moved:
-            inst = itemsreg.get_instance(iid)
-            dropped.append(str(inst.get("iid") if inst else iid))
-    return dropped
+    The move is one set-based store write; with ``cap`` the store only fills
+    the room left on the tile.
+    """
+
+    return itemsreg.move_instances(iids, pos, cap=cap)
+
+
+def drop_or_vaporize(
+    groups: Iterable[Sequence[str]], pos: tuple[int, int, int]
+) -> tuple[list[str], int]:
+    """Drop existing iids at ``pos`` up to :data:`GROUND_CAP`; delete the rest.
+
+    ``groups`` are dropped in turn, so earlier groups get the free slots
+    first.  The moves and the deletes run in one store transaction; iids
+    already lying on ``pos`` are left alone.  Returns the dropped iids and the
+    number vaporized.
+    """
+
+    dropped, deleted = itemsreg.drop_or_delete_instances(groups, pos, GROUND_CAP)
+    return dropped, len(deleted)
 
 
 def spawn_skull(pos: tuple[int, int, int], *, origin: str = "monster_drop") -> list[str]:
@@ -362,56 +374,60 @@ def drop_monster_loot(
     minted: list[dict[str, object]] = []
     vaporized: list[dict[str, object]] = []
     summary_messages: list[str] = []
-    summary_attempt_order: list[str] = []
+    summary_attempt_order = [source for source, _ in attempts]
     created_at_base = int(time.time() * 1000)
-    created_at_counter = 0
 
-    def _next_created_at() -> int:
-        nonlocal created_at_counter
-        ts = created_at_base + created_at_counter
-        created_at_counter += 1
-        return ts
-
-    for source, entry in attempts:
-        summary_attempt_order.append(source)
-        if free_slots <= 0:
-            vaporized.append(_clone_entry(entry, source=source))
-            continue
+    # Entries with neither an item id nor an instance cannot land; they never
+    # take a slot.
+    landable = [
+        (source, entry)
+        for source, entry in attempts
+        if _resolve_item_id(entry) or _resolve_instance_id(entry)
+    ]
+    placed = landable[:free_slots]
+    for source, entry in landable[free_slots:]:
+        vaporized.append(_clone_entry(entry, source=source))
+
+    # Stamps follow the attempt order so the tile lists bags, skull, armour.
+    stamps = [created_at_base + idx for idx in range(len(placed))]
+    existing = {
+        _resolve_instance_id(entry): stamp
+        for (_, entry), stamp in zip(placed, stamps)
+        if _resolve_instance_id(entry)
+    }
+    moved: set[str] = set()
+    if existing:
+        # One set-based move for every carried instance; the store re-checks
+        # the tile cap in SQL.
+        moved = set(
+            itemsreg.move_instances(list(existing), pos, cap=GROUND_CAP, created_at=existing)
+        )
 
+    # Carried instances that did not fit are gone with the monster.
+    leftovers = [
+        _resolve_instance_id(entry)
+        for _, entry in landable[free_slots:]
+        if _resolve_instance_id(entry)
+    ]
+    on_tile = {str(inst.get("iid") or inst.get("instance_id") or "") for inst in ground}
+    for (source, entry), created_at_value in zip(placed, stamps):
         iid = _resolve_instance_id(entry)
-        if iid:
-            inst = itemsreg.get_instance(iid)
-            if inst:
-                moved = itemsreg.move_instance(iid, dest=pos)
-                if moved:
-                    created_at_value = _next_created_at()
-                    try:
-                        updated = itemsreg.update_instance(
-                            iid,
-                            owner=None,
-                            pos={"year": year, "x": x, "y": y},
-                            drop_source=entry.get("drop_source") or source,
-                            origin=entry.get("origin") or inst.get("origin"),
-                            created_at=created_at_value,
-                        )
-                    except KeyError:
-                        # If the instance disappeared, fall back to minting a fresh copy.
-                        inst = None
-                    else:
-                        record = _clone_entry(entry, source=source)
-                        record["iid"] = iid
-                        if record.get("item_id"):
-                            record["item_id"] = str(inst.get("item_id") or record.get("item_id"))
-                        else:
-                            record["item_id"] = str(inst.get("item_id") or record.get("catalog_id") or "")
-                        record["created_at"] = (
-                            updated.get("created_at", created_at_value)
-                            if isinstance(updated, Mapping)
-                            else created_at_value
-                        )
-                        minted.append(record)
-                        free_slots -= 1
-                        continue
+        if iid and iid not in moved and (iid in on_tile or itemsreg.get_instance(iid)):
+            # The store refused the move (the tile filled up under us) or the
+            # item already lies here; never mint a second copy of it.
+            if iid not in on_tile:
+                vaporized.append(_clone_entry(entry, source=source))
+                leftovers.append(iid)
+            continue
+        if iid in moved:
+            record = _clone_entry(entry, source=source)
+            record["iid"] = iid
+            if not _resolve_item_id(record):
+                inst = itemsreg.get_instance(iid)
+                record["item_id"] = str((inst or {}).get("item_id") or "")
+            record["created_at"] = created_at_value
+            minted.append(record)
+            continue
 
         minted_iids = drop_new_entries([entry], pos)
         if not minted_iids:
@@ -424,14 +440,15 @@ def drop_monster_loot(
             inst = itemsreg.get_instance(iid)
             if inst and inst.get("item_id"):
                 record["item_id"] = str(inst.get("item_id"))
-        created_at_value = _next_created_at()
         try:
             updated = itemsreg.update_instance(iid, created_at=created_at_value)
             record["created_at"] = updated.get("created_at", created_at_value) if isinstance(updated, Mapping) else created_at_value
         except KeyError:
             record["created_at"] = created_at_value
         minted.append(record)
-        free_slots -= 1
+
+    if leftovers:
+        itemsreg.remove_instances(leftovers)
 
     if isinstance(drop_summary, MutableMapping):
         drop_summary["pos"] = {"year": year, "x": x, "y": y}
@@ -442,29 +459,3 @@ def drop_monster_loot(
 
     return minted, vaporized
 
-
-def enforce_capacity(
-    pos: tuple[int, int, int],
-    new_iids: Iterable[str],
-    *,
-    bus=None,
-    catalog: Mapping[str, Mapping[str, object]] | None = None,
-) -> list[str]:
-    year, x, y = pos
-    ground = itemsreg.list_instances_at(year, x, y)
-    overflow = len(ground) - GROUND_CAP
-    if overflow <= 0:
-        return []
-
-    candidates = [iid for iid in new_iids if iid]
-    removed: list[str] = []
-    idx = len(candidates) - 1
-    while overflow > 0 and idx >= 0:
-        iid = candidates[idx]
-        inst = itemsreg.get_instance(iid)
-        if inst:
-            itemsreg.remove_instance(iid)
-            removed.append(iid)
-            overflow -= 1
-        idx -= 1
-    return removed
@@ -8,7 +8,12 @@ they render cleanly in the MkDocs API reference.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, List, Mapping, MutableMapping, Optional, Sequence
+
+try:  # Optional fast path for large simulation batches.
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is not a runtime dependency
+    _np = None
 
 from mutants.registries import items_catalog, items_instances as itemsreg
 from mutants.services import combat_calc, player_state as pstate
@@ -136,6 +141,99 @@ def apply_ac_mitigation(raw_damage: int, ac: int) -> int:
     return base_damage - mitigation
 
 
+def _coerce_column(values: Any, name: str) -> Sequence[Any]:
+    if isinstance(values, (str, bytes)) or not hasattr(values, "__len__"):
+        raise TypeError(f"{name} must be a sequence")
+    return values
+
+
+def _mitigated_batch_python(
+    attack_power: Sequence[Any],
+    armour_ac: Sequence[Any],
+    dex_bonus: Sequence[Any],
+) -> List[int]:
+    results: List[int] = []
+    append = results.append
+    for power, armour, dex in zip(attack_power, armour_ac, dex_bonus):
+        total_ac = max(0, _coerce_int(dex, 0)) + max(0, _coerce_int(armour, 0))
+        append(apply_ac_mitigation(power, total_ac))
+    return results
+
+
+def _mitigated_batch_numpy(attack_power: Any, armour_ac: Any, dex_bonus: Any) -> Any:
+    power = _np.asarray(attack_power, dtype=_np.int64)
+    total_ac = _np.maximum(_np.asarray(dex_bonus, dtype=_np.int64), 0) + _np.maximum(
+        _np.asarray(armour_ac, dtype=_np.int64), 0
+    )
+    # ``np.rint`` rounds half to even like ``round`` and the float64 products
+    # match the scalar path bit for bit.
+    mitigation = _np.rint((total_ac / 10) * 3.15).astype(_np.int64)
+    return power - mitigation
+
+
+def numpy_available() -> bool:
+    """Return ``True`` when the numpy fast path of the batch API can be used."""
+
+    return _np is not None
+
+
+def resolve_attacks_batch(
+    attack_power: Sequence[Any],
+    armour_ac: Sequence[Any],
+    dex_bonus: Sequence[Any],
+    *,
+    use_numpy: Optional[bool] = None,
+) -> Any:
+    """Return pre-floor damage for many attacks at once.
+
+    The batch mirrors :func:`resolve_attack` for callers that have already
+    resolved attacker power and defender armour, e.g. balance simulations.
+    Element ``i`` equals ``apply_ac_mitigation(attack_power[i], ac)`` where
+    ``ac`` is the defender AC that :func:`get_total_ac` would report for a
+    defender with ``dex_bonus[i]`` and equipped ``armour_ac[i]``.
+
+    Parameters
+    ----------
+    attack_power
+        Attacker power per attack, as returned by :func:`get_attacker_power`.
+    armour_ac
+        Armour class contributed by the defender's equipped armour.
+    dex_bonus
+        Defender dexterity bonus. Negative values clamp to ``0`` like the
+        scalar path.
+    use_numpy
+        ``None`` picks numpy when it is installed, ``False`` forces the
+        pure-Python loop and ``True`` requires numpy.
+
+    Returns
+    -------
+    list of int or numpy.ndarray
+        Damage per attack prior to damage floors. The numpy path returns an
+        ``int64`` array; the fallback returns a list.
+
+    Raises
+    ------
+    ValueError
+        If the input columns differ in length.
+    RuntimeError
+        If ``use_numpy`` is ``True`` and numpy is not installed.
+    """
+
+    attack_power = _coerce_column(attack_power, "attack_power")
+    armour_ac = _coerce_column(armour_ac, "armour_ac")
+    dex_bonus = _coerce_column(dex_bonus, "dex_bonus")
+    if not len(attack_power) == len(armour_ac) == len(dex_bonus):
+        raise ValueError("attack_power, armour_ac and dex_bonus must have the same length")
+
+    if use_numpy is None:
+        use_numpy = _np is not None
+    if use_numpy:
+        if _np is None:
+            raise RuntimeError("numpy is not installed")
+        return _mitigated_batch_numpy(attack_power, armour_ac, dex_bonus)
+    return _mitigated_batch_python(attack_power, armour_ac, dex_bonus)
+
+
 def _resolve_enchant_level(item: Any, payload: Mapping[str, Any]) -> int:
     if "enchant_level" in payload:
         return max(0, _coerce_int(payload.get("enchant_level"), 0))
@@ -0,0 +1,297 @@
+"""Idle-time maintenance of the SQLite state database.
+
+SQLite checkpoints the WAL from whichever commit crosses
+``wal_autocheckpoint`` pages, which can land in the middle of a player turn.
+While the REPL is blocked on input it has nothing else to do, so
+:func:`enter_idle` wakes a background thread that
+
+* runs ``PRAGMA wal_checkpoint(PASSIVE)`` (never blocks the game),
+* switches to ``TRUNCATE`` once the ``-wal`` file exceeds ``truncate_kb``,
+* runs ``PRAGMA optimize`` every ``optimize_interval_s`` seconds.
+
+Once the REPL drives turns through :func:`leave_idle`, automatic
+checkpointing is turned off on the game's connections so commits never pay
+for it.  Headless runs never go idle and keep SQLite's automatic checkpoints.
+
+The thread uses its own private connection: registry connections belong to
+the thread that opened them.  Timings are reported by ``debug wal``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Any, Dict, List, Optional
+
+from mutants.env import db_maintenance_config, get_state_backend, get_state_database_path
+from mutants.registries import sqlite_store
+
+LOG = logging.getLogger(__name__)
+
+__all__ = [
+    "DbMaintenance",
+    "current",
+    "enter_idle",
+    "format_stats",
+    "leave_idle",
+    "run_idle_maintenance",
+    "start",
+    "stats",
+    "stop",
+]
+
+# The maintenance connection gives up quickly rather than queue behind a turn.
+_BUSY_TIMEOUT_MS = 100
+
+
+class _Timing:
+    __slots__ = ("runs", "total_ms", "last_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.runs += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "runs": self.runs,
+            "total_ms": round(self.total_ms, 3),
+            "last_ms": round(self.last_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class DbMaintenance:
+    """Background thread that checkpoints and optimizes while the REPL idles."""
+
+    def __init__(self, *, truncate_kb: int = 4096, optimize_interval_s: float = 600.0) -> None:
+        self.truncate_bytes = max(0, int(truncate_kb)) * 1024
+        self.optimize_interval_s = float(optimize_interval_s)
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[Path] = None
+        self._last_optimize = monotonic()
+        self.turns_own_checkpoints = False
+        self.idle_passes = 0
+        self.errors = 0
+        self.last_checkpoint: Optional[tuple[int, int, int]] = None
+        self.wal_bytes = 0
+        self.timings = {"passive": _Timing(), "truncate": _Timing(), "optimize": _Timing()}
+
+    # Lifecycle ---------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="mutants-db-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._idle.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            self._close_connection()
+        if self.turns_own_checkpoints:
+            sqlite_store.set_wal_autocheckpoint(None)
+            self.turns_own_checkpoints = False
+
+    def enter_idle(self) -> None:
+        self._idle.set()
+
+    def leave_idle(self) -> None:
+        self._idle.clear()
+        if not self.turns_own_checkpoints:
+            # From here on checkpoints happen between turns, not inside them.
+            sqlite_store.set_wal_autocheckpoint(0)
+            self.turns_own_checkpoints = True
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._idle.wait()
+            if self._stopping.is_set():
+                break
+            self._idle.clear()  # one pass per idle period
+            self.run_once()
+
+    # Work --------------------------------------------------------------
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:  # pragma: no cover - defensive
+                pass
+        self._conn = None
+        self._conn_path = None
+
+    def _connection(self, path: Path) -> sqlite3.Connection:
+        if self._conn is None or self._conn_path != path:
+            self._close_connection()
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+            self._conn = conn
+            self._conn_path = path
+        return self._conn
+
+    def _timed(self, conn: sqlite3.Connection, kind: str, sql: str) -> Any:
+        started = perf_counter()
+        row = conn.execute(sql).fetchone()
+        self.timings[kind].add((perf_counter() - started) * 1000.0)
+        return row
+
+    def run_once(self) -> bool:
+        """Checkpoint (and maybe optimize) the state database now.
+
+        Returns ``False`` when there was nothing to maintain.
+        """
+
+        if get_state_backend() == "sqlite-memory":
+            return False
+        path = get_state_database_path()
+        if not path.exists():
+            return False
+        wal_path = path.with_name(path.name + "-wal")
+        with self._lock:
+            try:
+                conn = self._connection(path)
+                row = self._timed(conn, "passive", "PRAGMA wal_checkpoint(PASSIVE)")
+                if row is not None:
+                    self.last_checkpoint = (int(row[0]), int(row[1]), int(row[2]))
+                wal_bytes = wal_path.stat().st_size if wal_path.exists() else 0
+                if wal_bytes > self.truncate_bytes:
+                    row = self._timed(conn, "truncate", "PRAGMA wal_checkpoint(TRUNCATE)")
+                    if row is not None:
+                        self.last_checkpoint = (int(row[0]), int(row[1]), int(row[2]))
+                    wal_bytes = wal_path.stat().st_size if wal_path.exists() else 0
+                self.wal_bytes = wal_bytes
+                if monotonic() - self._last_optimize >= self.optimize_interval_s:
+                    self._timed(conn, "optimize", "PRAGMA optimize")
+                    self._last_optimize = monotonic()
+            except (sqlite3.Error, OSError):
+                self.errors += 1
+                LOG.debug("Idle database maintenance failed", exc_info=True)
+                self._close_connection()
+            self.idle_passes += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "idle_passes": self.idle_passes,
+            "errors": self.errors,
+            "wal_bytes": self.wal_bytes,
+            "autocheckpoint_off": self.turns_own_checkpoints,
+            "last_checkpoint": self.last_checkpoint,
+            **{kind: timing.as_dict() for kind, timing in self.timings.items()},
+        }
+
+
+_SERVICE: Optional[DbMaintenance] = None
+
+
+def start() -> Optional[DbMaintenance]:
+    """Start the maintenance thread (once per process) unless disabled."""
+
+    global _SERVICE
+    config = db_maintenance_config()
+    if not config["enabled"]:
+        return None
+    if _SERVICE is None:
+        _SERVICE = DbMaintenance(
+            truncate_kb=config["truncate_kb"],
+            optimize_interval_s=config["optimize_interval_s"],
+        )
+    _SERVICE.start()
+    return _SERVICE
+
+
+def stop() -> None:
+    global _SERVICE
+    if _SERVICE is not None:
+        _SERVICE.stop()
+        _SERVICE = None
+
+
+def current() -> Optional[DbMaintenance]:
+    return _SERVICE
+
+
+def enter_idle() -> None:
+    """The REPL is about to block on input."""
+
+    if _SERVICE is not None:
+        _SERVICE.enter_idle()
+
+
+def leave_idle() -> None:
+    """The REPL has input and is about to run a turn."""
+
+    if _SERVICE is not None:
+        _SERVICE.leave_idle()
+
+
+def run_idle_maintenance() -> bool:
+    """Run one maintenance pass on the calling thread (tools and tests)."""
+
+    service = _SERVICE
+    if service is None:
+        config = db_maintenance_config()
+        service = DbMaintenance(
+            truncate_kb=config["truncate_kb"], optimize_interval_s=config["optimize_interval_s"]
+        )
+    return service.run_once()
+
+
+def stats() -> Optional[Dict[str, Any]]:
+    return _SERVICE.stats() if _SERVICE is not None else None
+
+
+def format_stats(data: Optional[Dict[str, Any]]) -> List[str]:
+    """Render :func:`stats` as ``debug wal`` lines."""
+
+    if data is None:
+        return ["DB maintenance: not running (MUTANTS_DB_MAINTENANCE=0 or no REPL)."]
+    state = "running" if data["running"] else "stopped"
+    autockpt = "off during turns" if data["autocheckpoint_off"] else "SQLite default"
+    lines = [
+        f"DB maintenance: {state}, {data['idle_passes']} idle passes, {data['errors']} errors, "
+        f"WAL {data['wal_bytes'] / 1024:.0f} KiB, autocheckpoint {autockpt}"
+    ]
+    for kind in ("passive", "truncate", "optimize"):
+        timing = data[kind]
+        runs = timing["runs"]
+        mean = timing["total_ms"] / runs if runs else 0.0
+        lines.append(
+            f"  {kind:<9} {runs:>6} runs  last {timing['last_ms']:8.3f}ms  "
+            f"mean {mean:8.3f}ms  max {timing['max_ms']:8.3f}ms"
+        )
+    if data["last_checkpoint"] is not None:
+        busy, log_pages, done = data["last_checkpoint"]
+        lines.append(f"  last checkpoint: {done}/{log_pages} WAL pages copied{' (busy)' if busy else ''}")
+    return lines
+
+
+atexit.register(stop)
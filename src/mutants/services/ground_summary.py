@@ -0,0 +1,306 @@
+"""Per-tick summaries of the items lying on a tile.
+
+The monster AI feature gates, the monster pickup action and the room renderer
+all ask what is on the ground under someone.  Each of those used to run its
+own ``items_instances`` query for the same tile.  Between :func:`begin_tick`
+and :func:`end_tick` the summaries are cached by ``(year, x, y)``, and
+:func:`prefetch` loads every tile occupied by the active monsters with one
+batched query.
+
+Every write to the items store invalidates the tiles it touches.  The store
+reports the iid and the item's new position; the item's previous tile is found
+through the iids held by the cached summaries.  Bulk writes drop the whole
+cache.  Outside a tick, :func:`get` always reads the store.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from mutants.env import get_state_database_path
+from mutants.registries import items_catalog, items_instances as itemsreg
+from mutants.registries import sqlite_store
+from mutants.services.items_weight import get_effective_weight
+
+__all__ = [
+    "GroundItem",
+    "GroundSummary",
+    "active",
+    "begin_tick",
+    "cached",
+    "end_tick",
+    "get",
+    "invalidate",
+    "prefetch",
+    "stats",
+]
+
+Pos = Tuple[int, int, int]
+
+_BROKEN_ITEM_IDS = frozenset({itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID})
+
+
+@dataclass(frozen=True)
+class GroundItem:
+    """One item instance lying on a tile."""
+
+    iid: str
+    item_id: str
+    value: int
+    weight: int
+
+    @property
+    def pickable(self) -> bool:
+        return bool(self.item_id) and self.item_id not in _BROKEN_ITEM_IDS
+
+
+@dataclass(frozen=True)
+class GroundSummary:
+    """The items on one tile, in display order (oldest first)."""
+
+    pos: Pos
+    items: Tuple[GroundItem, ...]
+    instances: Tuple[Mapping[str, Any], ...]
+
+    @property
+    def iids(self) -> Tuple[str, ...]:
+        return tuple(item.iid for item in self.items)
+
+    @property
+    def item_ids(self) -> Tuple[str, ...]:
+        return tuple(item.item_id for item in self.items if item.item_id)
+
+    @property
+    def has_pickup(self) -> bool:
+        """True when a monster could pick something up (anything not broken)."""
+
+        return any(item.pickable for item in self.items)
+
+    @property
+    def has_convertible(self) -> bool:
+        return any(item.pickable and item.value > 0 for item in self.items)
+
+
+class _TickCache:
+    __slots__ = ("active", "source", "tiles", "iid_pos", "catalog", "hits", "misses", "batches")
+
+    def __init__(self) -> None:
+        self.active = False
+        self.source: Optional[Path] = None
+        self.tiles: Dict[Pos, GroundSummary] = {}
+        self.iid_pos: Dict[str, Pos] = {}
+        self.catalog: Any = None
+        self.hits = 0
+        self.misses = 0
+        self.batches = 0
+
+    def reset(self) -> None:
+        self.tiles.clear()
+        self.iid_pos.clear()
+        self.catalog = None
+
+    def store(self, summary: GroundSummary) -> None:
+        self.drop(summary.pos)
+        self.tiles[summary.pos] = summary
+        for iid in summary.iids:
+            self.iid_pos[iid] = summary.pos
+
+    def drop(self, pos: Pos) -> None:
+        previous = self.tiles.pop(pos, None)
+        if previous is None:
+            return
+        for iid in previous.iids:
+            if self.iid_pos.get(iid) == pos:
+                del self.iid_pos[iid]
+
+
+_CACHE = _TickCache()
+
+
+def _coerce_pos(pos: Iterable[Any]) -> Optional[Pos]:
+    try:
+        year, x, y = (int(value) for value in pos)
+    except (TypeError, ValueError):
+        return None
+    return (year, x, y)
+
+
+def _catalog() -> Any:
+    if _CACHE.active and _CACHE.catalog is not None:
+        return _CACHE.catalog
+    try:
+        catalog = items_catalog.load_catalog()
+    except FileNotFoundError:
+        catalog = {}
+    if _CACHE.active:
+        _CACHE.catalog = catalog
+    return catalog
+
+
+def _template(catalog: Any, item_id: str) -> Mapping[str, Any] | None:
+    getter = getattr(catalog, "get", None)
+    if not callable(getter):
+        return None
+    template = getter(item_id)
+    return template if isinstance(template, Mapping) else None
+
+
+def _convert_value(catalog: Any, item_id: str, enchant_level: Any) -> int:
+    from mutants.commands import convert as convert_cmd  # local import to avoid cycle
+
+    # Same as convert._convert_value, but uses the enchant level already on
+    # the instance instead of re-reading it from the registry.
+    try:
+        base, defined = convert_cmd._base_convert_value(item_id, catalog)
+        if not defined:
+            return 0
+        return base + convert_cmd._enchant_convert_bonus(enchant_level)
+    except Exception:
+        return 0
+
+
+def _summarize(pos: Pos, instances: Iterable[Mapping[str, Any]], catalog: Any) -> GroundSummary:
+    items = []
+    kept = []
+    for inst in instances:
+        # Only unowned instances are on the ground.
+        if inst.get("owner") not in (None, "", 0):
+            continue
+        item_id = str(inst.get("item_id") or inst.get("catalog_id") or "").strip()
+        iid = str(inst.get("iid") or inst.get("instance_id") or "")
+        template = _template(catalog, item_id) if item_id else None
+        try:
+            weight = get_effective_weight(inst, template)
+        except Exception:
+            weight = 0
+        items.append(
+            GroundItem(
+                iid=iid,
+                item_id=item_id,
+                value=_convert_value(catalog, item_id, inst.get("enchant_level")) if item_id else 0,
+                weight=weight,
+            )
+        )
+        kept.append(inst)
+    return GroundSummary(pos=pos, items=tuple(items), instances=tuple(kept))
+
+
+def _fetch(positions: Iterable[Pos]) -> Dict[Pos, GroundSummary]:
+    rows = itemsreg.list_instances_at_many(positions)
+    catalog = _catalog()
+    return {pos: _summarize(pos, instances, catalog) for pos, instances in rows.items()}
+
+
+def _ensure_source() -> None:
+    """Drop the cache if the state database moved since :func:`begin_tick`."""
+
+    source = get_state_database_path()
+    if source != _CACHE.source:
+        _CACHE.reset()
+        _CACHE.source = source
+
+
+def active() -> bool:
+    return _CACHE.active
+
+
+def begin_tick() -> None:
+    """Start caching ground summaries; drops anything left from the last tick."""
+
+    _CACHE.reset()
+    _CACHE.source = get_state_database_path()
+    _CACHE.active = True
+
+
+def end_tick() -> None:
+    """Stop caching and drop every summary taken during the tick."""
+
+    _CACHE.active = False
+    _CACHE.reset()
+    _CACHE.source = None
+
+
+def prefetch(positions: Iterable[Iterable[Any]]) -> int:
+    """Load every uncached tile in *positions* with a single batched query.
+
+    Returns the number of tiles fetched.  Does nothing outside a tick.
+    """
+
+    if not _CACHE.active:
+        return 0
+    _ensure_source()
+    wanted = []
+    seen = set()
+    for raw in positions:
+        pos = _coerce_pos(raw) if raw is not None else None
+        if pos is None or pos in seen or pos in _CACHE.tiles:
+            continue
+        seen.add(pos)
+        wanted.append(pos)
+    if not wanted:
+        return 0
+    _CACHE.batches += 1
+    for summary in _fetch(wanted).values():
+        _CACHE.store(summary)
+    return len(wanted)
+
+
+def cached(year: int, x: int, y: int) -> Optional[GroundSummary]:
+    """Return the summary already loaded for the tile this tick, if any."""
+
+    if not _CACHE.active:
+        return None
+    _ensure_source()
+    return _CACHE.tiles.get((int(year), int(x), int(y)))
+
+
+def get(year: int, x: int, y: int) -> GroundSummary:
+    """Return the ground summary for ``(year, x, y)``."""
+
+    pos = (int(year), int(x), int(y))
+    if _CACHE.active:
+        _ensure_source()
+        summary = _CACHE.tiles.get(pos)
+        if summary is not None:
+            _CACHE.hits += 1
+            return summary
+        _CACHE.misses += 1
+    summary = _fetch([pos])[pos]
+    if _CACHE.active:
+        _CACHE.store(summary)
+    return summary
+
+
+def invalidate(iid: Optional[str] = None, pos: Optional[Pos] = None) -> None:
+    """Drop the tiles touched by a write to *iid* (now at *pos*).
+
+    ``invalidate()`` with no arguments drops the whole cache.
+    """
+
+    if not _CACHE.active:
+        return
+    if iid is None and pos is None:
+        _CACHE.reset()
+        return
+    if iid is not None:
+        previous = _CACHE.iid_pos.get(str(iid))
+        if previous is not None:
+            _CACHE.drop(previous)
+    if pos is not None:
+        _CACHE.drop(tuple(pos))  # type: ignore[arg-type]
+
+
+def stats() -> Dict[str, int]:
+    """Return cache counters (for debugging and benchmarks)."""
+
+    return {
+        "hits": _CACHE.hits,
+        "misses": _CACHE.misses,
+        "batches": _CACHE.batches,
+        "tiles": len(_CACHE.tiles),
+    }
+
+
+sqlite_store.add_items_listener(invalidate)
@@ -0,0 +1,422 @@
+"""Running per-owner inventory aggregates.
+
+The inventory and statistics commands need the carried weight, item count and
+worn armour class of the active player, and combat needs the armour class on
+every exchange.  Rather than walking the bag with a registry fetch and catalog
+lookup per item each time, this module caches one :class:`ItemContribution`
+per item instance and keeps a running :class:`OwnerAggregate` per owner.
+
+Aggregates are adjusted by deltas: bag syncs only resolve iids that entered the
+bag, and the items registry reports enchant, condition, template and deletion
+changes through :func:`item_changed`.  Set ``MUTANTS_OWNER_AGGREGATES_TABLE=1``
+to mirror the totals into the ``owner_aggregates`` SQLite table.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from mutants.env import get_state_database_path, owner_aggregates_table_enabled
+from mutants.registries import items_catalog, items_instances as itemsreg
+from mutants.registries.storage import get_stores
+from mutants.services.items_weight import get_effective_weight
+
+LOG = logging.getLogger(__name__)
+
+_UNCHANGED: Any = object()
+
+__all__ = [
+    "InventoryAggregates",
+    "ItemContribution",
+    "OwnerAggregate",
+    "contribution_for",
+    "forget_owner",
+    "get_aggregates",
+    "item_changed",
+    "recompute_owner",
+    "reset",
+    "sync_owner",
+    "verify_owner",
+]
+
+
+@dataclass(frozen=True)
+class ItemContribution:
+    """Weight and armour class a single item instance adds to its owner."""
+
+    iid: str
+    item_id: Optional[str]
+    exists: bool
+    weight: int
+    armour_class: int
+
+
+@dataclass
+class OwnerAggregate:
+    """Running totals for one owner's bag and worn armour."""
+
+    owner: str
+    total_weight: int = 0
+    item_count: int = 0
+    armour_class: int = 0
+    armour_iid: Optional[str] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def totals(self) -> tuple[int, int, int]:
+        return (self.total_weight, self.item_count, self.armour_class)
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _load_catalog() -> Any:
+    try:
+        return items_catalog.load_catalog()
+    except FileNotFoundError:
+        return None
+
+
+def _template_id(inst: Mapping[str, Any]) -> Optional[str]:
+    for key in ("item_id", "catalog_id", "id"):
+        value = inst.get(key)
+        if value:
+            return str(value)
+    return None
+
+
+def _resolve_contribution(
+    iid: str, inst: Optional[Mapping[str, Any]] = None, *, catalog: Any = None
+) -> ItemContribution:
+    """Resolve the contribution of ``iid`` using the same rules as the commands.
+
+    ``inst`` may be supplied by callers that already fetched the instance.
+    Unknown iids fall back to being treated as catalog ids, which mirrors the
+    legacy inventory rendering of template-only entries.
+    """
+
+    if inst is None:
+        inst = itemsreg.get_instance(iid)
+    if catalog is None:
+        catalog = _load_catalog()
+
+    item_id: Optional[str]
+    if inst:
+        item_id = _template_id(inst)
+    else:
+        item_id = str(iid)
+
+    template = catalog.get(item_id) if (catalog and item_id) else None
+    weight_template: Mapping[str, Any] = template if isinstance(template, Mapping) else {}
+    if not weight_template and item_id:
+        try:
+            weight_template = items_catalog.catalog_defaults(item_id)
+        except Exception:
+            weight_template = {}
+
+    weight = max(0, _coerce_int(get_effective_weight(inst if inst else None, weight_template)))
+
+    armour_class = 0
+    if isinstance(template, Mapping):
+        enchant = itemsreg._sanitize_enchant_level(inst.get("enchant_level")) if inst else 0
+        armour_class = max(0, _coerce_int(template.get("armour_class"))) + max(0, enchant)
+
+    return ItemContribution(
+        iid=str(iid),
+        item_id=item_id,
+        exists=bool(inst),
+        weight=weight,
+        armour_class=armour_class,
+    )
+
+
+class InventoryAggregates:
+    """In-memory aggregate registry bound to one state database."""
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else get_state_database_path()
+        self._contributions: Dict[str, ItemContribution] = {}
+        self._owners: Dict[str, OwnerAggregate] = {}
+        self._holders: Dict[str, Set[str]] = {}
+        self._lock = RLock()
+
+    # Lookups ------------------------------------------------------------
+    def contribution(
+        self, iid: str, inst: Optional[Mapping[str, Any]] = None
+    ) -> ItemContribution:
+        """Return the cached contribution for ``iid`` resolving it on a miss."""
+
+        key = str(iid)
+        with self._lock:
+            cached = self._contributions.get(key)
+            if cached is not None:
+                return cached
+            resolved = _resolve_contribution(key, inst)
+            self._contributions[key] = resolved
+            return resolved
+
+    def get(self, owner: str) -> Optional[OwnerAggregate]:
+        with self._lock:
+            return self._owners.get(str(owner))
+
+    # Owner mutations ----------------------------------------------------
+    def sync_owner(
+        self,
+        owner: str,
+        iids: Iterable[str],
+        *,
+        armour_iid: Optional[str] = _UNCHANGED,
+        instances: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> OwnerAggregate:
+        """Bring ``owner`` in line with ``iids`` applying only the differences.
+
+        ``armour_iid`` is left untouched when omitted.  ``instances`` lets
+        callers that already fetched the bag seed the contribution cache so
+        new entries do not trigger a second fetch.
+        """
+
+        owner_key = str(owner)
+        wanted: Dict[str, int] = {}
+        for iid in iids:
+            if not iid:
+                continue
+            token = str(iid)
+            wanted[token] = wanted.get(token, 0) + 1
+        preloaded = instances or {}
+
+        with self._lock:
+            agg = self._owners.get(owner_key)
+            if agg is None:
+                agg = OwnerAggregate(owner=owner_key)
+                self._owners[owner_key] = agg
+            before = agg.totals()
+
+            for iid in [token for token in agg.counts if token not in wanted]:
+                self._adjust(agg, iid, -agg.counts[iid])
+            for iid, count in wanted.items():
+                delta = count - agg.counts.get(iid, 0)
+                if delta:
+                    if iid not in self._contributions and iid in preloaded:
+                        self.contribution(iid, preloaded[iid])
+                    self._adjust(agg, iid, delta)
+
+            if armour_iid is not _UNCHANGED:
+                self._set_armour(agg, armour_iid)
+            if agg.totals() != before:
+                self._persist(agg)
+            return agg
+
+    def add_item(self, owner: str, iid: str) -> OwnerAggregate:
+        with self._lock:
+            agg = self._owners.setdefault(str(owner), OwnerAggregate(owner=str(owner)))
+            self._adjust(agg, str(iid), 1)
+            self._persist(agg)
+            return agg
+
+    def remove_item(self, owner: str, iid: str) -> Optional[OwnerAggregate]:
+        with self._lock:
+            agg = self._owners.get(str(owner))
+            if agg is None or str(iid) not in agg.counts:
+                return agg
+            self._adjust(agg, str(iid), -1)
+            self._persist(agg)
+            return agg
+
+    def forget_owner(self, owner: str) -> None:
+        with self._lock:
+            agg = self._owners.pop(str(owner), None)
+            if agg is None:
+                return
+            for iid in list(agg.counts) + ([agg.armour_iid] if agg.armour_iid else []):
+                self._release(owner, iid)
+        if owner_aggregates_table_enabled():
+            try:
+                get_stores().owner_aggregates.delete(str(owner))
+            except Exception:  # pragma: no cover - best-effort mirror
+                LOG.debug("owner_aggregates delete failed owner=%s", owner, exc_info=True)
+
+    # Item mutations -----------------------------------------------------
+    def item_changed(self, iid: str) -> None:
+        """Re-resolve ``iid`` and push the delta to every owner holding it."""
+
+        key = str(iid)
+        with self._lock:
+            old = self._contributions.pop(key, None)
+            holders = self._holders.get(key)
+            if old is None or not holders:
+                return
+            new = self.contribution(key)
+            for owner in list(holders):
+                agg = self._owners.get(owner)
+                if agg is None:
+                    continue
+                before = agg.totals()
+                count = agg.counts.get(key, 0)
+                agg.total_weight += (new.weight - old.weight) * count
+                if agg.armour_iid == key:
+                    agg.armour_class = new.armour_class
+                if agg.totals() != before:
+                    self._persist(agg)
+
+    # Verification -------------------------------------------------------
+    def recompute(self, owner: str) -> Optional[OwnerAggregate]:
+        """Return freshly computed totals for ``owner`` bypassing every cache."""
+
+        with self._lock:
+            agg = self._owners.get(str(owner))
+            if agg is None:
+                return None
+            counts = dict(agg.counts)
+            armour_iid = agg.armour_iid
+        catalog = _load_catalog()
+        fresh = OwnerAggregate(owner=str(owner), armour_iid=armour_iid, counts=counts)
+        for iid, count in counts.items():
+            fresh.total_weight += _resolve_contribution(iid, catalog=catalog).weight * count
+            fresh.item_count += count
+        if armour_iid:
+            fresh.armour_class = _resolve_contribution(armour_iid, catalog=catalog).armour_class
+        return fresh
+
+    def verify(self, owner: Optional[str] = None) -> List[str]:
+        """Return human readable mismatches between running and fresh totals."""
+
+        with self._lock:
+            owners = [str(owner)] if owner is not None else sorted(self._owners)
+        problems: List[str] = []
+        for key in owners:
+            running = self.get(key)
+            fresh = self.recompute(key)
+            if running is None or fresh is None:
+                continue
+            if running.totals() != fresh.totals():
+                problems.append(
+                    f"{key}: running={running.totals()} recomputed={fresh.totals()}"
+                )
+        return problems
+
+    # Internal helpers ---------------------------------------------------
+    def _adjust(self, agg: OwnerAggregate, iid: str, delta: int) -> None:
+        contrib = self.contribution(iid)
+        count = agg.counts.get(iid, 0) + delta
+        if count > 0:
+            agg.counts[iid] = count
+            self._holders.setdefault(iid, set()).add(agg.owner)
+        else:
+            agg.counts.pop(iid, None)
+            if agg.armour_iid != iid:
+                self._release(agg.owner, iid)
+        agg.total_weight += contrib.weight * delta
+        agg.item_count += delta
+
+    def _set_armour(self, agg: OwnerAggregate, armour_iid: Optional[str]) -> None:
+        token = str(armour_iid) if armour_iid else None
+        if token == agg.armour_iid:
+            return
+        previous = agg.armour_iid
+        agg.armour_iid = token
+        if previous and previous not in agg.counts:
+            self._release(agg.owner, previous)
+        if token:
+            self._holders.setdefault(token, set()).add(agg.owner)
+            agg.armour_class = self.contribution(token).armour_class
+        else:
+            agg.armour_class = 0
+
+    def _release(self, owner: str, iid: str) -> None:
+        holders = self._holders.get(iid)
+        if holders is None:
+            return
+        holders.discard(str(owner))
+        if not holders:
+            self._holders.pop(iid, None)
+            self._contributions.pop(iid, None)
+
+    def _persist(self, agg: OwnerAggregate) -> None:
+        if not owner_aggregates_table_enabled():
+            return
+        try:
+            get_stores().owner_aggregates.upsert(
+                agg.owner,
+                total_weight=agg.total_weight,
+                item_count=agg.item_count,
+                armour_class=agg.armour_class,
+            )
+        except Exception:  # pragma: no cover - best-effort mirror
+            LOG.debug("owner_aggregates upsert failed owner=%s", agg.owner, exc_info=True)
+
+
+_AGGREGATES: Optional[InventoryAggregates] = None
+_AGGREGATES_LOCK = RLock()
+
+
+def get_aggregates() -> InventoryAggregates:
+    """Return the process-wide registry for the active state database."""
+
+    global _AGGREGATES
+    db_path = get_state_database_path()
+    with _AGGREGATES_LOCK:
+        if _AGGREGATES is None or _AGGREGATES.db_path != db_path:
+            _AGGREGATES = InventoryAggregates(db_path)
+        return _AGGREGATES
+
+
+def reset() -> None:
+    """Drop every cached contribution and aggregate."""
+
+    global _AGGREGATES
+    with _AGGREGATES_LOCK:
+        _AGGREGATES = None
+
+
+def contribution_for(iid: str) -> ItemContribution:
+    """Return the cached contribution for ``iid``."""
+
+    return get_aggregates().contribution(iid)
+
+
+def sync_owner(
+    owner: str,
+    iids: Iterable[str],
+    *,
+    armour_iid: Optional[str] = _UNCHANGED,
+    instances: Optional[Mapping[str, Mapping[str, Any]]] = None,
+) -> OwnerAggregate:
+    """Sync ``owner`` against ``iids`` using the shared registry."""
+
+    return get_aggregates().sync_owner(
+        owner, iids, armour_iid=armour_iid, instances=instances
+    )
+
+
+def item_changed(iid: str) -> None:
+    """Invalidate ``iid`` after an enchant, condition, template or delete change."""
+
+    global _AGGREGATES
+    if _AGGREGATES is None:
+        return
+    _AGGREGATES.item_changed(iid)
+
+
+def forget_owner(owner: str) -> None:
+    """Drop the running aggregate for ``owner``."""
+
+    get_aggregates().forget_owner(owner)
+
+
+def recompute_owner(owner: str) -> Optional[OwnerAggregate]:
+    """Return freshly computed totals for ``owner``."""
+
+    return get_aggregates().recompute(owner)
+
+
+def verify_owner(owner: Optional[str] = None) -> List[str]:
+    """Return mismatches between running and recomputed aggregates."""
+
+    return get_aggregates().verify(owner)
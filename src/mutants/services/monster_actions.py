@@ -9,7 +9,7 @@ from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Optio
 from mutants.commands import convert as convert_cmd
 from mutants.registries import items_catalog, items_instances as itemsreg
 from mutants.services import combat_actions, combat_loot
-from mutants.services import damage_engine, items_wear, monsters_state
+from mutants.services import damage_engine, ground_summary, items_wear, monsters_state
 from mutants.services import player_death
 from mutants.services import player_state as pstate
 from mutants.services.combat_config import CombatConfig
@@ -19,6 +19,7 @@ from mutants.services.monster_ai import inventory as inventory_mod
 from mutants.services.monster_ai import heal as heal_mod
 from mutants.services.monster_ai import casting as casting_mod
 from mutants.services.monster_ai import emote as emote_mod
+from mutants.services.monster_ai import player_snapshot as snapshot_mod
 from mutants.services.monster_ai import taunt as taunt_mod
 from mutants.services.monster_ai import tracking as tracking_mod
 from mutants.services.monster_ai.pursuit import attempt_pursuit, attempt_flee_step
@@ -133,8 +134,15 @@ def _drop_entry_sort_key(
     return (label.lower(), item_id, iid)
 
 
-def _is_collocated(monster: Mapping[str, Any], ctx: Mapping[str, Any]) -> bool:
+def _is_collocated(
+    monster: Mapping[str, Any],
+    ctx: Mapping[str, Any],
+    player: snapshot_mod.PlayerSnapshot | None = None,
+) -> bool:
     """Return True when monster and active player share the same tile/year."""
+    snapshot = player or snapshot_mod.current(ctx)
+    if snapshot is not None:
+        return snapshot.collocated_with(monster.get("pos"))
     try:
         state = ctx.get("player_state") if isinstance(ctx, Mapping) and isinstance(ctx.get("player_state"), Mapping) else None
     except Exception:
@@ -468,6 +476,8 @@ def _catalogue_base_damage(
 def _score_pickup_candidate(
     inst: Mapping[str, Any],
     catalog: Mapping[str, Mapping[str, Any]],
+    *,
+    convert_value: Optional[int] = None,
 ) -> int:
     item_id = _resolve_item_id(inst)
     if not item_id or _is_broken_placeholder(item_id):
@@ -481,12 +491,15 @@ def _score_pickup_candidate(
     base_damage = _derived_base_damage(inst)
     if base_damage is None:
         base_damage = _catalogue_base_damage(tpl, enchant)
-    iid = inst.get("iid") or inst.get("instance_id")
-    iid_token = None
-    if iid is not None:
-        token = str(iid)
-        iid_token = token if token else None
-    convert_val = _convert_value(catalog, iid_token, item_id)
+    if convert_value is None:
+        iid = inst.get("iid") or inst.get("instance_id")
+        iid_token = None
+        if iid is not None:
+            token = str(iid)
+            iid_token = token if token else None
+        convert_val = _convert_value(catalog, iid_token, item_id)
+    else:
+        convert_val = convert_value
     base_damage = max(0, base_damage)
     convert_val = max(0, convert_val)
     if base_damage <= 0 and convert_val <= 0:
@@ -599,6 +612,7 @@ def _apply_weapon_wear(
                 else:
                     entry.pop("condition", None)
                 entry["enchant_level"] = max(0, int(inst.get("enchant_level", 0) or 0))
+                monsters_state.bump_bag_version(monster)
             break
     payload = dict(result)
     if payload.get("cracked"):
@@ -672,6 +686,8 @@ def _handle_player_death(
     active: MutableMapping[str, Any],
     bus: Any,
 ) -> None:
+    # The player respawns elsewhere; later monsters this pass must re-resolve.
+    snapshot_mod.invalidate(ctx)
     try:
         monsters_ctx = ctx.get("monsters") if isinstance(ctx, Mapping) else None
         pstate.clear_target(reason="player-death", monsters=monsters_ctx)
@@ -720,16 +736,12 @@ def _handle_player_death(
         except Exception:
             pos = (2000, 0, 0)
     
-    catalog = _load_catalog()
     inventory_iids = _collect_player_items(state, active, victim_class)
-    dropped: list[str] = []
-    if inventory_iids:
-        dropped.extend(combat_loot.drop_existing_iids(inventory_iids, pos))
     armour_iid = pstate.get_equipped_armour_id(state)
-    if armour_iid and armour_iid not in dropped:
-        dropped.extend(combat_loot.drop_existing_iids([armour_iid], pos))
-    if dropped:
-        combat_loot.enforce_capacity(pos, dropped, bus=bus, catalog=catalog)
+    # Bag first, then worn armour; whatever the tile cannot hold vaporizes.
+    dropped, _ = combat_loot.drop_or_vaporize(
+        [inventory_iids, [armour_iid] if armour_iid else []], pos
+    )
 
     turnlog.emit(
         ctx,
@@ -1011,24 +1023,23 @@ def _pickup_from_ground(
         year, x, y = int(coords[0]), int(coords[1]), int(coords[2])
     except (TypeError, ValueError):
         return False
-    ground = itemsreg.list_instances_at(year, x, y)
-    if not ground:
+    ground = ground_summary.get(year, x, y)
+    if not ground.has_pickup:
         return False
     catalog = _load_catalog()
     best_inst: Optional[Mapping[str, Any]] = None
     best_score = -1
-    for inst in ground:
-        if not isinstance(inst, Mapping):
+    for inst, item in zip(ground.instances, ground.items):
+        if not item.pickable:
             continue
-        item_id = _resolve_item_id(inst)
-        if _is_broken_placeholder(item_id):
-            continue
-        score = _score_pickup_candidate(inst, catalog)
+        score = _score_pickup_candidate(inst, catalog, convert_value=item.value)
         if score > best_score:
             best_score = score
             best_inst = inst
     if not best_inst or best_score <= 0:
         return False
+    # Summaries are shared for the tick; work on a copy.
+    best_inst = dict(best_inst)
     iid = best_inst.get("iid") or best_inst.get("instance_id")
     if not iid:
         return False
@@ -1044,6 +1055,7 @@ def _pickup_from_ground(
     entry = _build_bag_entry(monster, best_inst, catalog)
     bag = _bag_list(monster)
     bag.append(entry)
+    monsters_state.bump_bag_version(monster)
     _add_picked_up(monster, iid_str)
     _refresh_monster(monster)
     _mark_monsters_dirty(ctx, monster)
@@ -1103,6 +1115,7 @@ def _convert_item(
     iid = str(best_entry.get("iid"))
     if best_entry in bag:
         bag.remove(best_entry)
+        monsters_state.bump_bag_version(monster)
     _remove_picked_up(monster, iid)
     if monster.get("wielded") == iid:
         monster["wielded"] = None
@@ -1589,7 +1602,14 @@ _ACTION_TABLE: dict[str, ActionFn] = {
     "idle": _idle_stub,
 }
 
-def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cast_guard: MutableMapping[str, Any] | None = None) -> Any:
+def execute_random_action(
+    monster: Any,
+    ctx: Any,
+    *,
+    rng: Any | None = None,
+    cast_guard: MutableMapping[str, Any] | None = None,
+    player: snapshot_mod.PlayerSnapshot | None = None,
+) -> Any:
     if not isinstance(monster, MutableMapping):
         return None
     if not isinstance(ctx, MutableMapping):
@@ -1599,6 +1619,8 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
     else:
         random_obj = random.Random()
     ctx["monster_ai_rng"] = random_obj
+    if player is None:
+        player = snapshot_mod.current(ctx)
     flee_mode = _is_flee_mode(monster)
     inventory_mod.process_pending_drops(monster, ctx, random_obj)
     pursuit_target = _pop_pending_pursuit(monster, ctx)
@@ -1606,7 +1628,7 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
         # Discard pending pursuits while fleeing.
         pursuit_target = None
     # Bound monsters should always advance toward their target, regardless of distance.
-    if not flee_mode and not _is_collocated(monster, ctx):
+    if not flee_mode and not _is_collocated(monster, ctx, player):
         target_id = _sanitize_player_id(monster.get("target_player_id"))
         if not target_id:
             state = monster.get("_ai_state") if isinstance(monster, Mapping) else None
@@ -1617,18 +1639,23 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
             target_pos, _ = tracking_mod.get_target_position(monster, target_id)
         if target_pos is None:
             # Try cached position for the active player even if target_id is unset.
-            player_state = ctx.get("player_state") if isinstance(ctx, Mapping) else None
             active_player_id = None
-            try:
-                state, active = pstate.get_active_pair(player_state)
-                active_player_id = _sanitize_player_id((active or {}).get("id")) if isinstance(active, Mapping) else None
-            except Exception:
-                active_player_id = None
+            if player is not None:
+                active_player_id = player.player_id
+            else:
+                player_state = ctx.get("player_state") if isinstance(ctx, Mapping) else None
+                try:
+                    state, active = pstate.get_active_pair(player_state)
+                    active_player_id = _sanitize_player_id((active or {}).get("id")) if isinstance(active, Mapping) else None
+                except Exception:
+                    active_player_id = None
             if active_player_id:
                 target_pos, _ = tracking_mod.get_target_position(monster, active_player_id)
         if target_pos is None:
             target_pos = pursuit_target
         # Fall back to the player's current position if everything else failed.
+        if target_pos is None and player is not None:
+            target_pos = player.pos
         if target_pos is None:
             player_state = ctx.get("player_state") if isinstance(ctx, Mapping) else None
             try:
@@ -1654,21 +1681,14 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
                     step_x = mx + (1 if tx > mx else -1 if tx < mx else 0)
                     step_y = my + (1 if ty > my else -1 if ty < my else 0)
                     if step_x != mx or step_y != my:
-                        monster["pos"] = [int(mpos[0]), step_x, step_y]
-                        monsters_state._refresh_monster_derived(monster)
+                        monsters_obj = ctx.get("monsters") if isinstance(ctx, Mapping) else getattr(ctx, "monsters", None)
+                        monsters_state.relocate_monster(monsters_obj, monster, (int(mpos[0]), step_x, step_y))
                         try:
                             audio_cues.emit_sound(monster.get("pos"), tpos, kind="footsteps", ctx=ctx, movement=(step_x - mx, step_y - my), once_per_frame=False)
                         except Exception:
                             LOG.debug("Failed to emit forced pursue footsteps", exc_info=True)
                         moved = True
             if moved:
-                try:
-                    monsters_obj = ctx.get("monsters") if isinstance(ctx, Mapping) else getattr(ctx, "monsters", None)
-                    updater = getattr(monsters_obj, "update_position_cache", None)
-                    if callable(updater) and mpos:
-                        updater(monster, previous_pos=mpos)
-                except Exception:
-                    pass
                 _mark_monsters_dirty(ctx, monster)
                 return {"ok": True, "pursued": True, "stop_turn": True}
     if pursuit_target is not None:
@@ -1682,7 +1702,7 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
         emote_mod.schedule_free_emote(monster, ctx, gate=cascade_result.gate)
         if action_name == "emote":
             action_name = None
-    if not action_name and _is_collocated(monster, ctx):
+    if not action_name and _is_collocated(monster, ctx, player):
         action_name = "attack"
     if not action_name:
         return None
@@ -1703,7 +1723,7 @@ def execute_random_action(monster: Any, ctx: Any, *, rng: Any | None = None, cas
         "flee_statement",
         "cast",
     }
-    if requires_collocation and not _is_collocated(monster, ctx):
+    if requires_collocation and not _is_collocated(monster, ctx, player):
         # Skip actions that require being on the same tile (e.g., taunts, attacks)
         # instead of burning the monster's whole turn.
         return {"ok": False, "reason": "not_collocated", "stop_turn": False}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
+import time
 from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Sequence, Tuple
 
 from mutants.services import player_state as pstate
@@ -9,8 +10,11 @@ from mutants.debug import turnlog
 from mutants.services import state_debug
 
 from mutants.services.combat_config import CombatConfig
-from mutants.services import monsters_state
+from mutants.services import ground_summary, monsters_state
+from . import features as features_mod
+from . import player_snapshot as snapshot_mod
 from . import pursuit
+from . import scheduler as scheduler_mod
 
 from .wake import should_wake
 from . import tracking as tracking_mod
@@ -317,6 +321,21 @@ def _iter_targeted_monsters(
 def on_player_command(ctx: Any, *, token: str, resolved: str | None, arg: str | None = None) -> None:
     """Advance monster turns after a player command."""
 
+    # Outside a scheduler tick, keep ground summaries for this pass only.
+    own_ground_tick = not ground_summary.active()
+    if own_ground_tick:
+        ground_summary.begin_tick()
+    features_mod.begin_pass()
+    try:
+        _run_monster_pass(ctx, token=token, resolved=resolved, arg=arg)
+    finally:
+        features_mod.end_pass()
+        snapshot_mod.invalidate(ctx)
+        if own_ground_tick:
+            ground_summary.end_tick()
+
+
+def _run_monster_pass(ctx: Any, *, token: str, resolved: str | None, arg: str | None) -> None:
     monsters = _pull(ctx, "monsters")
     if monsters is None:
         return
@@ -371,6 +390,9 @@ def on_player_command(ctx: Any, *, token: str, resolved: str | None, arg: str |
     except Exception:
         return
 
+    player = snapshot_mod.capture(player_id, (year, x, y), active)
+    snapshot_mod.install(ctx, player)
+
     rng = _resolve_rng(ctx)
     weights = _resolve_weights(ctx)
     config = _resolve_combat_config(ctx)
@@ -430,22 +452,10 @@ def on_player_command(ctx: Any, *, token: str, resolved: str | None, arg: str |
                 step_x = mx + (1 if tx > mx else -1 if tx < mx else 0)
                 step_y = my + (1 if ty > my else -1 if ty < my else 0)
                 if (step_x, step_y) != (mx, my):
-                    monster["pos"] = [int(pos[0]), step_x, step_y]
-                    try:
-                        monsters_state._refresh_monster_derived(monster)
-                    except Exception:
-                        pass
+                    monsters_state.relocate_monster(monsters, monster, (int(pos[0]), step_x, step_y))
                     moved = True
             except Exception:
                 moved = False
-        if moved:
-            try:
-                previous = (int(mon_pos[0]), int(mon_pos[1]), int(mon_pos[2]))
-                updater = getattr(monsters, "update_position_cache", None)
-                if callable(updater):
-                    updater(monster, previous_pos=previous)
-            except Exception:
-                pass
         if moved:
             _mark_dirty(monster)
         return moved
@@ -569,16 +579,34 @@ def on_player_command(ctx: Any, *, token: str, resolved: str | None, arg: str |
                     _force_bound_pursuit_step(monster)
                     break
             try:
-                result = actions_mod.execute_random_action(monster, ctx, rng=rng, cast_guard=cast_guard)
+                result = actions_mod.execute_random_action(
+                    monster, ctx, rng=rng, cast_guard=cast_guard, player=snapshot_mod.current(ctx)
+                )
                 if isinstance(result, Mapping) and result.get("stop_turn"):
                     break
             except Exception:  # pragma: no cover - defensive
                 LOG.exception("Monster action execution failed", extra={"monster": _monster_id(monster)})
                 break
 
-    # Only process targeted monsters in the same year.
-    for monster in _iter_targeted_monsters(monsters, year=year, player_id=player_id):
+    # Only process targeted monsters in the same year: nearby and fleeing ones
+    # get a full turn, distant pursuers are advanced coarsely on a budget.
+    ai_scheduler = scheduler_mod.get_scheduler(ctx)
+    sim_tick = ai_scheduler.begin_tick()
+    full_tier, coarse_tier = ai_scheduler.partition(
+        list(_iter_targeted_monsters(monsters, year=year, player_id=player_id)),
+        pos,
+        player_id,
+        is_flee=_is_flee_mode,
+    )
+    # One batched ground query for the player's tile and every full-tier tile.
+    ground_summary.prefetch([pos, *(monster.get("pos") for monster in full_tier)])
+    started = time.perf_counter()
+    for monster in full_tier:
         _process_monster(monster, allow_target_roll=False, require_wake=False)
+        scheduler_mod.stamp(monster, sim_tick)
+    ai_scheduler.record_full(len(full_tier), (time.perf_counter() - started) * 1000.0)
+    if coarse_tier:
+        ai_scheduler.run_coarse(ctx, coarse_tier, pos, sim_tick, mark_dirty=_mark_dirty)
 
     # If any audio was emitted during this tick, signal the REPL to flush immediately
     # so sounds tied to travel/pursuit aren't delayed to the next player command.
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Any, Callable, Mapping, Sequence
+from typing import Any, Callable, Mapping, MutableMapping, Sequence, Tuple
 
 from mutants.registries import items_catalog, items_instances as itemsreg
+from mutants.services import monsters_state
+from mutants.services.monster_ai import features as features_mod
+
+
+ATTACK_TABLE_KEY = monsters_state.ATTACK_TABLE_KEY
+
+# (weighted sources, melee item token, bolt item token)
+_WeightTable = Tuple[Tuple[Tuple[str, int], ...], "str | None", "str | None"]
+
+_CACHE_ENABLED = True
 
 
 @dataclass(frozen=True)
@@ -324,10 +334,19 @@ def _build_weight_table(
     return {"melee": melee_w, "bolt": ranged_w, "innate": innate_w}
 
 
-def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
-    """Return an :class:`AttackPlan` describing the chosen attack source."""
+def _weighted_sources(
+    monster: Mapping[str, Any],
+    ctx: Any,
+    *,
+    wielded_token: str | None,
+    has_bound_target: bool,
+    prefers_ranged: bool,
+    prefers_innate: bool,
+) -> _WeightTable:
+    """Derive the weighted attack sources and their item tokens."""
 
-    bag = _bag_entries(monster)
+    features = features_mod.cached(monster)
+    bag = list(features.bag) if features is not None else _bag_entries(monster)
     catalog = _load_catalog()
     wielded_entry = _find_wielded_entry(monster, bag)
 
@@ -355,14 +374,7 @@ def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
                 best_ranged_score = score
                 ranged_entry = entry
 
-    # If this monster is bound to a player, bias toward the first bag item but still allow innate.
-    state = monster.get("_ai_state") if isinstance(monster, Mapping) else None
-    pending_target = state.get("pending_pursuit") if isinstance(state, Mapping) else None
-    has_bound_target = bool(monster.get("target_player_id") or pending_target)
-
     has_innate = _has_innate(monster)
-    prefers_ranged = _resolve_prefers_ranged(monster, ctx)
-    prefers_innate = _resolve_prefers_innate(monster, ctx)
     melee_power = max(0, best_melee_score)
     ranged_power = max(0, best_ranged_score)
     innate_power = _innate_power(monster)
@@ -386,7 +398,7 @@ def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
         if weight > 0:
             weighted_sources.append((source, weight))
 
-    # Bound monsters: prefer first bag item but allow innate in the mix.
+    # Bound monsters: prefer first bag item but still allow innate in the mix.
     if has_bound_target:
         weighted_sources = []
         if bag:
@@ -394,6 +406,73 @@ def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
         if has_innate:
             weighted_sources.append(("innate", 30))
 
+    return (
+        tuple(weighted_sources),
+        _entry_token(melee_entry, fallback=wielded_token),
+        _entry_token(ranged_entry, fallback=wielded_token),
+    )
+
+
+def _cached_weight_table(
+    monster: Mapping[str, Any],
+    ctx: Any,
+    *,
+    wielded_token: str | None,
+) -> _WeightTable:
+    """Return the weight table for *monster*, memoized on the record.
+
+    The table is keyed by the monster's bag version (bumped by every bag or
+    bag-entry mutation via :func:`monsters_state.bump_bag_version`) together
+    with the remaining inputs that are cheap to read: bag length, wielded
+    token, bound-target flag and the ranged/innate preferences.
+    """
+
+    state = monster.get("_ai_state") if isinstance(monster, Mapping) else None
+    pending_target = state.get("pending_pursuit") if isinstance(state, Mapping) else None
+    has_bound_target = bool(monster.get("target_player_id") or pending_target)
+    prefers_ranged = _resolve_prefers_ranged(monster, ctx)
+    prefers_innate = _resolve_prefers_innate(monster, ctx)
+
+    bag = monster.get("bag")
+    key = (
+        monsters_state.bag_version(monster),
+        len(bag) if isinstance(bag, Sequence) else -1,
+        wielded_token,
+        has_bound_target,
+        prefers_ranged,
+        prefers_innate,
+    )
+    cached = monster.get(ATTACK_TABLE_KEY) if _CACHE_ENABLED else None
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key:
+        return cached[1]
+    table = _weighted_sources(
+        monster,
+        ctx,
+        wielded_token=wielded_token,
+        has_bound_target=has_bound_target,
+        prefers_ranged=prefers_ranged,
+        prefers_innate=prefers_innate,
+    )
+    if _CACHE_ENABLED and isinstance(monster, MutableMapping):
+        monster[ATTACK_TABLE_KEY] = (key, table)
+    return table
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the memoized weight tables (for tests and benchmarks)."""
+
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = bool(enabled)
+
+
+def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
+    """Return an :class:`AttackPlan` describing the chosen attack source."""
+
+    wielded_token = _normalize_token(monster.get("wielded"))
+    weighted_sources, melee_token, bolt_token = _cached_weight_table(
+        monster, ctx, wielded_token=wielded_token
+    )
+
     if not weighted_sources:
         # No usable weapons or innate attack – fall back to innate punch.
         return AttackPlan("innate", None)
@@ -414,12 +493,8 @@ def select_attack(monster: Mapping[str, Any], ctx: Any) -> AttackPlan:
                 selected_source = source
                 break
 
-    wielded_token = _normalize_token(monster.get("wielded"))
     if selected_source == "melee":
-        iid = _entry_token(melee_entry, fallback=wielded_token)
-        return AttackPlan("melee", iid)
+        return AttackPlan("melee", melee_token)
     if selected_source == "bolt":
-        iid = _entry_token(ranged_entry, fallback=wielded_token)
-        return AttackPlan("bolt", iid)
+        return AttackPlan("bolt", bolt_token)
     return AttackPlan("innate", None)
-
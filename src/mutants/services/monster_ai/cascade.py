@@ -6,19 +6,18 @@ import logging
 import math
 import random
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Mapping, MutableMapping, Sequence, Collection
+from typing import Any, Mapping, MutableMapping
 
 from mutants.debug import turnlog
-from mutants.registries import items_instances as itemsreg
 from mutants.services import combat_loot
 from mutants.services.combat_config import CombatConfig
+from mutants.services.monster_ai import features as features_mod
 from mutants.services.monster_ai import heal as heal_mod
 from mutants.services.monster_ai import tracking as tracking_mod
 from mutants.services import monster_entities
 
 LOG = logging.getLogger(__name__)
 
-ORIGIN_WORLD = "world"
 _FLEE_HP_THRESHOLD = 25
 
 
@@ -42,13 +41,6 @@ class BonusActionState:
     force_pickup: bool = False
 
 
-def _coerce_int(value: Any, default: int = 0) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return default
-
-
 def _monster_id(monster: Mapping[str, Any]) -> str:
     for key in ("id", "instance_id", "monster_id"):
         raw = monster.get(key)
@@ -105,166 +97,6 @@ def _resolve_config(ctx: Any) -> CombatConfig:
     return CombatConfig()
 
 
-def _player_level(ctx: Any) -> int:
-    """Return the opposing player level with a floor of ``1``."""
-
-    keys = (
-        "monster_ai_player_level",
-        "player_level",
-        "level",
-    )
-
-    candidate: Any = None
-    if isinstance(ctx, Mapping):
-        for key in keys:
-            if key in ctx:
-                candidate = ctx.get(key)
-                break
-        if candidate is None:
-            player = ctx.get("player")
-            if isinstance(player, Mapping):
-                candidate = player.get("level")
-    else:
-        for key in keys:
-            candidate = getattr(ctx, key, None)
-            if candidate is not None:
-                break
-        if candidate is None:
-            player = getattr(ctx, "player", None)
-            if isinstance(player, Mapping):
-                candidate = player.get("level")
-
-    return max(1, _coerce_int(candidate, default=1))
-
-
-def _hp_pct(monster: Mapping[str, Any]) -> int:
-    hp_block = monster.get("hp")
-    if isinstance(hp_block, Mapping):
-        current = _coerce_int(hp_block.get("current"), 0)
-        maximum = _coerce_int(hp_block.get("max"), current)
-    else:
-        current = _coerce_int(monster.get("hp_current"), 0)
-        maximum = _coerce_int(monster.get("hp_max"), max(current, 0))
-    maximum = max(maximum, 1)
-    pct = int(round((max(0, current) / maximum) * 100))
-    return max(0, min(100, pct))
-
-
-def _ions(monster: Mapping[str, Any]) -> tuple[int, int]:
-    ions = _coerce_int(monster.get("ions"), 0)
-    ions_max = monster.get("ions_max")
-    if ions_max is None:
-        ions_max = monster.get("ionsMaximum")
-    ions_max = _coerce_int(ions_max, 0)
-    return max(0, ions), max(0, ions_max)
-
-
-def _ions_pct(ions: int, ions_max: int) -> int:
-    if ions_max <= 0:
-        return 100
-    pct = int(round((max(0, ions) / ions_max) * 100))
-    return max(0, min(100, pct))
-
-
-def _bag_entries(monster: Mapping[str, Any]) -> list[Mapping[str, Any]]:
-    bag = monster.get("bag")
-    if isinstance(bag, Sequence) and not isinstance(bag, (str, bytes)):
-        entries: list[Mapping[str, Any]] = []
-        for entry in bag:
-            if isinstance(entry, Mapping):
-                entries.append(entry)
-        return entries
-    return []
-
-
-def _normalized_origin(entry: Mapping[str, Any]) -> str:
-    origin = entry.get("origin")
-    if isinstance(origin, str):
-        token = origin.strip().lower()
-        if token:
-            return token
-    return ""
-
-
-def _is_world_item(entry: Mapping[str, Any]) -> bool:
-    return _normalized_origin(entry) == ORIGIN_WORLD
-
-
-def _is_cracked_entry(entry: Mapping[str, Any]) -> bool:
-    item_id = str(entry.get("item_id") or "").strip()
-    if not item_id:
-        return False
-    if item_id != itemsreg.BROKEN_WEAPON_ID:
-        return False
-    enchant = _coerce_int(entry.get("enchant_level"), 0)
-    return enchant <= 0
-
-
-def _is_wielded_cracked(monster: Mapping[str, Any], bag: Sequence[Mapping[str, Any]]) -> bool:
-    wielded = monster.get("wielded")
-    if wielded is None:
-        return False
-    token = str(wielded)
-    if not token:
-        return False
-    for entry in bag:
-        iid = entry.get("iid")
-        if iid is None:
-            continue
-        if str(iid) != token:
-            continue
-        if _is_cracked_entry(entry):
-            return True
-        return False
-    return False
-
-
-def _tracked_pickups(monster: Mapping[str, Any]) -> set[str]:
-    state = monster.get("_ai_state")
-    if not isinstance(state, Mapping):
-        return set()
-    pickups = state.get("picked_up")
-    if isinstance(pickups, Iterable) and not isinstance(pickups, (str, bytes)):
-        tokens: set[str] = set()
-        for iid in pickups:
-            if iid is None:
-                continue
-            token = str(iid).strip()
-            if token:
-                tokens.add(token)
-        return tokens
-    return set()
-
-
-def _has_convertible_loot(
-    bag: Sequence[Mapping[str, Any]], tracked: Collection[str]
-) -> bool:
-    if not tracked:
-        return False
-    tracked_tokens: set[str] = set()
-    for token in tracked:
-        token_str = str(token).strip()
-        if token_str:
-            tracked_tokens.add(token_str)
-    if not tracked_tokens:
-        return False
-    for entry in bag:
-        if not _is_world_item(entry):
-            continue
-        iid = entry.get("iid")
-        if iid is None:
-            continue
-        if str(iid).strip() not in tracked_tokens:
-            continue
-        item_id = str(entry.get("item_id") or "").strip()
-        if not item_id:
-            continue
-        if item_id in {itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID}:
-            continue
-        return True
-    return False
-
-
 def _sanitize_player_id(value: Any) -> str | None:
     if value is None:
         return None
@@ -295,68 +127,6 @@ def _ensure_ai_state(monster: Any) -> MutableMapping[str, Any]:
     return state
 
 
-def _sanitize_ground_items(raw: Any) -> list[Mapping[str, Any]]:
-    if isinstance(raw, Sequence) and not isinstance(raw, (str, bytes)):
-        result: list[Mapping[str, Any]] = []
-        for entry in raw:
-            if isinstance(entry, Mapping):
-                result.append(entry)
-        return result
-    return []
-
-
-def _ground_items_from_ctx(ctx: Any) -> list[Mapping[str, Any]]:
-    if isinstance(ctx, Mapping):
-        direct = ctx.get("monster_ai_ground_items")
-    else:
-        direct = getattr(ctx, "monster_ai_ground_items", None)
-    return _sanitize_ground_items(direct)
-
-
-def _ground_items_from_registry(monster: Mapping[str, Any]) -> list[Mapping[str, Any]]:
-    pos = monster.get("pos")
-    if not isinstance(pos, Iterable):
-        return []
-    coords = list(pos)
-    if len(coords) != 3:
-        return []
-    try:
-        year, x, y = int(coords[0]), int(coords[1]), int(coords[2])
-    except (TypeError, ValueError):
-        return []
-    list_at = getattr(itemsreg, "list_instances_at", None)
-    if not callable(list_at):
-        return []
-    try:
-        ground = list_at(year, x, y)
-    except Exception:  # pragma: no cover - defensive
-        return []
-    return _sanitize_ground_items(ground)
-
-
-def _has_pickup_candidate(monster: Mapping[str, Any], ctx: Any) -> bool:
-    allow = True
-    if isinstance(ctx, Mapping):
-        allow = bool(ctx.get("allow_pickup", True))
-    else:
-        allow = bool(getattr(ctx, "allow_pickup", True))
-    if not allow:
-        return False
-
-    ground = _ground_items_from_ctx(ctx)
-    if not ground:
-        ground = _ground_items_from_registry(monster)
-
-    for entry in ground:
-        item_id = str(entry.get("item_id") or entry.get("catalog_id") or "").strip()
-        if not item_id:
-            continue
-        if item_id in {itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID}:
-            continue
-        return True
-    return False
-
-
 def _is_flee_mode(monster: Mapping[str, Any]) -> bool:
     state = monster.get("_ai_state") if isinstance(monster, Mapping) else None
     if isinstance(state, Mapping):
@@ -599,19 +369,19 @@ def evaluate_cascade(monster: Any, ctx: Any) -> ActionResult:
     prefers_ranged_override = overrides.get("prefers_ranged") if overrides else None
     species_tags = tuple(overrides.get("tags", ())) if overrides else tuple()
 
-    bag = _bag_entries(monster)
-    tracked_pickups = _tracked_pickups(monster)
-    hp_pct = _hp_pct(monster)
-    monster_level = heal_mod.monster_level(monster)
-    player_level = _player_level(ctx)
+    features = features_mod.snapshot(monster, ctx)
+    tracked_pickups = features.tracked_pickups
+    hp_pct = features.hp_pct
+    monster_level = features.monster_level
+    player_level = features.player_level
     level_delta = player_level - monster_level
-    ions, ions_max = _ions(monster)
-    ions_pct = _ions_pct(ions, ions_max)
-    low_ions = ions_max > 0 and ions_pct < config.low_ion_pct
-    cracked = _is_wielded_cracked(monster, bag)
-    convertible = _has_convertible_loot(bag, tracked_pickups)
-    pickup_ready = _has_pickup_candidate(monster, ctx)
-    monster_pos = _coerce_pos(monster.get("pos"))
+    ions, ions_max = features.ions, features.ions_max
+    ions_pct = features.ions_pct
+    low_ions = features.low_ions
+    cracked = features.cracked
+    convertible = features.convertible
+    pickup_ready = features.pickup_ready
+    monster_pos = features.pos
     target_id = _sanitize_player_id(monster.get("target_player_id"))
     target_pos: tuple[int, int, int] | None = None
     target_collocated = False
@@ -638,7 +408,7 @@ def evaluate_cascade(monster: Any, ctx: Any) -> ActionResult:
     convert_threshold = _apply_cascade_modifier(config.convert_pct, cascade_overrides.get("convert_pct"))
     base_pickup_pct = _apply_cascade_modifier(config.pickup_pct, cascade_overrides.get("pickup_pct"))
     pickup_threshold = _clamp_pct(base_pickup_pct + (config.cracked_pickup_bonus if cracked else 0))
-    if not monster.get("wielded"):
+    if not features.wielded:
         pickup_threshold = _clamp_pct(pickup_threshold + 10)
 
     if low_ions:
@@ -0,0 +1,400 @@
+"""Per-tick monster feature snapshots for the AI cascade.
+
+The cascade gates, attack selection and pursuit all look at the same handful
+of derived monster values (HP/ion percentages, bag contents, cracked weapon,
+convertible loot, pickup candidates on the ground).  :func:`snapshot` derives
+them once per monster per AI pass; what lies on each tile comes from the
+per-tick :mod:`mutants.services.ground_summary` cache, shared with the pickup
+action and the room renderer.
+
+Caching is only active between :func:`begin_pass` and :func:`end_pass`;
+outside a pass every call derives a fresh snapshot.  ``MonstersState.mark_dirty``
+calls :func:`monster_changed`, which drops the monster's snapshot.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, Iterable, Mapping, Sequence, Tuple
+
+from mutants.registries import items_instances as itemsreg
+from mutants.services import combat_loot, ground_summary
+from mutants.services.combat_config import CombatConfig
+
+from . import heal as heal_mod
+
+__all__ = [
+    "MonsterFeatures",
+    "begin_pass",
+    "cached",
+    "end_pass",
+    "monster_changed",
+    "snapshot",
+    "stats",
+]
+
+ORIGIN_WORLD = "world"
+
+Pos = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class MonsterFeatures:
+    """Derived monster values shared by the AI gates for one pass."""
+
+    bag: Tuple[Mapping[str, Any], ...]
+    tracked_pickups: frozenset[str]
+    hp_pct: int
+    ions: int
+    ions_max: int
+    ions_pct: int
+    low_ions: bool
+    monster_level: int
+    player_level: int
+    cracked: bool
+    convertible: bool
+    wielded: bool
+    pickup_ready: bool
+    pos: Pos | None
+
+
+class _PassCache:
+    __slots__ = ("active", "monsters", "player_level", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.active = False
+        self.monsters: Dict[str, MonsterFeatures] = {}
+        self.player_level: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self) -> None:
+        self.monsters.clear()
+        self.player_level = None
+
+
+_CACHE = _PassCache()
+
+
+def _coerce_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _monster_id(monster: Mapping[str, Any]) -> str | None:
+    for key in ("id", "instance_id", "monster_id"):
+        raw = monster.get(key)
+        if raw is None:
+            continue
+        token = str(raw).strip()
+        if token:
+            return token
+    return None
+
+
+def _player_level(ctx: Any) -> int:
+    """Return the opposing player level with a floor of ``1``."""
+
+    keys = (
+        "monster_ai_player_level",
+        "player_level",
+        "level",
+    )
+
+    candidate: Any = None
+    if isinstance(ctx, Mapping):
+        for key in keys:
+            if key in ctx:
+                candidate = ctx.get(key)
+                break
+        if candidate is None:
+            player = ctx.get("player")
+            if isinstance(player, Mapping):
+                candidate = player.get("level")
+    else:
+        for key in keys:
+            candidate = getattr(ctx, key, None)
+            if candidate is not None:
+                break
+        if candidate is None:
+            player = getattr(ctx, "player", None)
+            if isinstance(player, Mapping):
+                candidate = player.get("level")
+
+    return max(1, _coerce_int(candidate, default=1))
+
+
+def _hp_pct(monster: Mapping[str, Any]) -> int:
+    hp_block = monster.get("hp")
+    if isinstance(hp_block, Mapping):
+        current = _coerce_int(hp_block.get("current"), 0)
+        maximum = _coerce_int(hp_block.get("max"), current)
+    else:
+        current = _coerce_int(monster.get("hp_current"), 0)
+        maximum = _coerce_int(monster.get("hp_max"), max(current, 0))
+    maximum = max(maximum, 1)
+    pct = int(round((max(0, current) / maximum) * 100))
+    return max(0, min(100, pct))
+
+
+def _ions(monster: Mapping[str, Any]) -> tuple[int, int]:
+    ions = _coerce_int(monster.get("ions"), 0)
+    ions_max = monster.get("ions_max")
+    if ions_max is None:
+        ions_max = monster.get("ionsMaximum")
+    ions_max = _coerce_int(ions_max, 0)
+    return max(0, ions), max(0, ions_max)
+
+
+def _ions_pct(ions: int, ions_max: int) -> int:
+    if ions_max <= 0:
+        return 100
+    pct = int(round((max(0, ions) / ions_max) * 100))
+    return max(0, min(100, pct))
+
+
+def _bag_entries(monster: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    bag = monster.get("bag")
+    if isinstance(bag, Sequence) and not isinstance(bag, (str, bytes)):
+        entries: list[Mapping[str, Any]] = []
+        for entry in bag:
+            if isinstance(entry, Mapping):
+                entries.append(entry)
+        return entries
+    return []
+
+
+def _normalized_origin(entry: Mapping[str, Any]) -> str:
+    origin = entry.get("origin")
+    if isinstance(origin, str):
+        token = origin.strip().lower()
+        if token:
+            return token
+    return ""
+
+
+def _is_world_item(entry: Mapping[str, Any]) -> bool:
+    return _normalized_origin(entry) == ORIGIN_WORLD
+
+
+def _is_cracked_entry(entry: Mapping[str, Any]) -> bool:
+    item_id = str(entry.get("item_id") or "").strip()
+    if not item_id:
+        return False
+    if item_id != itemsreg.BROKEN_WEAPON_ID:
+        return False
+    enchant = _coerce_int(entry.get("enchant_level"), 0)
+    return enchant <= 0
+
+
+def _is_wielded_cracked(monster: Mapping[str, Any], bag: Sequence[Mapping[str, Any]]) -> bool:
+    wielded = monster.get("wielded")
+    if wielded is None:
+        return False
+    token = str(wielded)
+    if not token:
+        return False
+    for entry in bag:
+        iid = entry.get("iid")
+        if iid is None:
+            continue
+        if str(iid) != token:
+            continue
+        if _is_cracked_entry(entry):
+            return True
+        return False
+    return False
+
+
+def _tracked_pickups(monster: Mapping[str, Any]) -> set[str]:
+    state = monster.get("_ai_state")
+    if not isinstance(state, Mapping):
+        return set()
+    pickups = state.get("picked_up")
+    if isinstance(pickups, Iterable) and not isinstance(pickups, (str, bytes)):
+        tokens: set[str] = set()
+        for iid in pickups:
+            if iid is None:
+                continue
+            token = str(iid).strip()
+            if token:
+                tokens.add(token)
+        return tokens
+    return set()
+
+
+def _has_convertible_loot(
+    bag: Sequence[Mapping[str, Any]], tracked: Collection[str]
+) -> bool:
+    if not tracked:
+        return False
+    tracked_tokens: set[str] = set()
+    for token in tracked:
+        token_str = str(token).strip()
+        if token_str:
+            tracked_tokens.add(token_str)
+    if not tracked_tokens:
+        return False
+    for entry in bag:
+        if not _is_world_item(entry):
+            continue
+        iid = entry.get("iid")
+        if iid is None:
+            continue
+        if str(iid).strip() not in tracked_tokens:
+            continue
+        item_id = str(entry.get("item_id") or "").strip()
+        if not item_id:
+            continue
+        if item_id in {itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID}:
+            continue
+        return True
+    return False
+
+
+def _sanitize_ground_items(raw: Any) -> list[Mapping[str, Any]]:
+    if isinstance(raw, Sequence) and not isinstance(raw, (str, bytes)):
+        result: list[Mapping[str, Any]] = []
+        for entry in raw:
+            if isinstance(entry, Mapping):
+                result.append(entry)
+        return result
+    return []
+
+
+def _ground_has_pickup(ground: Iterable[Mapping[str, Any]]) -> bool:
+    for entry in ground:
+        item_id = str(entry.get("item_id") or entry.get("catalog_id") or "").strip()
+        if not item_id:
+            continue
+        if item_id in {itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID}:
+            continue
+        return True
+    return False
+
+
+def _tile_has_pickup(pos: Pos) -> bool:
+    try:
+        return ground_summary.get(*pos).has_pickup
+    except Exception:  # pragma: no cover - defensive
+        return False
+
+
+def _has_pickup_candidate(pos: Pos | None, ctx: Any) -> bool:
+    if isinstance(ctx, Mapping):
+        allow = bool(ctx.get("allow_pickup", True))
+        direct = ctx.get("monster_ai_ground_items")
+    else:
+        allow = bool(getattr(ctx, "allow_pickup", True))
+        direct = getattr(ctx, "monster_ai_ground_items", None)
+    if not allow:
+        return False
+    ground = _sanitize_ground_items(direct)
+    if ground:
+        return _ground_has_pickup(ground)
+    if pos is None:
+        return False
+    return _tile_has_pickup(pos)
+
+
+def _resolve_config(ctx: Any) -> CombatConfig:
+    if isinstance(ctx, Mapping):
+        candidate = ctx.get("combat_config")
+    else:
+        candidate = getattr(ctx, "combat_config", None)
+    if isinstance(candidate, CombatConfig):
+        return candidate
+    return CombatConfig()
+
+
+def _compute(monster: Mapping[str, Any], ctx: Any) -> MonsterFeatures:
+    bag = tuple(_bag_entries(monster))
+    tracked = frozenset(_tracked_pickups(monster))
+    ions, ions_max = _ions(monster)
+    ions_pct = _ions_pct(ions, ions_max)
+    config = _resolve_config(ctx)
+    if _CACHE.active:
+        if _CACHE.player_level is None:
+            _CACHE.player_level = _player_level(ctx)
+        player_level = _CACHE.player_level
+    else:
+        player_level = _player_level(ctx)
+    pos = combat_loot.coerce_pos(monster.get("pos"))
+    return MonsterFeatures(
+        bag=bag,
+        tracked_pickups=tracked,
+        hp_pct=_hp_pct(monster),
+        ions=ions,
+        ions_max=ions_max,
+        ions_pct=ions_pct,
+        low_ions=ions_max > 0 and ions_pct < config.low_ion_pct,
+        monster_level=heal_mod.monster_level(monster),
+        player_level=player_level,
+        cracked=_is_wielded_cracked(monster, bag),
+        convertible=_has_convertible_loot(bag, tracked),
+        wielded=bool(monster.get("wielded")),
+        pickup_ready=_has_pickup_candidate(pos, ctx),
+        pos=pos,
+    )
+
+
+def snapshot(monster: Mapping[str, Any], ctx: Any) -> MonsterFeatures:
+    """Return the feature snapshot for *monster*, cached for the active pass."""
+
+    if not _CACHE.active:
+        return _compute(monster, ctx)
+    mid = _monster_id(monster)
+    if mid is not None:
+        features = _CACHE.monsters.get(mid)
+        if features is not None:
+            _CACHE.hits += 1
+            return features
+    _CACHE.misses += 1
+    features = _compute(monster, ctx)
+    if mid is not None:
+        _CACHE.monsters[mid] = features
+    return features
+
+
+def cached(monster: Mapping[str, Any]) -> MonsterFeatures | None:
+    """Return the snapshot already taken for *monster* this pass, if any."""
+
+    if not _CACHE.active:
+        return None
+    mid = _monster_id(monster)
+    return _CACHE.monsters.get(mid) if mid is not None else None
+
+
+def monster_changed(monster: Mapping[str, Any] | str | None) -> None:
+    """Invalidate the snapshot for *monster*."""
+
+    if not _CACHE.active:
+        return
+    if monster is None:
+        _CACHE.reset()
+        return
+    mid = monster if isinstance(monster, str) else _monster_id(monster)
+    if mid:
+        _CACHE.monsters.pop(mid, None)
+
+
+def begin_pass() -> None:
+    """Start caching snapshots for one AI pass."""
+
+    _CACHE.reset()
+    _CACHE.active = True
+
+
+def end_pass() -> None:
+    """Stop caching and drop every snapshot taken during the pass."""
+
+    _CACHE.active = False
+    _CACHE.reset()
+
+
+def stats() -> Dict[str, int]:
+    """Return cache hit/miss counters (for debugging and benchmarks)."""
+
+    return {"hits": _CACHE.hits, "misses": _CACHE.misses}
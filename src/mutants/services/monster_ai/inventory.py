@@ -197,6 +197,7 @@ def _remove_bag_entry(monster: MutableMapping[str, Any], iid: str) -> MutableMap
             continue
         if str(entry.get("iid")) == iid:
             bag.remove(entry)
+            monsters_state.bump_bag_version(monster)
             return entry
     return None
 
@@ -214,6 +215,7 @@ def _drop_weapon(monster: MutableMapping[str, Any], ctx: MutableMapping[str, Any
         bag = monster.setdefault("bag", [])
         if isinstance(bag, list):
             bag.append(entry)
+            monsters_state.bump_bag_version(monster)
         return False
     if monster.get("wielded") == iid:
         monster["wielded"] = None
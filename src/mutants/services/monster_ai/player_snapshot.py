@@ -0,0 +1,80 @@
+"""Immutable view of the active player for one monster AI pass.
+
+``monster_ai.on_player_command`` resolves the player once, stores a
+:class:`PlayerSnapshot` in the context and hands it to every monster action,
+so collocation checks and pursuit fallbacks no longer re-walk the player
+state for each monster.  The snapshot is dropped at the end of the pass, and
+earlier if the player dies (which moves them to the respawn point).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, MutableMapping, Optional, Tuple
+
+from mutants.services import combat_loot
+
+__all__ = ["CTX_KEY", "PlayerSnapshot", "capture", "current", "install", "invalidate"]
+
+CTX_KEY = "monster_ai_player"
+
+Pos = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    """The active player as seen by monsters during one AI pass."""
+
+    player_id: str
+    pos: Pos
+    level: int
+    class_name: Optional[str]
+
+    def collocated_with(self, pos: Any) -> bool:
+        coords = combat_loot.coerce_pos(pos)
+        # Mirrors monster_actions._is_collocated: unknown positions count as
+        # collocated.
+        return coords is None or coords == self.pos
+
+
+def _coerce_level(value: Any) -> int:
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def capture(player_id: str, pos: Any, active: Mapping[str, Any] | None) -> Optional[PlayerSnapshot]:
+    """Build a snapshot for *player_id* at *pos*; ``None`` if *pos* is invalid."""
+
+    coords = combat_loot.coerce_pos(pos)
+    if not player_id or coords is None:
+        return None
+    source = active if isinstance(active, Mapping) else {}
+    class_raw = source.get("class") or source.get("name")
+    return PlayerSnapshot(
+        player_id=str(player_id),
+        pos=coords,
+        level=_coerce_level(source.get("level")),
+        class_name=str(class_raw) if class_raw else None,
+    )
+
+
+def install(ctx: Any, snapshot: Optional[PlayerSnapshot]) -> None:
+    if isinstance(ctx, MutableMapping):
+        ctx[CTX_KEY] = snapshot
+
+
+def current(ctx: Any) -> Optional[PlayerSnapshot]:
+    """Return the snapshot for the running pass, if any."""
+
+    if isinstance(ctx, Mapping):
+        value = ctx.get(CTX_KEY)
+    else:
+        value = getattr(ctx, CTX_KEY, None)
+    return value if isinstance(value, PlayerSnapshot) else None
+
+
+def invalidate(ctx: Any) -> None:
+    if isinstance(ctx, MutableMapping):
+        ctx.pop(CTX_KEY, None)
@@ -367,18 +367,10 @@ def _apply_movement(
             details.setdefault("reason", details.get("direct_reason", "blocked"))
             return False, details
 
-    monster["pos"] = [year, step_taken[0], step_taken[1]]
-    try:
-        monsters_state._refresh_monster_derived(monster)
-    except Exception:
-        pass
-    try:
-        monsters_obj = ctx.get("monsters") if isinstance(ctx, Mapping) else getattr(ctx, "monsters", None)
-        updater = getattr(monsters_obj, "update_position_cache", None)
-        if callable(updater):
-            updater(monster, previous_pos=(year, start[0], start[1]))
-    except Exception:
-        pass
+    monsters_obj = ctx.get("monsters") if isinstance(ctx, Mapping) else getattr(ctx, "monsters", None)
+    # Position-only move: the spatial index is updated by move_monster and
+    # derived equipment stats do not depend on ``pos``.
+    monsters_state.relocate_monster(monsters_obj, monster, (year, step_taken[0], step_taken[1]))
     return True, details
 
 
@@ -526,6 +518,51 @@ def attempt_pursuit(
     return False
 
 
+def coarse_advance(
+    monster: MutableMapping[str, Any],
+    target_pos: Iterable[int] | Mapping[str, Any],
+    steps: int,
+    *,
+    ctx: Any | None = None,
+) -> int:
+    """Move ``monster`` up to ``steps`` tiles along one path toward ``target_pos``.
+
+    This is the cheap off-screen counterpart of :func:`attempt_pursuit`: a
+    single BFS covers several ticks worth of movement, no rolls or cues are
+    made, and the walk stops short of the target tile so arrival is always
+    resolved by a full-fidelity turn.  Returns the number of tiles moved.
+    """
+
+    pos = combat_loot.coerce_pos(monster.get("pos"))
+    target = combat_loot.coerce_pos(target_pos)
+    if pos is None or target is None or int(pos[0]) != int(target[0]):
+        return 0
+    if steps <= 0:
+        return 0
+    year = int(pos[0])
+    start = (int(pos[1]), int(pos[2]))
+    loader = _resolve_world_loader(ctx)
+    try:
+        world = loader(year)
+    except Exception:
+        return 0
+    path = world_years.find_path_between(
+        year,
+        start,
+        (int(target[1]), int(target[2])),
+        world=world,
+        dynamics=_resolve_dynamics(ctx),
+    )
+    if len(path) < 3:
+        return 0
+    moved = min(int(steps), len(path) - 2)
+    step = path[moved]
+    monsters_obj = ctx.get("monsters") if isinstance(ctx, Mapping) else getattr(ctx, "monsters", None)
+    monsters_state.relocate_monster(monsters_obj, monster, (year, int(step[0]), int(step[1])))
+    _log(ctx, monster, success=True, reason="coarse", mode="coarse", steps=moved, step=tuple(step))
+    return moved
+
+
 def attempt_flee_step(
     monster: MutableMapping[str, Any],
     away_from_pos: Iterable[int] | Mapping[str, Any] | None,
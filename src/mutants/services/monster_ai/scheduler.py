@@ -0,0 +1,318 @@
+"""Tiered scheduling for monster AI turns.
+
+Monsters close to the player (same tile or within ``near_radius``) and any
+monster that is fleeing run the full AI pipeline every tick.  Bound pursuers
+elsewhere in the player's year are advanced in coarse multi-tile steps every
+``cadence`` ticks, within a per-tick time budget.  Monsters in other years are
+not touched at all; each monster stores ``_ai_state["last_sim_tick"]`` so the
+elapsed ticks are caught up (capped) the next time it is scheduled.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Sequence, Tuple
+
+from mutants import env
+from mutants.services import audio_cues, combat_loot, random_pool
+
+from . import pursuit
+
+__all__ = ["AIScheduler", "get_scheduler", "last_sim_tick", "stamp"]
+
+_TICK_RNG_NAME = "turn"
+
+Pos = Tuple[int, int, int]
+
+
+def _normalize_id(value: Any) -> str | None:
+    if value is None:
+        return None
+    token = str(value).strip()
+    return token or None
+
+
+def _ai_state(monster: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+    state = monster.get("_ai_state")
+    if isinstance(state, MutableMapping):
+        return state
+    state = dict(state) if isinstance(state, Mapping) else {}
+    monster["_ai_state"] = state
+    return state
+
+
+def last_sim_tick(monster: Mapping[str, Any]) -> int | None:
+    """Return the tick at which *monster* was last simulated, if recorded."""
+
+    state = monster.get("_ai_state")
+    if not isinstance(state, Mapping):
+        return None
+    value = state.get("last_sim_tick")
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def stamp(monster: Any, tick: int) -> None:
+    """Record that *monster* was simulated on *tick*."""
+
+    if isinstance(monster, MutableMapping):
+        _ai_state(monster)["last_sim_tick"] = int(tick)
+
+
+def _is_alive(monster: Mapping[str, Any]) -> bool:
+    hp_block = monster.get("hp")
+    if isinstance(hp_block, Mapping):
+        try:
+            return int(hp_block.get("current", 0)) > 0
+        except (TypeError, ValueError):
+            return True
+    return True
+
+
+class AIScheduler:
+    """Split a tick's monsters into tiers and run the coarse tier on a budget."""
+
+    def __init__(self, config: Mapping[str, int] | None = None) -> None:
+        cfg = dict(env.ai_scheduler_config())
+        if config:
+            cfg.update(config)
+        self.near_radius = max(0, int(cfg["near_radius"]))
+        self.cadence = max(1, int(cfg["cadence"]))
+        self.budget_ms = max(0, int(cfg["budget_ms"]))
+        self.catchup_cap = max(1, int(cfg["catchup_cap"]))
+        self._last_tick: int | None = None
+        self.last: Dict[str, Any] = {}
+        self.totals: Dict[str, float] = {
+            "ticks": 0,
+            "full": 0,
+            "coarse": 0,
+            "deferred": 0,
+            "over_budget": 0,
+            "full_ms": 0.0,
+            "coarse_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    def begin_tick(self) -> int:
+        """Return the tick id for this AI pass.
+
+        The persisted ``turn`` RNG tick is used so ``last_sim_tick`` stays
+        meaningful across sessions; the value is forced to be monotonic for
+        callers that run AI passes outside the turn scheduler.
+        """
+
+        try:
+            tick = int(random_pool.get_rng_tick(_TICK_RNG_NAME))
+        except Exception:
+            tick = 0
+        if self._last_tick is not None and tick <= self._last_tick:
+            tick = self._last_tick + 1
+        self._last_tick = tick
+        self.last = {
+            "tick": tick,
+            "full": 0,
+            "coarse": 0,
+            "waiting": 0,
+            "deferred": 0,
+            "moved": 0,
+            "full_ms": 0.0,
+            "coarse_ms": 0.0,
+            "budget_ms": self.budget_ms,
+        }
+        self.totals["ticks"] += 1
+        return tick
+
+    def partition(
+        self,
+        monsters: Sequence[Mapping[str, Any]],
+        pos: Pos,
+        player_id: str,
+        *,
+        is_flee: Callable[[Mapping[str, Any]], bool],
+    ) -> Tuple[List[Mapping[str, Any]], List[Mapping[str, Any]]]:
+        """Return ``(full, coarse)`` tiers for *monsters* relative to *pos*."""
+
+        full: List[Mapping[str, Any]] = []
+        coarse: List[Mapping[str, Any]] = []
+        year, px, py = pos
+        for monster in monsters:
+            mon_pos = combat_loot.coerce_pos(monster.get("pos"))
+            if mon_pos is None or mon_pos[0] != year:
+                full.append(monster)
+                continue
+            dist = max(abs(mon_pos[1] - px), abs(mon_pos[2] - py))
+            if dist <= self.near_radius or not isinstance(monster, MutableMapping):
+                full.append(monster)
+                continue
+            state = monster.get("_ai_state")
+            flee_dir = state.get("flee_dir") if isinstance(state, Mapping) else None
+            bound = _normalize_id(state.get("bound_player_id")) if isinstance(state, Mapping) else None
+            target = _normalize_id(monster.get("target_player_id"))
+            if flee_dir or is_flee(monster) or player_id not in (target, bound):
+                full.append(monster)
+                continue
+            coarse.append(monster)
+        return full, coarse
+
+    def record_full(self, count: int, elapsed_ms: float) -> None:
+        self.last["full"] = count
+        self.last["full_ms"] = elapsed_ms
+        self.totals["full"] += count
+        self.totals["full_ms"] += elapsed_ms
+
+    def run_coarse(
+        self,
+        ctx: Any,
+        monsters: Sequence[MutableMapping[str, Any]],
+        pos: Pos,
+        tick: int,
+        *,
+        mark_dirty: Callable[[MutableMapping[str, Any]], None],
+    ) -> None:
+        """Advance due coarse-tier monsters toward *pos* within the budget.
+
+        Monsters are handled nearest-first, with ticks spent waiting counted
+        against distance so far-away stragglers are not starved.  Once the
+        budget (less the time already spent on the full tier) is exhausted,
+        the remaining due monsters keep their ``last_sim_tick`` and catch up
+        on a later tick.  At least one due monster is always advanced.
+        """
+
+        start = time.perf_counter()
+        remaining_ms = None
+        if self.budget_ms > 0:
+            remaining_ms = max(0.0, self.budget_ms - float(self.last.get("full_ms", 0.0)))
+
+        year, px, py = pos
+        due: List[Tuple[int, int, MutableMapping[str, Any]]] = []
+        waiting = 0
+        for monster in monsters:
+            if not _is_alive(monster):
+                continue
+            last = last_sim_tick(monster)
+            if last is None:
+                elapsed = self.cadence
+            elif last > tick:
+                stamp(monster, tick)
+                continue
+            else:
+                elapsed = tick - last
+            if elapsed < self.cadence:
+                waiting += 1
+                continue
+            mon_pos = combat_loot.coerce_pos(monster.get("pos"))
+            dist = max(abs(mon_pos[1] - px), abs(mon_pos[2] - py)) if mon_pos else 0
+            due.append((dist - elapsed, elapsed, monster))
+        due.sort(key=lambda entry: entry[0])
+
+        sounds: List[Tuple[Pos, str]] = []
+        processed = 0
+        moved_total = 0
+        deferred = 0
+        target = [year, px, py]
+        for index, (_priority, elapsed, monster) in enumerate(due):
+            if (
+                remaining_ms is not None
+                and processed > 0
+                and (time.perf_counter() - start) * 1000.0 >= remaining_ms
+            ):
+                deferred = len(due) - index
+                break
+            _ai_state(monster)["pending_pursuit"] = list(target)
+            moved = pursuit.coarse_advance(monster, target, min(elapsed, self.catchup_cap), ctx=ctx)
+            stamp(monster, tick)
+            processed += 1
+            if moved:
+                moved_total += 1
+                mark_dirty(monster)
+                new_pos = combat_loot.coerce_pos(monster.get("pos"))
+                if new_pos is not None:
+                    sounds.append((new_pos, "footsteps"))
+
+        if sounds and audio_cues.emit_sounds(sounds, pos, ctx=ctx):
+            if isinstance(ctx, MutableMapping):
+                ctx["_ai_emitted_audio"] = True
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.last.update(
+            coarse=processed,
+            waiting=waiting,
+            deferred=deferred,
+            moved=moved_total,
+            coarse_ms=elapsed_ms,
+        )
+        self.totals["coarse"] += processed
+        self.totals["deferred"] += deferred
+        self.totals["coarse_ms"] += elapsed_ms
+        if deferred:
+            self.totals["over_budget"] += 1
+
+    # ------------------------------------------------------------------
+    def report_lines(self) -> List[str]:
+        """Return human-readable lines for ``debug ai-budget``."""
+
+        lines = [
+            "AI scheduler: near_radius=%d cadence=%d budget=%s catchup_cap=%d"
+            % (
+                self.near_radius,
+                self.cadence,
+                f"{self.budget_ms}ms" if self.budget_ms else "off",
+                self.catchup_cap,
+            )
+        ]
+        last = self.last
+        if last:
+            lines.append(
+                "last tick %d: full=%d (%.2fms) coarse=%d (%.2fms) moved=%d waiting=%d deferred=%d"
+                % (
+                    last["tick"],
+                    last["full"],
+                    last["full_ms"],
+                    last["coarse"],
+                    last["coarse_ms"],
+                    last["moved"],
+                    last["waiting"],
+                    last["deferred"],
+                )
+            )
+        totals = self.totals
+        ticks = int(totals["ticks"])
+        if ticks:
+            lines.append(
+                "session %d ticks: full=%d coarse=%d deferred=%d over_budget=%d "
+                "avg full=%.2fms avg coarse=%.2fms"
+                % (
+                    ticks,
+                    totals["full"],
+                    totals["coarse"],
+                    totals["deferred"],
+                    totals["over_budget"],
+                    totals["full_ms"] / ticks,
+                    totals["coarse_ms"] / ticks,
+                )
+            )
+        return lines
+
+
+def get_scheduler(ctx: Any) -> AIScheduler:
+    """Return the scheduler stored on *ctx*, creating it on first use."""
+
+    if isinstance(ctx, Mapping):
+        existing = ctx.get("ai_scheduler")
+    else:
+        existing = getattr(ctx, "ai_scheduler", None)
+    if isinstance(existing, AIScheduler):
+        return existing
+    scheduler = AIScheduler()
+    if isinstance(ctx, MutableMapping):
+        ctx["ai_scheduler"] = scheduler
+    else:
+        try:
+            setattr(ctx, "ai_scheduler", scheduler)
+        except Exception:
+            pass
+    return scheduler
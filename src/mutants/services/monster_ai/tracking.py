@@ -127,17 +127,12 @@ def _iter_monsters(monsters: Any) -> Iterable[MutableMapping[str, Any]]:
 
     entries: Iterable[Any] = []
 
-    list_targeting = getattr(monsters, "list_targeting_player", None)
+    # Only used for monster containers without a targeting index; the
+    # caller filters by player_id.
     list_year = getattr(monsters, "list_in_year", None)
     list_all = getattr(monsters, "list_all", None)
 
-    # Prefer narrowest; caller filters by player_id outside.
-    if callable(list_targeting):
-        try:
-            entries = list_all() if callable(list_all) else []  # type: ignore[misc]
-        except Exception:
-            entries = []
-    elif callable(list_year):
+    if callable(list_year):
         try:
             entries = list_year(None)  # type: ignore[misc]
         except Exception:
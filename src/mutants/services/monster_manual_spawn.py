@@ -8,88 +8,100 @@ import random
 from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 from mutants.registries import (
+    id_blocks,
     items_catalog,
     items_instances,
     monsters_catalog,
     monsters_instances,
 )
 from mutants.services import monster_entities
-from mutants.util import ids as id_utils
 
 LOG = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from mutants.services.monsters_state import MonstersState
 
-# Helper to get a random number for the unique suffix
 _RNG = random.Random()
+_SUFFIX_KEY_PREFIX = "monster_suffix:"
 
 
-def _get_next_suffix_id(
-    monsters_reg: Any,
-    base_name: str,
-) -> int:
-    """Finds the next available numeric suffix for a monster."""
-
-    def _extract_name(inst: Mapping[str, Any]) -> str | None:
-        """Best-effort extraction of the monster display name.
-
-        Instances returned by :class:`MonstersInstances` are usually fully
-        normalized and expose the ``name`` field directly. However, legacy
-        rows – especially those minted by external tooling – may still have
-        the name embedded inside the serialized ``stats_json`` payload. The
-        manual spawn command should treat both formats identically so that the
-        suffix generator can see all existing names and avoid duplicates.
-        """
-
-        name = inst.get("name")
-        if isinstance(name, str) and name.strip():
-            return name.strip()
-
-        # Fall back to decoding ``stats_json`` if present. This mirrors the
-        # logic in ``SQLiteMonstersInstanceStore._row_to_payload`` where the
-        # field is normally unpacked.
-        stats_json = inst.get("stats_json")
-        if isinstance(stats_json, str) and stats_json.strip():
-            try:
-                decoded = json.loads(stats_json)
-            except json.JSONDecodeError:
-                decoded = None
-            if isinstance(decoded, Mapping):
-                raw_name = decoded.get("name")
-                if isinstance(raw_name, str) and raw_name.strip():
-                    return raw_name.strip()
-        return None
+def _extract_name(inst: Mapping[str, Any]) -> str | None:
+    """Best-effort extraction of the monster display name.
+
+    Instances returned by :class:`MonstersInstances` are usually fully
+    normalized and expose the ``name`` field directly. However, legacy
+    rows – especially those minted by external tooling – may still have
+    the name embedded inside the serialized ``stats_json`` payload. The
+    manual spawn command should treat both formats identically so that the
+    suffix generator can see all existing names and avoid duplicates.
+    """
+
+    name = inst.get("name")
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+
+    # Fall back to decoding ``stats_json`` if present. This mirrors the
+    # logic in ``SQLiteMonstersInstanceStore._row_to_payload`` where the
+    # field is normally unpacked.
+    stats_json = inst.get("stats_json")
+    if isinstance(stats_json, str) and stats_json.strip():
+        try:
+            decoded = json.loads(stats_json)
+        except json.JSONDecodeError:
+            decoded = None
+        if isinstance(decoded, Mapping):
+            raw_name = decoded.get("name")
+            if isinstance(raw_name, str) and raw_name.strip():
+                return raw_name.strip()
+    return None
 
-    current_suffixes = set()
+
+def _highest_suffix(monsters_reg: Any, base_name: str) -> int:
+    """Return the largest ``<base_name>-<n>`` suffix in use (99 if none)."""
+
+    highest = 99  # so the first suffix has three digits
     prefix = f"{base_name}-"
+    # The persistent registry can stream just the serialized payloads; the
+    # in-memory MonstersState only offers its cached list.
+    iter_fields = getattr(monsters_reg, "iter_fields", None)
     list_all = getattr(monsters_reg, "list_all", None)
-    if not callable(list_all):
-        return _RNG.randint(100, 999)
-
-    for inst in list_all():
+    if callable(iter_fields):
+        rows = iter_fields("stats_json")
+    elif callable(list_all):
+        rows = list_all()
+    else:
+        return highest
+
+    for inst in rows:
         if not isinstance(inst, Mapping):
             continue
         name = _extract_name(inst)
         if isinstance(name, str) and name.startswith(prefix):
             try:
-                suffix = int(name[len(prefix) :])
-                current_suffixes.add(suffix)
+                highest = max(highest, int(name[len(prefix) :]))
             except (TypeError, ValueError):
                 continue
+    return highest
+
+
+def next_suffix_id(
+    monsters_reg: Any,
+    base_name: str,
+) -> int:
+    """Return the next numeric suffix for a monster named *base_name*.
 
-    if not current_suffixes:
-        return _RNG.randint(100, 999)  # Start with 3 digits if none
+    Suffixes come from a per-name block allocator, so the existing names are
+    only scanned the first time a name is spawned in a database.  Every spawn
+    path (manual and :mod:`mutants.services.monster_spawner`) must use this so
+    names never repeat.
+    """
 
-    # Find the max and add a random amount to it, max 9999
-    next_id = max(current_suffixes) + _RNG.randint(1, 5)
-    if next_id > 9999:
-        # Fallback: find first free slot
-        for i in range(1, 10000):
-            if i not in current_suffixes:
-                return i
-        return 9999  # Should be unreachable
-    return next_id
+    allocator = id_blocks.allocator(
+        f"{_SUFFIX_KEY_PREFIX}{base_name}",
+        block_size=id_blocks.SUFFIX_BLOCK,
+        floor=lambda: _highest_suffix(monsters_reg, base_name),
+    )
+    return allocator.next()
 
 
 def _coerce_pos(pos: Sequence[int] | Mapping[str, Any] | None) -> list[int] | None:
@@ -271,9 +283,9 @@ def spawn_monster_at(
     if not template:
         return None
 
-    instance_id = id_utils.new_instance_id()
+    instance_id = monsters_reg.mint_store_instance_id(template.monster_id)
     base_name = template.name or "Monster"
-    suffix = _get_next_suffix_id(monsters_reg, base_name)
+    suffix = next_suffix_id(monsters_reg, base_name)
     coords = _coerce_pos(pos) or [0, 0, 0]
     instance_data = _build_instance_payload(
         template, base_name, suffix, instance_id, coords
@@ -351,8 +363,8 @@ def spawn_monster_into_state(
         return None
 
     base_name = template.name or monster_id
-    suffix = _get_next_suffix_id(monsters_state_obj, base_name)
-    instance_id = id_utils.new_instance_id()
+    suffix = next_suffix_id(monsters_state_obj, base_name)
+    instance_id = monsters_state_obj.mint_instance_id(template.monster_id)
     coords = _coerce_pos(pos) or [2000, 0, 0]
     instance_data = _build_instance_payload(
         template, base_name, suffix, instance_id, coords
@@ -0,0 +1,311 @@
+"""Runtime monster spawner driven by per-year population quotas.
+
+The turn scheduler calls :meth:`RuntimeSpawner.tick` once per turn.  Each
+year has a population ``floor`` and ``cap``:
+
+* below the floor the year is topped up immediately;
+* between floor and cap one monster is added every ``interval`` turns
+  (± ``jitter_pct``);
+* at or above the cap nothing spawns.
+
+Populations come from :meth:`MonstersState.count_alive`, which is maintained
+incrementally by the spatial index, so quota checks never query SQL.  Spawn
+tiles are drawn from an open-tile list computed once per year, at most
+``batch_max`` monsters are created per tick across all years, and each tick's
+monsters are inserted with a single :meth:`MonstersState.spawn_batch`
+transaction.  All draws come from the ``spawner`` stream of
+:mod:`mutants.services.random_pool`, so a given seed and tick sequence yields
+the same spawns on the same starting database.  Ids and names never embed the
+wall-clock date; replaying a seed against a database that already holds its
+spawns continues the stored counters rather than reusing ids.
+
+Instance ids and name suffixes come from the same block allocators that
+manual spawns use (:meth:`MonstersState.mint_instance_id` and
+:func:`mutants.services.monster_manual_spawn.next_suffix_id`), so the two
+paths never hand out the same id or name.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import random
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from mutants.services import random_pool
+from mutants.services.monster_manual_spawn import next_suffix_id
+
+LOG = logging.getLogger(__name__)
+
+__all__ = ["RuntimeSpawner", "build_runtime_spawner", "open_tiles_for"]
+
+_RNG_NAME = "spawner"
+
+Tile = Tuple[int, int]
+
+
+def _coerce_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def open_tiles_for(world: Any) -> List[Tile]:
+    """Return sorted ``(x, y)`` tiles of *world* that monsters may spawn on.
+
+    Store tiles are excluded.  The list is sorted so seeded draws do not
+    depend on the world file's tile order.
+    """
+
+    tiles: List[Tile] = []
+    iter_tiles = getattr(world, "iter_tiles", None)
+    if not callable(iter_tiles):
+        return tiles
+    for tile in iter_tiles():
+        if not isinstance(tile, Mapping):
+            continue
+        if tile.get("store_id") is not None:
+            continue
+        pos = tile.get("pos")
+        if not isinstance(pos, (list, tuple)) or len(pos) < 3:
+            continue
+        tiles.append((_coerce_int(pos[1]), _coerce_int(pos[2])))
+    tiles.sort()
+    return tiles
+
+
+def _default_rng() -> random.Random:
+    random_pool.advance_rng_tick(_RNG_NAME)
+    return random_pool.get_rng(_RNG_NAME)
+
+
+class RuntimeSpawner:
+    """Quota-driven spawner; see the module docstring for the rules."""
+
+    def __init__(
+        self,
+        *,
+        monsters_state_obj: Any,
+        templates: Mapping[int, Sequence[Mapping[str, Any]]],
+        open_tiles: Mapping[int, Sequence[Tile]],
+        config: Mapping[str, int],
+        targets: Mapping[int, Tuple[int, int]] | None = None,
+        rng_factory: Callable[[], random.Random] | None = None,
+        item_catalog: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._state = monsters_state_obj
+        self.interval = max(1, _coerce_int(config.get("interval"), 7))
+        self.jitter_pct = max(0, _coerce_int(config.get("jitter_pct"), 0))
+        self.batch_max = max(1, _coerce_int(config.get("batch_max"), 5))
+        floor = max(0, _coerce_int(config.get("floor"), 0))
+        cap = max(floor, _coerce_int(config.get("cap"), floor))
+        self._rng_factory = rng_factory or _default_rng
+        self._item_catalog = item_catalog
+
+        self._templates: Dict[int, List[Mapping[str, Any]]] = {}
+        self._tiles: Dict[int, List[Tile]] = {}
+        self.targets: Dict[int, Tuple[int, int]] = {}
+        for year in sorted(set(templates) & set(open_tiles)):
+            pool = [t for t in templates[year] if isinstance(t, Mapping)]
+            tiles = list(open_tiles[year])
+            if not pool or not tiles:
+                continue
+            self._templates[year] = pool
+            self._tiles[year] = tiles
+            year_floor, year_cap = (targets or {}).get(year, (floor, cap))
+            self.targets[year] = (max(0, year_floor), max(year_floor, year_cap))
+
+        self.turn = 0
+        self._next_due: Dict[int, int] = {year: self.interval for year in self.targets}
+        self._cursor = 0
+        self.stats: Dict[str, int] = {"ticks": 0, "spawned": 0, "batches": 0, "deaths": 0}
+
+    # ------------------------------------------------------------------
+    def years(self) -> List[int]:
+        return sorted(self.targets)
+
+    def _jittered_interval(self, rng: random.Random) -> int:
+        spread = self.interval * self.jitter_pct // 100
+        if spread <= 0:
+            return self.interval
+        return max(1, self.interval + rng.randint(-spread, spread))
+
+    def _plan(self) -> List[Tuple[int, int, bool]]:
+        """Return ``(year, count, growth)`` spawn requests for this turn."""
+
+        years = self.years()
+        if not years:
+            return []
+        start = self._cursor % len(years)
+        self._cursor += 1
+        budget = self.batch_max
+        plan: List[Tuple[int, int, bool]] = []
+        # Rotate the starting year so a deficit in one year cannot starve
+        # the others when the budget is tight.
+        for year in years[start:] + years[:start]:
+            if budget <= 0:
+                break
+            floor, cap = self.targets[year]
+            alive = self._state.count_alive(year)
+            if alive >= cap:
+                continue
+            if alive < floor:
+                count = min(floor - alive, budget)
+                plan.append((year, count, False))
+            elif self.turn >= self._next_due[year]:
+                count = 1
+                plan.append((year, count, True))
+            else:
+                continue
+            budget -= count
+        return plan
+
+    def _build_record(self, template: Mapping[str, Any], year: int, rng: random.Random) -> Dict[str, Any]:
+        x, y = rng.choice(self._tiles[year])
+        hp = max(1, _coerce_int(template.get("hp_max"), 1))
+        ions_min = _coerce_int(template.get("ions_min"), 0)
+        ions_max = max(ions_min, _coerce_int(template.get("ions_max"), ions_min))
+        rib_min = _coerce_int(template.get("riblets_min"), 0)
+        rib_max = max(rib_min, _coerce_int(template.get("riblets_max"), rib_min))
+        monster_id = str(template.get("monster_id") or "monster")
+        base_name = str(template.get("name") or monster_id)
+        instance_id = self._state.mint_instance_id(monster_id)
+        armour = template.get("starter_armour") or []
+        return {
+            "instance_id": instance_id,
+            "id": instance_id,
+            "monster_id": monster_id,
+            "name": f"{base_name}-{next_suffix_id(self._state, base_name)}",
+            "pos": [year, x, y],
+            "hp": {"current": hp, "max": hp},
+            "armour_class": _coerce_int(template.get("armour_class"), 0),
+            "level": max(1, _coerce_int(template.get("level"), 1)),
+            "ions": rng.randint(ions_min, ions_max),
+            "ions_max": ions_max,
+            "riblets": rng.randint(rib_min, rib_max),
+            "bag": [{"item_id": item} for item in list(template.get("starter_items") or [])[:4]],
+            "armour_wearing": armour[0] if armour else None,
+            "readied_spell": None,
+            "target_player_id": None,
+            "target_monster_id": None,
+            "ready_target": None,
+            "taunt": template.get("taunt") or "",
+            "innate_attack": copy.deepcopy(template.get("innate_attack") or {}),
+            "spells": list(template.get("spells") or []),
+            "stats": dict(template.get("stats") or {}),
+            "ai_overrides": copy.deepcopy(template.get("ai_overrides")),
+        }
+
+    # ------------------------------------------------------------------
+    def tick(self) -> List[Dict[str, Any]]:
+        """Advance one turn and spawn whatever the quotas call for."""
+
+        self.turn += 1
+        self.stats["ticks"] += 1
+        plan = self._plan()
+        if not plan:
+            return []
+
+        rng = self._rng_factory()
+        records: List[Dict[str, Any]] = []
+        for year, count, growth in plan:
+            pool = self._templates[year]
+            for _ in range(count):
+                records.append(self._build_record(rng.choice(pool), year, rng))
+            if growth:
+                self._next_due[year] = self.turn + self._jittered_interval(rng)
+
+        spawned = self._state.spawn_batch(records, catalog=self._item_catalog)
+        self.stats["spawned"] += len(spawned)
+        self.stats["batches"] += 1
+        LOG.info(
+            "spawner turn=%d spawned=%d plan=%s",
+            self.turn,
+            len(spawned),
+            [(year, count) for year, count, _ in plan],
+        )
+        return spawned
+
+    def notify_monster_death(self, payload: Mapping[str, Any] | None) -> None:
+        """Record a death; the next tick sees it through ``count_alive``."""
+
+        self.stats["deaths"] += 1
+
+    def report_lines(self) -> List[str]:
+        lines = [
+            "spawner: turn=%d interval=%d jitter=%d%% batch_max=%d spawned=%d batches=%d deaths=%d"
+            % (
+                self.turn,
+                self.interval,
+                self.jitter_pct,
+                self.batch_max,
+                self.stats["spawned"],
+                self.stats["batches"],
+                self.stats["deaths"],
+            )
+        ]
+        for year in self.years():
+            floor, cap = self.targets[year]
+            lines.append(
+                "  %d: alive=%d floor=%d cap=%d tiles=%d next_growth=%d"
+                % (
+                    year,
+                    self._state.count_alive(year),
+                    floor,
+                    cap,
+                    len(self._tiles[year]),
+                    self._next_due[year],
+                )
+            )
+        return lines
+
+
+def build_runtime_spawner(
+    *,
+    templates_state: Any = None,
+    catalog: Any,
+    instances: Any = None,
+    world_loader: Callable[[int], Any],
+    years: Iterable[int],
+    monsters_state_obj: Any,
+    config: Mapping[str, int],
+    rng_factory: Callable[[], random.Random] | None = None,
+) -> Optional[RuntimeSpawner]:
+    """Build a :class:`RuntimeSpawner` for *years*, or ``None`` if nothing can spawn.
+
+    ``templates_state`` and ``instances`` are accepted for the context
+    builder's call signature; persistence goes through *monsters_state_obj*.
+    """
+
+    if catalog is None or monsters_state_obj is None:
+        return None
+    list_spawnable = getattr(catalog, "list_spawnable", None)
+    if not callable(list_spawnable):
+        return None
+
+    templates: Dict[int, List[Mapping[str, Any]]] = {}
+    open_tiles: Dict[int, List[Tile]] = {}
+    for year in years:
+        year = _coerce_int(year)
+        pool = list(list_spawnable(year))
+        if not pool:
+            continue
+        try:
+            tiles = open_tiles_for(world_loader(year))
+        except Exception:
+            LOG.exception("Failed to load world %s for spawner", year)
+            continue
+        if tiles:
+            templates[year] = pool
+            open_tiles[year] = tiles
+
+    if not templates:
+        return None
+    return RuntimeSpawner(
+        monsters_state_obj=monsters_state_obj,
+        templates=templates,
+        open_tiles=open_tiles,
+        config=config,
+        rng_factory=rng_factory,
+    )
@@ -7,6 +7,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
 
+from mutants import env
 from mutants.registries import items_catalog
 from mutants.registries import items_instances
 from mutants.registries import monsters_instances
@@ -17,6 +18,11 @@ from mutants.state import state_path
 
 LOG = logging.getLogger(__name__)
 
+# Per-session memo fields kept on monster records; never persisted.
+BAG_VERSION_KEY = "_bag_version"
+ATTACK_TABLE_KEY = "_attack_table"
+_TRANSIENT_KEYS = (BAG_VERSION_KEY, ATTACK_TABLE_KEY)
+
 
 def _looks_like_instance_id(s: Any) -> bool:
     """Treat only strings prefixed with ``i.`` as real instance ids."""
@@ -602,6 +608,7 @@ def _auto_equip_armour(monster: MutableMapping[str, Any], bag: list[MutableMappi
     if isinstance(current, MutableMapping):
         bag.append(current)
     monster["armour_slot"] = best_entry
+    bump_bag_version(monster)
     return True
 
 
@@ -670,6 +677,20 @@ def _auto_equip_upgrades(monster: MutableMapping[str, Any], *, stats: Mapping[st
     return changed
 
 
+def bag_version(monster: Mapping[str, Any]) -> int:
+    """Return the in-memory version counter of ``monster``'s bag."""
+
+    value = monster.get(BAG_VERSION_KEY)
+    return value if isinstance(value, int) else 0
+
+
+def bump_bag_version(monster: Any) -> None:
+    """Record that ``monster``'s bag, a bag entry or its armour changed."""
+
+    if isinstance(monster, MutableMapping):
+        monster[BAG_VERSION_KEY] = bag_version(monster) + 1
+
+
 def _refresh_monster_derived(monster: MutableMapping[str, Any]) -> None:
     stats = _sanitize_stats(monster.get("stats"))
     monster["stats"] = stats
@@ -701,6 +722,24 @@ def _refresh_monster_derived(monster: MutableMapping[str, Any]) -> None:
     return equipment_changed
 
 
+def relocate_monster(monsters: Any, monster: MutableMapping[str, Any], new_pos: Iterable[Any]) -> None:
+    """Move *monster* to *new_pos* through ``monsters.move_monster`` when available.
+
+    Falls back to assigning ``pos`` directly for callers without a
+    :class:`MonstersState` (tests, scripted contexts).
+    """
+
+    coords = [int(value) for value in list(new_pos)[:3]]
+    mover = getattr(monsters, "move_monster", None)
+    if callable(mover):
+        try:
+            mover(monster, coords)
+            return
+        except Exception:
+            LOG.debug("move_monster failed; assigning pos directly", exc_info=True)
+    monster["pos"] = coords
+
+
 def _level_up_stats(stats: MutableMapping[str, int]) -> None:
     for key in ("str", "dex", "con", "int", "wis", "cha"):
         stats[key] = _sanitize_int(stats.get(key), fallback=0) + 10
@@ -750,39 +789,25 @@ class MonstersState:
         self._deleted_ids: set[str] = set()
         self._last_accessed_id: Optional[str] = None
         self._instances = instances or monsters_instances.load_monsters_instances(path)
-        self._pos_index: Dict[int, Dict[tuple[int, int], List[Dict[str, Any]]]] = {}
+        # Spatial hash: year -> (x, y) -> {monster id: record}.  Kept current in
+        # O(1) per move by ``move_monster``/``_index_monster``; ``_indexed``
+        # remembers where (and whether alive) each monster was filed so moves
+        # never need the caller's previous position.
+        self._pos_index: Dict[int, Dict[tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+        self._indexed: Dict[str, tuple[tuple[int, int, int], bool]] = {}
+        self._alive_by_year: Dict[int, int] = {}
         self._pos_index_dirty: bool = True
-        self._has_targeting: bool = any(
-            bool(
-                mon.get("target_player_id")
-                or (
-                    isinstance(mon.get("_ai_state"), Mapping)
-                    and mon.get("_ai_state", {}).get("bound_player_id")
-                )
-            )
-            for mon in monsters
-            if isinstance(mon, Mapping)
-        )
-        self._by_target: Dict[str, set[str]] = {}
+        # Reverse targeting index: player id -> {monster id: year}.
+        # ``_target_of`` is the forward side (monster id -> (player id, year))
+        # so acquire/release touch one bucket instead of scanning them all.
+        self._by_target: Dict[str, Dict[str, Optional[int]]] = {}
+        self._target_of: Dict[str, tuple[str, Optional[int]]] = {}
+        self._check_target_index = env.target_index_checks_enabled()
         self._statusful_count: int = 0
         for mon in monsters:
             if not isinstance(mon, Mapping):
                 continue
-            try:
-                pid = str(mon.get("target_player_id") or "").strip()
-                state = mon.get("_ai_state") if isinstance(mon, Mapping) else None
-                bound = ""
-                if isinstance(state, Mapping):
-                    bound = str(state.get("bound_player_id") or "").strip()
-                mid = str(mon.get("id") or mon.get("instance_id") or "")
-            except Exception:
-                pid = ""
-                bound = ""
-                mid = ""
-            if mid:
-                for pid_candidate in (pid, bound):
-                    if pid_candidate:
-                        self._by_target.setdefault(pid_candidate, set()).add(mid)
+            self._index_target(mon)
             try:
                 statuses = mon.get("status_effects") if isinstance(mon, Mapping) else None
                 if isinstance(statuses, list) and statuses:
@@ -791,7 +816,10 @@ class MonstersState:
                 pass
 
     def _prepare_store_payload(self, monster: Mapping[str, Any]) -> Dict[str, Any]:
-        payload = copy.deepcopy(dict(monster))
+        source = dict(monster)
+        for key in _TRANSIENT_KEYS:
+            source.pop(key, None)
+        payload = copy.deepcopy(source)
 
         iid = payload.get("instance_id")
         if not _looks_like_instance_id(iid):
@@ -932,158 +960,302 @@ class MonstersState:
                     except Exception:
                         pass
 
+        self._pos_index_dirty = True
+        self._rebuild_target_index()
         return records
 
     def _track_dirty(self, monster_id: Optional[str], *, force_all: bool = False) -> None:
+        from mutants.services.monster_ai import features as monster_features  # local import to avoid cycle
+
+        monster_features.monster_changed(None if force_all else monster_id)
         self._dirty = True
         if force_all:
             self._dirty_all = True
+            self._pos_index_dirty = True
             return
         if monster_id:
             self._dirty_ids.add(monster_id)
+            record = self._by_id.get(monster_id)
+            if record is not None:
+                # Dirty marks follow every target acquire/release, so the
+                # targeting index is refreshed here as well.
+                self._index_target(record, key=monster_id)
+            if record is not None and not self._pos_index_dirty:
+                # Picks up HP changes (and any direct ``pos`` edits) for the
+                # per-year live counts.
+                self._index_monster(record)
         else:
             self._dirty_all = True
+            self._pos_index_dirty = True
 
     def list_all(self) -> List[Dict[str, Any]]:
         # Cache is the authoritative read path during a session.
         return list(self._monsters)
 
+    @staticmethod
+    def _index_pos(monster: Mapping[str, Any]) -> Optional[tuple[int, int, int]]:
+        pos = monster.get("pos")
+        if not (isinstance(pos, list) and len(pos) >= 3):
+            return None
+        try:
+            return int(pos[0]), int(pos[1]), int(pos[2])
+        except Exception:
+            return None
+
+    @staticmethod
+    def _index_alive(monster: Mapping[str, Any]) -> bool:
+        hp_block = monster.get("hp") if isinstance(monster.get("hp"), Mapping) else {}
+        try:
+            return int(hp_block.get("current", monster.get("hp_cur", 1))) > 0
+        except Exception:
+            return True
+
+    def _index_key(self, monster: Mapping[str, Any]) -> str:
+        return self._coerce_monster_id(monster) or f"@{id(monster)}"
+
+    def _unindex(self, key: str) -> None:
+        previous = self._indexed.pop(key, None)
+        if previous is None:
+            return
+        (year, x, y), alive = previous
+        by_year = self._pos_index.get(year)
+        if by_year is not None:
+            bucket = by_year.get((x, y))
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del by_year[(x, y)]
+            if not by_year:
+                del self._pos_index[year]
+        if alive:
+            remaining = self._alive_by_year.get(year, 0) - 1
+            if remaining > 0:
+                self._alive_by_year[year] = remaining
+            else:
+                self._alive_by_year.pop(year, None)
+
+    def _index_monster(self, monster: Dict[str, Any], *, key: Optional[str] = None) -> None:
+        """File *monster* under its current ``pos`` (O(1); no-op if unchanged)."""
+
+        key = key or self._index_key(monster)
+        pos = self._index_pos(monster)
+        alive = self._index_alive(monster)
+        previous = self._indexed.get(key)
+        if previous is not None and previous == (pos, alive):
+            bucket = self._pos_index[pos[0]][(pos[1], pos[2])]
+            if bucket.get(key) is monster:
+                return
+        self._unindex(key)
+        if pos is None:
+            return
+        year, x, y = pos
+        self._pos_index.setdefault(year, {}).setdefault((x, y), {})[key] = monster
+        self._indexed[key] = (pos, alive)
+        if alive:
+            self._alive_by_year[year] = self._alive_by_year.get(year, 0) + 1
+
     def _rebuild_pos_index(self) -> None:
-        index: Dict[int, Dict[tuple[int, int], List[Dict[str, Any]]]] = {}
+        self._pos_index = {}
+        self._indexed = {}
+        self._alive_by_year = {}
         for mon in self._monsters:
-            pos = mon.get("pos")
-            if not (isinstance(pos, list) and len(pos) >= 3):
-                continue
-            try:
-                year, x, y = int(pos[0]), int(pos[1]), int(pos[2])
-            except Exception:
-                continue
-            by_year = index.setdefault(year, {})
-            by_year.setdefault((x, y), []).append(mon)
-        self._pos_index = index
+            self._index_monster(mon)
         self._pos_index_dirty = False
 
-    def list_in_year(self, year: int) -> List[Dict[str, Any]]:
-        """Return monsters whose ``pos`` year matches ``year`` (best-effort)."""
+    def _ensure_pos_index(self) -> None:
         if self._pos_index_dirty:
             self._rebuild_pos_index()
+
+    def move_monster(
+        self, monster: Mapping[str, Any] | str, new_pos: Iterable[Any] | None
+    ) -> bool:
+        """Set a monster's ``pos`` to *new_pos* and update the spatial hash.
+
+        ``monster`` may be a record or an id.  Returns ``False`` when the
+        monster is not part of this state (a passed record still gets its
+        ``pos`` updated so callers can use this unconditionally).
+        """
+
+        coords: Optional[List[int]] = None
+        if new_pos is not None:
+            coords = [int(value) for value in list(new_pos)[:3]]
+            if len(coords) < 3:
+                raise ValueError("new_pos must be (year, x, y)")
+        monster_id = self._coerce_monster_id(monster)
+        record = self._by_id.get(monster_id) if monster_id else None
+        if isinstance(monster, MutableMapping) and monster is not record:
+            monster["pos"] = list(coords) if coords is not None else None
+        if record is None:
+            return False
+        record["pos"] = coords
+        if not self._pos_index_dirty:
+            self._index_monster(record, key=monster_id)
+        if monster_id in self._target_of:
+            self._index_target(record, key=monster_id)
+        return True
+
+    def occupied_tiles(self, year: int) -> List[tuple[int, int]]:
+        """Return the ``(x, y)`` tiles in *year* holding at least one monster."""
+
+        self._ensure_pos_index()
+        return list(self._pos_index.get(int(year), {}).keys())
+
+    def count_alive(self, year: int) -> int:
+        """Return the number of live monsters in *year* without touching the store."""
+
+        self._ensure_pos_index()
+        return self._alive_by_year.get(int(year), 0)
+
+    def list_in_year(self, year: int) -> List[Dict[str, Any]]:
+        """Return monsters whose ``pos`` year matches ``year`` (best-effort)."""
+        self._ensure_pos_index()
         buckets = self._pos_index.get(int(year), {})
         result: list[Dict[str, Any]] = []
         for mons in buckets.values():
-            result.extend(mons)
+            result.extend(mons.values())
         return result
 
+    @staticmethod
+    def _target_player(monster: Mapping[str, Any]) -> str:
+        target = monster.get("target_player_id")
+        if isinstance(target, str) and target.strip():
+            return target.strip()
+        state = monster.get("_ai_state")
+        if isinstance(state, Mapping):
+            bound = state.get("bound_player_id")
+            if isinstance(bound, str) and bound.strip():
+                return bound.strip()
+        return ""
+
+    def _release_target(self, monster_id: str) -> None:
+        previous = self._target_of.pop(monster_id, None)
+        if previous is None:
+            return
+        bucket = self._by_target.get(previous[0])
+        if bucket is not None:
+            bucket.pop(monster_id, None)
+            if not bucket:
+                del self._by_target[previous[0]]
+
+    def _index_target(self, monster: Mapping[str, Any], *, key: Optional[str] = None) -> None:
+        """File *monster* under the player it targets (O(1); releases if none)."""
+
+        key = key or self._coerce_monster_id(monster)
+        if not key:
+            return
+        player_id = self._target_player(monster)
+        if not player_id:
+            self._release_target(key)
+            return
+        pos = self._index_pos(monster)
+        entry = (player_id, pos[0] if pos is not None else None)
+        previous = self._target_of.get(key)
+        if previous == entry:
+            return
+        if previous is not None and previous[0] != player_id:
+            self._release_target(key)
+        self._target_of[key] = entry
+        self._by_target.setdefault(player_id, {})[key] = entry[1]
+
+    def _rebuild_target_index(self) -> None:
+        self._by_target = {}
+        self._target_of = {}
+        for mon in self._monsters:
+            if isinstance(mon, Mapping):
+                self._index_target(mon)
+
     def _clear_target_index(self, monster_id: str, player_id: str | None = None) -> None:
+        """Drop *monster_id* from the targeting index.
+
+        With *player_id* only that binding is released; a monster still bound
+        to someone else (via ``target_player_id``/``bound_player_id``) is
+        re-filed from its current record.
+        """
+
         if not monster_id:
             return
-        if player_id:
-            bucket = self._by_target.get(player_id)
-            if bucket and monster_id in bucket:
-                bucket.discard(monster_id)
-                if not bucket:
-                    self._by_target.pop(player_id, None)
+        current = self._target_of.get(monster_id)
+        if player_id and (current is None or current[0] != player_id):
             return
-        for pid in list(self._by_target.keys()):
-            bucket = self._by_target.get(pid)
-            if bucket and monster_id in bucket:
-                bucket.discard(monster_id)
-                if not bucket:
-                    self._by_target.pop(pid, None)
+        self._release_target(monster_id)
+        record = self._by_id.get(monster_id)
+        if player_id and record is not None:
+            self._index_target(record, key=monster_id)
 
     def mark_targeting(self, monster: Mapping[str, Any] | str | None = None) -> None:
-        """Hint that at least one monster is targeting a player to avoid scans."""
+        """Re-file *monster* in the targeting index after a target acquire/release."""
+
         if monster is None:
-            self._has_targeting = True
             return
-        if isinstance(monster, str):
-            self._has_targeting = True
+        monster_id = self._coerce_monster_id(monster)
+        if not monster_id:
             return
-        try:
-            mid = str(monster.get("id") or monster.get("instance_id") or "").strip()
-            pid = str(monster.get("target_player_id") or "").strip()
-            state = monster.get("_ai_state") if isinstance(monster, Mapping) else None
-            bound = state.get("bound_player_id") if isinstance(state, Mapping) else None
-            if pid:
-                self._by_target.setdefault(pid, set()).add(mid)
-                self._has_targeting = True
-            elif bound:
-                self._by_target.setdefault(str(bound), set()).add(mid)
-                self._has_targeting = True
-        except Exception:
-            self._has_targeting = True
+        record = self._by_id.get(monster_id)
+        if record is None:
+            return
+        if isinstance(monster, Mapping) and monster is not record:
+            for key in ("target_player_id", "_ai_state"):
+                if key in monster:
+                    record[key] = monster[key]
+        self._index_target(record, key=monster_id)
+
+    def verify_target_index(self) -> None:
+        """Cross-check the targeting index against a full scan.
+
+        Raises ``AssertionError`` describing the first mismatch.  Enabled on
+        every :meth:`list_targeting_player` call when
+        ``MUTANTS_CHECK_TARGET_INDEX`` is set.
+        """
+
+        expected: Dict[str, Dict[str, Optional[int]]] = {}
+        for mon in self._monsters:
+            if not isinstance(mon, Mapping):
+                continue
+            mid = self._coerce_monster_id(mon)
+            player_id = self._target_player(mon)
+            if not mid or not player_id:
+                continue
+            pos = self._index_pos(mon)
+            expected.setdefault(player_id, {})[mid] = pos[0] if pos is not None else None
+        if expected != self._by_target:
+            for player_id in sorted(set(expected) | set(self._by_target)):
+                want = expected.get(player_id, {})
+                have = self._by_target.get(player_id, {})
+                if want != have:
+                    raise AssertionError(
+                        f"target index drift for {player_id}: index={have!r} scan={want!r}"
+                    )
+        forward = {
+            mid: (player_id, year)
+            for player_id, bucket in expected.items()
+            for mid, year in bucket.items()
+        }
+        if forward != self._target_of:
+            raise AssertionError(f"target index forward map drift: {self._target_of!r}")
 
     def list_targeting_player(self, player_id: str, *, year: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Return monsters explicitly targeting/bound to ``player_id`` (optionally in ``year``)."""
+        """Return monsters targeting/bound to ``player_id`` (optionally in ``year``).
+
+        Served from the reverse targeting index: O(monsters targeting the
+        player), never a scan of the whole population.
+        """
+
         pid = str(player_id).strip()
         if not pid:
             return []
-        if not self._has_targeting:
+        if self._check_target_index:
+            self.verify_target_index()
+        bucket = self._by_target.get(pid)
+        if not bucket:
             return []
-        candidates: list[Dict[str, Any]] = []
-        id_bucket = self._by_target.get(pid, set())
-        if id_bucket:
-            for mid in list(id_bucket):
-                mon = self._by_id.get(mid)
-                if not isinstance(mon, Mapping):
-                    continue
-                pos = mon.get("pos")
-                if year is not None:
-                    if not (isinstance(pos, list) and len(pos) >= 3):
-                        continue
-                    try:
-                        if int(pos[0]) != int(year):
-                            continue
-                    except Exception:
-                        continue
-                candidates.append(mon)
-        if candidates:
-            return candidates
-        # If we have a target bucket but nothing in this year, keep the targeting flag
-        # and return an empty list so cross-year travelers don't drop pursuit.
-        if id_bucket and year is not None:
-            return []
-        # Fallback: defensive scan when index is empty/stale. If none are found,
-        # drop the targeting flag so future calls don't scan every monster.
+        wanted_year = int(year) if year is not None else None
         result: list[Dict[str, Any]] = []
-        for mon in self._monsters:
-            pos = mon.get("pos")
-            if year is not None:
-                if not (isinstance(pos, list) and len(pos) >= 3):
-                    continue
-                try:
-                    if int(pos[0]) != int(year):
-                        continue
-                except Exception:
-                    continue
-            target = mon.get("target_player_id")
-            if isinstance(target, str) and target.strip() == pid:
-                result.append(mon)
+        for mid, mon_year in bucket.items():
+            if wanted_year is not None and mon_year != wanted_year:
                 continue
-            state = mon.get("_ai_state") if isinstance(mon, Mapping) else None
-            if isinstance(state, Mapping):
-                bound = state.get("bound_player_id")
-                if isinstance(bound, str) and bound.strip() == pid:
-                    result.append(mon)
-                    continue
-                pending = state.get("pending_pursuit")
-                pending_pos = None
-                try:
-                    pending_pos = combat_loot.coerce_pos(pending)
-                except Exception:
-                    pending_pos = None
-                if pending_pos is not None and (year is None or int(pending_pos[0]) == int(year)):
-                    result.append(mon)
-                    continue
-                positions_map = state.get("target_positions")
-                if isinstance(positions_map, Mapping):
-                    cached = positions_map.get(pid)
-                    if isinstance(cached, Mapping):
-                        cached_pos = combat_loot.coerce_pos(cached.get("pos"))
-                        if cached_pos is not None and (year is None or int(cached_pos[0]) == int(year)):
-                            result.append(mon)
-                            continue
-        if not result and not self._by_target:
-            self._has_targeting = False
+            mon = self._by_id.get(mid)
+            if isinstance(mon, Mapping):
+                result.append(mon)
         return result
 
     def list_adjacent_monsters(self, player_pos: Iterable[Any]) -> list[str]:
@@ -1102,8 +1274,7 @@ class MonstersState:
         except Exception:
             return []
 
-        if self._pos_index_dirty:
-            self._rebuild_pos_index()
+        self._ensure_pos_index()
 
         buckets = self._pos_index.get(year, {})
         # Match movement deltas (DELTA) where positive Y is north.
@@ -1116,8 +1287,8 @@ class MonstersState:
 
         dirs: list[str] = []
         for (dx, dy), token in offsets:
-            bucket = buckets.get((px + dx, py + dy), [])
-            for mon in bucket:
+            bucket = buckets.get((px + dx, py + dy), {})
+            for mon in bucket.values():
                 try:
                     hp_block = mon.get("hp") if isinstance(mon.get("hp"), Mapping) else {}
                     hp_cur = int(hp_block.get("current", mon.get("hp_cur", 1)))
@@ -1130,9 +1301,9 @@ class MonstersState:
         return dirs
 
     def list_at(self, year: int, x: int, y: int) -> List[Dict[str, Any]]:
-        if self._pos_index_dirty:
-            self._rebuild_pos_index()
-        raw = self._pos_index.get(int(year), {}).get((int(x), int(y)), [])
+        self._ensure_pos_index()
+        bucket = self._pos_index.get(int(year), {}).get((int(x), int(y)))
+        raw = list(bucket.values()) if bucket else []
 
         filtered: List[Dict[str, Any]] = []
         seen: set[str] = set()
@@ -1162,6 +1333,35 @@ class MonstersState:
         self._last_accessed_id = monster_id if monster else None
         return monster
 
+    def _adopt_entry(self, entry: Dict[str, Any]) -> str:
+        iid_raw = entry.get("instance_id") or entry.get("id")
+        iid = str(iid_raw) if iid_raw else ""
+        if not iid:
+            raise KeyError("instance_id")
+
+        replaced = False
+        if iid in self._by_id:
+            for idx, mon in enumerate(self._monsters):
+                if isinstance(mon, Mapping) and (
+                    mon.get("instance_id") == iid or mon.get("id") == iid
+                ):
+                    self._monsters[idx] = entry
+                    replaced = True
+                    break
+        self._by_id[iid] = entry
+        if not replaced:
+            self._monsters.append(entry)
+
+        if not self._pos_index_dirty:
+            self._index_monster(entry, key=iid)
+        self._index_target(entry, key=iid)
+        return iid
+
+    def mint_instance_id(self, monster_id: Any) -> str:
+        """Return a new instance id from the registry's block-allocated counter."""
+
+        return self._instances.mint_store_instance_id(monster_id)
+
     def add_instance(self, record: Mapping[str, Any]) -> Dict[str, Any]:
         """
         Add a (template-derived) monster instance into the cached state,
@@ -1174,58 +1374,47 @@ class MonstersState:
             raise ValueError("invalid monster record")
 
         entry = normalized[0]
-        iid_raw = entry.get("instance_id") or entry.get("id")
-        iid = str(iid_raw) if iid_raw else ""
-        if not iid:
-            raise KeyError("instance_id")
-
-        self._by_id[iid] = entry
-        replaced = False
-        for idx, mon in enumerate(self._monsters):
-            if isinstance(mon, Mapping) and (
-                mon.get("instance_id") == iid or mon.get("id") == iid
-            ):
-                self._monsters[idx] = entry
-                replaced = True
-                break
-        if not replaced:
-            self._monsters.append(entry)
-
+        iid = self._adopt_entry(entry)
         self._track_dirty(iid)
-        # Maintain position index incrementally on add/replace.
-        try:
-            pos = entry.get("pos")
-            if isinstance(pos, list) and len(pos) >= 3:
-                year, x, y = int(pos[0]), int(pos[1]), int(pos[2])
-                by_year = self._pos_index.setdefault(year, {})
-                bucket = by_year.setdefault((x, y), [])
-                # Remove any previous instances of this iid in this bucket.
-                bucket = [mon for mon in bucket if mon.get("id") != iid and mon.get("instance_id") != iid]
-                bucket.append(entry)
-                by_year[(x, y)] = bucket
-        except Exception:
-            self._pos_index_dirty = True
-        try:
-            if entry.get("target_player_id"):
-                self._has_targeting = True
-                pid = str(entry.get("target_player_id")).strip()
-                if pid:
-                    self._by_target.setdefault(pid, set()).add(iid)
-            else:
-                state = entry.get("_ai_state") if isinstance(entry, Mapping) else None
-                if isinstance(state, Mapping) and state.get("bound_player_id"):
-                    self._has_targeting = True
-                    bid = str(state.get("bound_player_id")).strip()
-                    if bid:
-                        self._by_target.setdefault(bid, set()).add(iid)
-        except Exception:
-            pass
         try:
             state_debug.log_monster_spawn(entry, reason="cache_add")
         except Exception:
             pass
         return entry
 
+    def spawn_batch(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        catalog: Mapping[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Normalize *records*, insert them into the store in one transaction and
+        add them to the cache.
+
+        Unlike :meth:`add_instance` the new monsters are persisted immediately
+        and are not marked dirty, so the next ``save`` does not write them a
+        second time.  Nothing is cached if the store rejects the batch.
+        """
+
+        normalized = normalize_records([dict(record) for record in records], catalog=catalog)
+        if not normalized:
+            return []
+        payloads = [self._prepare_store_payload(entry) for entry in normalized]
+        spawn_many = getattr(self._instances, "spawn_many", None)
+        if callable(spawn_many):
+            spawn_many(payloads)
+        else:
+            for payload in payloads:
+                self._instances.spawn(payload)
+        for entry in normalized:
+            self._adopt_entry(entry)
+            try:
+                state_debug.log_monster_spawn(entry, reason="spawner")
+            except Exception:
+                pass
+        return normalized
+
     def set_status_effects(
         self, monster_id: str, statuses: Iterable[Mapping[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -1259,36 +1448,6 @@ class MonstersState:
         self._track_dirty(monster_id)
         return payload
 
-    def decrement_status_effects(self, amount: int = 1) -> Dict[str, List[Dict[str, Any]]]:
-        if amount <= 0:
-            return {}
-        if self._statusful_count <= 0:
-            return {}
-
-        expired: Dict[str, List[Dict[str, Any]]] = {}
-        changed = False
-
-        for monster_id, monster in list(self._by_id.items()):
-            entries = _sanitize_status_list(monster.get("status_effects"))
-            updated: List[Dict[str, Any]] = []
-            expired_entries: List[Dict[str, Any]] = []
-            for entry in entries:
-                remaining = max(0, int(entry.get("duration", 0)) - amount)
-                if remaining > 0:
-                    updated.append({"status_id": entry["status_id"], "duration": remaining})
-                else:
-                    expired_entries.append({"status_id": entry["status_id"], "duration": 0})
-            if expired_entries:
-                expired[monster_id] = expired_entries
-            if updated != entries:
-                changed = True
-            self.set_status_effects(monster_id, updated)
-
-        if changed:
-            self.save()
-
-        return expired
-
     def _coerce_monster_id(self, monster: Mapping[str, Any] | str | None) -> Optional[str]:
         if monster is None:
             return None
@@ -1307,53 +1466,30 @@ class MonstersState:
 
     def update_position_cache(self, monster: Mapping[str, Any], *, previous_pos: Iterable[Any] | None = None) -> None:
         """
-        Maintain the position index incrementally when a monster moves.
+        Re-file ``monster`` under its current ``pos`` in the spatial hash.
 
-        Falls back to marking the index dirty if anything goes wrong so callers
-        never pay the price of stale lookups.
+        Kept for callers that assign ``pos`` themselves; new code should use
+        :meth:`move_monster`.  ``previous_pos`` is accepted for compatibility
+        but no longer needed because the index tracks where each monster was
+        filed.  A ``None`` position removes the monster from the index.
         """
 
-        def _coerce_pos(value: Any) -> Optional[tuple[int, int, int]]:
-            try:
-                raw = list(value)
-            except Exception:
-                return None
-            if len(raw) < 3:
-                return None
-            try:
-                return int(raw[0]), int(raw[1]), int(raw[2])
-            except Exception:
-                return None
-
         monster_id = self._coerce_monster_id(monster)
+        if monster_id in self._target_of:
+            # Keep the targeting index's year in step with the move.
+            self._index_target(monster, key=monster_id)
+        if self._pos_index_dirty:
+            return
         if not monster_id:
             self._pos_index_dirty = True
             return
-
-        new_pos = _coerce_pos(monster.get("pos"))
-        old_pos = _coerce_pos(previous_pos)
-
-        try:
-            if old_pos:
-                by_year = self._pos_index.get(old_pos[0])
-                if by_year is not None:
-                    bucket = by_year.get((old_pos[1], old_pos[2]), [])
-                    filtered = [entry for entry in bucket if self._coerce_monster_id(entry) != monster_id]
-                    if filtered:
-                        by_year[(old_pos[1], old_pos[2])] = filtered
-                    else:
-                        by_year.pop((old_pos[1], old_pos[2]), None)
-                    if not by_year:
-                        self._pos_index.pop(old_pos[0], None)
-
-            if new_pos:
-                by_year = self._pos_index.setdefault(new_pos[0], {})
-                bucket = by_year.get((new_pos[1], new_pos[2]), [])
-                bucket = [entry for entry in bucket if self._coerce_monster_id(entry) != monster_id]
-                bucket.append(monster)
-                by_year[(new_pos[1], new_pos[2])] = bucket
-        except Exception:
-            self._pos_index_dirty = True
+        record = self._by_id.get(monster_id)
+        if record is None or self._index_pos(monster) is None:
+            self._unindex(monster_id)
+            return
+        if record is not monster:
+            record["pos"] = monster.get("pos")
+        self._index_monster(record, key=monster_id)
 
     def mark_dirty(self, monster: Mapping[str, Any] | str | None = None) -> None:
         monster_id = self._coerce_monster_id(monster)
@@ -1410,6 +1546,7 @@ class MonstersState:
             catalog = {}
 
         monster["bag"] = _collect_bag_entries(monster, catalog=catalog, seen_iids=set())
+        bump_bag_version(monster)
 
         for idx, entry in enumerate(self._monsters):
             if entry is monster or entry.get("id") == monster_id:
@@ -1447,6 +1584,7 @@ class MonstersState:
         monster["bag"] = []
         monster["armour_slot"] = None
         monster["wielded"] = None
+        bump_bag_version(monster)
 
         hp_block = monster.get("hp")
         if isinstance(hp_block, MutableMapping):
@@ -1616,6 +1754,7 @@ def _normalize_monsters(monsters: List[Dict[str, Any]], *, catalog: Mapping[str,
             bag = [item for item in bag if item.get("iid") != armour.get("iid")]
             monster["bag"] = bag
         monster["armour_slot"] = armour
+        bump_bag_version(monster)
 
         wielded_iid = _resolve_wielded(monster.get("wielded"), bag=bag)
         monster["wielded"] = wielded_iid
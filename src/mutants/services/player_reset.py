@@ -7,10 +7,10 @@ from importlib import resources
 from pathlib import Path
 from typing import Any, Dict, List, MutableMapping
 
-from mutants import env
 from mutants.bootstrap.lazyinit import compute_ac_from_dex
 from mutants.players import startup as player_startup
-from mutants.services import player_state as pstate
+from mutants.registries import items_instances as itemsreg
+from mutants.services import inventory_aggregates, player_state as pstate
 from mutants.constants import CLASS_ORDER
 
 
@@ -193,39 +193,14 @@ def _purge_player_items(player_id: str) -> int:
         LOG.info("Removed 0 item rows for <unknown> during bury")
         return 0
 
-    db_path = env.get_state_database_path()
     removed = 0
     try:
-        with sqlite3.connect(db_path) as con:
-            con.execute("PRAGMA foreign_keys=ON")
-            cur = con.execute(
-                "DELETE FROM items_instances WHERE owner = ?",
-                (player_id,),
-            )
-            removed = cur.rowcount or 0
-            try:
-                con.execute(
-                    "UPDATE players SET wield_item_id=NULL, armour_item_id=NULL "
-                    "WHERE player_id=?",
-                    (player_id,),
-                )
-            except sqlite3.OperationalError:
-                LOG.debug(
-                    "players table missing while clearing equipment for %s",
-                    player_id,
-                    exc_info=True,
-                )
-    except sqlite3.OperationalError as exc:
-        LOG.debug(
-            "Skipping inventory purge for %s due to missing tables: %s",
-            player_id,
-            exc,
-            exc_info=True,
-        )
+        removed = len(itemsreg.remove_owner_instances(player_id))
     except sqlite3.Error as exc:
         LOG.warning("Failed to purge inventory for %s: %s", player_id, exc)
     finally:
         LOG.info("Removed %d item rows for %s during bury", removed, player_id)
+    inventory_aggregates.forget_owner(player_id)
     return removed
 
 
@@ -698,6 +698,12 @@ def update_player_inventory(
         active_view["inventory"] = list(sanitized)
         active_view.get("bags", {})[class_token] = list(sanitized)
 
+    owner_id = _sanitize_player_id(entry.get("id"))
+    if owner_id:
+        from mutants.services import inventory_aggregates  # local import to avoid cycle
+
+        inventory_aggregates.sync_owner(owner_id, sanitized)
+
     return list(sanitized)
 
 
@@ -1443,40 +1449,40 @@ def normalize_class_name(value: Any) -> Optional[str]:
 def _evaluate_item_instance_invariants() -> Tuple[bool, Dict[str, Any]]:
     summary: Dict[str, Any] = {}
 
-    try:
-        snapshot = itemsreg.snapshot_instances()
-    except Exception as exc:  # pragma: no cover - defensive only
-        summary["error"] = repr(exc)
-        return False, summary
-
-    summary["count"] = len(snapshot)
+    count = 0
     invalid_levels: List[str] = []
     missing_condition: List[str] = []
     stray_condition: List[str] = []
 
     broken_ids = {itemsreg.BROKEN_WEAPON_ID, itemsreg.BROKEN_ARMOUR_ID}
 
-    for inst in snapshot:
-        iid_raw = inst.get("instance_id") or inst.get("iid") or inst.get("item_id")
-        iid = str(iid_raw) if iid_raw is not None else "<unknown>"
-
-        try:
-            level_val = int(inst.get("enchant_level", 0))
-        except (TypeError, ValueError):
-            level_val = -1
-        if level_val < 0:
-            invalid_levels.append(iid)
-
-        item_id_raw = inst.get("item_id") or inst.get("catalog_id") or inst.get("id")
-        item_id = str(item_id_raw) if item_id_raw is not None else ""
-        broken = item_id in broken_ids
-        has_condition = "condition" in inst
+    try:
+        for inst in itemsreg.iter_instances(("iid", "item_id", "enchant", "condition")):
+            count += 1
+            iid_raw = inst.get("instance_id") or inst.get("iid") or inst.get("item_id")
+            iid = str(iid_raw) if iid_raw is not None else "<unknown>"
 
-        if broken and has_condition:
-            stray_condition.append(iid)
-        if not broken and not has_condition:
-            missing_condition.append(iid)
+            try:
+                level_val = int(inst.get("enchant_level", 0))
+            except (TypeError, ValueError):
+                level_val = -1
+            if level_val < 0:
+                invalid_levels.append(iid)
+
+            item_id_raw = inst.get("item_id") or inst.get("catalog_id") or inst.get("id")
+            item_id = str(item_id_raw) if item_id_raw is not None else ""
+            broken = item_id in broken_ids
+            has_condition = "condition" in inst
+
+            if broken and has_condition:
+                stray_condition.append(iid)
+            if not broken and not has_condition:
+                missing_condition.append(iid)
+    except Exception as exc:  # pragma: no cover - defensive only
+        summary["error"] = repr(exc)
+        return False, summary
 
+    summary["count"] = count
     if invalid_levels:
         summary["invalid_enchant_count"] = len(invalid_levels)
         summary["invalid_enchant_sample"] = invalid_levels[:5]
@@ -3878,8 +3884,17 @@ def clear_target(*, reason: Optional[str] = None, monsters: Any | None = None) -
         except Exception:
             return previous
 
+    list_targeting = getattr(monsters, "list_targeting_player", None)
+    if callable(list_targeting):
+        # Only monsters in the targeting index can be tied to these players.
+        candidates: list[Any] = []
+        for pid in sorted(player_ids):
+            candidates.extend(list_targeting(pid))
+    else:
+        candidates = monsters.list_all()
+
     cleared = False
-    for record in monsters.list_all():
+    for record in candidates:
         if not isinstance(record, Mapping):
             continue
         target_token = _sanitize_player_id(record.get("target_player_id"))
@@ -4070,48 +4085,6 @@ def set_status_effects_for_class(
     return [dict(entry) for entry in sanitized]
 
 
-def decrement_status_effects(amount: int = 1) -> Dict[str, List[Dict[str, Any]]]:
-    """Decrement durations across all classes, returning expired entries."""
-
-    if amount <= 0:
-        return {}
-
-    state = load_state()
-    normalized, _active, _klass = _prepare_active_storage(state)
-    status_map = normalized.setdefault("status_effects_by_class", {})
-    if not isinstance(status_map, dict):
-        status_map = {}
-        normalized["status_effects_by_class"] = status_map
-
-    expired: Dict[str, List[Dict[str, Any]]] = {}
-    changed = False
-
-    for key, payload in list(status_map.items()):
-        cls_name = _normalize_class_name(key)
-        if not cls_name:
-            continue
-        entries = _sanitize_status_effect_list(payload)
-        updated: List[Dict[str, Any]] = []
-        expired_entries: List[Dict[str, Any]] = []
-        for entry in entries:
-            remaining = max(0, int(entry.get("duration", 0)) - amount)
-            if remaining > 0:
-                updated.append({"status_id": entry["status_id"], "duration": remaining})
-            else:
-                expired_entries.append({"status_id": entry["status_id"], "duration": 0})
-        if expired_entries:
-            expired[cls_name] = expired_entries
-        if updated != entries:
-            changed = True
-        status_map[cls_name] = updated
-
-    if changed:
-        normalized["status_effects_by_class"] = status_map
-        save_state(normalized)
-
-    return expired
-
-
 def get_active_pair(
     state: Optional[Dict[str, Any]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -17,6 +17,19 @@ _LOGGER: logging.Logger | None = None
 _LOG_MAX_BYTES = 5 * 1024 * 1024
 _LOG_BACKUPS = 3
 _MAX_MON_LOG = 25
+_FORCE_DISABLED = False  # headless runs can switch state-debug I/O off entirely
+
+
+def set_enabled(enabled: bool) -> bool:
+    """Allow (``True``) or suppress (``False``) state-debug logging for this process.
+
+    Returns the previous setting so callers can restore it.
+    """
+
+    global _FORCE_DISABLED
+    previous = not _FORCE_DISABLED
+    _FORCE_DISABLED = not enabled
+    return previous
 
 
 def _debug_enabled() -> bool:
@@ -26,8 +39,13 @@ def _debug_enabled() -> bool:
       1) Env var MUTANTS_STATE_DEBUG truthy (1/true/on)
       2) Env var MUTANTS_LOGGING truthy (matches the -Logging switch)
       3) Presence of flag file state/logs/state_debug.flag
+
+    :func:`set_enabled` with ``False`` overrides all of the above.
     """
 
+    if _FORCE_DISABLED:
+        return False
+
     def _truthy(value: str | None) -> bool:
         if value is None:
             return False
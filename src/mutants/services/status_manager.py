@@ -1,24 +1,39 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, List, Mapping, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
 
 from mutants.services import monsters_state, player_state
+from mutants.util.timer_wheel import TimerWheel
 
 LOG = logging.getLogger(__name__)
 
+TimerKey = Tuple[str, str, str]
+
 
 class StatusManager:
-    """Manage timed status effects for player classes and monsters."""
+    """Manage timed status effects for player classes and monsters.
+
+    Every effect is scheduled on a :class:`TimerWheel` keyed by its expiry
+    tick, so :meth:`tick` only visits the effects that actually expire that
+    turn; nothing is rewritten or marked dirty for the others.  Stored
+    ``duration`` values are refreshed from the wheel whenever an owner's
+    effects are written (apply, expiry, :meth:`flush`), and
+    :meth:`remaining` reads them straight from the expiry tick.
+    """
 
     def __init__(
         self,
         *,
         player_loader=player_state.load_state,
         monster_loader=monsters_state.load_state,
+        wheel: Optional[TimerWheel] = None,
     ) -> None:
         self._load_player_state = player_loader
         self._load_monster_state = monster_loader
+        self._wheel = wheel or TimerWheel()
+        self._players_primed = False
+        self._primed_monsters: Any = None
 
     def apply(self, entity_id: str, status_id: str, duration: int) -> List[Dict[str, Any]]:
         """Apply or update a status for ``entity_id``."""
@@ -30,22 +45,181 @@ class StatusManager:
             return self._apply_to_monster(token, status_id, duration)
         raise ValueError(f"Unsupported entity type for {entity_id!r}")
 
-    def tick(self, amount: int = 1) -> None:
-        """Advance all status timers by ``amount`` turns (default: 1)."""
+    def remaining(self, entity_id: str, status_id: str) -> int:
+        """Return the turns left on ``status_id`` for ``entity_id`` (``0`` if absent)."""
+
+        self._prime()
+        kind, token = self._normalize_entity(entity_id)
+        if kind == "player":
+            token = player_state.normalize_class_name(token) or token
+        left = self._wheel.remaining((kind, token, self._normalize_status_id(status_id)))
+        return left or 0
+
+    def tick(self, amount: int = 1) -> Dict[str, List[Dict[str, Any]]]:
+        """Advance all status timers by ``amount`` turns (default: 1).
+
+        Returns the expired entries keyed by ``player:<class>`` or
+        ``monster:<id>``.
+        """
 
         if amount <= 0:
-            return
+            return {}
 
         try:
-            player_state.decrement_status_effects(amount)
+            self._prime()
         except Exception:  # pragma: no cover - defensive logging
-            LOG.exception("Failed to decrement player status effects")
+            LOG.exception("Failed to schedule status effects")
+
+        due: Dict[Tuple[str, str], set[str]] = {}
+        for kind, owner, status_id in self._wheel.advance(amount):
+            due.setdefault((kind, owner), set()).add(status_id)
+        if not due:
+            return {}
 
+        expired: Dict[str, List[Dict[str, Any]]] = {}
         try:
-            monsters = self._load_monster_state()
-            monsters.decrement_status_effects(amount)
+            self._expire_players(
+                {owner: ids for (kind, owner), ids in due.items() if kind == "player"}, expired
+            )
         except Exception:  # pragma: no cover - defensive logging
-            LOG.exception("Failed to decrement monster status effects")
+            LOG.exception("Failed to expire player status effects")
+
+        try:
+            self._expire_monsters(
+                {owner: ids for (kind, owner), ids in due.items() if kind == "monster"}, expired
+            )
+        except Exception:  # pragma: no cover - defensive logging
+            LOG.exception("Failed to expire monster status effects")
+        return expired
+
+    def flush(self) -> None:
+        """Write the wheel's remaining durations back to every scheduled owner."""
+
+        owners: Dict[str, set[str]] = {"player": set(), "monster": set()}
+        for kind, owner, _status_id in self._wheel.keys():  # type: ignore[misc]
+            owners.setdefault(kind, set()).add(owner)
+        if owners["player"]:
+            state = self._load_player_state()
+            for cls_name in sorted(owners["player"]):
+                entries = player_state.get_status_effects_for_class(cls_name, state=state)
+                player_state.set_status_effects_for_class(
+                    cls_name, self._with_remaining("player", cls_name, entries), state=state
+                )
+        if owners["monster"]:
+            monsters = self._load_monster_state()
+            for monster_id in sorted(owners["monster"]):
+                monster = monsters.get(monster_id)
+                if monster is None:
+                    continue
+                entries = monster.get("status_effects") or []
+                monsters.set_status_effects(
+                    monster_id, self._with_remaining("monster", monster_id, entries)
+                )
+
+    # Timer bookkeeping ------------------------------------------------
+    def _schedule(self, kind: str, owner: str, entries: Iterable[Mapping[str, Any]]) -> None:
+        for entry in entries:
+            if not isinstance(entry, Mapping) or not entry.get("status_id"):
+                continue
+            key: Hashable = (kind, owner, str(entry["status_id"]))
+            duration = max(0, self._coerce_int(entry.get("duration")))
+            if duration > 0:
+                self._wheel.schedule_in(key, duration)
+            else:
+                self._wheel.cancel(key)
+
+    def _prime(self) -> None:
+        """Schedule effects already in storage the first time they are needed."""
+
+        if not self._players_primed:
+            self._players_primed = True
+            status_map = player_state.get_status_effects_map(self._load_player_state())
+            for cls_name, entries in status_map.items():
+                self._schedule("player", cls_name, entries)
+
+        monsters = self._load_monster_state()
+        if monsters is self._primed_monsters:
+            return
+        # A different monsters cache (reload, new session): re-seed its timers.
+        for key in self._wheel.keys():
+            if key[0] == "monster":  # type: ignore[index]
+                self._wheel.cancel(key)
+        self._primed_monsters = monsters
+        for monster in monsters.list_all():
+            statuses = monster.get("status_effects") if isinstance(monster, Mapping) else None
+            if not statuses:
+                continue
+            monster_id = str(monster.get("id") or monster.get("instance_id") or "")
+            if monster_id:
+                self._schedule("monster", monster_id, statuses)
+
+    def _with_remaining(
+        self, kind: str, owner: str, entries: Iterable[Mapping[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Return *entries* with durations read from the wheel.
+
+        Entries written by something other than this manager are adopted
+        onto the wheel with their stored duration.
+        """
+
+        result: List[Dict[str, Any]] = []
+        for entry in entries:
+            if not isinstance(entry, Mapping) or not entry.get("status_id"):
+                continue
+            status_id = str(entry["status_id"])
+            left = self._wheel.remaining((kind, owner, status_id))
+            if left is None:
+                left = max(0, self._coerce_int(entry.get("duration")))
+                if left > 0:
+                    self._wheel.schedule_in((kind, owner, status_id), left)
+            if left > 0:
+                result.append({"status_id": status_id, "duration": left})
+        return result
+
+    def _expire_players(
+        self, due: Mapping[str, set[str]], expired: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        if not due:
+            return
+        state = self._load_player_state()
+        for cls_name, status_ids in sorted(due.items()):
+            entries = player_state.get_status_effects_for_class(cls_name, state=state)
+            gone = [e for e in entries if e.get("status_id") in status_ids]
+            if not gone:
+                continue
+            kept = self._with_remaining(
+                "player", cls_name, [e for e in entries if e.get("status_id") not in status_ids]
+            )
+            player_state.set_status_effects_for_class(cls_name, kept, state=state)
+            expired[f"player:{cls_name}"] = [
+                {"status_id": e["status_id"], "duration": 0} for e in gone
+            ]
+
+    def _expire_monsters(
+        self, due: Mapping[str, set[str]], expired: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        if not due:
+            return
+        monsters = self._load_monster_state()
+        changed = False
+        for monster_id, status_ids in sorted(due.items()):
+            monster = monsters.get(monster_id)
+            if monster is None:
+                continue
+            entries = [e for e in monster.get("status_effects") or [] if isinstance(e, Mapping)]
+            gone = [e for e in entries if e.get("status_id") in status_ids]
+            if not gone:
+                continue
+            kept = self._with_remaining(
+                "monster", monster_id, [e for e in entries if e.get("status_id") not in status_ids]
+            )
+            monsters.set_status_effects(monster_id, kept)
+            expired[f"monster:{monster_id}"] = [
+                {"status_id": e["status_id"], "duration": 0} for e in gone
+            ]
+            changed = True
+        if changed:
+            monsters.save()
 
     # Internal helpers -------------------------------------------------
     def _apply_to_player(
@@ -55,8 +229,12 @@ class StatusManager:
         target = player_state.normalize_class_name(class_token)
         if not target:
             target = self._resolve_player_class_from_id(state, class_token)
-        existing = player_state.get_status_effects_for_class(target, state=state)
+        self._prime()
+        existing = self._with_remaining(
+            "player", target, player_state.get_status_effects_for_class(target, state=state)
+        )
         merged = self._merge_entries(existing, status_id, duration)
+        self._schedule_applied("player", target, status_id, merged)
         return player_state.set_status_effects_for_class(target, merged, state=state)
 
     def _apply_to_monster(
@@ -66,12 +244,21 @@ class StatusManager:
         monster = monsters.get(monster_id)
         if monster is None:
             raise KeyError(monster_id)
-        existing = monster.get("status_effects") or []
+        self._prime()
+        existing = self._with_remaining("monster", monster_id, monster.get("status_effects") or [])
         merged = self._merge_entries(existing, status_id, duration)
+        self._schedule_applied("monster", monster_id, status_id, merged)
         result = monsters.set_status_effects(monster_id, merged)
         monsters.save()
         return result
 
+    def _schedule_applied(
+        self, kind: str, owner: str, status_id: str, merged: Iterable[Mapping[str, Any]]
+    ) -> None:
+        normalized_id = self._normalize_status_id(status_id)
+        self._wheel.cancel((kind, owner, normalized_id))
+        self._schedule(kind, owner, [e for e in merged if e.get("status_id") == normalized_id])
+
     def _resolve_player_class_from_id(
         self, state: Mapping[str, Any], token: str
     ) -> str:
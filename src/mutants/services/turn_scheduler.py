@@ -9,7 +9,8 @@ from mutants.debug import turnlog
 from mutants.services import state_debug
 if TYPE_CHECKING:
     from mutants.services.status_manager import StatusManager
-from mutants.services import random_pool
+from mutants.registries import sqlite_statements, sqlite_store
+from mutants.services import ground_summary, random_pool
 from mutants.services.combat_config import CombatConfig
 
 LOG = logging.getLogger(__name__)
@@ -54,6 +55,10 @@ class TurnScheduler:
         self._player_save_interval = max(1, p_interval)
         self._player_save_counter = 0
 
+    @property
+    def status_manager(self) -> Optional["StatusManager"]:
+        return self._status_manager
+
     # Internal state helpers --------------------------------------------
     def _monster_id(self, monster: Mapping[str, Any] | None) -> str:
         if not isinstance(monster, Mapping):
@@ -83,7 +88,10 @@ class TurnScheduler:
         """Advance the shared tick counter and resolve a full turn."""
 
         tick_id = random_pool.advance_rng_tick(self._rng_name)
+        sqlite_store.set_change_tick(tick_id)
         self._log_tick(tick_id)
+        # Ground summaries stay cached until the frame for this tick renders.
+        ground_summary.begin_tick()
 
         rng = random_pool.get_rng(self._rng_name)
         restore_token = self._inject_rng(rng)
@@ -174,6 +182,8 @@ class TurnScheduler:
                     player["_dirty"] = False
             except Exception:  # pragma: no cover
                 LOG.exception("Failed to persist runtime player at end of command")
+            # Per-turn SQL counters (``debug sql`` / ``sqlite_admin stats --live``).
+            sqlite_statements.end_turn()
 
     # Internal helpers -------------------------------------------------
     def _normalize_result(self, result: Any) -> tuple[str, Optional[str], Optional[str]]:
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import os
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Deque, Dict, List, Tuple
 
 from mutants.state import state_path
 
+# (ts, kind, text) or (ts, kind, formatter, payload) for deferred entries.
+_Entry = Tuple[Any, ...]
+
 
 class LogSink:
-    """Ring buffer sink that also appends to a file."""
+    """Ring buffer sink that also appends to a file.
+
+    Entries are kept as tuples; deferred entries (see :meth:`add_deferred`) are
+    only formatted when read via :meth:`tail` or written to the log file.
+    """
 
     def __init__(self, capacity: int = 200, file_path: str | Path | None = state_path("logs", "game.log")) -> None:
         self.capacity = capacity
@@ -17,26 +25,46 @@ class LogSink:
         if not logging_enabled:
             file_path = None
         self.file_path = Path(file_path) if file_path else None
-        self.buffer: List[str] = []
+        self.buffer: Deque[_Entry] = deque(maxlen=capacity)
         if self.file_path:
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _format(entry: _Entry) -> str:
+        if len(entry) == 4:
+            ts, kind, formatter, payload = entry
+            text = formatter(payload)
+        else:
+            ts, kind, text = entry
+        return f"{ts} {kind} - {text}"
+
+    def _write(self, line: str) -> None:
+        with open(self.file_path, "a", encoding="utf-8") as f:  # type: ignore[arg-type]
+            f.write(line + "\n")
+
     def add(self, kind: str, text: str, ts: str) -> None:
         """Preferred API: add a log event with explicit fields."""
-        line = f"{ts} {kind} - {text}"
-        self.buffer.append(line)
-        if len(self.buffer) > self.capacity:
-            self.buffer = self.buffer[-self.capacity :]
+        entry = (ts, kind, text)
+        self.buffer.append(entry)
+        if self.file_path:
+            self._write(self._format(entry))
+
+    def add_deferred(
+        self, kind: str, formatter: Callable[[Any], str], payload: Any, ts: str = ""
+    ) -> None:
+        """Record an event whose text is ``formatter(payload)``, built on demand."""
+        entry = (ts, kind, formatter, payload)
+        self.buffer.append(entry)
         if self.file_path:
-            with open(self.file_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            self._write(self._format(entry))
 
     def handle(self, ev: Dict[str, str]) -> None:
         """Legacy shim: accept dicts as used by some commands."""
         self.add(ev.get("kind", ""), ev.get("text", ""), ev.get("ts", ""))
 
     def tail(self, n: int = 100) -> List[str]:
-        return self.buffer[-n:]
+        entries = list(self.buffer)[-n:]
+        return [self._format(entry) for entry in entries]
 
     def clear(self) -> None:
         self.buffer.clear()
@@ -416,18 +416,43 @@ def render_tokenized(
     return [st.resolve_segments(segs, palette) for segs in lines]
 
 
-def render(
-    vm: RoomVM,
-    feedback_events: Optional[List[dict]] = None,
-    width: int = c.WIDTH,
-    palette: Dict[str, str] | None = None,
+# Formatted static block (title, compass, directions) memoized by the room's
+# static key plus the style version; see ``app.context._static_room_parts``.
+_CORE_CACHE: Dict[tuple, tuple[str, ...]] = {}
+_CORE_CACHE_MAX = 512
+
+
+def clear_frame_cache() -> None:
+    """Drop memoized static room blocks."""
+    _CORE_CACHE.clear()
+
+
+def _core_lines(
+    vm: RoomVM, player_state_hint: Any, world: Any, dyn_mod: Any
 ) -> List[str]:
-    """Render *vm* to ANSI strings using group-based colors."""
-    ctx = appctx.current_context() if hasattr(appctx, "current_context") else None
-    player_state_hint = ctx.get("player_state") if ctx else None
-    world = ctx.get("world") if ctx else None
-    dyn_mod = ctx.get("dynamics") if ctx and ctx.get("dynamics") else dyn
-    player_display_name = pstate.get_player_display_name(player_state_hint)
+    """Return the title/compass/direction block for *vm*, memoized when static.
+
+    The resolver path depends on live player state rather than the VM, so it is
+    never cached.
+    """
+    static_key = vm.get("static_key")
+    if static_key is None or (player_state_hint is not None and world is not None):
+        return _render_core_lines(vm, player_state_hint, world, dyn_mod)
+    key = (static_key, st.style_version())
+    cached = _CORE_CACHE.get(key)
+    if cached is None:
+        if len(_CORE_CACHE) >= _CORE_CACHE_MAX:
+            _CORE_CACHE.clear()
+        cached = tuple(_render_core_lines(vm, player_state_hint, world, dyn_mod))
+        _CORE_CACHE[key] = cached
+    return list(cached)
+
+
+def _render_core_lines(
+    vm: RoomVM, player_state_hint: Any, world: Any, dyn_mod: Any
+) -> List[str]:
+    DEV = os.environ.get("MUTANTS_DEV") == "1"
+    logger = logging.getLogger(__name__)
 
     lines: List[str] = []
     header = vm.get("header")
@@ -447,9 +472,6 @@ def render(
             k: v for k, v in raw_dirs.items() if v and v.get("base", 0) in (0, 3)
         }
 
-    DEV = os.environ.get("MUTANTS_DEV") == "1"
-    logger = logging.getLogger(__name__)
-
     # Validate with the passability engine.
     # - base==0 (open): drop if resolver blocks.
     # - base==3 (gate): never drop; show open/closed/locked via resolver.
@@ -490,9 +512,27 @@ def render(
                 continue
         lines.append(fmt.format_direction_line(d, edge))
 
-    # ------- Build blocks instead of emitting separators inline -------
-    block_core = list(lines)
-    lines = []
+    return lines
+
+
+def render(
+    vm: RoomVM,
+    feedback_events: Optional[List[dict]] = None,
+    width: int = c.WIDTH,
+    palette: Dict[str, str] | None = None,
+) -> List[str]:
+    """Render *vm* to ANSI strings using group-based colors."""
+    ctx = appctx.current_context() if hasattr(appctx, "current_context") else None
+    player_state_hint = ctx.get("player_state") if ctx else None
+    world = ctx.get("world") if ctx else None
+    dyn_mod = ctx.get("dynamics") if ctx and ctx.get("dynamics") else dyn
+    player_display_name = pstate.get_player_display_name(player_state_hint)
+
+    DEV = os.environ.get("MUTANTS_DEV") == "1"
+    logger = logging.getLogger(__name__)
+
+    block_core = _core_lines(vm, player_state_hint, world, dyn_mod)
+    lines: List[str] = []
 
     # ---- Ground Block (optional) ----
     block_ground: list[str] = []
@@ -71,6 +71,7 @@ _DEFAULT_COLOR: str = "white"
 _COLOR_FILE_ENV = "MUTANTS_UI_COLORS_PATH"  # optional override via env
 _COLORS_PATH_OVERRIDE: Optional[str] = None  # programmatic override via theme
 _ANSI_ENABLED: bool = True  # allow theme to disable ANSI for clean transcripts
+_STYLE_VERSION = 0  # bumped when colors/ANSI settings change (render caches)
 
 
 def _normalize_colors_path(raw: str | os.PathLike[str]) -> str:
@@ -120,22 +121,35 @@ def set_colors_map_path(path: Optional[str]) -> None:
     Programmatically override the colors.json path (used by theme switching).
     Pass None to clear the override and fall back to env/defaults.
     """
-    global _COLORS_PATH_OVERRIDE, _COLORS_CACHE
+    global _COLORS_PATH_OVERRIDE, _COLORS_CACHE, _STYLE_VERSION
     _COLORS_PATH_OVERRIDE = _normalize_colors_path(path) if path else None
     _COLORS_CACHE = None  # force reload on next resolve
+    _STYLE_VERSION += 1
 
 
 def reload_colors_map() -> None:
     """Drop cache and reload immediately (useful after set_colors_map_path)."""
-    global _COLORS_CACHE
+    global _COLORS_CACHE, _STYLE_VERSION
     _COLORS_CACHE = None
+    _STYLE_VERSION += 1
     _ = _load_colors_map()
 
 
-def set_ansi_enabled(enabled: bool) -> None:
-    """Enable/disable ANSI coloring globally (themes can toggle this)."""
-    global _ANSI_ENABLED
+def set_ansi_enabled(enabled: bool) -> bool:
+    """Enable/disable ANSI coloring globally (themes can toggle this).
+
+    Returns the previous setting.
+    """
+    global _ANSI_ENABLED, _STYLE_VERSION
+    previous = _ANSI_ENABLED
     _ANSI_ENABLED = bool(enabled)
+    _STYLE_VERSION += 1
+    return previous
+
+
+def style_version() -> int:
+    """Return a counter that changes whenever colorization settings change."""
+    return _STYLE_VERSION
 
 
 def resolve_color_for_group(group: Optional[str]) -> str:
@@ -3,21 +3,31 @@
 from __future__ import annotations
 
 import hashlib
+import random
 import time
 import uuid
 
 
-def new_instance_id(*, year: int | None = None, item_id: str | None = None, tag: str | None = None) -> str:
+def new_instance_id(
+    *,
+    year: int | None = None,
+    item_id: str | None = None,
+    tag: str | None = None,
+    rng: random.Random | None = None,
+) -> str:
     """Return a globally-unique, URL-safe instance identifier.
 
     The identifier is composed of dot-separated segments to aid debugging while
     keeping the token easy to slice when analysing logs.
 
     Format: ``i.<yyyymmdd>[.<year>][.<tag>][.<item_hash>].<12hex>``
+
+    When *rng* is given the trailing hex is drawn from it so seeded callers
+    (the runtime spawner) mint reproducible ids.
     """
 
     yyyymmdd = time.strftime("%Y%m%d", time.gmtime())
-    core = uuid.uuid4().hex[:12]
+    core = f"{rng.getrandbits(48):012x}" if rng is not None else uuid.uuid4().hex[:12]
     parts = ["i", yyyymmdd]
 
     if year is not None:
@@ -0,0 +1,127 @@
+"""Hierarchical timer wheel keyed by absolute expiry tick."""
+
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterator, List, Optional, Set
+
+__all__ = ["TimerWheel"]
+
+
+class TimerWheel:
+    """Schedule keys to fire at an absolute tick.
+
+    Level ``n`` has ``2 ** slot_bits`` slots, each covering
+    ``2 ** (slot_bits * n)`` ticks.  A timer is filed on the lowest level whose
+    span covers its distance from :attr:`now` and cascades down as the clock
+    reaches its slot, so :meth:`advance` only touches timers that are due or
+    cascading instead of every scheduled key.  Timers further out than the
+    top level wait on an overflow list that is re-filed whenever the top level
+    turns over.
+
+    Rescheduling a key replaces its previous expiry; timers scheduled at or
+    before :attr:`now` fire on the next :meth:`advance`.
+    """
+
+    def __init__(self, *, slot_bits: int = 6, levels: int = 4, now: int = 0) -> None:
+        if slot_bits <= 0 or levels <= 0:
+            raise ValueError("slot_bits and levels must be positive")
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: List[List[Set[Hashable]]] = [
+            [set() for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._overflow: Set[Hashable] = set()
+        self._due: Set[Hashable] = set()
+        self._expiry: Dict[Hashable, int] = {}
+        self._bucket: Dict[Hashable, Set[Hashable]] = {}
+        self.now = int(now)
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._expiry
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(list(self._expiry))
+
+    def expiry(self, key: Hashable) -> Optional[int]:
+        """Return the tick *key* fires at, or ``None`` if it is not scheduled."""
+
+        return self._expiry.get(key)
+
+    def remaining(self, key: Hashable) -> Optional[int]:
+        """Return the ticks left before *key* fires (``0`` when overdue)."""
+
+        expires = self._expiry.get(key)
+        if expires is None:
+            return None
+        return max(0, expires - self.now)
+
+    def schedule(self, key: Hashable, expires_at: int) -> None:
+        self.cancel(key)
+        self._expiry[key] = int(expires_at)
+        self._file(key)
+
+    def schedule_in(self, key: Hashable, ticks: int) -> None:
+        self.schedule(key, self.now + int(ticks))
+
+    def cancel(self, key: Hashable) -> bool:
+        bucket = self._bucket.pop(key, None)
+        if bucket is None:
+            return False
+        bucket.discard(key)
+        del self._expiry[key]
+        return True
+
+    def _file(self, key: Hashable) -> None:
+        expires = self._expiry[key]
+        delta = expires - self.now
+        if delta <= 0:
+            bucket = self._due
+        else:
+            bucket = self._overflow
+            for level in range(self._levels):
+                if delta < 1 << (self._bits * (level + 1)):
+                    slot = (expires >> (self._bits * level)) & self._mask
+                    bucket = self._wheels[level][slot]
+                    break
+        bucket.add(key)
+        self._bucket[key] = bucket
+
+    def _refile(self, bucket: Set[Hashable]) -> None:
+        keys = list(bucket)
+        bucket.clear()
+        for key in keys:
+            self._file(key)
+
+    def advance(self, ticks: int = 1) -> List[Hashable]:
+        """Move the clock forward *ticks* and return the keys that fired.
+
+        Keys are returned in expiry order and are no longer scheduled.
+        """
+
+        fired: List[Hashable] = []
+        for _ in range(max(0, int(ticks))):
+            self.now += 1
+            now = self.now
+            for level in range(1, self._levels):
+                if now & ((1 << (self._bits * level)) - 1):
+                    break
+                slot = (now >> (self._bits * level)) & self._mask
+                self._refile(self._wheels[level][slot])
+            top_span = 1 << (self._bits * max(1, self._levels - 1))
+            if self._overflow and not now & (top_span - 1):
+                self._refile(self._overflow)
+            current = self._wheels[0][now & self._mask]
+            if not current and not self._due:
+                continue
+            due = sorted(current | self._due, key=lambda key: (self._expiry[key], repr(key)))
+            current.clear()
+            self._due.clear()
+            for key in due:
+                del self._bucket[key]
+                del self._expiry[key]
+            fired.extend(due)
+        return fired
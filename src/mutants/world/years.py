@@ -112,14 +112,14 @@ def _load_years_from_file() -> list[int]:
 
 
 def _load_years_from_catalog(db_path: Path) -> list[int]:
-    if not db_path.exists():
+    from mutants.registries.sqlite_store import SQLiteConnectionManager  # local import to avoid cycle
+
+    manager = SQLiteConnectionManager(db_path)
+    if not manager.in_memory and not db_path.exists():
         return []
     years: set[int] = set()
     try:
-        conn = sqlite3.connect(db_path)
-    except sqlite3.Error:
-        return []
-    try:
+        conn = manager.connect()
         cursor = conn.execute("SELECT spawn_years FROM monsters_catalog")
         for (raw_years,) in cursor.fetchall():
             if not raw_years:
@@ -134,8 +134,8 @@ def _load_years_from_catalog(db_path: Path) -> list[int]:
                         years.add(int(value))
                     except (TypeError, ValueError):
                         continue
-    finally:
-        conn.close()
+    except sqlite3.Error:
+        return []
     return _dedupe_sorted(years)
 
 
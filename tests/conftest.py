@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_store
+
+
+@pytest.fixture(autouse=True)
+def _close_sqlite_connections():
+    """Give every test a fresh connection registry (tests switch state roots)."""
+
+    yield
+    sqlite_store.close_all()
+
+
+@pytest.fixture(scope="session")
+def seeded_state_snapshot(tmp_path_factory: pytest.TempPathFactory) -> Iterator[sqlite3.Connection]:
+    """Schema plus the bundled item and monster catalogs, seeded once per session."""
+
+    root = tmp_path_factory.mktemp("seeded-state")
+    env = dict(os.environ, GAME_STATE_ROOT=str(root), MUTANTS_STATE_BACKEND="sqlite")
+    db_path = root / "mutants.db"
+    for command in (
+        [str(REPO_ROOT / "tools" / "sqlite_admin.py"), "init"],
+        [str(REPO_ROOT / "tools" / "sqlite_admin.py"), "catalog-import-items"],
+        [
+            str(REPO_ROOT / "scripts" / "monsters_import.py"),
+            "--catalog",
+            str(REPO_ROOT / "state" / "monsters" / "catalog.json"),
+            "--db",
+            str(db_path),
+        ],
+    ):
+        subprocess.check_call([sys.executable, *command], env=env, cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+    snapshot = sqlite_store.snapshot_database(db_path, in_memory=False)
+    sqlite_store.close_all()
+    yield snapshot
+    snapshot.close()
+
+
+@pytest.fixture
+def seed_state_db(seeded_state_snapshot: sqlite3.Connection) -> Callable[..., None]:
+    """Clone the session snapshot into a state database (default: the current one)."""
+
+    def _clone(db_path: os.PathLike[str] | str | None = None) -> None:
+        sqlite_store.restore_database(seeded_state_snapshot, db_path)
+
+    return _clone
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import itertools
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.commands import debug as debug_cmd
+from mutants.services import audio_cues, random_pool
+from mutants.services.monster_ai import pursuit, scheduler as ai_scheduler
+
+PLAYER = "player_thief"
+PLAYER_POS = (2000, 0, 0)
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.events: List[tuple[str, str]] = []
+
+    def push(self, kind: str, text: str, **_meta: Any) -> None:
+        self.events.append((kind, text))
+
+
+def _straight_path(year, start, target, **_kwargs):
+    x, y = start
+    path = [(x, y)]
+    while (x, y) != tuple(target):
+        x += (target[0] > x) - (target[0] < x)
+        y += (target[1] > y) - (target[1] < y)
+        path.append((x, y))
+    return path
+
+
+def _monster(mid: str, x: int, y: int, **state: Any) -> Dict[str, Any]:
+    return {
+        "id": mid,
+        "pos": [2000, x, y],
+        "hp": {"current": 5, "max": 5},
+        "target_player_id": PLAYER,
+        "_ai_state": {"bound_player_id": PLAYER, **state},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pursuit.world_years, "find_path_between", _straight_path)
+    monkeypatch.setattr(random_pool, "get_rng_tick", lambda _name: 10)
+
+
+def _scheduler(**overrides: int) -> ai_scheduler.AIScheduler:
+    config = {"near_radius": 1, "cadence": 3, "budget_ms": 0, "catchup_cap": 4}
+    config.update(overrides)
+    return ai_scheduler.AIScheduler(config)
+
+
+def test_partition_keeps_near_and_fleeing_monsters_at_full_fidelity() -> None:
+    sched = _scheduler()
+    near = _monster("near", 1, 1)
+    far = _monster("far", 6, 0)
+    fleeing = _monster("flee", 6, 6, flee_mode=True)
+    unbound = {"id": "idle", "pos": [2000, 5, 5], "_ai_state": {}}
+
+    full, coarse = sched.partition(
+        [near, far, fleeing, unbound],
+        PLAYER_POS,
+        PLAYER,
+        is_flee=lambda mon: bool(mon["_ai_state"].get("flee_mode")),
+    )
+
+    assert [m["id"] for m in full] == ["near", "flee", "idle"]
+    assert [m["id"] for m in coarse] == ["far"]
+
+
+def test_coarse_tier_catches_up_on_cadence_and_stops_short() -> None:
+    sched = _scheduler()
+    ctx: Dict[str, Any] = {"player_state": {"pos": list(PLAYER_POS)}}
+    fresh = _monster("fresh", 9, 0, last_sim_tick=9)
+    stale = _monster("stale", 0, 12, last_sim_tick=1)
+    close = _monster("close", 3, 0, last_sim_tick=2)
+    dirty: List[str] = []
+
+    tick = sched.begin_tick()
+    sched.run_coarse(ctx, [fresh, stale, close], PLAYER_POS, tick, mark_dirty=lambda m: dirty.append(m["id"]))
+
+    assert tick == 10
+    assert fresh["pos"] == [2000, 9, 0]  # not due yet
+    assert fresh["_ai_state"]["last_sim_tick"] == 9
+    assert stale["pos"] == [2000, 0, 8]  # nine ticks owed, capped at four
+    assert close["pos"] == [2000, 1, 0]  # never steps onto the player tile
+    assert stale["_ai_state"]["last_sim_tick"] == 10
+    assert stale["_ai_state"]["pending_pursuit"] == [2000, 0, 0]
+    assert sorted(dirty) == ["close", "stale"]
+    assert sched.last["waiting"] == 1 and sched.last["moved"] == 2
+    assert audio_cues.peek(ctx) == ["You hear loud sounds of footsteps to the east."]
+    assert ctx["_ai_emitted_audio"] is True
+
+    assert sched.begin_tick() == 11  # monotonic even if the turn tick is unchanged
+
+
+def test_budget_defers_remaining_monsters_and_reports(monkeypatch: pytest.MonkeyPatch) -> None:
+    sched = _scheduler(budget_ms=5)
+    clock = itertools.count(start=0.0, step=0.004)
+    monkeypatch.setattr(ai_scheduler.time, "perf_counter", lambda: next(clock))
+    monsters = [_monster(f"m{i}", 10 + i, 0, last_sim_tick=0) for i in range(4)]
+
+    tick = sched.begin_tick()
+    sched.run_coarse({}, monsters, PLAYER_POS, tick, mark_dirty=lambda _m: None)
+
+    advanced = [m for m in monsters if m["_ai_state"]["last_sim_tick"] == tick]
+    assert [m["id"] for m in advanced] == ["m0", "m1"]
+    assert all(m["_ai_state"]["last_sim_tick"] == 0 for m in monsters[2:])
+    assert sched.last["deferred"] == 2
+
+    bus = _Bus()
+    debug_cmd.debug_cmd("ai-budget", {"feedback_bus": bus, "ai_scheduler": sched})
+    text = "\n".join(line for _kind, line in bus.events)
+    assert "budget=5ms" in text
+    assert "deferred=2" in text
+    assert "over_budget=1" in text
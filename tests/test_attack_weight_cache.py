@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import monsters_state
+from mutants.services.monster_ai import attack_selection
+
+_CATALOG = {
+    "rusty_sword": {"base_power_melee": 6},
+    "war_axe": {"base_power_melee": 14},
+    "crossbow": {"base_power_bolt": 9, "ranged": True},
+    "sling": {"base_power_bolt": 3, "ranged": True},
+    "skull": {"base_power_melee": 1},
+    "chain_mail": {"armour": True, "armour_class": 3},
+    "broken_weapon": {"base_power_melee": 2},
+}
+
+
+@pytest.fixture(autouse=True)
+def _catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(attack_selection, "_load_catalog", lambda: _CATALOG)
+    yield
+    attack_selection.set_cache_enabled(True)
+
+
+def _random_monster(rng: random.Random) -> Dict[str, Any]:
+    bag = []
+    for idx in range(rng.randrange(0, 5)):
+        entry: Dict[str, Any] = {"iid": f"i{idx}", "item_id": rng.choice(sorted(_CATALOG))}
+        if rng.random() < 0.3:
+            entry["derived"] = {"base_damage": rng.randrange(0, 30)}
+        if rng.random() < 0.2:
+            entry["enchant_level"] = rng.randrange(0, 3)
+        bag.append(entry)
+    monster: Dict[str, Any] = {"id": "m", "bag": bag, "_ai_state": {}}
+    if bag and rng.random() < 0.7:
+        monster["wielded"] = rng.choice(bag)["iid"]
+    if rng.random() < 0.6:
+        monster["innate_attack"] = {"base_power": rng.randrange(0, 20)}
+    if rng.random() < 0.3:
+        monster["prefers_ranged"] = True
+    if rng.random() < 0.2:
+        monster["ai_overrides"] = {"prefers_innate": True}
+    if rng.random() < 0.25:
+        monster["target_player_id"] = "p1"
+    return monster
+
+
+def _draws(monster: Dict[str, Any], seed: int, count: int) -> list:
+    ctx = {"monster_ai_rng": random.Random(seed)}
+    return [attack_selection.select_attack(monster, ctx) for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_cached_plans_match_uncached_path(seed: int) -> None:
+    monster = _random_monster(random.Random(seed))
+
+    attack_selection.set_cache_enabled(False)
+    expected = _draws(monster, seed, 200)
+    assert attack_selection.ATTACK_TABLE_KEY not in monster
+
+    attack_selection.set_cache_enabled(True)
+    assert _draws(monster, seed, 200) == expected
+    _key, cached_table = monster[attack_selection.ATTACK_TABLE_KEY]
+
+    attack_selection.set_cache_enabled(False)
+    wielded = attack_selection._normalize_token(monster.get("wielded"))
+    fresh_table = attack_selection._cached_weight_table(monster, {}, wielded_token=wielded)
+    assert cached_table == fresh_table  # same weights => same distribution for any RNG
+
+
+def test_only_the_rng_draw_runs_while_the_bag_is_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monster = {
+        "id": "m",
+        "bag": [{"iid": "a", "item_id": "rusty_sword"}, {"iid": "b", "item_id": "crossbow"}],
+        "wielded": "a",
+        "innate_attack": {"base_power": 5},
+        "_ai_state": {},
+    }
+    builds = []
+    original = attack_selection._build_weight_table
+    monkeypatch.setattr(
+        attack_selection,
+        "_build_weight_table",
+        lambda **kw: builds.append(kw) or original(**kw),
+    )
+
+    for _ in range(10):
+        attack_selection.select_attack(monster, {"monster_ai_rng": random.Random(1)})
+    assert len(builds) == 1
+
+    monster["bag"][0]["item_id"] = "war_axe"
+    monsters_state.bump_bag_version(monster)
+    plan = attack_selection.select_attack(monster, {"monster_ai_rng": random.Random(1)})
+    assert len(builds) == 2
+    assert plan.source in {"melee", "bolt", "innate"}
+
+    monster["wielded"] = "b"
+    attack_selection.select_attack(monster, {"monster_ai_rng": random.Random(1)})
+    attack_selection.select_attack(monster, {"monster_ai_rng": random.Random(1), "monster_ai_prefers_ranged": True})
+    assert len(builds) == 4
+
+
+def test_memo_fields_are_not_persisted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monster = {
+        "id": "mon-1",
+        "instance_id": "mon-1",
+        "monster_id": "ghoul",
+        "pos": [2000, 0, 0],
+        "hp": {"current": 3, "max": 3},
+        "bag": [{"iid": "a", "item_id": "rusty_sword"}],
+        "_ai_state": {},
+    }
+    attack_selection.select_attack(monster, {"monster_ai_rng": random.Random(0)})
+    monsters_state.bump_bag_version(monster)
+    state = monsters_state.MonstersState(tmp_path / "m.json", [monster], instances=object())
+    monkeypatch.setattr(monsters_state, "_looks_like_instance_id", lambda _iid: True)
+    payload = state._prepare_store_payload(monster)
+
+    assert monsters_state.ATTACK_TABLE_KEY in monster
+    assert monsters_state.ATTACK_TABLE_KEY not in payload
+    assert monsters_state.BAG_VERSION_KEY not in payload
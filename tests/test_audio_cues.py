@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import audio_cues
+
+
+def _ctx(pos=(2000, 0, 0)) -> dict:
+    return {"player_state": {"pos": list(pos)}}
+
+
+def test_emit_sound_formats_and_dedupes_per_frame() -> None:
+    ctx = _ctx()
+
+    assert audio_cues.emit_sound((2000, 1, 0), (2000, 0, 0), "step", ctx=ctx) == (
+        "You hear loud sounds of footsteps to the east."
+    )
+    assert audio_cues.emit_sound((2000, -3, 2), (2000, 0, 0), "yells", ctx=ctx) == (
+        "You hear faint sounds of yelling and screaming far to the northwest."
+    )
+    for _ in range(50):
+        audio_cues.emit_sound((2000, 1, 0), (2000, 0, 0), "footsteps", ctx=ctx)
+        audio_cues.emit_sound((2000, 2, 0), (2000, 0, 0), "footsteps", ctx=ctx, once_per_frame=False)
+
+    assert audio_cues.emit_sound((2000, 0, 0), (2000, 0, 0), "footsteps", ctx=ctx) is None
+    assert audio_cues.emit_sound((2000, 5, 0), (2000, 0, 0), "footsteps", ctx=ctx) is None
+    assert audio_cues.emit_sound((2100, 1, 0), (2000, 0, 0), "footsteps", ctx=ctx) is None
+
+    assert ctx["_suppress_shadows_once"] is True
+    assert audio_cues.drain(ctx) == [
+        "You hear loud sounds of footsteps to the east.",
+        "You hear faint sounds of yelling and screaming far to the northwest.",
+        "You hear faint sounds of footsteps far to the east.",
+    ]
+    assert audio_cues.drain(ctx) == []
+
+
+def test_emit_sounds_batches_a_tick() -> None:
+    ctx = _ctx()
+    sounds = [
+        ((2000, 0, 1), "footsteps"),
+        ((2000, 0, 1), "footsteps"),
+        ((2000, 0, -1), "growl"),
+        ((2000, 9, 9), "footsteps"),
+        ("bogus", "footsteps"),
+    ]
+
+    messages = audio_cues.emit_sounds(sounds, (2000, 0, 0), ctx=ctx)
+
+    assert messages == [
+        "You hear loud sounds of footsteps to the north.",
+        "You hear loud sounds of footsteps to the north.",
+        "You hear loud sounds of growl to the south.",
+    ]
+    assert audio_cues.peek(ctx) == [
+        "You hear loud sounds of footsteps to the north.",
+        "You hear loud sounds of growl to the south.",
+    ]
+    assert "_suppress_shadows_once" not in ctx
+
+
+def test_drain_drops_cues_from_another_year() -> None:
+    ctx = _ctx()
+    audio_cues.emit_sound((2000, 1, 1), (2000, 0, 0), "footsteps", ctx=ctx)
+    ctx["player_state"]["pos"] = [2100, 0, 0]
+
+    assert audio_cues.drain(ctx) == []
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_statements, sqlite_store
+from mutants.services.item_transfer import GROUND_CAP
+
+TILE = (2000, 3, 4)
+
+
+def _item(iid: str, *, owner: str | None = None, pos=TILE, created_at: int = 1):
+    record = {"iid": iid, "item_id": "bottle_cap", "created_at": created_at}
+    if owner is not None:
+        record.update(owner=owner, year=-1, x=-1, y=-1)
+    else:
+        record.update(year=pos[0], x=pos[1], y=pos[2])
+    return record
+
+
+@pytest.fixture
+def stores(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from mutants import state as state_mod
+
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    return sqlite_store.get_stores(tmp_path / "mutants.db")
+
+
+def _calls(name: str) -> int:
+    counters = {e["name"]: e for e in sqlite_statements.snapshot()["statements"]}
+    return counters.get(name, {}).get("calls", 0)
+
+
+def _ground(stores) -> list[str]:
+    return [row["iid"] for row in stores.items.list_at(*TILE)]
+
+
+def test_move_many_fills_the_tile_in_one_statement(stores) -> None:
+    stores.items.bulk_insert([_item(f"g{idx}") for idx in range(GROUND_CAP - 2)])
+    stores.items.bulk_insert([_item(f"b{idx}", owner="p1") for idx in range(4)])
+
+    sqlite_statements.reset()
+    moved = stores.items.move_many(["b3", "missing", "b1", "b0"], TILE, cap=GROUND_CAP)
+    assert moved == ["b1", "b0"]  # lowest iids win the two free slots
+    assert _calls("items.move_many") == 1
+    assert _calls("txn.begin_immediate") == 1
+    assert len(_ground(stores)) == GROUND_CAP
+    assert stores.items.get_by_iid("b3")["owner"] == "p1"
+
+    # Already on the tile: nothing to move, no slot consumed.
+    assert stores.items.move_many(["b0"], TILE, cap=GROUND_CAP) == []
+
+
+def test_move_many_stamps_created_at_in_the_given_order(stores) -> None:
+    stores.items.bulk_insert([_item("b1", owner="m1"), _item("b2", owner="m1")])
+    moved = stores.items.move_many(["b2", "b1"], TILE, created_at={"b2": 50, "b1": 60})
+    assert moved == ["b2", "b1"]
+    assert _ground(stores) == ["b2", "b1"]
+    assert stores.items.get_by_iid("b1")["owner"] is None
+
+
+def test_drop_or_delete_logs_moves_and_deletes(stores) -> None:
+    sqlite_store.set_change_feed(True)
+    try:
+        stores.items.bulk_insert([_item(f"g{idx}") for idx in range(GROUND_CAP - 1)])
+        stores.items.bulk_insert([_item(f"b{idx}", owner="p1") for idx in range(3)])
+        head = stores.changes.head()
+
+        dropped, deleted = stores.items.drop_or_delete([["b2", "b1"], ["b0"]], TILE, GROUND_CAP)
+        assert dropped == ["b1"]  # lowest iid of the first group
+        assert deleted == ["b2", "b0"]
+        assert list(stores.items.list_by_owner("p1")) == []
+
+        changes = stores.changes.changes_since(head)
+        assert [(c["key"], c["op"]) for c in changes] == [
+            ("b1", "update"),
+            ("b2", "delete"),
+            ("b0", "delete"),
+        ]
+        assert changes[0]["fields"] == {"owner": None, "year": 2000, "x": 3, "y": 4}
+    finally:
+        sqlite_store.set_change_feed(None)
+
+
+def test_delete_many_and_delete_by_owner(stores) -> None:
+    stores.items.bulk_insert([_item(f"b{idx}", owner="p1") for idx in range(3)])
+    stores.items.bulk_insert([_item("g0")])
+    assert stores.items.delete_many(["g0", "nope", "b0", "g0"]) == ["g0", "b0"]
+    assert sorted(stores.items.delete_by_owner("p1")) == ["b1", "b2"]
+    assert stores.items.delete_many([]) == []
+    assert list(stores.items.snapshot()) == []
+
+
+def test_player_death_drop_prefers_bag_over_armour(stores) -> None:
+    from mutants.services import combat_loot
+
+    stores.items.bulk_insert([_item(f"g{idx}") for idx in range(GROUND_CAP - 2)])
+    stores.items.bulk_insert([_item(iid, owner="p1") for iid in ("a0", "b8", "b9", "zz")])
+
+    sqlite_statements.reset()
+    dropped, vaporized = combat_loot.drop_or_vaporize(
+        [["b9", "b8", "gone", "g0"], ["a0"]], TILE
+    )
+    assert dropped == ["b9", "b8"]
+    assert vaporized == 1
+    assert _calls("txn.begin_immediate") == 1
+    assert stores.items.get_by_iid("a0") is None
+    # Already on the death tile: neither moved nor vaporized.
+    assert stores.items.get_by_iid("g0") is not None
+    assert stores.items.get_by_iid("zz")["owner"] == "p1"
+
+
+def test_monster_loot_moves_carried_items_and_vaporizes_the_rest(stores) -> None:
+    from mutants.services import combat_loot
+
+    stores.items.bulk_insert([_item(f"g{idx}") for idx in range(GROUND_CAP - 1)])
+    stores.items.bulk_insert([_item("m1", owner="monster"), _item("m2", owner="monster")])
+
+    minted, vaporized = combat_loot.drop_monster_loot(
+        pos=TILE,
+        bag_entries=[{"iid": "m1", "item_id": "bottle_cap"}, {"iid": "m2", "item_id": "bottle_cap"}],
+        armour_entry=None,
+        monster={},
+        catalog={},
+    )
+    assert [entry["iid"] for entry in minted] == ["m1"]
+    assert [entry["drop_source"] for entry in vaporized] == ["bag", "skull"]
+    assert stores.items.get_by_iid("m1")["owner"] is None
+    assert stores.items.get_by_iid("m2") is None
+    assert len(_ground(stores)) == GROUND_CAP
+
+
+def test_monster_loot_never_re_mints_a_refused_carried_item(stores, monkeypatch) -> None:
+    from mutants.registries import items_instances as itemsreg
+    from mutants.services import combat_loot
+
+    stores.items.bulk_insert([_item(f"g{idx}") for idx in range(GROUND_CAP)])
+    stores.items.bulk_insert([_item("m1", owner="monster")])
+    # A stale ground listing: the tile looks empty but the store is full.
+    monkeypatch.setattr(itemsreg, "list_instances_at", lambda *_: [])
+
+    minted, vaporized = combat_loot.drop_monster_loot(
+        pos=TILE,
+        bag_entries=[{"iid": "m1", "item_id": "bottle_cap"}],
+        armour_entry=None,
+        monster={},
+        catalog={},
+    )
+    assert "m1" not in {entry["iid"] for entry in minted}
+    assert "bag" in [entry["drop_source"] for entry in vaporized]
+    assert stores.items.get_by_iid("m1") is None
+
+
+def test_bury_purges_through_the_store(stores) -> None:
+    from mutants.services import player_reset
+
+    stores.items.bulk_insert([_item("b0", owner="p1"), _item("b1", owner="p1"), _item("g0")])
+    sqlite_statements.reset()
+    assert player_reset._purge_player_items("p1") == 2
+    assert _calls("items.delete_by_owner") == 1
+    assert [row["iid"] for row in stores.items.snapshot()] == ["g0"]
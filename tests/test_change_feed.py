@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_store
+
+
+@pytest.fixture
+def db_path(tmp_path: Path):
+    sqlite_store.set_change_feed(True)
+    sqlite_store.set_change_tick(0)
+    yield tmp_path / "mutants.db"
+    sqlite_store.set_change_feed(None)
+    sqlite_store.set_change_tick(0)
+
+
+def _item(iid: str, **extra):
+    return {"iid": iid, "item_id": "bottle_cap", "year": 2000, "x": 1, "y": 2, **extra}
+
+
+def test_every_write_is_logged_in_order(db_path: Path) -> None:
+    stores = sqlite_store.get_stores(db_path)
+    stores.items.mint(_item("it1"))
+    sqlite_store.set_change_tick(7)
+    stores.items.update_fields("it1", owner="player1")
+    stores.items.bulk_insert([_item("it2", origin="daily_litter"), _item("it3")])
+    stores.items.delete("it3")
+    stores.items.delete_by_origin("daily_litter")
+    stores.monsters.spawn({"instance_id": "i.g1", "monster_id": "ghoul", "pos": [2000, 0, 0]})
+    stores.monsters.update_fields("i.g1", hp_cur=3)
+    stores.monsters.delete("i.g1")
+
+    changes = stores.changes.changes_since(0)
+    assert [(c["table"], c["key"], c["op"]) for c in changes] == [
+        ("items_instances", "it1", "insert"),
+        ("items_instances", "it1", "update"),
+        ("items_instances", "it2", "insert"),
+        ("items_instances", "it3", "insert"),
+        ("items_instances", "it3", "delete"),
+        ("items_instances", None, "delete_where"),
+        ("monsters_instances", "i.g1", "insert"),
+        ("monsters_instances", "i.g1", "update"),
+        ("monsters_instances", "i.g1", "delete"),
+    ]
+    assert changes[0]["fields"]["year"] == 2000 and changes[0]["tick"] == 0
+    assert changes[1]["fields"] == {"owner": "player1", "year": -1, "x": -1, "y": -1}
+    assert changes[1]["tick"] == 7
+    assert changes[5]["fields"] == {"origin": "daily_litter"}
+    assert changes[7]["fields"] == {"hp_cur": 3}
+    assert changes[8]["fields"] is None
+    assert [c["seq"] for c in changes] == sorted(c["seq"] for c in changes)
+    assert stores.changes.head() == changes[-1]["seq"]
+
+
+def test_rolled_back_writes_leave_no_change(db_path: Path) -> None:
+    stores = sqlite_store.get_stores(db_path)
+    stores.items.mint(_item("it1"))
+    with pytest.raises(KeyError):
+        stores.items.mint(_item("it1"))
+    with pytest.raises(KeyError):
+        stores.items.delete("missing")
+    with pytest.raises(KeyError):
+        stores.monsters.spawn_many(
+            [
+                {"instance_id": "i.a", "monster_id": "ghoul"},
+                {"instance_id": "i.a", "monster_id": "ghoul"},
+            ]
+        )
+    assert [c["op"] for c in stores.changes.changes_since(0)] == ["insert"]
+
+
+def test_feed_off_writes_nothing(db_path: Path) -> None:
+    sqlite_store.set_change_feed(False)
+    stores = sqlite_store.get_stores(db_path)
+    stores.items.mint(_item("it1"))
+    assert stores.changes.head() == 0
+    assert stores.changes.changes_since(0) == []
+
+
+def test_cursor_pages_and_survives_compaction(db_path: Path) -> None:
+    stores = sqlite_store.get_stores(db_path)
+    stores.items.bulk_insert([_item(f"it{idx}") for idx in range(10)])
+
+    first = stores.changes.changes_since(0, limit=4)
+    assert [c["key"] for c in first] == [f"it{idx}" for idx in range(4)]
+    cursor = first[-1]["seq"]
+
+    assert stores.changes.compact(keep=3) == 7
+    stores.items.mint(_item("late"))
+    rest = stores.changes.changes_since(cursor)
+    assert [c["key"] for c in rest] == ["it7", "it8", "it9", "late"]
+
+    stores.changes.compact()
+    assert stores.changes.head() == 0
+    stores.items.mint(_item("later"))
+    # seq keeps counting after a full compaction.
+    assert stores.changes.changes_since(rest[-1]["seq"])[0]["key"] == "later"
+
+
+def test_admin_commands_tail_and_compact(db_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    spec = importlib.util.spec_from_file_location("sqlite_admin", REPO_ROOT / "tools" / "sqlite_admin.py")
+    sqlite_admin = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sqlite_admin)
+
+    stores = sqlite_store.get_stores(db_path)
+    stores.items.bulk_insert([_item("it1"), _item("it2")])
+
+    sqlite_admin.main(["--database", str(db_path), "changes", "--since", "0", "--limit", "1"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["key"] for line in lines] == ["it1", "it2"]
+
+    sqlite_admin.main(["--database", str(db_path), "changes-compact", "--upto", str(lines[0]["seq"])])
+    assert "Removed 1 change rows" in capsys.readouterr().out
+    assert [c["key"] for c in stores.changes.changes_since(0)] == ["it2"]
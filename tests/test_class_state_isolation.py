@@ -17,6 +17,14 @@ if str(SRC_DIR) not in sys.path:
 from mutants.services import player_state
 
 
+@pytest.fixture(autouse=True)
+def _no_runtime_spawns(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the runtime spawner from dropping monsters into these transcripts."""
+
+    monkeypatch.setenv("POP_FLOOR", "0")
+    monkeypatch.setenv("POP_CAP", "0")
+
+
 def _reload_state_modules() -> None:
     import mutants.state as state_mod
     import mutants.env as env_mod
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import damage_engine
+
+
+def _columns(seed: int, count: int):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        attack = {"power_base": rng.randrange(0, 120), "enchant_level": rng.randrange(0, 4)}
+        attacker = {"derived": {"str_bonus": rng.randrange(0, 8)}}
+        defender = {
+            "derived": {"dex_bonus": rng.randrange(-2, 9)},
+            "armour_slot": {"armour_class": rng.randrange(0, 60)},
+        }
+        rows.append((attack, attacker, defender))
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_batch_matches_scalar_resolve_attack(seed: int, use_numpy: bool) -> None:
+    if use_numpy and not damage_engine.numpy_available():
+        pytest.skip("numpy not installed")
+    rows = _columns(seed, 300)
+    expected = [damage_engine.resolve_attack(*row).damage for row in rows]
+
+    power = [damage_engine.get_attacker_power(attack, attacker) for attack, attacker, _ in rows]
+    armour = [defender["armour_slot"]["armour_class"] for _, _, defender in rows]
+    dex = [defender["derived"]["dex_bonus"] for _, _, defender in rows]
+    result = damage_engine.resolve_attacks_batch(power, armour, dex, use_numpy=use_numpy)
+
+    assert [int(value) for value in result] == expected
+
+
+def test_batch_covers_rounding_ties_and_rejects_ragged_columns() -> None:
+    # ac=100 puts the mitigation on a .5 boundary; the batch must
+    # round half to even exactly like the scalar helper.
+    acs = list(range(0, 200))
+    result = damage_engine.resolve_attacks_batch([100] * len(acs), acs, [0] * len(acs), use_numpy=False)
+    assert result == [damage_engine.apply_ac_mitigation(100, ac) for ac in acs]
+    assert damage_engine.resolve_attacks_batch([], [], [], use_numpy=False) == []
+
+    with pytest.raises(ValueError):
+        damage_engine.resolve_attacks_batch([1, 2], [0], [0, 0], use_numpy=False)
+    if not damage_engine.numpy_available():
+        with pytest.raises(RuntimeError):
+            damage_engine.resolve_attacks_batch([1], [0], [0], use_numpy=True)
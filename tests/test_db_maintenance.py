@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants import state as state_mod
+from mutants.commands import debug as debug_cmd
+from mutants.registries import sqlite_store
+from mutants.services import db_maintenance
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.events: List[tuple[str, str]] = []
+
+    def push(self, kind: str, text: str, **_meta: Any) -> None:
+        self.events.append((kind, text))
+
+
+@pytest.fixture
+def state_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    return tmp_path
+
+
+def _fill(stores, count: int, prefix: str = "it") -> None:
+    for idx in range(count):
+        stores.items.mint(
+            {"iid": f"{prefix}{idx}", "item_id": "bottle_cap", "year": 2000, "x": idx % 7, "y": 0}
+        )
+
+
+def _wal_bytes(root: Path) -> int:
+    wal = root / "mutants.db-wal"
+    return wal.stat().st_size if wal.exists() else 0
+
+
+def test_idle_pass_checkpoints_and_truncates_large_wal(state_root: Path) -> None:
+    sqlite_store.set_wal_autocheckpoint(0)
+    try:
+        _fill(sqlite_store.get_stores(), 200)
+    finally:
+        sqlite_store.set_wal_autocheckpoint(None)
+    assert _wal_bytes(state_root) > 16 * 1024
+
+    service = db_maintenance.DbMaintenance(truncate_kb=16, optimize_interval_s=0)
+    assert service.run_once()
+    data = service.stats()
+    assert data["passive"]["runs"] == 1
+    assert data["truncate"]["runs"] == 1
+    assert data["optimize"]["runs"] == 1
+    assert data["wal_bytes"] == 0 == _wal_bytes(state_root)
+    busy, log_pages, done = data["last_checkpoint"]
+    assert busy == 0 and log_pages == done
+    service.stop()
+
+
+def test_thread_runs_while_idle_and_turns_skip_autocheckpoint(state_root: Path) -> None:
+    stores = sqlite_store.get_stores()
+    conn = stores.items._connection()
+    service = db_maintenance.DbMaintenance(truncate_kb=0, optimize_interval_s=3600)
+    service.start()
+    try:
+        service.leave_idle()
+        assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 0
+        _fill(stores, 20)
+        assert _wal_bytes(state_root) > 0
+
+        service.enter_idle()
+        deadline = time.monotonic() + 5.0
+        while service.idle_passes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        service.leave_idle()
+        with service._lock:  # wait out a pass still in flight
+            pass
+        assert service.idle_passes == 1
+        assert service.timings["truncate"].runs == 1
+        assert _wal_bytes(state_root) == 0
+    finally:
+        service.stop()
+    assert not service.running
+    assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 1000
+
+
+def test_memory_backend_has_nothing_to_maintain(state_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite-memory")
+    sqlite_store.get_stores().runtime_kv.set("k", "v")
+    assert not db_maintenance.DbMaintenance().run_once()
+
+
+def test_debug_wal_reports_checkpoint_timings(state_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bus = _Bus()
+    monkeypatch.setattr(db_maintenance, "_SERVICE", None)
+    debug_cmd.debug_cmd("wal", {"feedback_bus": bus})
+    assert "not running" in bus.events[-1][1]
+
+    _fill(sqlite_store.get_stores(), 5)
+    service = db_maintenance.DbMaintenance(truncate_kb=1 << 20, optimize_interval_s=3600)
+    service.run_once()
+    monkeypatch.setattr(db_maintenance, "_SERVICE", service)
+    bus.events.clear()
+    debug_cmd.debug_cmd("wal", {"feedback_bus": bus})
+    text = [line for _kind, line in bus.events]
+    assert text[0].startswith("DB maintenance: stopped, 1 idle passes")
+    assert any(line.strip().startswith("passive") and "1 runs" in line for line in text)
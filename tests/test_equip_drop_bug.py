@@ -3,9 +3,7 @@ from __future__ import annotations
 import contextlib
 import importlib
 import io
-import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 from textwrap import dedent
@@ -18,6 +16,14 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 
+@pytest.fixture(autouse=True)
+def _no_runtime_spawns(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the runtime spawner from dropping monsters into these transcripts."""
+
+    monkeypatch.setenv("POP_FLOOR", "0")
+    monkeypatch.setenv("POP_CAP", "0")
+
+
 GAMEPLAY_LOG = dedent(
     """
     Gameplay evidence (manual repro):
@@ -43,25 +49,6 @@ def _reload_state_modules() -> None:
     importlib.reload(env_mod)
 
 
-def _run_admin_command(args: list[str], env: dict[str, str]) -> None:
-    subprocess.check_call([sys.executable, "tools/sqlite_admin.py", *args], env=env)
-
-
-def _import_monsters_catalog(db_path: Path, env: dict[str, str]) -> None:
-    catalog_path = Path("state/monsters/catalog.json").resolve()
-    subprocess.check_call(
-        [
-            sys.executable,
-            "scripts/monsters_import.py",
-            "--catalog",
-            str(catalog_path),
-            "--db",
-            str(db_path),
-        ],
-        env=env,
-    )
-
-
 def _build_command_runner():
     from mutants.app.context import build_context, flush_feedback, render_frame
     from mutants.commands.register_all import register_all
@@ -96,7 +83,9 @@ def _normalize(text: str) -> str:
     return normalized
 
 
-def test_drop_after_remove_leaves_inventory_incorrectly(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_drop_after_remove_leaves_inventory_incorrectly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
+):
     """Reproduce Scrap-Armour drop bug via real command loop."""
 
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -105,22 +94,7 @@ def test_drop_after_remove_leaves_inventory_incorrectly(tmp_path: Path, monkeypa
 
     _reload_state_modules()
 
-    from mutants.env import get_state_database_path
-
-    db_path = get_state_database_path()
-
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
-    _import_monsters_catalog(db_path, env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
@@ -143,7 +117,9 @@ def test_drop_after_remove_leaves_inventory_incorrectly(tmp_path: Path, monkeypa
     )
 
 
-def test_throw_item_appears_in_target_room(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_throw_item_appears_in_target_room(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
+):
     """Ensure thrown items show up in the destination room."""
 
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -152,17 +128,7 @@ def test_throw_item_appears_in_target_room(tmp_path: Path, monkeypatch: pytest.M
 
     _reload_state_modules()
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
@@ -178,7 +144,7 @@ def test_throw_item_appears_in_target_room(tmp_path: Path, monkeypatch: pytest.M
 
 
 def test_drop_on_full_ground_swaps_and_remains_visible(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
 ):
     """Dropping onto a full ground should swap items and leave the drop visible."""
 
@@ -188,17 +154,7 @@ def test_drop_on_full_ground_swaps_and_remains_visible(
 
     _reload_state_modules()
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
@@ -220,7 +176,9 @@ def test_drop_on_full_ground_swaps_and_remains_visible(
     assert "ion-decay" in normalized_inv, "an existing ground item should have been swapped into inventory"
 
 
-def test_convert_consumes_item(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_convert_consumes_item(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
+):
     """Converting an item should pay the player and remove the item from play."""
 
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -229,17 +187,7 @@ def test_convert_consumes_item(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 
     _reload_state_modules()
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
@@ -274,7 +222,9 @@ def test_convert_consumes_item(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     )
 
 
-def test_travel_persistence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_travel_persistence(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
+):
     """Dropped items should stay in the original room when the player moves."""
 
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -283,17 +233,7 @@ def test_travel_persistence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 
     _reload_state_modules()
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
@@ -313,7 +253,9 @@ def test_travel_persistence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     assert "light-spear" in east_look, "dropped item should persist in its original room"
 
 
-def test_wear_updates_status(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_wear_updates_status(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db
+):
     """Equipping and removing armour should update status and inventory indicators."""
 
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -322,17 +264,7 @@ def test_wear_updates_status(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 
     _reload_state_modules()
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "MUTANTS_STATE_BACKEND": "sqlite",
-            "GAME_STATE_ROOT": str(tmp_path),
-            "DEBUG": "1",
-        }
-    )
-
-    _run_admin_command(["init"], env)
-    _run_admin_command(["catalog-import-items"], env)
+    seed_state_db()
 
     ctx, run = _build_command_runner()
 
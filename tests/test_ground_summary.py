@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants import state as state_mod
+from mutants.registries import items_catalog, items_instances as itemsreg
+from mutants.registries.sqlite_store import SQLiteConnectionManager
+from mutants.services import ground_summary
+
+TILES: List[Tuple[int, int, int]] = [(2000, x, y) for x in range(3) for y in range(3)] + [(2100, 0, 0)]
+ITEM_IDS = ("gold_chunk", "nuclear_waste", "bottle_cap", "broken_weapon")
+
+
+@pytest.fixture()
+def seeded_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo_root = Path(__file__).resolve().parents[1]
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+
+    shutil.copytree(repo_root / "state", tmp_path, dirs_exist_ok=True)
+
+    manager = SQLiteConnectionManager(tmp_path / "mutants.db")
+    manager.connect()
+    catalog_data = json.loads((repo_root / "state" / "items" / "catalog.json").read_text())
+    for entry in catalog_data:
+        manager.upsert_item_catalog(
+            entry["item_id"], json.dumps(entry, ensure_ascii=False, sort_keys=True)
+        )
+    manager.close()
+    items_catalog._CATALOG_CACHE = None
+    ground_summary.end_tick()
+    yield tmp_path
+    ground_summary.end_tick()
+    items_catalog._CATALOG_CACHE = None
+
+
+def _ground_iids(tile: Tuple[int, int, int]) -> Tuple[str, ...]:
+    return tuple(
+        inst["iid"] for inst in itemsreg.list_instances_at(*tile) if inst.get("owner") in (None, "", 0)
+    )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_cached_summaries_follow_item_writes(seeded_catalog: Path, seed: int) -> None:
+    rng = random.Random(seed)
+    iids = [
+        itemsreg.create_and_save_instance(rng.choice(ITEM_IDS), *rng.choice(TILES), origin="test")
+        for _ in range(12)
+    ]
+
+    ground_summary.begin_tick()
+    ground_summary.prefetch(TILES)
+    for _ in range(60):
+        op = rng.random()
+        iid = rng.choice(iids)
+        if op < 0.35:
+            itemsreg.set_position(iid, *rng.choice(TILES))
+        elif op < 0.5:
+            itemsreg.clear_position(iid)
+        elif op < 0.6:
+            itemsreg.update_instance(iid, owner="player_thief")
+        elif op < 0.75:
+            iids.append(itemsreg.create_and_save_instance(rng.choice(ITEM_IDS), *rng.choice(TILES)))
+        elif op < 0.85 and len(iids) > 1:
+            itemsreg.remove_instance(iid)
+            iids.remove(iid)
+        else:
+            ground_summary.prefetch(rng.sample(TILES, 4))
+        for tile in TILES:
+            assert ground_summary.get(*tile).iids == _ground_iids(tile)
+
+
+def test_prefetch_batches_tiles_and_summarizes(seeded_catalog: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    gold = itemsreg.create_and_save_instance("gold_chunk", 2000, 1, 1)
+    broken = itemsreg.create_and_save_instance("broken_weapon", 2000, 1, 2)
+
+    calls: List[int] = []
+    original = itemsreg.list_instances_at_many
+
+    def _counting(positions):
+        tiles = list(positions)
+        calls.append(len(tiles))
+        return original(tiles)
+
+    monkeypatch.setattr(itemsreg, "list_instances_at_many", _counting)
+
+    ground_summary.begin_tick()
+    assert ground_summary.prefetch(TILES + [(2000, 1, 1)]) == len(TILES)
+    assert calls == [len(TILES)]
+
+    gold_tile = ground_summary.get(2000, 1, 1)
+    assert gold_tile.iids == (gold,) and gold_tile.item_ids == ("gold_chunk",)
+    assert gold_tile.has_pickup and gold_tile.items[0].weight > 0
+    broken_tile = ground_summary.get(2000, 1, 2)
+    assert broken_tile.iids == (broken,) and not broken_tile.has_pickup
+    assert not ground_summary.get(2000, 0, 0).items
+    assert calls == [len(TILES)]
+    assert ground_summary.cached(2000, 1, 1) is gold_tile
+
+    # Picking the gold up drops the tile; the next read refetches just that tile.
+    assert itemsreg.clear_position_at(gold, 2000, 1, 1)
+    assert ground_summary.cached(2000, 1, 1) is None
+    assert ground_summary.get(2000, 1, 1).iids == ()
+    assert calls == [len(TILES), 1]
+
+    ground_summary.end_tick()
+    assert ground_summary.cached(2000, 1, 2) is None
+
+
+def test_skipped_frame_closes_the_tick() -> None:
+    from mutants.app import context as appctx
+    from mutants.ui.feedback import FeedbackBus
+
+    ground_summary.begin_tick()
+    assert ground_summary.active()
+    assert appctx.skip_frame({"feedback_bus": FeedbackBus()}) == []
+    assert not ground_summary.active()
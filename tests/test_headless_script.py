@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def _reload_state_modules() -> None:
+    import mutants.state as state_mod
+    import mutants.env as env_mod
+
+    importlib.reload(state_mod)
+    importlib.reload(env_mod)
+
+
+@pytest.fixture()
+def headless_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db) -> Path:
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setenv("DEBUG", "1")
+    _reload_state_modules()
+
+    seed_state_db()
+    return tmp_path
+
+
+def test_script_runs_without_rendering(headless_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from mutants.app import context as context_mod
+    from mutants.debug import turnlog
+    from mutants.repl import loop
+    from mutants.services import state_debug
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("headless mode must not build or render frames")
+
+    monkeypatch.setattr(context_mod, "build_room_vm", _fail)
+    monkeypatch.setattr(context_mod, "render_frame", _fail)
+    monkeypatch.setattr(loop, "render_frame", _fail)
+
+    out = io.StringIO()
+    script = [
+        "# pick the first class, then play",
+        "1",
+        "",
+        "debug add scrap",
+        "get sc",
+        "look",
+        "zz",
+        "x",  # back to the class menu
+        "x",  # exit from the menu
+        "never reached",
+    ]
+    summary = loop.run_headless(script, out=out, debug_io=False)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert "\x1b" not in out.getvalue()
+    assert records[-1] == summary
+    assert summary["kind"] == "SCRIPT/SUMMARY"
+    assert summary["commands"] == 7
+
+    cmds = [rec["cmd"] for rec in records[:-1]]
+    assert cmds[0] is None  # class menu rows are emitted before the script starts
+    assert {"get sc", "zz", "x"} <= set(cmds)
+    assert "never reached" not in cmds
+    assert any(
+        rec["cmd"] == "zz" and rec["kind"] == "SYSTEM/WARN" for rec in records
+    )
+    assert all(isinstance(rec["text"], str) for rec in records[:-1])
+
+    assert not (headless_env / "logs" / "move_lag.log").exists()
+    # The switches are only off for the run.
+    assert turnlog.enabled()
+    assert not state_debug._FORCE_DISABLED
+    assert context_mod._MOVE_LAG_LOG_ENABLED
+
+
+def test_script_text_has_no_ansi_outside_pytest(
+    headless_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mutants.repl import loop
+
+    # build_context only forces ANSI off under pytest; headless must not rely on that.
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    out = io.StringIO()
+    loop.run_headless(["1", "inv", "stat", "look"], out=out, debug_io=False)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()[:-1]]
+    assert {"inv", "stat"} <= {rec["cmd"] for rec in records}
+    assert all("\x1b[" not in rec["text"] for rec in records)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import id_blocks, sqlite_statements, sqlite_store
+from mutants.registries.monsters_instances import MonstersInstances
+
+
+@pytest.fixture
+def stores(tmp_path: Path):
+    return sqlite_store.get_stores(tmp_path / "mutants.db")
+
+
+def test_block_is_reserved_in_one_transaction(stores) -> None:
+    alloc = id_blocks.BlockAllocator(stores.runtime_kv, "test_ids", block_size=10)
+    sqlite_statements.reset()
+    assert [alloc.next() for _ in range(10)] == list(range(1, 11))
+    counters = {e["name"]: e for e in sqlite_statements.snapshot()["statements"]}
+    assert counters["runtime_kv.set"]["calls"] == 1
+    assert stores.runtime_kv.get("test_ids") == "10"
+
+    assert alloc.next() == 11
+    assert alloc.reservations == 2
+
+
+def test_crash_wastes_at_most_one_block(stores) -> None:
+    first = id_blocks.BlockAllocator(stores.runtime_kv, "test_ids", block_size=8)
+    assert [first.next() for _ in range(3)] == [1, 2, 3]
+    # ``first`` dies with 4..8 unused; a restarted process skips them.
+    restarted = id_blocks.BlockAllocator(stores.runtime_kv, "test_ids", block_size=8)
+    assert restarted.next() == 9
+
+
+def test_floor_seeds_a_missing_key_once(stores) -> None:
+    calls = []
+
+    def floor() -> int:
+        calls.append(1)
+        return 41
+
+    alloc = id_blocks.BlockAllocator(stores.runtime_kv, "test_ids", block_size=2, floor=floor)
+    assert [alloc.next() for _ in range(5)] == [42, 43, 44, 45, 46]
+    assert len(calls) == 1
+
+
+def test_concurrent_allocators_never_overlap(tmp_path: Path) -> None:
+    db_path = tmp_path / "mutants.db"
+    sqlite_store.get_stores(db_path).runtime_kv.get("warm")  # schema once
+    results: list[list[int]] = []
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        # Separate allocators model separate processes; each thread also
+        # gets its own SQLite connection from the registry.
+        kv = sqlite_store.SQLiteRuntimeKVStore(sqlite_store.SQLiteConnectionManager(db_path))
+        alloc = id_blocks.BlockAllocator(kv, "shared_ids", block_size=7)
+        try:
+            results.append([alloc.next() for _ in range(300)])
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    issued = [value for chunk in results for value in chunk]
+    assert len(issued) == 1800
+    assert len(set(issued)) == len(issued)
+
+
+def test_shared_allocator_is_thread_safe(stores) -> None:
+    alloc = id_blocks.allocator("shared_ids", block_size=5, kv=stores.runtime_kv)
+    issued: list[int] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        local = [alloc.next() for _ in range(200)]
+        with lock:
+            issued.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(issued) == list(range(1, 801))
+
+
+def test_monster_counter_recovers_from_existing_rows(stores) -> None:
+    stores.monsters.spawn({"instance_id": "i.ghoul#0000002A", "monster_id": "ghoul", "pos": [2000, 0, 0]})
+    registry = MonstersInstances("unused.json", [], store=stores.monsters, kv_store=stores.runtime_kv)
+    minted = {registry.mint_instance_id("ghoul") for _ in range(100)}
+    assert len(minted) == 100
+    assert min(minted) == "ghoul#0000002B"
+
+
+def test_item_iids_survive_reopening_the_database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from mutants import state as state_mod
+    from mutants.registries import items_instances
+
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    seen: set[str] = set()
+    before = [items_instances.mint_iid(seen=seen) for _ in range(3)]
+    assert seen == set(before)
+    sqlite_store.close_all()
+    after = items_instances.mint_iid()
+    assert len({*before, after}) == 4
+    assert int(after, 16) > id_blocks.ITEM_IID_BLOCK
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants import state as state_mod
+from mutants.registries import items_catalog, items_instances as itemsreg
+from mutants.registries.sqlite_store import SQLiteConnectionManager
+from mutants.registries.storage import get_stores
+from mutants.services import combat_calc, inventory_aggregates
+
+
+@pytest.fixture()
+def seeded_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo_root = Path(__file__).resolve().parents[1]
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+
+    shutil.copytree(repo_root / "state", tmp_path, dirs_exist_ok=True)
+
+    manager = SQLiteConnectionManager(tmp_path / "mutants.db")
+    manager.connect()
+    catalog_data = json.loads((repo_root / "state" / "items" / "catalog.json").read_text())
+    for entry in catalog_data:
+        manager.upsert_item_catalog(
+            entry["item_id"], json.dumps(entry, ensure_ascii=False, sort_keys=True)
+        )
+    manager.close()
+    items_catalog._CATALOG_CACHE = None
+    inventory_aggregates.reset()
+    yield tmp_path
+    items_catalog._CATALOG_CACHE = None
+    inventory_aggregates.reset()
+
+
+def _mint(item_id: str) -> str:
+    return itemsreg.mint_instance(item_id, origin="test")
+
+
+def test_sync_owner_tracks_weight_count_and_armour(seeded_catalog: Path) -> None:
+    bag = [_mint("gold_chunk"), _mint("nuclear_waste"), _mint("Thick-Hide")]
+    armour = _mint("Chrome-Plating")
+
+    agg = inventory_aggregates.sync_owner("player_thief", bag, armour_iid=armour)
+
+    assert agg.item_count == 3
+    assert agg.total_weight == 25 + 30 + 15
+    assert agg.armour_class == 8
+    assert inventory_aggregates.verify_owner("player_thief") == []
+
+    agg = inventory_aggregates.sync_owner("player_thief", bag[:1], armour_iid=None)
+    assert (agg.total_weight, agg.item_count, agg.armour_class) == (25, 1, 0)
+    assert inventory_aggregates.verify_owner() == []
+
+
+def test_registry_mutations_update_running_totals(seeded_catalog: Path) -> None:
+    hide = _mint("Thick-Hide")
+    chrome = _mint("Chrome-Plating")
+    waste = _mint("nuclear_waste")
+    inventory_aggregates.sync_owner("player_thief", [chrome, waste], armour_iid=hide)
+
+    itemsreg.update_instance(chrome, enchant_level=1)
+    itemsreg.update_instance(hide, enchant_level=3)
+    agg = inventory_aggregates.get_aggregates().get("player_thief")
+    assert agg is not None
+    assert agg.total_weight == 12 + 30
+    assert agg.armour_class == 2 + 3
+    assert inventory_aggregates.verify_owner("player_thief") == []
+
+    itemsreg.crack_instance(hide)
+    itemsreg.remove_instance(waste)
+    # broken_armour has no base armour class; the enchant bonus still applies.
+    assert agg.armour_class == 3
+    assert agg.total_weight == 12
+    assert inventory_aggregates.verify_owner("player_thief") == []
+
+
+def test_armour_class_from_equipped_uses_cached_contribution(
+    seeded_catalog: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    armour = _mint("Gate-Mail")
+    state = {"armour_slot": None}
+    monkeypatch.setattr(
+        combat_calc.pstate, "get_equipped_armour_id", lambda _state: armour
+    )
+
+    assert combat_calc.armour_class_from_equipped(state) == 8
+
+    calls: list[str] = []
+    original = itemsreg.get_instance
+    monkeypatch.setattr(
+        itemsreg, "get_instance", lambda iid: calls.append(iid) or original(iid)
+    )
+    assert combat_calc.armour_class_from_equipped(state) == 8
+    assert calls == []
+
+
+def test_owner_aggregates_table_mirror(
+    seeded_catalog: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MUTANTS_OWNER_AGGREGATES_TABLE", "1")
+    bag = [_mint("ion_pack"), _mint("gold_chunk")]
+
+    inventory_aggregates.sync_owner("player_priest", bag, armour_iid=None)
+
+    row = get_stores().owner_aggregates.get("player_priest")
+    assert row is not None
+    assert (row["total_weight"], row["item_count"], row["armour_class"]) == (75, 2, 0)
+
+    inventory_aggregates.forget_owner("player_priest")
+    assert get_stores().owner_aggregates.get("player_priest") is None
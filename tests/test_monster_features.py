@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import ground_summary, monsters_state
+from mutants.services.monster_ai import cascade, features
+
+
+def _monster(mid: str, hp: int = 10) -> Dict[str, Any]:
+    return {
+        "id": mid,
+        "pos": [2000, 1, 1],
+        "hp": {"current": hp, "max": 10},
+        "ions": 5,
+        "ions_max": 100,
+        "bag": [{"iid": f"{mid}-w", "item_id": "broken_weapon"}],
+        "wielded": f"{mid}-w",
+        "_ai_state": {},
+    }
+
+
+@pytest.fixture()
+def ground_reads(monkeypatch: pytest.MonkeyPatch) -> List[tuple]:
+    reads: List[tuple] = []
+
+    def _list_at_many(positions):
+        tiles = [tuple(pos) for pos in positions]
+        reads.extend(tiles)
+        return {pos: [{"iid": "g1", "item_id": "skull"}] for pos in tiles}
+
+    monkeypatch.setattr(ground_summary.itemsreg, "list_instances_at_many", _list_at_many)
+    monkeypatch.setattr(ground_summary, "_catalog", lambda: {})
+    ground_summary.end_tick()
+    yield reads
+    features.end_pass()
+    ground_summary.end_tick()
+
+
+def test_snapshot_is_fresh_outside_a_pass(ground_reads: List[tuple]) -> None:
+    monster = _monster("m1")
+
+    first = features.snapshot(monster, {})
+    monster["hp"]["current"] = 2
+    second = features.snapshot(monster, {"player_level": 4})
+
+    assert (first.hp_pct, second.hp_pct) == (100, 20)
+    assert second.player_level == 4
+    assert first.cracked and first.low_ions and first.pickup_ready
+    assert features.cached(monster) is None
+    assert len(ground_reads) == 2
+
+
+def test_pass_shares_snapshots_and_ground_summaries(ground_reads: List[tuple]) -> None:
+    ghoul, rat = _monster("ghoul"), _monster("rat")
+    ctx = {"player_level": 3}
+
+    ground_summary.begin_tick()
+    features.begin_pass()
+    snap = features.snapshot(ghoul, ctx)
+    assert features.snapshot(ghoul, ctx) is snap
+    assert features.cached(ghoul) is snap
+    features.snapshot(rat, ctx)
+    assert ground_reads == [(2000, 1, 1)]
+
+    cascade.evaluate_cascade(ghoul, ctx)
+    assert features.cached(ghoul) is snap
+
+    ghoul["hp"]["current"] = 1
+    features.monster_changed("ghoul")
+    assert features.cached(ghoul) is None
+    assert features.snapshot(ghoul, ctx).hp_pct == 10
+    # Monster changes leave the ground alone; item writes invalidate it.
+    assert len(ground_reads) == 1
+    ground_summary.invalidate("g1")
+    features.monster_changed("rat")
+    features.snapshot(rat, ctx)
+    assert len(ground_reads) == 2
+
+    features.end_pass()
+    assert features.cached(rat) is None
+
+
+def test_mark_dirty_invalidates_the_snapshot(ground_reads: List[tuple], tmp_path: Path) -> None:
+    monster = _monster("m1")
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", [monster], instances=object())
+
+    features.begin_pass()
+    snap = features.snapshot(monster, {})
+    state.mark_dirty({"id": "m2"})
+    assert features.cached(monster) is snap
+
+    state.mark_dirty(monster)
+    assert features.cached(monster) is None
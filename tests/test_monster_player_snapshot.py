@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import monster_actions, monsters_state, player_state as pstate
+from mutants.services.monster_ai import player_snapshot
+
+
+def _ctx() -> Dict[str, Any]:
+    active = {"id": "p1", "class": "Thief", "level": "3", "pos": [2000, 1, 1]}
+    return {"player_state": {"players": [active], "active_id": "p1", "pos": [2000, 1, 1]}}
+
+
+def test_capture_normalises_player_fields() -> None:
+    ctx = _ctx()
+    snap = player_snapshot.capture("p1", [2000, 1, 1], ctx["player_state"]["players"][0])
+    assert snap == player_snapshot.PlayerSnapshot("p1", (2000, 1, 1), 3, "Thief")
+    assert player_snapshot.capture("p1", None, {}) is None
+    assert player_snapshot.capture("", (2000, 1, 1), {}) is None
+
+
+def test_collocation_reads_installed_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    ctx = _ctx()
+    snap = player_snapshot.capture("p1", (2000, 1, 1), ctx["player_state"]["players"][0])
+    player_snapshot.install(ctx, snap)
+
+    def _boom(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("player state re-resolved during a pass")
+
+    monkeypatch.setattr(pstate, "canonical_player_pos", _boom)
+    monkeypatch.setattr(pstate, "get_active_pair", _boom)
+
+    assert monster_actions._is_collocated({"pos": [2000, 1, 1]}, ctx)
+    assert not monster_actions._is_collocated({"pos": [2000, 1, 2]}, ctx)
+    assert monster_actions._is_collocated({"pos": None}, ctx)
+
+    player_snapshot.invalidate(ctx)
+    assert player_snapshot.current(ctx) is None
+    monkeypatch.undo()
+    assert not monster_actions._is_collocated({"pos": [2100, 1, 1]}, ctx)
+
+
+def test_player_death_drops_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    ctx = _ctx()
+    state = ctx["player_state"]
+    active = state["players"][0]
+    player_snapshot.install(ctx, player_snapshot.capture("p1", (2000, 1, 1), active))
+    monkeypatch.setattr(monster_actions.player_death, "handle_player_death", lambda *a, **k: state)
+    monkeypatch.setattr(pstate, "clear_target", lambda **_kwargs: None)
+
+    monster_actions._handle_player_death({"id": "m1", "name": "Ghoul"}, ctx, state, active, None)
+    assert player_snapshot.current(ctx) is None
+
+
+def test_pursuit_step_skips_derived_refresh(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monster = {"id": "m1", "instance_id": "m1", "pos": [2000, 0, 0], "hp": {"current": 5, "max": 5}, "target_player_id": "p1"}
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", [monster], instances=object())
+
+    def _boom(*_args: Any, **_kwargs: Any) -> None:
+        raise AssertionError("derived stats rebuilt for a position-only move")
+
+    monkeypatch.setattr(monsters_state, "_refresh_monster_derived", _boom)
+    monsters_state.relocate_monster(state, monster, (2000, 0, 1))
+    assert monster["pos"] == [2000, 0, 1]
+    assert [m["id"] for m in state.list_at(2000, 0, 1)] == ["m1"]
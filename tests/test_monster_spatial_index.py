@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import monsters_state
+
+YEARS = (2000, 2100)
+
+
+def _monster(idx: int, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": f"m{idx}",
+        "instance_id": f"m{idx}",
+        "pos": [rng.choice(YEARS), rng.randrange(4), rng.randrange(4)],
+        "hp": {"current": rng.randrange(0, 3), "max": 5},
+    }
+
+
+def _snapshot(state: monsters_state.MonstersState) -> tuple:
+    tiles = {
+        year: {tile: sorted(bucket) for tile, bucket in by_year.items()}
+        for year, by_year in state._pos_index.items()
+    }
+    counts = {year: state.count_alive(year) for year in YEARS}
+    return tiles, counts
+
+
+def _assert_matches_rebuild(state: monsters_state.MonstersState) -> None:
+    incremental = _snapshot(state)
+    state._rebuild_pos_index()
+    assert _snapshot(state) == incremental
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_index_matches_full_rebuild(seed: int, tmp_path: Path) -> None:
+    rng = random.Random(seed)
+    monsters: List[Dict[str, Any]] = [_monster(i, rng) for i in range(12)]
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", monsters, instances=object())
+    state._rebuild_pos_index()
+
+    next_id = len(monsters)
+    for _ in range(150):
+        live = state.list_all()
+        op = rng.random()
+        if op < 0.5 and live:
+            mon = rng.choice(live)
+            target = mon if rng.random() < 0.5 else mon["id"]
+            state.move_monster(target, (rng.choice(YEARS), rng.randrange(4), rng.randrange(4)))
+        elif op < 0.65 and live:
+            mon = rng.choice(live)
+            mon["hp"]["current"] = rng.randrange(0, 3)
+            state.mark_dirty(mon)
+        elif op < 0.75 and live:
+            mon = rng.choice(live)
+            mon["pos"] = [rng.choice(YEARS), rng.randrange(4), rng.randrange(4)]
+            state.update_position_cache(mon)
+        elif op < 0.85 and live:
+            state.kill_monster(rng.choice(live)["id"])
+        else:
+            state._monsters.append(_monster(next_id, rng))
+            state._by_id[f"m{next_id}"] = state._monsters[-1]
+            state.update_position_cache(state._monsters[-1])
+            next_id += 1
+        if rng.random() < 0.2:
+            _assert_matches_rebuild(state)
+
+    _assert_matches_rebuild(state)
+    for year in YEARS:
+        expected = sum(
+            1 for mon in state.list_all() if mon["pos"][0] == year and mon["hp"]["current"] > 0
+        )
+        assert state.count_alive(year) == expected
+
+
+def test_move_monster_updates_queries_without_rebuilding(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ghoul = {"id": "ghoul", "instance_id": "ghoul", "pos": [2000, 1, 1], "hp": {"current": 4, "max": 4}}
+    rat = {"id": "rat", "instance_id": "rat", "pos": [2000, 1, 2], "hp": {"current": 0, "max": 4}}
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", [ghoul, rat], instances=object())
+    assert state.count_alive(2000) == 1
+
+    monkeypatch.setattr(state, "_rebuild_pos_index", lambda: pytest.fail("full rebuild"))
+    assert state.move_monster("ghoul", (2000, 1, 2))
+    assert ghoul["pos"] == [2000, 1, 2]
+    assert [m["id"] for m in state.list_at(2000, 1, 2)] == ["rat", "ghoul"]
+    assert state.list_at(2000, 1, 1) == []
+    assert state.occupied_tiles(2000) == [(1, 2)]
+    assert state.list_adjacent_monsters((2000, 1, 1)) == ["N"]
+
+    assert state.move_monster(ghoul, (2100, 0, 0))
+    assert state.count_alive(2000) == 0 and state.count_alive(2100) == 1
+    assert state.list_in_year(2100) == [ghoul]
+
+    stranger: Dict[str, Any] = {"id": "stranger", "pos": [2000, 0, 0]}
+    assert not state.move_monster(stranger, (2000, 3, 3))
+    assert stranger["pos"] == [2000, 3, 3]
+    assert state.list_at(2000, 3, 3) == []
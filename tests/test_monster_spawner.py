@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_store
+from mutants.registries.monsters_instances import MonstersInstances
+from mutants.services import monster_spawner, monsters_state
+
+YEARS = (2000, 2100)
+TILES = [(x, y) for x in range(-3, 4) for y in range(-3, 4)]
+TEMPLATES = [
+    {
+        "monster_id": "rat",
+        "name": "Rat",
+        "level": 1,
+        "hp_max": 6,
+        "armour_class": 1,
+        "ions_min": 10,
+        "ions_max": 20,
+        "riblets_min": 0,
+        "riblets_max": 3,
+        "starter_items": ["bolt_pouch"],
+        "innate_attack": {"name": "bite", "power_base": 2},
+    },
+    {"monster_id": "ghoul", "name": "Ghoul", "level": 3, "hp_max": 20},
+]
+
+
+class _RecordingInstances(MonstersInstances):
+    """Real registry on the test database that records each spawn batch."""
+
+    def __init__(self, path: Path) -> None:
+        stores = sqlite_store.get_stores(path / "mutants.db")
+        super().__init__(path / "instances.json", [], store=stores.monsters, kv_store=stores.runtime_kv)
+        self.batches: List[int] = []
+
+    def spawn_many(self, insts) -> int:
+        insts = list(insts)
+        self.batches.append(len(insts))
+        return super().spawn_many(insts)
+
+    def count_alive(self, year: int) -> int:  # pragma: no cover - must stay unused
+        pytest.fail("spawner queried the store for a population count")
+
+
+@pytest.fixture(autouse=True)
+def state_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the default state store (used by the id allocators) at *tmp_path*."""
+
+    return _use_state_root(tmp_path, monkeypatch)
+
+
+def _use_state_root(path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    from mutants import state as state_mod
+
+    path.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("GAME_STATE_ROOT", str(path))
+    monkeypatch.setattr(state_mod, "STATE_ROOT", path)
+    return path
+
+
+def _alive(idx: int, year: int) -> Dict[str, Any]:
+    return {
+        "id": f"i.pre{idx}",
+        "instance_id": f"i.pre{idx}",
+        "name": f"Rat-{idx + 1}",
+        "pos": [year, 0, 0],
+        "hp": {"current": 5, "max": 5},
+    }
+
+
+def _spawner(tmp_path: Path, seed: int, config: Dict[str, int], preload: List[Dict[str, Any]] | None = None):
+    instances = _RecordingInstances(tmp_path)
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", list(preload or []), instances=instances)
+    rng = random.Random(seed)
+    spawner = monster_spawner.RuntimeSpawner(
+        monsters_state_obj=state,
+        templates={year: TEMPLATES for year in YEARS},
+        open_tiles={year: TILES for year in YEARS},
+        config=config,
+        rng_factory=lambda: random.Random(rng.getrandbits(64)),
+    )
+    return spawner, state, instances
+
+
+def test_floor_refill_is_bounded_per_tick_and_one_transaction(tmp_path: Path) -> None:
+    config = {"interval": 5, "jitter_pct": 0, "floor": 6, "cap": 8, "batch_max": 4}
+    spawner, state, instances = _spawner(tmp_path, 1, config)
+
+    spawned = spawner.tick()
+    assert len(spawned) == 4
+    assert instances.batches == [4]
+    assert state.count_alive(2000) == 4 and state.count_alive(2100) == 0
+
+    for _ in range(2):
+        spawner.tick()
+    assert instances.batches == [4, 4, 4]
+    assert [state.count_alive(year) for year in YEARS] == [6, 6]
+    assert len(list(instances.list_all())) == 12
+    for monster in state.list_all():
+        assert monster["instance_id"].startswith(("i.rat#", "i.ghoul#"))
+        assert (monster["pos"][1], monster["pos"][2]) in TILES
+        assert monster["hp"]["current"] == monster["hp"]["max"]
+    assert not state._dirty_ids
+
+
+def test_growth_interval_and_cap(tmp_path: Path) -> None:
+    config = {"interval": 3, "jitter_pct": 0, "floor": 0, "cap": 2, "batch_max": 5}
+    spawner, state, instances = _spawner(tmp_path, 2, config)
+
+    counts = []
+    for _ in range(12):
+        spawner.tick()
+        counts.append(state.count_alive(2000))
+    assert counts == [0, 0, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2]
+    assert instances.batches == [2, 2]
+
+    state.kill_monster(state.list_in_year(2000)[0]["id"])
+    spawner.notify_monster_death({"year": 2000})
+    spawner.tick()
+    assert state.count_alive(2000) == 2
+    assert spawner.stats["deaths"] == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_seed_yields_same_spawns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed: int
+) -> None:
+    config = {"interval": 2, "jitter_pct": 50, "floor": 3, "cap": 10, "batch_max": 3}
+    runs = []
+    for run in range(2):
+        root = _use_state_root(tmp_path / str(run), monkeypatch)
+        spawner, state, _ = _spawner(root, seed, config)
+        for _ in range(15):
+            spawner.tick()
+        runs.append(
+            sorted((m["instance_id"], m["name"], tuple(m["pos"]), m["ions"]) for m in state.list_all())
+        )
+    assert runs[0] == runs[1]
+    assert len(runs[0]) > 6
+
+
+def test_replay_on_the_same_database_gets_fresh_ids(tmp_path: Path) -> None:
+    config = {"interval": 2, "jitter_pct": 50, "floor": 3, "cap": 10, "batch_max": 3}
+    runs = []
+    for _ in range(2):
+        spawner, state, instances = _spawner(tmp_path, 4, config)
+        for _ in range(15):
+            spawner.tick()
+        runs.append(sorted(state.list_all(), key=lambda m: m["instance_id"]))
+
+    # Same draws, but ids and names continue the stored counters instead of
+    # colliding with the first run's rows.
+    assert [tuple(m["pos"]) for m in runs[0]] == [tuple(m["pos"]) for m in runs[1]]
+    first = {m["instance_id"] for m in runs[0]}
+    second = {m["instance_id"] for m in runs[1]}
+    assert not first & second
+    assert not {m["name"] for m in runs[0]} & {m["name"] for m in runs[1]}
+    assert len(list(instances.list_all())) == len(first) + len(second)
+
+
+def test_large_population_between_floor_and_cap_grows_by_one_per_year(tmp_path: Path) -> None:
+    preload = [_alive(idx, YEARS[idx % 2]) for idx in range(10_000)]
+    config = {"interval": 1, "jitter_pct": 0, "floor": 4_990, "cap": 5_010, "batch_max": 5}
+    spawner, state, instances = _spawner(tmp_path, 3, config, preload)
+
+    spawned = spawner.tick()
+    assert len(spawned) == 2
+    assert instances.batches == [2]
+    assert [state.count_alive(year) for year in YEARS] == [5_001, 5_001]
+    assert len({m["name"] for m in state.list_all()}) == 10_002
+
+
+def test_spawner_and_manual_spawns_share_ids_and_suffixes(tmp_path: Path) -> None:
+    from mutants.services import monster_entities, monster_manual_spawn
+
+    rat = monster_entities.MonsterTemplate(
+        monster_id="rat", name="Rat", level=1, hp_max=6, armour_class=1, spawn_years=[2000],
+        spawnable=True, taunt="", stats={}, innate_attack={}, exp_bonus=None, ions_min=0,
+        ions_max=0, riblets_min=0, riblets_max=0, spells=[], starter_armour=[], starter_items=[],
+    )
+    catalog = SimpleNamespace(get_template=lambda monster_id: rat)
+    preload = [dict(_alive(0, 2000), name="Rat-150")]
+    config = {"interval": 1, "jitter_pct": 0, "floor": 0, "cap": 100, "batch_max": 2}
+    spawner, state, instances = _spawner(tmp_path, 5, config, preload)
+
+    manual: List[Dict[str, Any]] = []
+    for _ in range(20):
+        # Manual spawns first so they seed the shared keys, then the spawner.
+        manual.append(
+            monster_manual_spawn.spawn_monster_into_state(
+                "rat", [2000, 0, 0], catalog, None, None, state
+            )
+        )
+        manual.append(
+            monster_manual_spawn.spawn_monster_at("rat", [2000, 1, 1], catalog, instances, None, None)
+        )
+        spawner.tick()
+
+    monsters = {m["instance_id"]: m for m in [*state.list_all(), *instances.list_all(), *manual]}
+    assert len(monsters) == 1 + 40 + 40
+    names = [m["name"] for m in monsters.values()]
+    assert len(set(names)) == len(names)
+    rats = [int(name[4:]) for name in names if name.startswith("Rat-") and name != "Rat-150"]
+    assert min(rats) > 150
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import monsters_state
+
+YEARS = (2000, 2100)
+PLAYERS = ("player_thief", "player_priest")
+
+
+def _monster(idx: int, rng: random.Random) -> Dict[str, Any]:
+    monster: Dict[str, Any] = {
+        "id": f"m{idx}",
+        "instance_id": f"m{idx}",
+        "pos": [rng.choice(YEARS), rng.randrange(4), rng.randrange(4)],
+        "hp": {"current": 3, "max": 3},
+        "target_player_id": None,
+        "_ai_state": {},
+    }
+    if rng.random() < 0.3:
+        monster["target_player_id"] = rng.choice(PLAYERS)
+    return monster
+
+
+class _NoScanList(list):
+    def __iter__(self):
+        raise AssertionError("full scan of the monster list")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_target_index_tracks_acquire_release_and_moves(seed: int, tmp_path: Path) -> None:
+    rng = random.Random(seed)
+    monsters: List[Dict[str, Any]] = [_monster(i, rng) for i in range(15)]
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", monsters, instances=object())
+    state.verify_target_index()
+
+    for _ in range(200):
+        live = state.list_all()
+        if not live:
+            break
+        mon = rng.choice(live)
+        op = rng.random()
+        if op < 0.3:
+            player = rng.choice(PLAYERS)
+            mon["target_player_id"] = player
+            mon["_ai_state"]["bound_player_id"] = player
+            state.mark_targeting(mon)
+        elif op < 0.5:
+            mon["target_player_id"] = None
+            mon["_ai_state"].pop("bound_player_id", None)
+            state.mark_dirty(mon)
+        elif op < 0.55:
+            # Bound-only monsters are still indexed under the bound player.
+            mon["target_player_id"] = None
+            mon["_ai_state"]["bound_player_id"] = rng.choice(PLAYERS)
+            state.mark_dirty(mon)
+        elif op < 0.85:
+            state.move_monster(mon, (rng.choice(YEARS), rng.randrange(4), rng.randrange(4)))
+        elif op < 0.95:
+            state._clear_target_index(mon["id"], rng.choice(PLAYERS))
+        else:
+            state.kill_monster(mon["id"])
+        state.verify_target_index()
+
+    for player in PLAYERS:
+        for year in YEARS:
+            expected = sorted(
+                mon["id"]
+                for mon in state.list_all()
+                if mon["pos"][0] == year
+                and (mon.get("target_player_id") or mon["_ai_state"].get("bound_player_id")) == player
+            )
+            got = sorted(mon["id"] for mon in state.list_targeting_player(player, year=year))
+            assert got == expected
+
+
+def test_list_targeting_player_does_not_scan(tmp_path: Path) -> None:
+    hunter = {"id": "hunter", "pos": [2000, 1, 1], "hp": {"current": 3, "max": 3}, "target_player_id": "p1"}
+    idle = {"id": "idle", "pos": [2000, 1, 1], "hp": {"current": 3, "max": 3}}
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", [hunter, idle], instances=object())
+    state._monsters = _NoScanList(state._monsters)
+
+    assert state.list_targeting_player("p1", year=2000) == [hunter]
+    assert state.list_targeting_player("p1", year=2100) == []
+    assert state.list_targeting_player("p2") == []
+
+    state.move_monster("hunter", (2100, 0, 0))
+    assert state.list_targeting_player("p1", year=2100) == [hunter]
+
+
+def test_check_mode_reports_index_drift(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MUTANTS_CHECK_TARGET_INDEX", "1")
+    hunter = {"id": "hunter", "pos": [2000, 1, 1], "hp": {"current": 3, "max": 3}, "target_player_id": "p1"}
+    state = monsters_state.MonstersState(tmp_path / "monsters.json", [hunter], instances=object())
+    assert state.list_targeting_player("p1") == [hunter]
+
+    # A target assigned without going through mark_targeting/mark_dirty.
+    hunter["target_player_id"] = "p2"
+    with pytest.raises(AssertionError, match="p1|p2"):
+        state.list_targeting_player("p1")
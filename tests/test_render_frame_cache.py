@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants import state as state_mod
+from mutants.app import context as context_mod
+from mutants.registries import world as world_registry
+from mutants.ui import renderer
+from mutants.ui import styles as st
+from mutants.ui.feedback import FeedbackBus
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# Frames for every 15th tile of 2000, 2100 and 3000, captured with the
+# renderer as it was before the static-block cache and single-write output
+# (colors from state/ui/colors.json, ANSI on, the dummies below).
+BASELINE_FRAMES = Path(__file__).resolve().parent / "fixtures" / "render_frames_baseline.json"
+
+
+class DummyMonsters:
+    def __init__(self, names_by_pos: dict[tuple[int, int, int], list[str]]):
+        self._names = names_by_pos
+
+    def list_at(self, year, x, y):
+        names = self._names.get((int(year), int(x), int(y)), [])
+        return [
+            {"instance_id": f"i.{idx}", "name": name, "hp": {"current": 5}}
+            for idx, name in enumerate(names)
+        ]
+
+    def list_adjacent_monsters(self, _pos):
+        return ["north"]
+
+
+class DummyItems:
+    def list_ids_at(self, year, x, y):
+        return ["nuclear_waste", "nuclear_waste"] if (x + y) % 3 == 0 else []
+
+
+def _state_at(year: int, x: int, y: int) -> dict:
+    return {"active_id": "p1", "players": [{"id": "p1", "pos": [year, x, y]}]}
+
+
+@pytest.fixture()
+def world(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> world_registry.WorldRegistry:
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    shutil.copytree(REPO_ROOT / "state" / "world", tmp_path / "world")
+    monkeypatch.setattr(context_mod, "_STATIC_ROOM_CACHE", {})
+    # The renderer reads the display name from the current context's player.
+    monkeypatch.setattr(
+        context_mod, "_CURRENT_CTX", {"player_state": _state_at(2000, 0, 0)}
+    )
+    renderer.clear_frame_cache()
+    yield world_registry.WorldRegistry(base_dir=tmp_path / "world")
+    renderer.clear_frame_cache()
+
+
+def _frames(world_reg, year: int, positions, monsters, items) -> list[list[str]]:
+    frames = []
+    for x, y in positions:
+        vm = context_mod.build_room_vm(
+            _state_at(year, x, y), world_reg.load_year, [], monsters, items
+        )
+        frames.append(renderer.render(vm, feedback_events=[{"kind": "SYSTEM/OK", "text": "ok"}]))
+    return frames
+
+
+def _uncached_frames(world_reg, year: int, positions, monsters, items) -> list[list[str]]:
+    frames = []
+    for x, y in positions:
+        vm = context_mod.build_room_vm(
+            _state_at(year, x, y), world_reg.load_year, [], monsters, items
+        )
+        vm["static_key"] = None
+        frames.append(renderer.render(vm, feedback_events=[{"kind": "SYSTEM/OK", "text": "ok"}]))
+    return frames
+
+
+def test_cached_frames_are_byte_identical_for_every_tile(world) -> None:
+    for year in (2000, 2100, 3000):
+        yw = world.load_year(year)
+        positions = [tuple(t["pos"][1:]) for t in yw.iter_tiles()]
+        monsters = DummyMonsters({(year, *positions[0]): ["Ghoul", "Ghoul", "Rat"]})
+        items = DummyItems()
+
+        expected = _uncached_frames(world, year, positions, monsters, items)
+        first = _frames(world, year, positions, monsters, items)
+        second = _frames(world, year, positions, monsters, items)
+
+        assert first == expected
+        assert second == expected
+
+
+@pytest.fixture()
+def baseline_styles():
+    st.set_colors_map_path(str(REPO_ROOT / "state" / "ui" / "colors.json"))
+    previous = st.set_ansi_enabled(True)
+    yield
+    st.set_ansi_enabled(previous)
+    st.set_colors_map_path(None)
+
+
+def test_render_frame_matches_baseline_golden_frames(
+    world, baseline_styles, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    golden = json.loads(BASELINE_FRAMES.read_text(encoding="utf-8"))
+    writes: list[str] = []
+    monkeypatch.setattr(sys, "stdout", SimpleNamespace(write=writes.append, flush=lambda: None))
+
+    for year_key, frames in golden.items():
+        year = int(year_key)
+        first = next(iter(world.load_year(year).iter_tiles()))["pos"]
+        monsters = DummyMonsters({(year, first[1], first[2]): ["Ghoul", "Ghoul", "Rat"]})
+        # Twice per tile: the second pass is served from the static-block cache.
+        for _ in range(2):
+            for tile, lines in frames.items():
+                x, y = (int(part) for part in tile.split(","))
+                bus = FeedbackBus()
+                bus.push("SYSTEM/OK", "ok")
+                writes.clear()
+                context_mod.render_frame(
+                    {
+                        "player_state": _state_at(year, x, y),
+                        "world_loader": world.load_year,
+                        "headers": [],
+                        "monsters": monsters,
+                        "items": DummyItems(),
+                        "feedback_bus": bus,
+                        "theme": SimpleNamespace(palette=None, width=80),
+                        "renderer": renderer.render,
+                    }
+                )
+                assert writes == ["\n".join(lines) + "\n"], (year, tile)
+
+
+def test_world_and_dynamics_writes_invalidate_static_block(
+    world, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from mutants.registries import dynamics
+
+    yw = world.load_year(2000)
+    target = next(
+        t
+        for t in yw.iter_tiles()
+        if t["edges"]["N"]["base"] == 0
+        and yw.get_tile(t["pos"][1], t["pos"][2] + 1) is not None
+    )
+    x, y = target["pos"][1], target["pos"][2]
+    before = _frames(world, 2000, [(x, y)], None, None)[0]
+
+    yw.close_gate(x, y, "N")
+    after = _frames(world, 2000, [(x, y)], None, None)[0]
+    assert after != before
+    assert after == _uncached_frames(world, 2000, [(x, y)], None, None)[0]
+
+    monkeypatch.setattr(dynamics, "PATH", tmp_path / "dynamics.json")
+    version = dynamics.version()
+    dynamics.set_lock(2000, x, y, "N", "key")
+    assert dynamics.version() > version
+    vm = context_mod.build_room_vm(_state_at(2000, x, y), world.load_year, [], None, None)
+    assert vm["static_key"][-1] == dynamics.version()
+
+
+def test_render_frame_emits_single_write(world, monkeypatch: pytest.MonkeyPatch) -> None:
+    writes: list[str] = []
+    monkeypatch.setattr(sys, "stdout", SimpleNamespace(write=writes.append, flush=lambda: None))
+    bus = FeedbackBus()
+    bus.push("SYSTEM/OK", "hello")
+    ctx = {
+        "player_state": _state_at(2000, 0, 0),
+        "world_loader": world.load_year,
+        "headers": [],
+        "monsters": DummyMonsters({(2000, 0, 0): ["Ghoul"]}),
+        "items": None,
+        "feedback_bus": bus,
+        "theme": SimpleNamespace(palette={}, width=80),
+        "renderer": renderer.render,
+    }
+
+    context_mod.render_frame(ctx)
+
+    assert len(writes) == 1
+    assert writes[0].endswith("\n")
+    assert "hello" in writes[0]
+    assert "Ghoul is here." in writes[0]
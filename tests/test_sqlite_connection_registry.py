@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_store
+
+
+def test_managers_share_one_verified_connection_per_path(tmp_path: Path) -> None:
+    sqlite_store.close_all()
+    db = tmp_path / "mutants.db"
+    before = sqlite_store.connection_stats()
+
+    first = sqlite_store.SQLiteConnectionManager(db)
+    conn = first.connect()
+    first.close()  # releases the handle only
+    assert sqlite_store.SQLiteConnectionManager(str(db)).connect() is conn
+    assert conn.execute("SELECT version FROM schema_meta").fetchone()[0] >= 8
+
+    stores = sqlite_store.get_stores(db)
+    assert sqlite_store.get_stores(db) is stores
+    assert stores.items._connection() is conn
+
+    other = sqlite_store.SQLiteConnectionManager(tmp_path / "other.db").connect()
+    assert other is not conn
+
+    after = sqlite_store.connection_stats()
+    assert after["opened"] - before["opened"] == 2
+    assert after["schema_checks"] - before["schema_checks"] == 2
+
+
+def test_threads_get_their_own_connection_without_rechecking_schema(tmp_path: Path) -> None:
+    sqlite_store.close_all()
+    manager = sqlite_store.SQLiteConnectionManager(tmp_path / "mutants.db")
+    main_conn = manager.connect()
+    checks = sqlite_store.connection_stats()["schema_checks"]
+
+    seen = []
+
+    def _worker() -> None:
+        conn = manager.connect()
+        seen.append((conn, manager.connect() is conn))
+        conn.execute("SELECT COUNT(*) FROM items_instances").fetchone()
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+
+    (worker_conn, stable), = seen
+    assert stable and worker_conn is not main_conn
+    assert sqlite_store.connection_stats()["schema_checks"] == checks
+    assert sqlite_store.connection_stats()["open"] == 2
+
+
+def test_close_all_closes_and_reverifies(tmp_path: Path) -> None:
+    manager = sqlite_store.SQLiteConnectionManager(tmp_path / "mutants.db")
+    conn = manager.connect()
+    checks = sqlite_store.connection_stats()["schema_checks"]
+
+    sqlite_store.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert sqlite_store.connection_stats()["open"] == 0
+
+    reopened = manager.connect()
+    assert reopened is not conn
+    assert sqlite_store.connection_stats()["schema_checks"] == checks + 1
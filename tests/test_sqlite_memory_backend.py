@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants import state as state_mod
+from mutants.registries import sqlite_store, storage
+
+
+@pytest.fixture
+def memory_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
+    monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite-memory")
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    return tmp_path
+
+
+def _mint(stores, iid: str) -> None:
+    stores.items.mint({"iid": iid, "item_id": "bottle_cap", "year": 2000, "x": 1, "y": 2})
+
+
+def test_memory_backend_writes_nothing_to_disk(memory_backend: Path) -> None:
+    stores = storage.get_stores()
+    _mint(stores, "it-mem")
+
+    assert [row["iid"] for row in stores.items.list_at(2000, 1, 2)] == ["it-mem"]
+    assert stores.items._manager.in_memory
+    assert stores.items._manager.path == memory_backend / "mutants.db"
+    assert list(memory_backend.iterdir()) == []
+
+    # Another thread gets its own connection to the same shared-cache database.
+    counts = []
+    other = sqlite_store.SQLiteConnectionManager(memory_backend / "mutants.db")
+    reader = threading.Thread(
+        target=lambda: counts.append(
+            other.connect().execute("SELECT COUNT(*) FROM items_instances").fetchone()[0]
+        )
+    )
+    reader.start()
+    reader.join()
+    assert counts == [1]
+    # A different path is a different database.
+    elsewhere = sqlite_store.get_stores(memory_backend / "other.db")
+    assert elsewhere.items.list_at(2000, 1, 2) == []
+
+    sqlite_store.close_all()
+    assert storage.get_stores().items.list_at(2000, 1, 2) == []
+
+
+def test_restored_clones_are_independent(memory_backend: Path) -> None:
+    seed = sqlite_store.get_stores(memory_backend / "seed.db")
+    _mint(seed, "it-seed")
+    snapshot = sqlite_store.snapshot_database(memory_backend / "seed.db")
+    try:
+        for name in ("a.db", "b.db"):
+            target = memory_backend / name
+            sqlite_store.restore_database(snapshot, target)
+            clone = sqlite_store.get_stores(target)
+            assert [row["iid"] for row in clone.items.list_at(2000, 1, 2)] == ["it-seed"]
+            _mint(clone, f"it-{name}")
+
+        sqlite_store.restore_database(snapshot, memory_backend / "a.db")
+        restored = sqlite_store.get_stores(memory_backend / "a.db")
+        assert [row["iid"] for row in restored.items.list_at(2000, 1, 2)] == ["it-seed"]
+        assert len(sqlite_store.get_stores(memory_backend / "b.db").items.list_at(2000, 1, 2)) == 2
+    finally:
+        snapshot.close()
+
+
+def test_session_snapshot_restores_into_memory_backend(
+    memory_backend: Path, seed_state_db
+) -> None:
+    seed_state_db()
+
+    manager = sqlite_store.SQLiteConnectionManager()
+    assert manager.in_memory
+    assert manager.get_item_catalog("bottle_cap") is not None
+    assert list(memory_backend.iterdir()) == []
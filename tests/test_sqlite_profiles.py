@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_statements, sqlite_store
+
+_SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+
+
+def _pragma(conn, name: str) -> int:
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def _indexes(conn, table: str) -> set[str]:
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+@pytest.mark.parametrize("profile", sorted(sqlite_store.PRAGMA_PROFILES))
+def test_env_profile_configures_new_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, profile: str
+) -> None:
+    monkeypatch.setenv("MUTANTS_SQLITE_PROFILE", profile)
+    conn = sqlite_store.SQLiteConnectionManager(tmp_path / "mutants.db").connect()
+
+    expected = sqlite_store.PRAGMA_PROFILES[profile]
+    assert sqlite_store.active_profile() == profile
+    assert _pragma(conn, "journal_mode") == "wal"
+    assert _pragma(conn, "busy_timeout") == 5000
+    assert _pragma(conn, "synchronous") == _SYNCHRONOUS[expected["synchronous"]]
+    assert _pragma(conn, "cache_size") == expected["cache_size"]
+    assert _pragma(conn, "temp_store") == 2
+    assert _pragma(conn, "wal_autocheckpoint") == expected["wal_autocheckpoint"]
+
+
+def test_unknown_profile_falls_back_and_set_profile_validates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MUTANTS_SQLITE_PROFILE", "turbo")
+    assert sqlite_store.active_profile() == "interactive"
+    conn = sqlite_store.SQLiteConnectionManager(tmp_path / "mutants.db").connect()
+
+    with pytest.raises(ValueError):
+        sqlite_store.set_profile("turbo")
+    sqlite_store.set_profile("durable")
+    try:
+        assert _pragma(conn, "synchronous") == 2
+    finally:
+        sqlite_store.set_profile(None)
+    assert _pragma(conn, "synchronous") == 1
+
+
+def test_bulk_import_defers_indexes_and_restores_profile(tmp_path: Path) -> None:
+    stores = sqlite_store.get_stores(tmp_path / "mutants.db")
+    conn = stores.items._connection()
+    indexes = _indexes(conn, "items_instances")
+    assert "items_at_idx" in indexes
+
+    with pytest.raises(RuntimeError):
+        with sqlite_store.bulk_import(conn, ("items_instances",)):
+            assert _indexes(conn, "items_instances") == set()
+            assert _pragma(conn, "synchronous") == 0
+            stores.items.bulk_insert(
+                [
+                    {"iid": f"it{idx}", "item_id": "bottle_cap", "year": 2000, "x": 0, "y": idx}
+                    for idx in range(50)
+                ]
+            )
+            raise RuntimeError("import failed half way")
+
+    assert _indexes(conn, "items_instances") == indexes
+    assert _pragma(conn, "synchronous") == 1
+    assert len(stores.items.list_at(2000, 0, 7)) == 1
+
+
+def test_close_all_optimizes_each_connection(tmp_path: Path) -> None:
+    sqlite_store.get_stores(tmp_path / "mutants.db").runtime_kv.set("k", "v")
+    with sqlite_statements.capture_trace() as trace:
+        sqlite_store.close_all()
+    assert "PRAGMA optimize" in trace
@@ -0,0 +1,227 @@
+"""Query-plan and latency regression checks for the SQLite instance stores.
+
+Builds one synthetic database (100k items, 10k monsters) per module and runs
+``EXPLAIN QUERY PLAN`` for every statement declared by ``sqlite_store``.  A
+new statement must be added to ``_PLANS`` before this passes.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_statements, sqlite_store
+
+ITEMS = 100_000
+MONSTERS = 10_000
+PLAYERS = 50
+YEARS = (2000, 2100, 2200, 2300)
+SPAN = 50
+RARE_ORIGIN = "plan_test_event"
+
+_NO_PLAN = "no-plan"  # inserts/upserts/BEGIN: nothing to search
+_EXPORT = "export"  # whole-table reads and deletes: scanning is the point
+_ROWID = "rowid"  # range search on an INTEGER PRIMARY KEY
+
+# Statement name -> index its plan must SEARCH with (or one of the markers).
+_PLANS: Dict[str, str] = {
+    "txn.begin_immediate": _NO_PLAN,
+    "items.get_by_iid": "sqlite_autoindex_items_instances_1",
+    "items.list_at": "items_at_idx",
+    "items.list_at_many": "items_at_idx",
+    "items.list_by_owner": "items_owner_idx",
+    "items.update_fields": "sqlite_autoindex_items_instances_1",
+    "items.delete": "sqlite_autoindex_items_instances_1",
+    "items.delete_by_origin": "items_origin_idx",
+    "items.move_many": "sqlite_autoindex_items_instances_1",
+    "items.delete_many": "sqlite_autoindex_items_instances_1",
+    "items.delete_off_tile": "sqlite_autoindex_items_instances_1",
+    "items.delete_by_owner": "items_owner_idx",
+    "items.insert": _NO_PLAN,
+    "items.snapshot": _EXPORT,
+    "items.stream": _EXPORT,
+    "items.delete_all": _EXPORT,
+    "monsters.get": "sqlite_autoindex_monsters_instances_1",
+    "monsters.list_at": "monsters_at_idx",
+    "monsters.list_by_target": "monsters_target_idx",
+    "monsters.count_alive": "monsters_at_idx",
+    "monsters.update_fields": "sqlite_autoindex_monsters_instances_1",
+    "monsters.delete": "sqlite_autoindex_monsters_instances_1",
+    "monsters.insert": _NO_PLAN,
+    "monsters.snapshot": _EXPORT,
+    "monsters.stream": _EXPORT,
+    "monsters.delete_all": _EXPORT,
+    "runtime_kv.get": "sqlite_autoindex_runtime_kv_1",
+    "runtime_kv.set": _NO_PLAN,
+    "runtime_kv.delete": "sqlite_autoindex_runtime_kv_1",
+    "owner_aggregates.get": "sqlite_autoindex_owner_aggregates_1",
+    "owner_aggregates.upsert": _NO_PLAN,
+    "owner_aggregates.delete": "sqlite_autoindex_owner_aggregates_1",
+    "owner_aggregates.snapshot": _EXPORT,
+    "items_catalog.get": "sqlite_autoindex_items_catalog_1",
+    "items_catalog.upsert": _NO_PLAN,
+    "items_catalog.list_spawnable": _EXPORT,
+    "monsters_catalog.get": "sqlite_autoindex_monsters_catalog_1",
+    "monsters_catalog.upsert": _NO_PLAN,
+    "monsters_catalog.list_spawnable": _EXPORT,
+    "changes.append": _NO_PLAN,
+    "changes.head": _NO_PLAN,
+    "changes.since": _ROWID,
+    "changes.compact": _ROWID,
+}
+
+# Representative fillings for template statements.
+_RENDER: Dict[str, Dict[str, str]] = {
+    "items.list_at_many": {
+        "clauses": "(year = ? AND x = ? AND y IN (?, ?)) OR (year = ? AND x = ? AND y IN (?))"
+    },
+    "items.update_fields": {"assignments": "year = ?, x = ?, y = ?"},
+    "items.stream": {"columns": "iid, owner, year, x, y", "where": ""},
+    "items.move_many": {
+        "stamps": ", created_at = CASE iid WHEN ? THEN ? ELSE created_at END",
+        "placeholders": "?, ?, ?",
+    },
+    "items.delete_many": {"placeholders": "?, ?, ?"},
+    "items.delete_off_tile": {"placeholders": "?, ?, ?"},
+    "monsters.stream": {"columns": "instance_id", "where": ""},
+    "monsters.update_fields": {"assignments": "hp_cur = ?, target_player_id = ?"},
+}
+
+_STORE_NAMESPACES = {name.split(".", 1)[0] for name in _PLANS}
+
+# Mean milliseconds per call at this scale.  A table scan of 100k rows costs
+# well over these on any machine that runs the suite; index lookups sit far
+# below them.
+_LATENCY_MS: Dict[str, float] = {
+    "items.get_by_iid": 1.0,
+    "items.list_at": 2.0,
+    "items.list_at_many": 5.0,
+    "items.list_by_owner": 2.0,
+    "items.update_fields": 2.0,
+    "items.delete_by_origin": 25.0,
+    "monsters.get": 1.0,
+    "monsters.list_at": 2.0,
+    "monsters.list_by_target": 10.0,
+    "monsters.count_alive": 10.0,
+    "monsters.update_fields": 2.0,
+}
+
+
+def _store_statements() -> Dict[str, str]:
+    return {
+        name: sql
+        for name, sql in sqlite_statements.declared().items()
+        if name.split(".", 1)[0] in _STORE_NAMESPACES
+    }
+
+
+def _pos(rng: random.Random) -> tuple[int, int, int]:
+    return rng.choice(YEARS), rng.randint(-SPAN, SPAN), rng.randint(-SPAN, SPAN)
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory: pytest.TempPathFactory):
+    rng = random.Random(43)
+    stores = sqlite_store.get_stores(tmp_path_factory.mktemp("plans") / "mutants.db")
+    items: List[Dict[str, Any]] = []
+    for idx in range(ITEMS):
+        record: Dict[str, Any] = {"iid": f"it{idx:06d}", "item_id": "bottle_cap"}
+        if idx % 3 == 0:
+            record["owner"] = f"owner{idx % 5000}"
+            record["year"] = record["x"] = record["y"] = -1
+        else:
+            record["year"], record["x"], record["y"] = _pos(rng)
+        record["origin"] = RARE_ORIGIN if idx % 1000 == 0 else ("daily_litter", "monster_drop", None)[idx % 3]
+        items.append(record)
+    stores.items.bulk_insert(items)
+    monsters = []
+    for idx in range(MONSTERS):
+        year, x, y = _pos(rng)
+        monsters.append(
+            {
+                "instance_id": f"i.plan.{idx:05d}",
+                "monster_id": "ghoul",
+                "pos": [year, x, y],
+                "hp": {"current": 0 if idx % 5 == 0 else 20, "max": 20},
+                "target_player_id": f"player{(idx // 10) % PLAYERS}" if idx % 10 == 0 else None,
+            }
+        )
+    stores.monsters.spawn_many(monsters)
+    return stores
+
+
+def _plan(conn, sql: str) -> List[str]:
+    names = re.findall(r":(\w+)", sql)
+    params: Any = {name: None for name in names} if names else (0,) * sql.count("?")
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def test_every_store_statement_has_an_expected_plan() -> None:
+    assert sorted(_store_statements()) == sorted(_PLANS)
+
+
+@pytest.mark.parametrize("name", sorted(_PLANS))
+def test_statement_uses_expected_index(stores, name: str) -> None:
+    sql = _store_statements()[name]
+    if name in _RENDER:
+        sql = sql.format(**_RENDER[name])
+    plan = _plan(stores.items._connection(), sql)
+    expected = _PLANS[name]
+    if expected == _EXPORT:
+        return
+    assert not any(step.startswith("SCAN") for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    if expected == _NO_PLAN:
+        return
+    if expected == _ROWID:
+        assert any("USING INTEGER PRIMARY KEY" in step for step in plan), plan
+        return
+    assert any(
+        re.search(rf"USING (COVERING )?INDEX {expected}\b", step) for step in plan
+    ), plan
+
+
+def _mean_ms(name: str) -> Optional[float]:
+    for stats in sqlite_statements.top(len(_PLANS) * 2):
+        if stats.name == name:
+            return stats.mean_ms
+    return None
+
+
+def test_store_latency_at_scale(stores) -> None:
+    rng = random.Random(7)
+    sqlite_statements.reset()
+    for idx in range(200):
+        year, x, y = _pos(rng)
+        stores.items.get_by_iid(f"it{rng.randrange(ITEMS):06d}")
+        stores.items.list_at(year, x, y)
+        stores.items.list_by_owner(f"owner{rng.randrange(5000)}")
+        stores.monsters.get(f"i.plan.{rng.randrange(MONSTERS):05d}")
+        stores.monsters.list_at(year, x, y)
+        stores.items.update_fields(f"it{3 * idx + 1:06d}", condition=rng.randint(1, 100))
+        stores.monsters.update_fields(f"i.plan.{idx:05d}", hp_cur=rng.randint(1, 20))
+    for idx in range(20):
+        stores.items.list_at_many([_pos(rng) for _ in range(40)])
+        stores.monsters.list_by_target(f"player{idx}")
+        stores.monsters.count_alive(YEARS[idx % len(YEARS)])
+    stores.items.delete_by_origin(RARE_ORIGIN)
+
+    slow = {}
+    for name, bound in _LATENCY_MS.items():
+        mean = _mean_ms(name)
+        assert mean is not None, name
+        if mean > bound:
+            slow[name] = round(mean, 3)
+    assert not slow, f"statements over their latency bound: {slow}"
+    assert stores.items.get_by_iid("it000000") is None  # RARE_ORIGIN row is gone
+    hunters = [m["instance_id"] for m in stores.monsters.list_by_target("player3")]
+    assert hunters == [f"i.plan.{idx:05d}" for idx in range(30, MONSTERS, 10 * PLAYERS)]
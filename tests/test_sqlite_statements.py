@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.commands import debug as debug_cmd
+from mutants.registries import sqlite_statements, sqlite_store
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.events: List[tuple[str, str]] = []
+
+    def push(self, kind: str, text: str, **_meta: Any) -> None:
+        self.events.append((kind, text))
+
+
+@pytest.fixture
+def stores(tmp_path: Path):
+    stores = sqlite_store.get_stores(tmp_path / "mutants.db")
+    stores.items._connection()  # schema setup runs outside the counted calls
+    sqlite_statements.reset()
+    yield stores
+    sqlite_statements.reset()
+
+
+def _counters() -> dict[str, dict[str, Any]]:
+    return {entry["name"]: entry for entry in sqlite_statements.snapshot()["statements"]}
+
+
+def test_store_calls_are_counted_per_statement(stores) -> None:
+    for idx in range(3):
+        stores.items.mint({"iid": f"it{idx}", "item_id": "bottle_cap", "year": 2000, "x": 1, "y": 2})
+    assert len(stores.items.list_at(2000, 1, 2)) == 3
+    stores.items.update_fields("it0", condition=50)
+    stores.items.update_fields("it1", condition=40)
+    stores.items.list_at_many([(2000, 1, 2), (2000, 5, 5)])
+
+    counters = _counters()
+    assert counters["items.insert"]["calls"] == 3
+    assert counters["items.insert"]["rows"] == 3
+    assert counters["items.list_at"]["rows"] == 3
+    assert counters["items.update_fields"]["calls"] == 2
+    assert counters["items.list_at_many"]["calls"] == 1
+    assert counters["txn.begin_immediate"]["calls"] == 5
+
+    ranked = sqlite_statements.top(3)
+    assert [s.total_ms for s in ranked] == sorted((s.total_ms for s in ranked), reverse=True)
+
+
+def test_rendered_templates_are_reused_and_bounded() -> None:
+    stmt = sqlite_statements.declare("test.template", "SELECT {cols} FROM t")
+    first = stmt.render(cols="a, b")
+    assert stmt.render(cols="a, b") is first
+    for idx in range(sqlite_statements.CACHE_SIZE + 5):
+        stmt.render(cols=f"c{idx}")
+    assert len(sqlite_statements._RENDERED) <= sqlite_statements.CACHE_SIZE
+    with pytest.raises(ValueError):
+        sqlite_statements.declare("test.template", "SELECT 1")
+
+
+def test_capture_trace_sees_every_statement_on_registry_connections(stores) -> None:
+    stores.runtime_kv.set("k", "v")
+    with sqlite_statements.capture_trace() as trace:
+        assert stores.runtime_kv.get("k") == "v"
+        stores.runtime_kv.delete("k")
+    assert any("FROM runtime_kv WHERE key = 'k'" in line for line in trace)
+    assert any(line.startswith("DELETE FROM runtime_kv") for line in trace)
+    seen = len(trace)
+    stores.runtime_kv.get("k")
+    assert len(trace) == seen
+
+
+def test_published_counters_round_trip_and_debug_sql(stores, tmp_path: Path) -> None:
+    stores.monsters.count_alive(2000)
+    stores.monsters.count_alive(2000)
+    sqlite_statements.end_turn()
+    sqlite_statements.end_turn()
+
+    path = sqlite_statements.publish(tmp_path / "logs" / "sql_stats.json")
+    data = sqlite_statements.load_published(path)
+    assert data is not None and data["turns"] == 2
+    report = sqlite_statements.format_report(data)
+    assert "over 2 turns" in report[0]
+    assert any(line.startswith("monsters.count_alive") for line in report[2:])
+
+    bus = _Bus()
+    debug_cmd.debug_cmd("sql 5", {"feedback_bus": bus})
+    assert any("monsters.count_alive" in text for _kind, text in bus.events)
+    debug_cmd.debug_cmd("sql reset", {"feedback_bus": bus})
+    assert sqlite_statements.snapshot()["statements"] == []
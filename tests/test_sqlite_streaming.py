@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.registries import sqlite_statements, sqlite_store
+from mutants.registries.monsters_instances import MonstersInstances
+
+
+@pytest.fixture
+def stores(tmp_path: Path):
+    stores = sqlite_store.get_stores(tmp_path / "mutants.db")
+    items = []
+    for idx in range(1200):
+        record: dict[str, Any] = {"iid": f"it{idx:04d}", "item_id": "bottle_cap"}
+        if idx % 4 == 0:
+            record["owner"] = "player1"
+            record["year"] = record["x"] = record["y"] = -1
+        else:
+            record["year"], record["x"], record["y"] = 2000, idx % 7, 0
+        items.append(record)
+    stores.items.bulk_insert(items)
+    stores.monsters.spawn_many(
+        {
+            "instance_id": f"i.ghoul#{idx + 1:08x}",
+            "monster_id": "ghoul",
+            "name": "Ghoul",
+            "pos": [2000, idx, 0],
+            "hp": {"current": 5, "max": 5},
+        }
+        for idx in range(30)
+    )
+    sqlite_statements.reset()
+    return stores
+
+
+def _stream_counter(name: str) -> dict[str, Any]:
+    for entry in sqlite_statements.snapshot()["statements"]:
+        if entry["name"] == name:
+            return entry
+    raise AssertionError(name)
+
+
+def test_projection_and_filters_run_in_sql(stores) -> None:
+    with sqlite_statements.capture_trace() as trace:
+        rows = list(stores.items.iter_snapshot(("iid", "owner"), owner=None, x=3))
+    assert rows and all(set(row) == {"iid", "owner"} for row in rows)
+    assert {row["owner"] for row in rows} == {None}
+    expected = {
+        rec["iid"] for rec in stores.items.snapshot() if rec["owner"] is None and rec["x"] == 3
+    }
+    assert {row["iid"] for row in rows} == expected
+    assert any(
+        "SELECT iid, owner FROM items_instances WHERE owner IS NULL AND x = 3" in sql
+        for sql in trace
+    )
+
+
+def test_stream_fetches_in_chunks_and_counts_on_close(stores) -> None:
+    rows = stores.items.iter_snapshot(("iid",), chunk_size=100)
+    first = [next(rows)["iid"] for _ in range(150)]
+    assert first == [f"it{idx:04d}" for idx in range(150)]
+    rows.close()
+    counter = _stream_counter("items.stream")
+    assert counter["calls"] == 1
+    assert counter["rows"] == 200  # two chunks fetched, the rest never read
+
+    assert sum(1 for _ in stores.items.iter_snapshot(("iid",), chunk_size=64)) == 1200
+
+
+def test_unknown_columns_are_rejected(stores) -> None:
+    with pytest.raises(KeyError):
+        stores.items.iter_snapshot(("iid", "nope"))
+    with pytest.raises(KeyError):
+        stores.monsters.iter_snapshot(nope=1)
+
+
+def test_monster_stream_decodes_payloads_only_without_projection(stores) -> None:
+    full = list(stores.monsters.iter_snapshot(x=4))
+    assert [row["instance_id"] for row in full] == ["i.ghoul#00000005"]
+    assert full[0]["pos"] == [2000, 4, 0]
+    assert full[0]["name"] == "Ghoul"
+
+    ids = list(stores.monsters.iter_snapshot(("instance_id",)))
+    assert len(ids) == 30 and set(ids[0]) == {"instance_id"}
+
+
+def test_counter_recovery_streams_instance_ids(stores) -> None:
+    registry = MonstersInstances("unused.json", [], store=stores.monsters, kv_store=stores.runtime_kv)
+    assert registry._scan_existing_counter() == 30
+    assert _stream_counter("monsters.stream")["rows"] == 30
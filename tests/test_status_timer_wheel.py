@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.services import player_state
+from mutants.services.status_manager import StatusManager
+from mutants.util.timer_wheel import TimerWheel
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("slot_bits,levels", [(1, 1), (2, 2), (3, 3), (6, 4)])
+def test_timer_wheel_matches_brute_force(seed: int, slot_bits: int, levels: int) -> None:
+    rng = random.Random(seed)
+    wheel = TimerWheel(slot_bits=slot_bits, levels=levels)
+    expected: Dict[int, int] = {}
+    for _ in range(1500):
+        op = rng.random()
+        if op < 0.3:
+            key = rng.randrange(40)
+            expires = wheel.now + rng.choice([0, 1, 2, rng.randrange(200), rng.randrange(5000)])
+            wheel.schedule(key, expires)
+            expected[key] = expires
+        elif op < 0.4:
+            key = rng.randrange(40)
+            assert wheel.cancel(key) == (key in expected)
+            expected.pop(key, None)
+        else:
+            fired = wheel.advance(rng.choice([1, 1, 2, 9]))
+            due = sorted((k for k, at in expected.items() if at <= wheel.now), key=lambda k: (expected[k], repr(k)))
+            assert fired == due
+            for key in due:
+                del expected[key]
+        for key, at in expected.items():
+            assert wheel.remaining(key) == max(0, at - wheel.now)
+    assert len(wheel) == len(expected)
+
+
+class _FakeMonsters:
+    def __init__(self, monsters: List[Dict[str, Any]]) -> None:
+        self._by_id = {m["id"]: m for m in monsters}
+        self.writes: List[str] = []
+        self.saves = 0
+
+    def list_all(self) -> List[Dict[str, Any]]:
+        return list(self._by_id.values())
+
+    def get(self, monster_id: str) -> Dict[str, Any] | None:
+        return self._by_id.get(monster_id)
+
+    def set_status_effects(self, monster_id: str, statuses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.writes.append(monster_id)
+        self._by_id[monster_id]["status_effects"] = [dict(entry) for entry in statuses]
+        return statuses
+
+    def save(self) -> None:
+        self.saves += 1
+
+
+@pytest.fixture
+def player_statuses(monkeypatch: pytest.MonkeyPatch) -> Dict[str, List[Dict[str, Any]]]:
+    store: Dict[str, List[Dict[str, Any]]] = {"thief": [{"status_id": "poisoned", "duration": 3}]}
+
+    def _get_map(state: Any = None) -> Dict[str, List[Dict[str, Any]]]:
+        return {cls: [dict(e) for e in entries] for cls, entries in store.items()}
+
+    def _get_for_class(cls: str, *, state: Any = None) -> List[Dict[str, Any]]:
+        return [dict(e) for e in store.get(cls, [])]
+
+    def _set_for_class(cls: str, statuses: Any, *, state: Any = None) -> List[Dict[str, Any]]:
+        store[cls] = [dict(e) for e in statuses]
+        return store[cls]
+
+    monkeypatch.setattr(player_state, "get_status_effects_map", _get_map)
+    monkeypatch.setattr(player_state, "get_status_effects_for_class", _get_for_class)
+    monkeypatch.setattr(player_state, "set_status_effects_for_class", _set_for_class)
+    return store
+
+
+def test_tick_only_touches_expiring_effects(player_statuses: Dict[str, List[Dict[str, Any]]]) -> None:
+    monsters = _FakeMonsters(
+        [
+            {"id": f"m{idx}", "status_effects": [{"status_id": "stunned", "duration": 50 + idx}]}
+            for idx in range(200)
+        ]
+        + [{"id": "short", "status_effects": [{"status_id": "stunned", "duration": 2}, {"status_id": "slowed", "duration": 5}]}]
+    )
+    manager = StatusManager(player_loader=lambda: {}, monster_loader=lambda: monsters)
+
+    assert manager.tick() == {}
+    assert monsters.writes == [] and monsters.saves == 0
+    assert manager.remaining("monster:short", "slowed") == 4
+    assert manager.remaining("player:thief", "poisoned") == 2
+
+    expired = manager.tick()
+    assert expired == {"monster:short": [{"status_id": "stunned", "duration": 0}]}
+    assert monsters.writes == ["short"] and monsters.saves == 1
+    # The surviving entry is written back with its wheel-derived duration.
+    assert monsters.get("short")["status_effects"] == [{"status_id": "slowed", "duration": 3}]
+
+    expired = manager.tick()
+    assert expired == {"player:thief": [{"status_id": "poisoned", "duration": 0}]}
+    assert player_statuses["thief"] == []
+    assert monsters.writes == ["short"]
+
+
+def test_apply_reschedules_and_flush_writes_remaining(player_statuses: Dict[str, List[Dict[str, Any]]]) -> None:
+    monsters = _FakeMonsters([{"id": "ghoul", "status_effects": []}])
+    manager = StatusManager(player_loader=lambda: {}, monster_loader=lambda: monsters)
+
+    manager.apply("monster:ghoul", "stunned", 3)
+    manager.tick(2)
+    manager.apply("monster:ghoul", "stunned", 4)
+    manager.tick(3)
+    assert manager.remaining("monster:ghoul", "stunned") == 1
+
+    manager.flush()
+    assert monsters.get("ghoul")["status_effects"] == [{"status_id": "stunned", "duration": 1}]
+    assert player_statuses["thief"] == []
+
+    assert manager.tick() == {"monster:ghoul": [{"status_id": "stunned", "duration": 0}]}
+    assert manager.remaining("monster:ghoul", "stunned") == 0
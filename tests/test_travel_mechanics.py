@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import shutil
 import sys
 from pathlib import Path
@@ -16,7 +15,6 @@ if str(SRC_PATH) not in sys.path:
 from mutants import state as state_mod
 from mutants.commands import travel as travel_cmd
 from mutants.registries import items_catalog as items_catalog_mod
-from mutants.registries.sqlite_store import SQLiteConnectionManager
 from mutants.services import player_state
 
 
@@ -46,7 +44,7 @@ class Runner:
 
 
 @pytest.fixture()
-def run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+def run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, seed_state_db) -> Any:
     repo_root = Path(__file__).resolve().parents[1]
     monkeypatch.setenv("GAME_STATE_ROOT", str(tmp_path))
     monkeypatch.setenv("MUTANTS_STATE_BACKEND", "sqlite")
@@ -54,15 +52,7 @@ def run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
 
     shutil.copytree(repo_root / "state", tmp_path, dirs_exist_ok=True)
 
-    manager = SQLiteConnectionManager(tmp_path / "mutants.db")
-    manager.connect()
-
-    catalog_data = json.loads((repo_root / "state" / "items" / "catalog.json").read_text())
-    for entry in catalog_data:
-        manager.upsert_item_catalog(
-            entry["item_id"], json.dumps(entry, ensure_ascii=False, sort_keys=True)
-        )
-    manager.close()
+    seed_state_db(tmp_path / "mutants.db")
 
     items_catalog_mod._CATALOG_CACHE = None
 
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from mutants.debug import turnlog
+from mutants.services import player_state as pstate
+from mutants.ui.logsink import LogSink
+
+
+def test_emit_without_consumer_does_no_formatting(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _boom(_meta):
+        raise AssertionError("formatted without a consumer")
+
+    monkeypatch.setattr(turnlog, "_format_meta", _boom)
+
+    assert turnlog.enabled({}) is False
+    turnlog.emit({}, "AI/TICK", mon="m1", credits=2)
+    turnlog.emit({"turn_observer": turnlog.TurnObserver()}, "AI/TICK", mon="m1")
+
+
+def test_logsink_formats_lazily_in_a_ring_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict] = []
+    original = turnlog._format_meta
+
+    def _counting(meta):
+        calls.append(dict(meta))
+        return original(meta)
+
+    monkeypatch.setattr(turnlog, "_format_meta", _counting)
+    sink = LogSink(capacity=3, file_path=None)
+    ctx = {"logsink": sink}
+    assert turnlog.enabled(ctx)
+
+    for idx in range(5):
+        turnlog.emit(ctx, "AI/PURSUIT", mon=f"m{idx}", success=True, skipped=None)
+    turnlog.emit(ctx, "TURN/TICK", message="tick=9", tick=9)
+    assert calls == []
+
+    assert sink.tail(10) == [
+        " AI/PURSUIT - mon=m3 success=true",
+        " AI/PURSUIT - mon=m4 success=true",
+        " TURN/TICK - tick=9",
+    ]
+    assert len(calls) == 2
+
+
+def test_observer_reads_hp_from_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pstate, "_pdbg_enabled", lambda: True)
+
+    def _no_disk(*_args, **_kwargs):
+        raise AssertionError("turnlog must not reload player state from disk")
+
+    monkeypatch.setattr(pstate, "load_state", _no_disk)
+    monkeypatch.setattr(pstate, "get_hp_for_active", lambda state: dict(state["hp"]))
+
+    state = {"hp": {"current": 20, "max": 30}}
+    observer = turnlog.TurnObserver()
+    ctx = {"player_state": state, "turn_observer": observer}
+
+    observer.begin_turn(ctx, "att", "attack")
+    assert turnlog.enabled(ctx)
+    turnlog.emit(ctx, "COMBAT/STRIKE", target_name="Ghoul", damage=4, remaining_hp=6)
+    state["hp"] = {"current": 15, "max": 30}
+
+    lines: list[str] = []
+    monkeypatch.setattr(turnlog.LOG_P, "info", lambda fmt, *args: lines.append(fmt % args))
+    monkeypatch.setattr(pstate, "_pdbg_setup_file_logging", lambda: None)
+    observer.finish_turn(ctx, "att", "attack")
+
+    assert lines == [
+        "[playersdbg] TURN cmd=attack (att) | HPΔ=-5 (15/30) | strike Ghoul dmg=4 hp=6"
+    ]
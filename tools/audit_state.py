@@ -65,54 +65,32 @@ def _coerce_pos(entry) -> tuple[int, int, int] | None:
         return None
 
 
-def _audit_monster_cache(monsters) -> List[str]:
+def _audit_monster_cache() -> List[str]:
+    # instance_id is UNIQUE in the store, so only the columns checked here
+    # are read and nothing is kept between rows.
     issues: List[str] = []
-    seen_ids: set[str] = set()
-    for record in monsters.list_all():
-        if not isinstance(record, dict):
-            continue
-        mid = str(record.get("instance_id") or record.get("id") or record.get("monster_instance_id") or "").strip()
+    for record in get_stores().monsters.iter_snapshot(("instance_id", "year", "x", "y")):
+        mid = str(record.get("instance_id") or "").strip()
         if not mid:
             issues.append("monster missing instance_id")
             continue
-        if mid in seen_ids:
-            issues.append(f"monster duplicate instance_id={mid}")
-            continue
-        seen_ids.add(mid)
         pos = _coerce_pos(record)
         if pos is None:
             issues.append(f"monster {mid} missing/invalid pos")
-            continue
-        if any(not isinstance(token, int) for token in pos):
-            issues.append(f"monster {mid} non-int pos={pos}")
     return issues
 
 
 def _audit_item_cache() -> List[str]:
+    # iid is UNIQUE in the store; ground items are filtered in SQL.
     issues: List[str] = []
-    stores = get_stores()
-    item_store = stores.items
-    seen: set[str] = set()
-    for record in item_store.snapshot():
-        if not isinstance(record, dict):
-            continue
-        iid = str(record.get("iid") or record.get("instance_id") or record.get("id") or "").strip()
+    item_store = get_stores().items
+    for record in item_store.iter_snapshot(("iid", "year", "x", "y"), owner=None):
+        iid = str(record.get("iid") or "").strip()
         if not iid:
             issues.append("item missing instance_id")
             continue
-        if iid in seen:
-            issues.append(f"item duplicate instance_id={iid}")
-            continue
-        seen.add(iid)
-        owner = record.get("owner")
-        pos = _coerce_pos(record)
-        if owner in (None, "", 0):
-            if pos is None:
-                issues.append(f"ground item {iid} missing pos")
-        else:
-            # Inventory item: ensure it is not also on ground
-            if pos is None:
-                continue
+        if _coerce_pos(record) is None:
+            issues.append(f"ground item {iid} missing pos")
     return issues
 
 
@@ -122,7 +100,7 @@ def main() -> int:
 
     issues: List[str] = []
     issues.extend(_audit_ready_target(state, monsters))
-    issues.extend(_audit_monster_cache(monsters))
+    issues.extend(_audit_monster_cache())
     issues.extend(_audit_item_cache())
 
     if issues:
@@ -0,0 +1,267 @@
+"""Monster-vs-class combat simulator for balance tuning.
+
+Usage:
+    python tools/combat_sim.py [--fights 20000] [--workers 4] [--seed 1]
+                               [--monster ID ...] [--class NAME ...]
+                               [--weapon ITEM_ID] [--armour ITEM_ID]
+                               [--max-rounds 200] [--no-numpy]
+
+Every catalog monster is matched against every starting class.  Each matchup
+runs ``--fights`` independent fights in lock-step rounds: the player strikes,
+then the monster attacks when its seeded ``attack_pct`` draw passes.  Damage
+for all fights still in progress is resolved per round with
+``damage_engine.resolve_attacks_batch`` and the same floors and first-hit
+clamp as the live combat code.  Matchups are spread over a multiprocessing
+pool; each one derives its own RNG seed so results do not depend on the
+worker count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from mutants.services import combat_actions, damage_engine  # noqa: E402
+from mutants.services.combat_config import CombatConfig  # noqa: E402
+
+MONSTER_CATALOG = ROOT / "state" / "monsters" / "catalog.json"
+ITEMS_CATALOG = ROOT / "state" / "items" / "catalog.json"
+CLASS_TEMPLATES = ROOT / "src" / "mutants" / "data" / "startingclasstemplates.json"
+
+
+def _load_json_list(path: Path) -> List[Dict[str, Any]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        raise ValueError(f"{path} must contain a JSON list")
+    return [entry for entry in data if isinstance(entry, dict)]
+
+
+def _item_key(token: Any) -> str:
+    return str(token or "").strip().lower().replace("-", "_")
+
+
+def _index_items(items: Iterable[Mapping[str, Any]]) -> Dict[str, Mapping[str, Any]]:
+    index: Dict[str, Mapping[str, Any]] = {}
+    for item in items:
+        for token in (item.get("item_id"), item.get("name")):
+            if token:
+                index.setdefault(_item_key(token), item)
+    return index
+
+
+def _armour_class(items: Mapping[str, Mapping[str, Any]], token: Any) -> int:
+    template = items.get(_item_key(token)) if token else None
+    if not template or not template.get("armour"):
+        return 0
+    return max(0, int(template.get("armour_class") or 0))
+
+
+def _dex_bonus(stats: Mapping[str, Any]) -> int:
+    return max(0, int(stats.get("dex") or 0) // 10)
+
+
+def _monster_side(template: Mapping[str, Any], items: Mapping[str, Mapping[str, Any]], config: CombatConfig) -> Dict[str, Any]:
+    stats = dict(template.get("stats") or {})
+    level = max(1, int(template.get("level") or 1))
+    innate = dict(template.get("innate_attack") or {})
+    innate["power_base"] = int(innate.get("power_base") or 0) + int(innate.get("power_per_level") or 0) * (level - 1)
+    armour = (template.get("starter_armour") or [None])[0]
+    attack_pct = config.attack_pct
+    cascade = ((template.get("ai_overrides") or {}).get("cascade") or {}).get("attack_pct") or {}
+    attack_pct += int(cascade.get("add") or 0)
+    return {
+        "name": str(template.get("monster_id") or template.get("name")),
+        "hp": max(1, int(template.get("hp_max") or 1)),
+        "power": damage_engine.get_attacker_power(innate, {"stats": stats}, source="innate"),
+        "armour_ac": _armour_class(items, armour),
+        "dex_bonus": _dex_bonus(stats),
+        "attack_pct": max(0, min(100, attack_pct)),
+    }
+
+
+def _class_side(
+    template: Mapping[str, Any],
+    items: Mapping[str, Mapping[str, Any]],
+    weapon: Optional[str],
+    armour: Optional[str],
+) -> Dict[str, Any]:
+    stats = dict(template.get("base_stats") or {})
+    weapon_payload: Dict[str, Any] = {}
+    source = "innate"
+    if weapon:
+        weapon_template = items.get(_item_key(weapon))
+        if weapon_template is None:
+            raise SystemExit(f"unknown weapon: {weapon}")
+        weapon_payload = dict(weapon_template)
+        source = "bolt" if weapon_template.get("ranged") else "melee"
+    return {
+        "name": str(template.get("class")),
+        "hp": max(1, int(template.get("hp_max_start") or 1)),
+        "power": damage_engine.get_attacker_power(weapon_payload, {"stats": stats}, source=source),
+        "source": source,
+        "armour_ac": _armour_class(items, armour or template.get("armour_start")),
+        "dex_bonus": _dex_bonus(stats),
+    }
+
+
+# Damage floors as applied by combat_actions (player) and monster_actions.
+_PLAYER_FLOORS = {"bolt": combat_actions.MIN_BOLT_DAMAGE}
+_MONSTER_FLOORS = {
+    "innate": combat_actions.MIN_INNATE_DAMAGE,
+    "bolt": combat_actions.MIN_BOLT_DAMAGE,
+}
+
+
+def _floored(damage: int, source: str, floors: Mapping[str, int]) -> int:
+    return max(floors.get(source, 0), max(0, int(damage)))
+
+
+def _clamped(damage: int, current: int, maximum: int) -> int:
+    # Mirrors combat_actions._clamp_melee_damage: a hit on an unhurt target
+    # never kills outright.
+    if damage <= 0:
+        return 0
+    if current == maximum and current > 1 and damage >= current:
+        return current - 1
+    return damage
+
+
+def run_matchup(job: Tuple[Dict[str, Any], Dict[str, Any], int, int, int, bool]) -> Dict[str, Any]:
+    """Simulate ``fights`` fights for one monster/class pair."""
+
+    monster, player, fights, seed, max_rounds, use_numpy = job
+    rng = random.Random(seed)
+    mon_hp = [monster["hp"]] * fights
+    ply_hp = [player["hp"]] * fights
+    active = list(range(fights))
+    rounds_total = 0
+    player_wins = 0
+    monster_wins = 0
+    dealt = 0
+    taken = 0
+
+    rounds = 0
+    while active and rounds < max_rounds:
+        rounds += 1
+        size = len(active)
+        raw = damage_engine.resolve_attacks_batch(
+            [player["power"]] * size,
+            [monster["armour_ac"]] * size,
+            [monster["dex_bonus"]] * size,
+            use_numpy=use_numpy,
+        )
+        survivors: List[int] = []
+        for fight, damage in zip(active, raw):
+            hit = _clamped(_floored(damage, player["source"], _PLAYER_FLOORS), mon_hp[fight], monster["hp"])
+            dealt += hit
+            mon_hp[fight] = max(0, mon_hp[fight] - hit)
+            if mon_hp[fight] <= 0:
+                player_wins += 1
+                rounds_total += rounds
+            else:
+                survivors.append(fight)
+
+        attackers = [fight for fight in survivors if rng.randrange(100) < monster["attack_pct"]]
+        if attackers:
+            raw = damage_engine.resolve_attacks_batch(
+                [monster["power"]] * len(attackers),
+                [player["armour_ac"]] * len(attackers),
+                [player["dex_bonus"]] * len(attackers),
+                use_numpy=use_numpy,
+            )
+            dead = set()
+            for fight, damage in zip(attackers, raw):
+                hit = _clamped(_floored(damage, "innate", _MONSTER_FLOORS), ply_hp[fight], player["hp"])
+                taken += hit
+                ply_hp[fight] = max(0, ply_hp[fight] - hit)
+                if ply_hp[fight] <= 0:
+                    dead.add(fight)
+                    monster_wins += 1
+                    rounds_total += rounds
+            survivors = [fight for fight in survivors if fight not in dead]
+        active = survivors
+
+    finished = player_wins + monster_wins
+    return {
+        "monster": monster["name"],
+        "class": player["name"],
+        "fights": fights,
+        "player_win_pct": 100.0 * player_wins / fights,
+        "monster_win_pct": 100.0 * monster_wins / fights,
+        "timeouts": len(active),
+        "avg_rounds": rounds_total / finished if finished else float(max_rounds),
+        "dealt_per_fight": dealt / fights,
+        "taken_per_fight": taken / fights,
+    }
+
+
+def _matchup_seed(seed: int, monster: str, cls: str) -> int:
+    return random.Random(f"{seed}:{monster}:{cls}").getrandbits(63)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fights", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--monster", action="append", default=[])
+    parser.add_argument("--class", dest="classes", action="append", default=[])
+    parser.add_argument("--weapon", default=None, help="item_id wielded by every class")
+    parser.add_argument("--armour", default=None, help="item_id worn by every class")
+    parser.add_argument("--max-rounds", type=int, default=200)
+    parser.add_argument("--no-numpy", action="store_true", help="force the pure-Python batch path")
+    args = parser.parse_args(argv)
+
+    config = CombatConfig()
+    items = _index_items(_load_json_list(ITEMS_CATALOG))
+    wanted_monsters = {m.lower() for m in args.monster}
+    wanted_classes = {c.lower() for c in args.classes}
+    monsters = [
+        _monster_side(template, items, config)
+        for template in _load_json_list(MONSTER_CATALOG)
+        if not wanted_monsters or str(template.get("monster_id", "")).lower() in wanted_monsters
+    ]
+    players = [
+        _class_side(template, items, args.weapon, args.armour)
+        for template in _load_json_list(CLASS_TEMPLATES)
+        if not wanted_classes or str(template.get("class", "")).lower() in wanted_classes
+    ]
+    if not monsters or not players:
+        print("no matchups selected", file=sys.stderr)
+        return 1
+
+    use_numpy = False if args.no_numpy else None
+    fights = max(1, args.fights)
+    jobs = [
+        (monster, player, fights, _matchup_seed(args.seed, monster["name"], player["name"]), args.max_rounds, use_numpy)
+        for monster in monsters
+        for player in players
+    ]
+
+    start = time.perf_counter()
+    with Pool(processes=args.workers) as pool:
+        results = sorted(pool.imap_unordered(run_matchup, jobs), key=lambda r: (r["monster"], r["class"]))
+    elapsed = time.perf_counter() - start
+
+    print(f"{'monster':<22} {'class':<8} {'win%':>7} {'loss%':>7} {'t/o':>5} {'rounds':>7} {'dealt':>8} {'taken':>8}")
+    for row in results:
+        print(
+            f"{row['monster']:<22} {row['class']:<8} {row['player_win_pct']:7.2f} {row['monster_win_pct']:7.2f} "
+            f"{row['timeouts']:5d} {row['avg_rounds']:7.2f} {row['dealt_per_fight']:8.2f} {row['taken_per_fight']:8.2f}"
+        )
+    backend = "python" if args.no_numpy or not damage_engine.numpy_available() else "numpy"
+    print(f"{len(jobs) * fights} fights in {elapsed:.2f}s ({backend} batch path)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
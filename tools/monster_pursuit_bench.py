@@ -0,0 +1,148 @@
+"""Benchmark for monster pursuit turns against one player.
+
+Usage:
+    python tools/monster_pursuit_bench.py [--monsters 500] [--passes 3]
+
+Spawns ``--monsters`` monsters bound to a single player, spread over the
+tiles around them, and times:
+
+* the three collocation checks a pursuing monster makes per action, first
+  re-resolving the player state each time, then reading a PlayerSnapshot;
+* a pursuit step via ``relocate_monster`` with and without the old
+  ``_refresh_monster_derived`` call;
+* full ``execute_random_action`` passes (path finding included).
+
+Runs against a throwaway GAME_STATE_ROOT holding a copy of ``state/world``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+PLAYER_ID = "player_thief"
+PLAYER_POS = (2000, 0, 0)
+
+
+def _player_state() -> Dict[str, Any]:
+    active = {"id": PLAYER_ID, "class": "Thief", "level": 4, "pos": list(PLAYER_POS)}
+    return {"players": [active], "active_id": PLAYER_ID, "pos": list(PLAYER_POS)}
+
+
+def _monsters(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    monsters = []
+    for idx in range(count):
+        iid = f"i.bench.{idx:05d}"
+        pos = [PLAYER_POS[0], rng.randint(-12, 12), rng.randint(-12, 12)]
+        if (pos[1], pos[2]) == PLAYER_POS[1:]:
+            pos[1] += 1
+        monsters.append(
+            {
+                "id": iid,
+                "instance_id": iid,
+                "name": f"Ghoul-{idx}",
+                "pos": pos,
+                "hp": {"current": 20, "max": 20},
+                "stats": {"str": 30, "dex": 20, "con": 20, "int": 5, "wis": 5, "cha": 5},
+                "target_player_id": PLAYER_ID,
+                "_ai_state": {"bound_player_id": PLAYER_ID},
+                "bag": [
+                    {"iid": f"{iid}.b{slot}", "item_id": item}
+                    for slot, item in enumerate(("rusty_shiv", "bolt_pouch", "nuclear_decay", "bottle_cap"))
+                ],
+            }
+        )
+    return monsters
+
+
+def _timed(label: str, func, count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1e3:9.2f} ms  ({elapsed * 1e6 / max(1, count):8.1f} us/monster)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--monsters", type=int, default=500)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    state_root = Path(tempfile.mkdtemp(prefix="mutants-bench-"))
+    shutil.copytree(ROOT / "state" / "world", state_root / "world")
+    os.environ["GAME_STATE_ROOT"] = str(state_root)
+    # Pursuers kill and respawn the player repeatedly; keep the timings readable.
+    logging.disable(logging.CRITICAL)
+
+    from mutants.services import monster_actions, monsters_state  # noqa: E402
+    from mutants.services.monster_ai import player_snapshot  # noqa: E402
+
+    try:
+        count = max(1, args.monsters)
+        rng = random.Random(args.seed)
+        monsters = _monsters(count, rng)
+        state = monsters_state.MonstersState(state_root / "monsters.json", monsters, instances=object())
+        for monster in monsters:
+            monsters_state._refresh_monster_derived(monster)
+        ctx: Dict[str, Any] = {"monsters": state, "player_state": _player_state()}
+        snapshot = player_snapshot.capture(PLAYER_ID, PLAYER_POS, ctx["player_state"]["players"][0])
+
+        def _checks() -> None:
+            for _ in range(args.passes):
+                for monster in monsters:
+                    for _ in range(3):
+                        monster_actions._is_collocated(monster, ctx)
+
+        print(f"{count} pursuing monsters, {args.passes} passes")
+        legacy = _timed("collocation x3, player re-resolved", _checks, count * args.passes)
+        player_snapshot.install(ctx, snapshot)
+        fast = _timed("collocation x3, PlayerSnapshot", _checks, count * args.passes)
+        player_snapshot.invalidate(ctx)
+        print(f"{'':<44} {legacy / fast if fast else 0.0:9.1f}x")
+
+        def _moves(refresh: bool):
+            def run() -> None:
+                for _ in range(args.passes):
+                    for monster in monsters:
+                        year, x, y = monster["pos"]
+                        monsters_state.relocate_monster(state, monster, (year, x, y + 1))
+                        if refresh:
+                            monsters_state._refresh_monster_derived(monster)
+                        monsters_state.relocate_monster(state, monster, (year, x, y))
+                        if refresh:
+                            monsters_state._refresh_monster_derived(monster)
+
+            return run
+
+        legacy = _timed("step + _refresh_monster_derived", _moves(True), count * args.passes * 2)
+        fast = _timed("step via move_monster only", _moves(False), count * args.passes * 2)
+        print(f"{'':<44} {legacy / fast if fast else 0.0:9.1f}x")
+
+        def _actions() -> None:
+            action_rng = random.Random(args.seed)
+            for _ in range(args.passes):
+                player_snapshot.install(ctx, snapshot)
+                for monster in monsters:
+                    monster_actions.execute_random_action(monster, ctx, rng=action_rng, player=snapshot)
+                player_snapshot.invalidate(ctx)
+
+        _timed("execute_random_action (pursuit)", _actions, count * args.passes)
+    finally:
+        shutil.rmtree(state_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
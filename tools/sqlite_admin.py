@@ -7,6 +7,7 @@ import argparse
 import json
 import sqlite3
 import sys
+import time
 from pathlib import Path
 from typing import Callable
 
@@ -16,7 +17,13 @@ SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from mutants.registries.sqlite_store import SQLiteConnectionManager  # noqa: E402
+from mutants.env import get_sql_stats_path  # noqa: E402
+from mutants.registries import sqlite_statements  # noqa: E402
+from mutants.registries.sqlite_store import (  # noqa: E402
+    SQLiteConnectionManager,
+    bulk_import,
+    get_stores,
+)
 
 
 def _build_manager(db_path: str | None) -> SQLiteConnectionManager:
@@ -62,6 +69,22 @@ def _command_stats(args: argparse.Namespace) -> None:
         print(f"Monsters instances: {monsters}")
 
     _with_connection(args, render_stats)
+    if args.live:
+        _print_live_sql_stats(args.top)
+
+
+def _print_live_sql_stats(limit: int) -> None:
+    """Print the statement counters published by a running game."""
+
+    path = get_sql_stats_path()
+    data = sqlite_statements.load_published(path)
+    if data is None:
+        print(f"No live SQL counters at {path} (run the game with MUTANTS_SQL_STATS=1).")
+        return
+    age = max(0, int(time.time()) - int(data.get("generated_at") or 0))
+    print(f"Live SQL counters (pid {data.get('pid')}, {age}s old): {path}")
+    for line in sqlite_statements.format_report(data, limit):
+        print(line)
 
 
 def _command_vacuum(args: argparse.Namespace) -> None:
@@ -127,7 +150,7 @@ def _command_catalog_import_items(args: argparse.Namespace) -> None:
             "ON CONFLICT(item_id) DO UPDATE SET data_json = excluded.data_json"
         )
 
-        with conn:
+        with bulk_import(conn, ("items_catalog",)), conn:
             conn.execute("BEGIN IMMEDIATE")
             conn.executemany(sql, records)
 
@@ -202,7 +225,7 @@ def _command_catalog_import_monsters(args: argparse.Namespace) -> None:
             "starter_armour_json=excluded.starter_armour_json, starter_items_json=excluded.starter_items_json"
         )
 
-        with conn:
+        with bulk_import(conn, ("monsters_catalog",)), conn:
             conn.execute("BEGIN IMMEDIATE")
             conn.executemany(sql, records)
 
@@ -211,6 +234,31 @@ def _command_catalog_import_monsters(args: argparse.Namespace) -> None:
     _with_connection(args, import_catalog)
 
 
+def _command_changes(args: argparse.Namespace) -> None:
+    """Print change-feed rows after ``--since`` as JSON lines."""
+
+    feed = get_stores(args.database).changes
+    cursor = args.since
+    while True:
+        batch = feed.changes_since(cursor, limit=args.limit)
+        for change in batch:
+            print(json.dumps(change, sort_keys=True), flush=True)
+            cursor = change["seq"]
+        if batch and len(batch) == args.limit:
+            continue
+        if not args.follow:
+            return
+        time.sleep(args.interval)
+
+
+def _command_changes_compact(args: argparse.Namespace) -> None:
+    """Delete old change-feed rows."""
+
+    feed = get_stores(args.database).changes
+    removed = feed.compact(args.upto, keep=args.keep)
+    print(f"Removed {removed} change rows (head seq {feed.head()})")
+
+
 def _command_litter_run_now(args: argparse.Namespace) -> None:
     """Run the daily litter job immediately."""
 
@@ -253,6 +301,14 @@ def _build_parser() -> argparse.ArgumentParser:
     init_parser.set_defaults(func=_command_init)
 
     stats_parser = subparsers.add_parser("stats", help="Show counts for stored instances.")
+    stats_parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Also show the SQL statement counters published by a running game.",
+    )
+    stats_parser.add_argument(
+        "--top", type=int, default=15, metavar="N", help="Statements to list with --live (default 15)."
+    )
     stats_parser.set_defaults(func=_command_stats)
 
     vacuum_parser = subparsers.add_parser("vacuum", help="Run VACUUM and ANALYZE on the database.")
@@ -273,6 +329,38 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     catalog_import_monsters_parser.set_defaults(func=_command_catalog_import_monsters)
 
+    changes_parser = subparsers.add_parser(
+        "changes", help="Print change-feed rows as JSON lines (needs MUTANTS_CHANGE_FEED=1)."
+    )
+    changes_parser.add_argument(
+        "--since", type=int, default=0, metavar="SEQ", help="Start after this seq (default 0)."
+    )
+    changes_parser.add_argument(
+        "--limit", type=int, default=1000, metavar="N", help="Rows fetched per query (default 1000)."
+    )
+    changes_parser.add_argument(
+        "--follow", action="store_true", help="Keep polling for new changes."
+    )
+    changes_parser.add_argument(
+        "--interval", type=float, default=1.0, metavar="S", help="Poll interval with --follow."
+    )
+    changes_parser.set_defaults(func=_command_changes)
+
+    changes_compact_parser = subparsers.add_parser(
+        "changes-compact", help="Delete change-feed rows up to a seq."
+    )
+    changes_compact_parser.add_argument(
+        "--upto", type=int, default=None, metavar="SEQ", help="Delete rows with seq <= SEQ."
+    )
+    changes_compact_parser.add_argument(
+        "--keep",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Without --upto, keep the newest N rows (default 0).",
+    )
+    changes_compact_parser.set_defaults(func=_command_changes_compact)
+
     litter_run_parser = subparsers.add_parser(
         "litter-run-now", help="Run daily litter immediately (idempotent)."
     )
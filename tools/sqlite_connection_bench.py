@@ -0,0 +1,155 @@
+"""Count SQLite connections opened per game turn.
+
+Usage:
+    python tools/sqlite_connection_bench.py [--turns 40]
+
+Builds a throwaway state root (schema plus item catalog), starts a session,
+picks the first class and plays ``--turns`` commands (look and moves), each
+followed by a room render.  It runs twice:
+
+* ``per-manager``: every SQLiteConnectionManager opens and migrates its own
+  connection, as before the connection registry existed;
+* ``registry``: the process-wide registry in ``sqlite_store``.
+
+For each mode it prints the connections opened and schema checks run per
+turn, and the wall time per turn.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+COMMANDS = ("look", "north", "south", "east", "west")
+
+_COUNTERS = {"opened": 0, "schema_checks": 0}
+
+
+def _prepare_state_root() -> Path:
+    state_root = Path(tempfile.mkdtemp(prefix="mutants-connbench-"))
+    for name in ("world", "items", "monsters"):
+        source = ROOT / "state" / name
+        if source.exists():
+            shutil.copytree(source, state_root / name)
+    env = dict(os.environ, GAME_STATE_ROOT=str(state_root), MUTANTS_STATE_BACKEND="sqlite")
+    for args in (["init"], ["catalog-import-items"]):
+        subprocess.check_call(
+            [sys.executable, str(ROOT / "tools" / "sqlite_admin.py"), *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+    os.environ.update(GAME_STATE_ROOT=str(state_root), MUTANTS_STATE_BACKEND="sqlite")
+    return state_root
+
+
+@contextlib.contextmanager
+def _per_manager_connections(sqlite_store: Any):
+    """Give every manager a private, freshly migrated connection."""
+
+    held: Dict[int, sqlite3.Connection] = {}
+    managers: List[Any] = []  # keep ids stable while the mode runs
+    original_connect = sqlite_store.SQLiteConnectionManager.connect
+    original_get_stores = sqlite_store.get_stores
+
+    def connect(self: Any) -> sqlite3.Connection:
+        conn = held.get(id(self))
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            self._configure_connection(conn)
+            self._ensure_schema(conn)
+            held[id(self)] = conn
+            managers.append(self)
+            _COUNTERS["opened"] += 1
+            _COUNTERS["schema_checks"] += 1
+        return conn
+
+    def get_stores(db_path: Any = None) -> Any:
+        return sqlite_store._build_state_stores(sqlite_store.SQLiteConnectionManager(db_path))
+
+    sqlite_store.SQLiteConnectionManager.connect = connect
+    sqlite_store.get_stores = get_stores
+    try:
+        yield
+    finally:
+        sqlite_store.SQLiteConnectionManager.connect = original_connect
+        sqlite_store.get_stores = original_get_stores
+        for conn in held.values():
+            conn.close()
+
+
+def _counters(mode: str, sqlite_store: Any) -> Dict[str, int]:
+    if mode == "registry":
+        stats = sqlite_store.connection_stats()
+        return {"opened": stats["opened"], "schema_checks": stats["schema_checks"]}
+    return dict(_COUNTERS)
+
+
+def _play(turns: int, mode: str) -> None:
+    from mutants.app import context as context_mod
+    from mutants.registries import sqlite_store, storage
+    from mutants.repl import loop
+
+    sqlite_store.close_all()
+    guard = _per_manager_connections(sqlite_store) if mode == "per-manager" else contextlib.nullcontext()
+    with guard, contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        if mode == "per-manager":
+            # storage imported the registry-backed get_stores by name.
+            original = storage.sqlite_get_stores
+            storage.sqlite_get_stores = sqlite_store.get_stores
+        try:
+            loop.set_debug_io(False)
+            ctx, dispatch = loop._start_session(banner=False)
+            loop.handle_input("1", ctx)
+            context_mod.render_frame(ctx)
+            start_counts = _counters(mode, sqlite_store)
+            started = time.perf_counter()
+            for command in itertools.islice(itertools.cycle(COMMANDS), turns):
+                dispatch.call(command, "")
+                context_mod.render_frame(ctx)
+            elapsed = time.perf_counter() - started
+            end_counts = _counters(mode, sqlite_store)
+        finally:
+            if mode == "per-manager":
+                storage.sqlite_get_stores = original
+    opened = end_counts["opened"] - start_counts["opened"]
+    checks = end_counts["schema_checks"] - start_counts["schema_checks"]
+    print(
+        f"{mode:<12} {opened / turns:8.2f} connections/turn  "
+        f"{checks / turns:8.2f} schema checks/turn  {elapsed * 1e3 / turns:8.2f} ms/turn"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=40)
+    args = parser.parse_args()
+    turns = max(1, args.turns)
+
+    state_root = _prepare_state_root()
+    try:
+        print(f"{turns} turns (look/move + render)")
+        _play(turns, "per-manager")
+        _play(turns, "registry")
+    finally:
+        from mutants.registries import sqlite_store
+
+        sqlite_store.close_all()
+        shutil.rmtree(state_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Time the SQLite PRAGMA profiles against the import and litter workloads.
+
+Usage:
+    python tools/sqlite_profile_bench.py [--items 50000] [--days 5]
+
+Builds a throwaway state root (world, item and monster data) and, for each
+profile in ``sqlite_store.PRAGMA_PROFILES``, starts from an empty database:
+
+* ``import``: both catalog imports (``sqlite_admin`` commands) followed by
+  ``--items`` synthetic ground items inserted 1000 per transaction;
+* ``litter``: ``--days`` runs of the daily litter job on top of those items
+  (each run deletes the previous day's litter and spawns a new batch).
+
+``bulk-import`` is timed twice for the import workload: with the indexes
+maintained row by row, and inside ``sqlite_store.bulk_import`` with the
+``items_instances`` indexes deferred to the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+BATCH = 1000
+
+
+def _prepare_state_root() -> Path:
+    state_root = Path(tempfile.mkdtemp(prefix="mutants-profilebench-"))
+    for name in ("world", "items", "monsters"):
+        source = ROOT / "state" / name
+        if source.exists():
+            shutil.copytree(source, state_root / name)
+    os.environ.update(GAME_STATE_ROOT=str(state_root), MUTANTS_STATE_BACKEND="sqlite")
+    return state_root
+
+
+def _reset_database(state_root: Path) -> None:
+    from mutants.registries import sqlite_store
+
+    sqlite_store.close_all()
+    for suffix in ("", "-wal", "-shm"):
+        (state_root / f"mutants.db{suffix}").unlink(missing_ok=True)
+
+
+def _synthetic_items(count: int, years: List[int]) -> List[Dict[str, Any]]:
+    rng = random.Random(45)
+    return [
+        {
+            "iid": f"bench{idx:07d}",
+            "item_id": "bottle_cap",
+            "year": rng.choice(years),
+            "x": rng.randint(-15, 15),
+            "y": rng.randint(-15, 15),
+            "origin": "bench",
+        }
+        for idx in range(count)
+    ]
+
+
+def _import(items: List[Dict[str, Any]]) -> None:
+    sys.path.insert(0, str(ROOT / "tools"))
+    import sqlite_admin
+
+    from mutants.registries.storage import get_stores
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sqlite_admin.main(["catalog-import-items"])
+        sqlite_admin.main(["catalog-import-monsters"])
+    store = get_stores().items
+    for start in range(0, len(items), BATCH):
+        store.bulk_insert([dict(item) for item in items[start : start + BATCH]])
+
+
+def _litter(days: int) -> None:
+    from mutants.bootstrap import daily_litter
+    from mutants.registries.storage import get_stores
+
+    kv = get_stores().runtime_kv
+    for _ in range(days):
+        kv.delete(daily_litter.KV_LAST_RUN_KEY)
+        daily_litter.run_daily_litter_sqlite()
+
+
+def _timed(action: Callable[[], None]) -> float:
+    started = time.perf_counter()
+    action()
+    return (time.perf_counter() - started) * 1e3
+
+
+def _run(profile: str, deferred: bool, state_root: Path, items: List[Dict[str, Any]], days: int) -> str:
+    from mutants.registries import sqlite_store
+
+    _reset_database(state_root)
+    sqlite_store.set_profile(profile)
+    try:
+        conn = sqlite_store.SQLiteConnectionManager().connect()
+        if deferred:
+            with sqlite_store.bulk_import(conn, ("items_instances",)):
+                import_ms = _timed(lambda: _import(items))
+        else:
+            import_ms = _timed(lambda: _import(items))
+        litter_ms = _timed(lambda: _litter(days))
+    finally:
+        sqlite_store.set_profile(None)
+    label = profile + (" (deferred idx)" if deferred else "")
+    return f"{label:<28} import {import_ms:9.1f} ms   litter {litter_ms / days:8.1f} ms/day"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args()
+    days = max(1, args.days)
+
+    state_root = _prepare_state_root()
+    try:
+        from mutants.registries import items_catalog, sqlite_store
+
+        items = _synthetic_items(max(0, args.items), items_catalog.playable_years() or [2000])
+        print(f"{len(items)} items, {days} litter days")
+        for profile in sqlite_store.PRAGMA_PROFILES:
+            print(_run(profile, False, state_root, items, days))
+        print(_run("bulk-import", True, state_root, items, days))
+    finally:
+        from mutants.registries import sqlite_store
+
+        sqlite_store.close_all()
+        shutil.rmtree(state_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Microbenchmark for debug.turnlog.emit.
+
+Usage:
+    python tools/turnlog_bench.py [--events 200000]
+
+Prints the cost per emitted event with no consumer, with turn logging
+switched off, with a LogSink (deferred formatting), with a LogSink whose
+buffer is formatted via tail(), and with an active TurnObserver.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from mutants.debug import turnlog  # noqa: E402
+from mutants.ui.logsink import LogSink  # noqa: E402
+
+
+def _emit_loop(ctx: dict, count: int) -> float:
+    emit = turnlog.emit
+    start = time.perf_counter()
+    for i in range(count):
+        emit(ctx, "AI/PURSUIT", mon="ghoul#1", success=True, target=(2000, i, 3), reason="chase")
+    return time.perf_counter() - start
+
+
+def _report(label: str, seconds: float, count: int) -> None:
+    print(f"{label:<28} {seconds * 1e9 / count:9.1f} ns/event")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+    count = max(1, args.events)
+
+    _report("no consumer", _emit_loop({}, count), count)
+
+    turnlog.set_enabled(False)
+    sink = LogSink(capacity=200, file_path=None)
+    _report("disabled (sink attached)", _emit_loop({"logsink": sink}, count), count)
+    turnlog.set_enabled(True)
+
+    sink = LogSink(capacity=200, file_path=None)
+    _report("logsink, never read", _emit_loop({"logsink": sink}, count), count)
+
+    sink = LogSink(capacity=200, file_path=None)
+    ctx = {"logsink": sink}
+    start = time.perf_counter()
+    _emit_loop(ctx, count)
+    sink.tail(200)
+    _report("logsink + tail(200)", time.perf_counter() - start, count)
+
+    observer = turnlog.TurnObserver()
+    observer._active = True
+    _report("active observer", _emit_loop({"turn_observer": observer}, count), count)
+
+
+if __name__ == "__main__":
+    main()